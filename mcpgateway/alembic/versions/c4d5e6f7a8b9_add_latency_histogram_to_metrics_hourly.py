@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Add latency_histogram column to hourly metrics rollup tables.
+
+Revision ID: c4d5e6f7a8b9
+Revises: b1b2b3b4b5b6
+Create Date: 2026-02-02
+
+Stores the mergeable latency sketch written by in-process metrics
+pre-aggregation (METRICS_PREAGGREGATION_ENABLED), so percentiles stay
+correct when several workers and flushes contribute to the same hour.
+"""
+
+# Standard
+from typing import Sequence, Union
+
+# Third-Party
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, Sequence[str], None] = "b1b2b3b4b5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HOURLY_TABLES = (
+    "tool_metrics_hourly",
+    "resource_metrics_hourly",
+    "prompt_metrics_hourly",
+    "server_metrics_hourly",
+    "a2a_agent_metrics_hourly",
+)
+
+
+def upgrade() -> None:
+    """Add latency_histogram column to the hourly rollup tables."""
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    for table in HOURLY_TABLES:
+        if table not in tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table)]
+        if "latency_histogram" in columns:
+            print(f"latency_histogram column already exists in {table}. Skipping.")
+            continue
+        try:
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.add_column(sa.Column("latency_histogram", sa.JSON(), nullable=True))
+            print(f"Successfully added latency_histogram column to {table} table.")
+        except Exception as e:
+            print(f"Warning: Could not add latency_histogram column to {table}: {e}")
+
+
+def downgrade() -> None:
+    """Remove latency_histogram column from the hourly rollup tables."""
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    for table in HOURLY_TABLES:
+        if table not in tables:
+            continue
+        columns = [col["name"] for col in inspector.get_columns(table)]
+        if "latency_histogram" in columns:
+            try:
+                with op.batch_alter_table(table, schema=None) as batch_op:
+                    batch_op.drop_column("latency_histogram")
+            except Exception as e:
+                print(f"Warning: Could not drop latency_histogram column from {table}: {e}")
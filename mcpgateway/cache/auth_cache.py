@@ -17,7 +17,8 @@ Performance Impact:
 Security Considerations:
     - Short TTLs for revocation data (30s default) to limit exposure window
     - Cache invalidation on token revocation, user update, team change
-    - JWT payloads are NOT cached (security risk)
+    - JWT payloads are only cached by the verified token cache, keyed by a token
+      digest and bounded by ``exp``; revocations evict them (see verified_token_cache)
     - Graceful fallback to DB on cache failure
 
 Examples:
@@ -36,6 +37,10 @@ import threading
 import time
 from typing import Any, Dict, List, Optional, Set
 
+# First-Party
+from mcpgateway.cache.permission_cache import get_permission_cache
+from mcpgateway.cache.verified_token_cache import get_verified_token_cache
+
 logger = logging.getLogger(__name__)
 
 # Sentinel value to represent "user is not a member" in Redis cache
@@ -397,6 +402,8 @@ class AuthCache:
             for key in team_keys_to_remove:
                 self._team_cache.pop(key, None)
 
+        get_permission_cache().invalidate_user(email)
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -445,6 +452,8 @@ class AuthCache:
             for key in keys_to_remove:
                 self._context_cache.pop(key, None)
 
+        get_verified_token_cache().invalidate_jti(jti)
+
         # Update Redis
         redis = await self._get_redis_client()
         if redis:
@@ -625,6 +634,8 @@ class AuthCache:
         with self._lock:
             self._role_cache.pop(cache_key, None)
 
+        get_permission_cache().invalidate_user(email)
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -656,6 +667,8 @@ class AuthCache:
             for key in keys_to_remove:
                 self._role_cache.pop(key, None)
 
+        get_permission_cache().invalidate_team(team_id)
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -669,6 +682,36 @@ class AuthCache:
             except Exception as e:
                 logger.warning(f"AuthCache Redis invalidate_team_roles failed: {e}")
 
+    async def invalidate_permissions(self, email: Optional[str] = None) -> None:
+        """Invalidate compiled permission sets in all workers.
+
+        Call this when role assignments of a user change, or without an email
+        when role definitions change (every user holding the role is affected).
+
+        Args:
+            email: User email, or None to invalidate the permissions of all users
+
+        Examples:
+            >>> import asyncio
+            >>> cache = AuthCache()
+            >>> asyncio.run(cache.invalidate_permissions("test@example.com"))
+            >>> asyncio.run(cache.invalidate_permissions())
+        """
+        logger.debug(f"AuthCache: Invalidating permissions for {email or 'all users'}")
+
+        if email:
+            get_permission_cache().invalidate_user(email)
+        else:
+            get_permission_cache().invalidate_all()
+
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                # Publish invalidation for other workers
+                await redis.publish("mcpgw:auth:invalidate", f"permissions:{email or '*'}")
+            except Exception as e:
+                logger.warning(f"AuthCache Redis invalidate_permissions failed: {e}")
+
     async def get_user_teams(self, cache_key: str) -> Optional[List[str]]:
         """Get cached team IDs for a user.
 
@@ -991,6 +1034,8 @@ class AuthCache:
             for key in keys_to_remove:
                 self._team_cache.pop(key, None)
 
+        get_permission_cache().invalidate_user(user_email)
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -1004,6 +1049,23 @@ class AuthCache:
             except Exception as e:
                 logger.warning(f"AuthCache Redis invalidate_team_membership failed: {e}")
 
+    def is_token_revoked_sync(self, jti: str) -> bool:
+        """Check the local set of known revoked tokens (no I/O).
+
+        Args:
+            jti: JWT ID to check
+
+        Returns:
+            True if the token is known to be revoked in this worker
+
+        Examples:
+            >>> cache = AuthCache()
+            >>> cache._revoked_jtis.add("revoked-jti")
+            >>> cache.is_token_revoked_sync("revoked-jti"), cache.is_token_revoked_sync("other")
+            (True, False)
+        """
+        return jti in self._revoked_jtis
+
     async def is_token_revoked(self, jti: str) -> Optional[bool]:
         """Check if a token is revoked (cached check only).
 
@@ -1100,6 +1162,7 @@ class AuthCache:
 
             with self._lock:
                 self._revoked_jtis.update(jtis)
+            get_verified_token_cache().invalidate_jtis(jtis)
 
             # Also sync to Redis
             redis = await self._get_redis_client()
@@ -1132,6 +1195,8 @@ class AuthCache:
             self._teams_list_cache.clear()
             # Don't clear _revoked_jtis as those are confirmed revocations
 
+        get_permission_cache().invalidate_all()
+
         logger.info("AuthCache: All caches invalidated")
 
     def stats(self) -> Dict[str, Any]:
@@ -1169,6 +1234,8 @@ class AuthCache:
             "role_ttl": self._role_ttl,
             "teams_list_enabled": self._teams_list_enabled,
             "teams_list_ttl": self._teams_list_ttl,
+            "permissions": get_permission_cache().stats(),
+            "verified_tokens": get_verified_token_cache().stats(),
         }
 
     def reset_stats(self) -> None:
@@ -1185,6 +1252,7 @@ class AuthCache:
         self._miss_count = 0
         self._redis_hit_count = 0
         self._redis_miss_count = 0
+        get_verified_token_cache().reset_stats()
 
 
 # Global singleton instance
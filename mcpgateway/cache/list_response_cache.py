@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/list_response_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Pre-serialized list response cache.
+
+``tools/list``, ``prompts/list`` and ``resources/list`` rebuild a Pydantic read
+model and dump it for every entity on every call, which with thousands of
+entities costs tens of milliseconds of CPU per request. This cache keeps the
+final result per (list kind, server, cursor, caller scope): the orjson bytes
+and their ETag for ``/rpc``, and the MCP SDK objects for the streamable HTTP
+transport.
+
+The caller scope is the (user email, token teams) pair after the admin bypass,
+so two callers share an entry only when they see exactly the same entities.
+Entries are dropped when the registry cache of a type the list depends on is
+invalidated, including in other workers through the ``registry:{type}``
+pub/sub message, and expire after ``list_response_cache_ttl`` seconds.
+
+A list computed before an invalidation must not be stored afterwards. Callers
+take :meth:`ListResponseCache.generation` of the list kind before querying the
+database and pass it back when storing.
+
+Examples:
+    >>> cache = ListResponseCache(ttl=30)
+    >>> key = cache.make_key("tools", server_id=None, cursor=None, user_email=None, token_teams=["t2", "t1"])
+    >>> key == cache.make_key("tools", server_id=None, cursor=None, user_email=None, token_teams=["t1", "t2"])
+    True
+    >>> cache.get(key) is None
+    True
+    >>> generation = cache.generation("tools")
+    >>> entry = cache.set(key, serialize_result({"tools": []}), generation)
+    >>> entry.body
+    b'{"tools":[]}'
+    >>> cache.get(key) is entry
+    True
+    >>> cache.invalidate_type("servers")
+    >>> cache.get(key) is None
+    True
+    >>> _ = cache.set(key, entry, generation)  # computed before the invalidation
+    >>> cache.get(key) is None
+    True
+"""
+
+# Standard
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+# Third-Party
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Registry cache types whose changes can alter each list
+_DEPENDENCIES = {
+    "tools": frozenset({"tools", "servers", "gateways"}),
+    "prompts": frozenset({"prompts", "servers", "gateways"}),
+    "resources": frozenset({"resources", "servers", "gateways"}),
+}
+
+
+class CachedListResponse(NamedTuple):
+    """Serialized ``result`` member of a list response and its entity tag."""
+
+    body: bytes
+    etag: str
+
+
+def serialize_result(result: Dict[str, Any]) -> CachedListResponse:
+    """Serialize a list result and compute its strong ETag.
+
+    Args:
+        result: The JSON-RPC ``result`` object (e.g. ``{"tools": [...]}``)
+
+    Returns:
+        The serialized result with its ETag
+
+    Examples:
+        >>> entry = serialize_result({"prompts": [{"name": "p"}]})
+        >>> entry.body
+        b'{"prompts":[{"name":"p"}]}'
+        >>> entry.etag.startswith('"') and entry.etag.endswith('"')
+        True
+        >>> serialize_result({"prompts": [{"name": "p"}]}).etag == entry.etag
+        True
+    """
+    body = orjson.dumps(result)
+    return CachedListResponse(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag.
+
+    Args:
+        if_none_match: Header value, possibly a comma-separated list or ``*``
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+
+    Examples:
+        >>> etag_matches('"a", W/"b"', '"b"')
+        True
+        >>> etag_matches("*", '"a"'), etag_matches(None, '"a"'), etag_matches('"c"', '"a"')
+        (True, False, False)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class ListResponseCache:
+    """Thread-safe TTL cache of list results keyed by kind and caller scope.
+
+    Examples:
+        >>> cache = ListResponseCache(ttl=30, max_size=2)
+        >>> for i in range(3):
+        ...     _ = cache.set(cache.make_key("prompts", str(i), None, None, None), [i], cache.generation("prompts"))
+        >>> cache.stats()["size"]
+        2
+        >>> cache.get(cache.make_key("prompts", "0", None, None, None)) is None
+        True
+        >>> cache.get(cache.make_key("prompts", "2", None, None, None))
+        [2]
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_size: Optional[int] = None, enabled: Optional[bool] = None):
+        """Initialize the list response cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (default: from settings or 20)
+            max_size: Maximum number of entries (default: from settings or 1000)
+            enabled: Whether caching is enabled (default: from settings or True)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._ttl = ttl or getattr(settings, "list_response_cache_ttl", 20)
+            self._max_size = max_size or getattr(settings, "list_response_cache_max_entries", 1000)
+            self._enabled = enabled if enabled is not None else getattr(settings, "list_response_cache_enabled", True)
+        except ImportError:
+            self._ttl = ttl or 20
+            self._max_size = max_size or 1000
+            self._enabled = enabled if enabled is not None else True
+
+        self._cache: Dict[Tuple[Hashable, ...], Tuple[Any, float]] = {}
+        self._generations: Dict[str, int] = dict.fromkeys(_DEPENDENCIES, 0)
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            True if lookups and stores are active.
+        """
+        return self._enabled
+
+    def generation(self, kind: str) -> int:
+        """Invalidation counter of a list kind to take before computing the list.
+
+        Args:
+            kind: List kind (``tools``, ``prompts`` or ``resources``)
+
+        Returns:
+            The current generation; it changes on every invalidation of the kind.
+        """
+        return self._generations[kind]
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        server_id: Optional[str],
+        cursor: Optional[str],
+        user_email: Optional[str],
+        token_teams: Optional[List[str]],
+        representation: str = "rpc",
+    ) -> Tuple[Hashable, ...]:
+        """Build the cache key of a list request.
+
+        Args:
+            kind: List kind (``tools``, ``prompts`` or ``resources``)
+            server_id: Virtual server the list is scoped to, if any
+            cursor: Pagination cursor
+            user_email: Caller email after the admin bypass (None when unrestricted)
+            token_teams: Caller teams after the admin bypass (None when unrestricted)
+            representation: ``rpc`` for serialized bytes, ``mcp`` for MCP SDK objects
+
+        Returns:
+            Hashable cache key
+        """
+        teams = None if token_teams is None else tuple(sorted(token_teams))
+        return (kind, representation, server_id, cursor, user_email, teams)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return a cached value.
+
+        Args:
+            key: Key from :meth:`make_key`
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        if not self._enabled:
+            return None
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._hit_count += 1
+            return entry[0]
+        self._miss_count += 1
+        return None
+
+    def set(self, key: Tuple[Hashable, ...], value: Any, generation: int) -> Any:
+        """Cache a value, unless its list kind was invalidated since ``generation``.
+
+        Args:
+            key: Key from :meth:`make_key`
+            value: A :class:`CachedListResponse` or a list of MCP SDK objects
+            generation: Value of :meth:`generation` taken before computing the list
+
+        Returns:
+            The value (also when it was not stored), so callers can cache and use it in one expression.
+        """
+        if not self._enabled:
+            return value
+        with self._lock:
+            if generation != self._generations[key[0]]:
+                return value
+            if len(self._cache) >= self._max_size and key not in self._cache:
+                # Dicts keep insertion order: drop the oldest entry
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = (value, time.monotonic() + self._ttl)
+        return value
+
+    def invalidate_type(self, cache_type: str) -> None:
+        """Drop the entries of every list that depends on a registry type.
+
+        Args:
+            cache_type: Registry cache type (``tools``, ``servers``, ...)
+        """
+        kinds = {kind for kind, dependencies in _DEPENDENCIES.items() if cache_type in dependencies}
+        if not kinds:
+            return
+        with self._lock:
+            for kind in kinds:
+                self._generations[kind] += 1
+            for key in [key for key in self._cache if key[0] in kinds]:
+                del self._cache[key]
+        logger.debug(f"ListResponseCache: Invalidated {sorted(kinds)} entries after {cache_type} change")
+
+    def invalidate_all(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            for kind in self._generations:
+                self._generations[kind] += 1
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and size
+
+        Examples:
+            >>> ListResponseCache().stats()["hit_rate"]
+            0.0
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "size": len(self._cache),
+            "max_size": self._max_size,
+            "ttl": self._ttl,
+        }
+
+
+# Global singleton instance
+_list_response_cache: Optional[ListResponseCache] = None
+
+
+def get_list_response_cache() -> ListResponseCache:
+    """Get or create the singleton ListResponseCache instance.
+
+    Returns:
+        ListResponseCache: The singleton list response cache instance
+
+    Examples:
+        >>> get_list_response_cache() is get_list_response_cache()
+        True
+    """
+    global _list_response_cache  # pylint: disable=global-statement
+    if _list_response_cache is None:
+        _list_response_cache = ListResponseCache()
+    return _list_response_cache
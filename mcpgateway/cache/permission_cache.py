@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/permission_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Process-wide compiled permission cache.
+
+``PermissionService`` is created per request, so its own cache only lives for
+one request. This cache keeps, per worker process, the compiled result of the
+two RBAC lookups done on every permission check:
+
+- the effective permissions of a user, per team context, as a frozenset.
+  Identical sets are interned, so users sharing the same roles share one
+  frozenset object and permission strings are interned too.
+- whether the user is an admin.
+
+Entries expire after ``permission_cache_ttl`` seconds and are invalidated
+through the ``AuthCache`` invalidation hooks (user, role and team changes).
+Other workers are notified over the ``mcpgw:auth:invalidate`` Redis channel.
+
+A lookup started before an invalidation must not store its (possibly stale)
+result afterwards. Callers take :meth:`PermissionCache.generation` before
+querying the database and pass it back when storing.
+
+Examples:
+    >>> cache = PermissionCache(ttl=60)
+    >>> generation = cache.generation
+    >>> alice = cache.set_permissions("alice@example.com", None, {"tools.read", "tools.execute"}, generation)
+    >>> bob = cache.set_permissions("bob@example.com", "team-1", {"tools.execute", "tools.read"}, generation)
+    >>> alice is bob
+    True
+    >>> cache.get_permissions("alice@example.com", None) == frozenset({"tools.read", "tools.execute"})
+    True
+    >>> cache.invalidate_team("team-1")
+    >>> cache.get_permissions("bob@example.com", "team-1") is None
+    True
+    >>> _ = cache.set_permissions("bob@example.com", "team-1", {"tools.read"}, generation)  # stale lookup
+    >>> cache.get_permissions("bob@example.com", "team-1") is None
+    True
+    >>> cache.stats()["hit_count"], cache.stats()["miss_count"]
+    (1, 2)
+"""
+
+# Standard
+import logging
+import sys
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_GLOBAL = "global"
+
+
+class PermissionCache:
+    """Thread-safe per-process cache of compiled user permission sets and admin flags.
+
+    Examples:
+        >>> cache = PermissionCache(ttl=60)
+        >>> cache.set_admin("root@example.com", True, cache.generation)
+        >>> cache.get_admin("root@example.com")
+        True
+        >>> cache.get_admin("nobody@example.com") is None
+        True
+        >>> cache.invalidate_user("root@example.com")
+        >>> cache.get_admin("root@example.com") is None
+        True
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_entries: Optional[int] = None, enabled: Optional[bool] = None):
+        """Initialize the permission cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (default: from settings or 60)
+            max_entries: Maximum number of cached (user, team) entries (default: from settings or 10000)
+            enabled: Whether caching is enabled (default: from settings or True)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._ttl = ttl or getattr(settings, "permission_cache_ttl", 60)
+            self._max_entries = max_entries or getattr(settings, "permission_cache_max_entries", 10000)
+            self._enabled = enabled if enabled is not None else getattr(settings, "permission_cache_enabled", True)
+        except ImportError:
+            self._ttl = ttl or 60
+            self._max_entries = max_entries or 10000
+            self._enabled = enabled if enabled is not None else True
+
+        # (email, team_id or "global") -> (permissions, expiry)
+        self._permissions: Dict[Tuple[str, str], Tuple[FrozenSet[str], float]] = {}
+        # email -> (is_admin, expiry)
+        self._admins: Dict[str, Tuple[bool, float]] = {}
+        # Canonical instance of every distinct permission set
+        self._interned: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._invalidation_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            True if lookups and stores are active.
+        """
+        return self._enabled
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter to take before a database lookup.
+
+        Returns:
+            The current generation; it changes on every invalidation.
+        """
+        return self._generation
+
+    def get_permissions(self, email: str, team_id: Optional[str]) -> Optional[FrozenSet[str]]:
+        """Return the cached permission set of a user in a team context.
+
+        Args:
+            email: User email
+            team_id: Team context, or None for global/personal roles only
+
+        Returns:
+            The permission set, or None on a miss.
+        """
+        if not self._enabled:
+            return None
+        entry = self._permissions.get((email, team_id or _GLOBAL))
+        if entry is not None and entry[1] > time.monotonic():
+            self._hit_count += 1
+            return entry[0]
+        self._miss_count += 1
+        return None
+
+    def set_permissions(self, email: str, team_id: Optional[str], permissions: Iterable[str], generation: int) -> FrozenSet[str]:
+        """Compile and cache the permission set of a user in a team context.
+
+        Args:
+            email: User email
+            team_id: Team context, or None for global/personal roles only
+            permissions: Effective permissions loaded from the database
+            generation: Value of :attr:`generation` taken before the database lookup
+
+        Returns:
+            The interned permission set (also when it was not stored).
+        """
+        compiled = frozenset(sys.intern(permission) for permission in permissions)
+        with self._lock:
+            compiled = self._interned.setdefault(compiled, compiled)
+            if self._enabled and generation == self._generation:
+                if len(self._permissions) >= self._max_entries:
+                    self._evict()
+                self._permissions[(email, team_id or _GLOBAL)] = (compiled, time.monotonic() + self._ttl)
+        return compiled
+
+    def get_admin(self, email: str) -> Optional[bool]:
+        """Return the cached admin flag of a user.
+
+        Args:
+            email: User email
+
+        Returns:
+            True/False, or None on a miss.
+        """
+        if not self._enabled:
+            return None
+        entry = self._admins.get(email)
+        if entry is not None and entry[1] > time.monotonic():
+            self._hit_count += 1
+            return entry[0]
+        self._miss_count += 1
+        return None
+
+    def set_admin(self, email: str, is_admin: bool, generation: int) -> None:
+        """Cache the admin flag of a user.
+
+        Args:
+            email: User email
+            is_admin: Admin flag loaded from the database
+            generation: Value of :attr:`generation` taken before the database lookup
+        """
+        with self._lock:
+            if self._enabled and generation == self._generation:
+                if len(self._admins) >= self._max_entries:
+                    self._admins.clear()
+                self._admins[email] = (is_admin, time.monotonic() + self._ttl)
+
+    def _evict(self) -> None:
+        """Drop expired permission entries, or the oldest half if none expired. Caller holds the lock."""
+        now = time.monotonic()
+        expired = [key for key, (_, expiry) in self._permissions.items() if expiry <= now]
+        if not expired:
+            expired = list(self._permissions)[: max(1, len(self._permissions) // 2)]
+        for key in expired:
+            del self._permissions[key]
+        live = {permissions for permissions, _ in self._permissions.values()}
+        self._interned = {permissions: permissions for permissions in live}
+
+    def invalidate_user(self, email: str) -> None:
+        """Drop all cached entries of a user.
+
+        Args:
+            email: User email
+        """
+        with self._lock:
+            self._generation += 1
+            self._invalidation_count += 1
+            self._admins.pop(email, None)
+            for key in [key for key in self._permissions if key[0] == email]:
+                del self._permissions[key]
+        logger.debug(f"PermissionCache: Invalidated permissions for {email}")
+
+    def invalidate_team(self, team_id: str) -> None:
+        """Drop all cached permission sets computed for a team context.
+
+        Args:
+            team_id: Team ID
+        """
+        with self._lock:
+            self._generation += 1
+            self._invalidation_count += 1
+            for key in [key for key in self._permissions if key[1] == team_id]:
+                del self._permissions[key]
+        logger.debug(f"PermissionCache: Invalidated permissions for team {team_id}")
+
+    def invalidate_all(self) -> None:
+        """Drop every cached entry (role definitions changed)."""
+        with self._lock:
+            self._generation += 1
+            self._invalidation_count += 1
+            self._permissions.clear()
+            self._admins.clear()
+            self._interned.clear()
+        logger.debug("PermissionCache: Invalidated all permissions")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and sizes
+
+        Examples:
+            >>> PermissionCache().stats()["permission_entries"]
+            0
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "invalidation_count": self._invalidation_count,
+            "permission_entries": len(self._permissions),
+            "admin_entries": len(self._admins),
+            "distinct_permission_sets": len(self._interned),
+            "ttl": self._ttl,
+            "max_entries": self._max_entries,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self._hit_count = 0
+        self._miss_count = 0
+        self._invalidation_count = 0
+
+
+# Global singleton instance
+_permission_cache: Optional[PermissionCache] = None
+
+
+def get_permission_cache() -> PermissionCache:
+    """Get or create the singleton PermissionCache instance.
+
+    Returns:
+        PermissionCache: The singleton permission cache instance
+
+    Examples:
+        >>> isinstance(get_permission_cache(), PermissionCache)
+        True
+    """
+    global _permission_cache  # pylint: disable=global-statement
+    if _permission_cache is None:
+        _permission_cache = PermissionCache()
+    return _permission_cache
+
+
+def process_invalidation_message(message: str) -> None:
+    """Apply an ``mcpgw:auth:invalidate`` message published by another worker.
+
+    Args:
+        message: Invalidation message, e.g. ``user:<email>``, ``role:<email>:<team_id>``,
+            ``team_roles:<team_id>``, ``membership:<email>`` or ``permissions:<email or *>``
+
+    Examples:
+        >>> cache = get_permission_cache()
+        >>> _ = cache.set_permissions("carol@example.com", "t1", {"tools.read"}, cache.generation)
+        >>> process_invalidation_message("role:carol@example.com:t1")
+        >>> cache.get_permissions("carol@example.com", "t1") is None
+        True
+    """
+    cache = get_permission_cache()
+    kind, _, identifier = message.partition(":")
+    if kind in ("user", "membership"):
+        cache.invalidate_user(identifier)
+    elif kind == "role":
+        cache.invalidate_user(identifier.rpartition(":")[0])
+    elif kind == "team_roles":
+        cache.invalidate_team(identifier)
+    elif kind == "permissions":
+        if identifier == "*":
+            cache.invalidate_all()
+        else:
+            cache.invalidate_user(identifier)
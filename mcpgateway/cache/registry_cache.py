@@ -31,6 +31,10 @@ import threading
 import time
 from typing import Any, Dict, Optional
 
+# First-Party
+from mcpgateway.cache.list_response_cache import get_list_response_cache
+from mcpgateway.cache.resource_access_cache import get_resource_access_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -360,6 +364,10 @@ class RegistryCache:
             for key in keys_to_remove:
                 self._cache.pop(key, None)
 
+        # Entity visibility/team/owner used by token scoping may have changed too
+        get_resource_access_cache().invalidate_type(cache_type)
+        get_list_response_cache().invalidate_type(cache_type)
+
         # Clear Redis
         redis = await self._get_redis_client()
         if redis:
@@ -452,6 +460,8 @@ class RegistryCache:
         """
         with self._lock:
             self._cache.clear()
+        get_resource_access_cache().invalidate_all()
+        get_list_response_cache().invalidate_all()
         logger.info("RegistryCache: All caches invalidated")
 
     def stats(self) -> Dict[str, Any]:
@@ -534,16 +544,21 @@ registry_cache = get_registry_cache()
 class CacheInvalidationSubscriber:
     """Redis pubsub subscriber for cross-worker cache invalidation.
 
-    This class subscribes to the 'mcpgw:cache:invalidate' Redis channel
-    and processes invalidation messages from other workers, ensuring
-    local in-memory caches stay synchronized in multi-worker deployments.
+    This class subscribes to the 'mcpgw:cache:invalidate' and
+    'mcpgw:auth:invalidate' Redis channels and processes invalidation messages
+    from other workers, ensuring local in-memory caches stay synchronized in
+    multi-worker deployments.
 
-    Message formats handled:
+    Message formats handled on 'mcpgw:cache:invalidate':
         - registry:{cache_type} - Invalidate registry cache (tools, prompts, etc.)
         - tool_lookup:{name} - Invalidate specific tool lookup
         - tool_lookup:gateway:{gateway_id} - Invalidate all tools for a gateway
         - admin:{prefix} - Invalidate admin stats cache
 
+    Messages on 'mcpgw:auth:invalidate' (user:, role:, team_roles:, membership:,
+    permissions:) invalidate the local compiled permission cache; revoke:{jti}
+    evicts the revoked token from the local verified token cache.
+
     Examples:
         >>> subscriber = CacheInvalidationSubscriber()
         >>> # Start listening in background task:
@@ -558,6 +573,7 @@ class CacheInvalidationSubscriber:
         self._stop_event: Optional[asyncio.Event] = None
         self._pubsub: Optional[Any] = None
         self._channel = "mcpgw:cache:invalidate"
+        self._auth_channel = "mcpgw:auth:invalidate"
         self._started = False
 
     async def start(self) -> None:
@@ -587,10 +603,11 @@ class CacheInvalidationSubscriber:
             self._stop_event = asyncio.Event()
             self._pubsub = redis.pubsub()
             await self._pubsub.subscribe(self._channel)  # pyright: ignore[reportOptionalMemberAccess]
+            await self._pubsub.subscribe(self._auth_channel)  # pyright: ignore[reportOptionalMemberAccess]
 
             self._task = asyncio.create_task(self._listen_loop())
             self._started = True
-            logger.info("CacheInvalidationSubscriber started on channel '%s'", self._channel)
+            logger.info("CacheInvalidationSubscriber started on channels '%s', '%s'", self._channel, self._auth_channel)
 
         except Exception as e:
             logger.warning("CacheInvalidationSubscriber failed to start: %s", e)
@@ -637,12 +654,13 @@ class CacheInvalidationSubscriber:
 
         if self._pubsub:
             cleanup_timeout = _get_cleanup_timeout()
-            try:
-                await asyncio.wait_for(self._pubsub.unsubscribe(self._channel), timeout=cleanup_timeout)
-            except asyncio.TimeoutError:
-                logger.debug("Pubsub unsubscribe timed out - proceeding anyway")
-            except Exception as e:
-                logger.debug("Error unsubscribing from pubsub: %s", e)
+            for channel in (self._channel, self._auth_channel):
+                try:
+                    await asyncio.wait_for(self._pubsub.unsubscribe(channel), timeout=cleanup_timeout)
+                except asyncio.TimeoutError:
+                    logger.debug("Pubsub unsubscribe timed out - proceeding anyway")
+                except Exception as e:
+                    logger.debug("Error unsubscribing from pubsub: %s", e)
             try:
                 try:
                     await asyncio.wait_for(self._pubsub.aclose(), timeout=cleanup_timeout)
@@ -672,7 +690,12 @@ class CacheInvalidationSubscriber:
                         data = message.get("data")
                         if isinstance(data, bytes):
                             data = data.decode("utf-8")
-                        if data:
+                        channel = message.get("channel")
+                        if isinstance(channel, bytes):
+                            channel = channel.decode("utf-8")
+                        if data and channel == self._auth_channel:
+                            self._process_auth_invalidation(data)
+                        elif data:
                             await self._process_invalidation(data)
                 except asyncio.TimeoutError:
                     continue
@@ -707,6 +730,8 @@ class CacheInvalidationSubscriber:
                     keys_to_remove = [k for k in cache._cache if k.startswith(prefix)]  # pyright: ignore[reportPrivateUsage]
                     for key in keys_to_remove:
                         cache._cache.pop(key, None)  # pyright: ignore[reportPrivateUsage]
+                get_resource_access_cache().invalidate_type(cache_type)
+                get_list_response_cache().invalidate_type(cache_type)
                 logger.debug("CacheInvalidationSubscriber: Cleared local registry:%s cache (%d keys)", cache_type, len(keys_to_remove))
 
             elif message.startswith("tool_lookup:gateway:"):
@@ -753,6 +778,29 @@ class CacheInvalidationSubscriber:
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.warning("CacheInvalidationSubscriber: Error processing '%s': %s", message, e)
 
+    def _process_auth_invalidation(self, message: str) -> None:
+        """Process an auth cache invalidation message.
+
+        Only the compiled permission cache and the verified token cache are
+        cleared; the other AuthCache entries are short-lived and shared through Redis.
+
+        Args:
+            message: The invalidation message published by AuthCache
+        """
+        logger.debug("CacheInvalidationSubscriber received auth: %s", message)
+        try:
+            # First-Party
+            from mcpgateway.cache.permission_cache import process_invalidation_message  # pylint: disable=import-outside-toplevel
+
+            process_invalidation_message(message)
+            if message.startswith("revoke:"):
+                # First-Party
+                from mcpgateway.cache.verified_token_cache import get_verified_token_cache  # pylint: disable=import-outside-toplevel
+
+                get_verified_token_cache().invalidate_jti(message[len("revoke:") :])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("CacheInvalidationSubscriber: Error processing auth '%s': %s", message, e)
+
 
 # Global singleton for cache invalidation subscriber
 _cache_invalidation_subscriber: Optional[CacheInvalidationSubscriber] = None
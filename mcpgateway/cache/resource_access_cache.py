@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/resource_access_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Resource access cache for token scoping.
+
+``TokenScopingMiddleware`` checks the visibility, team and owner of the server,
+tool, resource, prompt or gateway addressed by every scoped request. This
+cache keeps those three columns per entity in memory so repeated requests to
+the same entity do not open a database session.
+
+Entries are dropped whenever the registry cache of the entity type is
+invalidated (every create/update/delete in the services does this), including
+in other workers through the ``registry:{type}`` pub/sub message, and expire
+after ``token_scoping_cache_ttl`` seconds.
+
+Examples:
+    >>> cache = ResourceAccessCache(ttl=30)
+    >>> cache.get("tool", "abc") is None
+    True
+    >>> cache.set("tool", "abc", ResourceScope("team", "team-1", "alice@example.com"))
+    >>> cache.get("tool", "abc").team_id
+    'team-1'
+    >>> cache.invalidate_type("tools")
+    >>> cache.get("tool", "abc") is None
+    True
+"""
+
+# Standard
+import logging
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Registry cache types (plural, as passed to RegistryCache.invalidate) -> resource types
+_REGISTRY_TYPES = {"servers": "server", "tools": "tool", "resources": "resource", "prompts": "prompt", "gateways": "gateway"}
+
+
+class ResourceScope(NamedTuple):
+    """Access-relevant columns of an entity."""
+
+    visibility: Optional[str]
+    team_id: Optional[str]
+    owner_email: Optional[str]
+
+
+# Cached marker for entities that do not exist
+NOT_FOUND = ResourceScope(None, None, None)
+
+
+class ResourceAccessCache:
+    """Thread-safe TTL cache of entity visibility/team/owner keyed by (type, id).
+
+    Examples:
+        >>> cache = ResourceAccessCache(ttl=30, max_size=2)
+        >>> for i in range(3):
+        ...     cache.set("server", str(i), NOT_FOUND)
+        >>> cache.stats()["size"]
+        2
+        >>> cache.get("server", "0") is None
+        True
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_size: Optional[int] = None, enabled: Optional[bool] = None):
+        """Initialize the resource access cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (default: from settings or 30)
+            max_size: Maximum number of entries (default: from settings or 10000)
+            enabled: Whether caching is enabled (default: from settings or True)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._ttl = ttl or getattr(settings, "token_scoping_cache_ttl", 30)
+            self._max_size = max_size or getattr(settings, "token_scoping_cache_max_entries", 10000)
+            self._enabled = enabled if enabled is not None else getattr(settings, "token_scoping_cache_enabled", True)
+        except ImportError:
+            self._ttl = ttl or 30
+            self._max_size = max_size or 10000
+            self._enabled = enabled if enabled is not None else True
+
+        self._cache: Dict[Tuple[str, str], Tuple[ResourceScope, float]] = {}
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            True if lookups and stores are active.
+        """
+        return self._enabled
+
+    def get(self, resource_type: str, resource_id: str) -> Optional[ResourceScope]:
+        """Return the cached scope of an entity.
+
+        Args:
+            resource_type: Entity type (server, tool, resource, prompt, gateway)
+            resource_id: Entity ID
+
+        Returns:
+            The cached scope (``NOT_FOUND`` for missing entities), or None on a miss.
+        """
+        if not self._enabled:
+            return None
+        entry = self._cache.get((resource_type, resource_id))
+        if entry is not None and entry[1] > time.monotonic():
+            self._hit_count += 1
+            return entry[0]
+        self._miss_count += 1
+        return None
+
+    def set(self, resource_type: str, resource_id: str, scope: ResourceScope) -> None:
+        """Cache the scope of an entity.
+
+        Args:
+            resource_type: Entity type
+            resource_id: Entity ID
+            scope: Scope loaded from the database, or ``NOT_FOUND``
+        """
+        if not self._enabled:
+            return
+        with self._lock:
+            if len(self._cache) >= self._max_size:
+                # Dicts keep insertion order: drop the oldest entry
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[(resource_type, resource_id)] = (scope, time.monotonic() + self._ttl)
+
+    def invalidate_type(self, cache_type: str) -> None:
+        """Drop all entries of an entity type.
+
+        Args:
+            cache_type: Registry cache type (``tools``, ``servers``, ...) or resource type (``tool``, ...)
+        """
+        resource_type = _REGISTRY_TYPES.get(cache_type, cache_type)
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == resource_type]:
+                del self._cache[key]
+        logger.debug(f"ResourceAccessCache: Invalidated {resource_type} entries")
+
+    def invalidate_all(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate and size
+
+        Examples:
+            >>> ResourceAccessCache().stats()["hit_rate"]
+            0.0
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "size": len(self._cache),
+            "max_size": self._max_size,
+            "ttl": self._ttl,
+        }
+
+
+# Global singleton instance
+_resource_access_cache: Optional[ResourceAccessCache] = None
+
+
+def get_resource_access_cache() -> ResourceAccessCache:
+    """Get or create the singleton ResourceAccessCache instance.
+
+    Returns:
+        ResourceAccessCache: The singleton resource access cache instance
+
+    Examples:
+        >>> get_resource_access_cache() is get_resource_access_cache()
+        True
+    """
+    global _resource_access_cache  # pylint: disable=global-statement
+    if _resource_access_cache is None:
+        _resource_access_cache = ResourceAccessCache()
+    return _resource_access_cache
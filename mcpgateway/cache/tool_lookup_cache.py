@@ -4,6 +4,12 @@
 This cache targets the hot-path tool lookup in ToolService.invoke_tool by
 avoiding a DB query per tool invocation. It uses a per-worker in-memory
 cache with TTL and optional Redis backing for distributed deployments.
+
+Cached tool payloads carry a content hash of their input and output schemas
+(``input_schema_version``/``output_schema_version``). Compiled schema
+validators cannot be serialized to Redis, so they are kept per worker next to
+L1, keyed by tool id and schema kind, and recompiled only when the version
+changes.
 """
 
 # Future
@@ -15,7 +21,7 @@ from dataclasses import dataclass
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # Third-Party
 import orjson
@@ -67,6 +73,7 @@ class ToolLookupCache:
             self._cache_prefix = "mcpgw:"
 
         self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._validators: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
         self._lock = threading.Lock()
 
         self._redis_checked = False
@@ -76,6 +83,8 @@ class ToolLookupCache:
         self._l1_miss_count = 0
         self._l2_hit_count = 0
         self._l2_miss_count = 0
+        self._validator_hit_count = 0
+        self._validator_compile_count = 0
 
         logger.info(
             "ToolLookupCache initialized: enabled=%s l1_max=%s ttl=%ss l2_enabled=%s",
@@ -300,10 +309,55 @@ class ToolLookupCache:
         except Exception as exc:
             logger.debug("ToolLookupCache Redis invalidate_gateway failed: %s", exc)
 
+    def get_validator(self, tool_id: str, kind: str, version: str, compile_validator: Callable[[], Any]) -> Any:
+        """Return the compiled schema validator of a tool, compiling it on first use.
+
+        Only one validator is kept per tool and schema kind: a different
+        version (the schema changed) replaces the previous one.
+
+        Args:
+            tool_id: Tool ID.
+            kind: Schema kind (``input`` or ``output``).
+            version: Schema version from the cached tool payload.
+            compile_validator: Callable compiling the validator on a miss.
+
+        Returns:
+            The compiled validator.
+
+        Examples:
+            >>> cache = ToolLookupCache()
+            >>> first = cache.get_validator("t1", "input", "v1", object)
+            >>> cache.get_validator("t1", "input", "v1", object) is first
+            True
+            >>> cache.get_validator("t1", "input", "v2", object) is first
+            False
+            >>> stats = cache.stats()
+            >>> stats["validator_count"], stats["validator_hit_count"], stats["validator_compile_count"]
+            (1, 1, 2)
+        """
+        key = (tool_id, kind)
+        with self._lock:
+            entry = self._validators.get(key)
+            if entry and entry[0] == version:
+                self._validators.move_to_end(key)
+                self._validator_hit_count += 1
+                return entry[1]
+
+        # Compile outside the lock; a concurrent compile of the same schema is harmless
+        validator = compile_validator()
+        with self._lock:
+            self._validators[key] = (version, validator)
+            self._validators.move_to_end(key)
+            while len(self._validators) > self._l1_maxsize:
+                self._validators.popitem(last=False)
+            self._validator_compile_count += 1
+        return validator
+
     def invalidate_all_local(self) -> None:
-        """Clear all L1 cache entries."""
+        """Clear all L1 cache entries and compiled validators."""
         with self._lock:
             self._cache.clear()
+            self._validators.clear()
 
     def stats(self) -> Dict[str, Any]:
         """Return cache hit/miss statistics and configuration.
@@ -327,6 +381,9 @@ class ToolLookupCache:
             "negative_ttl_seconds": self._negative_ttl_seconds,
             "l2_enabled": self._l2_enabled,
             "redis_available": self._redis_available,
+            "validator_count": len(self._validators),
+            "validator_hit_count": self._validator_hit_count,
+            "validator_compile_count": self._validator_compile_count,
         }
 
     def reset_stats(self) -> None:
@@ -335,6 +392,8 @@ class ToolLookupCache:
         self._l1_miss_count = 0
         self._l2_hit_count = 0
         self._l2_miss_count = 0
+        self._validator_hit_count = 0
+        self._validator_compile_count = 0
 
 
 tool_lookup_cache = ToolLookupCache()
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/cache/verified_token_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Verified JWT cache.
+
+``verify_jwt_token_cached`` only reuses a verified payload within one request,
+so every request pays the full signature check (expensive for RS256/ES256).
+This module keeps a bounded, process-wide LRU of verified claims keyed by a
+keyed BLAKE2b digest of the token (raw tokens are never stored).
+
+Security Considerations:
+    - Entries never outlive the token's ``exp`` claim, nor ``jwt_verify_cache_max_ttl``
+    - Revocation is honoured: a locally known revoked ``jti`` is never served, and
+      ``AuthCache.is_token_revoked`` is re-consulted every ``auth_cache_revocation_ttl``
+      seconds per entry. Revocations, the startup revocation sync and ``revoke:``
+      messages from other workers evict entries immediately.
+    - Callers receive a deep copy of the payload, so cached claims (including nested
+      ones such as ``teams``) cannot be mutated
+    - ``clear_jwt_caches()`` (key rotation, config reload) clears the cache
+
+Examples:
+    >>> import asyncio, time
+    >>> cache = VerifiedTokenCache(max_size=2, max_ttl=60, enabled=True)
+    >>> cache.set("token-a", {"sub": "alice", "jti": "j1", "exp": time.time() + 30})
+    >>> asyncio.run(cache.get("token-a"))["sub"]
+    'alice'
+    >>> cache.invalidate_jti("j1")
+    >>> asyncio.run(cache.get("token-a")) is None
+    True
+    >>> cache.stats()["hit_count"], cache.stats()["miss_count"]
+    (1, 1)
+"""
+
+# Standard
+from collections import OrderedDict
+import copy
+import hashlib
+import logging
+import secrets
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _VerifiedToken:
+    """Cached claims of one verified token."""
+
+    __slots__ = ("payload", "jti", "expires_at", "checked_at")
+
+    def __init__(self, payload: Dict[str, Any], jti: Optional[str], expires_at: float, checked_at: float):
+        """Create an entry.
+
+        Args:
+            payload: Verified claims
+            jti: Token ID used for revocation checks
+            expires_at: Wall-clock time after which the entry is invalid
+            checked_at: Wall-clock time of the last revocation check
+        """
+        self.payload = payload
+        self.jti = jti
+        self.expires_at = expires_at
+        self.checked_at = checked_at
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified JWT claims that honours ``exp`` and revocation.
+
+    Examples:
+        >>> import asyncio
+        >>> cache = VerifiedTokenCache(max_size=2, max_ttl=60, enabled=True)
+        >>> for name in ("a", "b", "c"):
+        ...     cache.set(name, {"sub": name})
+        >>> asyncio.run(cache.get("a")) is None, asyncio.run(cache.get("c"))
+        (True, {'sub': 'c'})
+        >>> cache.set("expired", {"sub": "x", "exp": 1})
+        >>> cache.stats()["size"]
+        2
+    """
+
+    def __init__(self, max_size: Optional[int] = None, max_ttl: Optional[int] = None, enabled: Optional[bool] = None, revocation_check_interval: Optional[int] = None):
+        """Initialize the verified token cache.
+
+        Args:
+            max_size: Maximum number of cached tokens (default: from settings or 10000)
+            max_ttl: Maximum seconds a token stays cached (default: from settings or 300)
+            enabled: Whether caching is enabled (default: from settings or True)
+            revocation_check_interval: Seconds between revocation re-checks of an entry
+                (default: auth_cache_revocation_ttl or 30)
+        """
+        try:
+            # First-Party
+            from mcpgateway.config import settings  # pylint: disable=import-outside-toplevel
+
+            self._max_size = max_size or getattr(settings, "jwt_verify_cache_max_size", 10000)
+            self._max_ttl = max_ttl or getattr(settings, "jwt_verify_cache_max_ttl", 300)
+            self._enabled = enabled if enabled is not None else getattr(settings, "jwt_verify_cache_enabled", True)
+            self._revocation_check_interval = revocation_check_interval or getattr(settings, "auth_cache_revocation_ttl", 30)
+        except ImportError:
+            self._max_size = max_size or 10000
+            self._max_ttl = max_ttl or 300
+            self._enabled = enabled if enabled is not None else True
+            self._revocation_check_interval = revocation_check_interval or 30
+
+        # Per-process key: digests cannot be precomputed or collided from outside
+        self._digest_key = secrets.token_bytes(32)
+        self._entries: "OrderedDict[bytes, _VerifiedToken]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hit_count = 0
+        self._miss_count = 0
+        self._expired_count = 0
+        self._revoked_count = 0
+        self._eviction_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            True if lookups and stores are active.
+        """
+        return self._enabled
+
+    def _digest(self, token: str) -> bytes:
+        """Return the cache key of a token.
+
+        Args:
+            token: Raw JWT
+
+        Returns:
+            Keyed 32-byte BLAKE2b digest
+        """
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=32, key=self._digest_key).digest()
+
+    async def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the verified claims of a token, if cached and still valid.
+
+        Args:
+            token: Raw JWT
+
+        Returns:
+            A deep copy of the cached claims, or None when the token must be verified.
+        """
+        if not self._enabled:
+            return None
+
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._miss_count += 1
+            return None
+
+        now = time.time()
+        if now >= entry.expires_at:
+            self._drop(key)
+            self._expired_count += 1
+            self._miss_count += 1
+            return None
+
+        if entry.jti and await self._is_revoked(entry, now):
+            self._drop(key)
+            self._revoked_count += 1
+            self._miss_count += 1
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        self._hit_count += 1
+        return copy.deepcopy(entry.payload)
+
+    async def _is_revoked(self, entry: _VerifiedToken, now: float) -> bool:
+        """Check the revocation status of a cached token.
+
+        Args:
+            entry: Cached token with a jti
+            now: Current wall-clock time
+
+        Returns:
+            True if the token is known to be revoked.
+        """
+        # First-Party
+        from mcpgateway.cache.auth_cache import get_auth_cache  # pylint: disable=import-outside-toplevel
+
+        auth_cache = get_auth_cache()
+        if auth_cache.is_token_revoked_sync(entry.jti):
+            return True
+        if now - entry.checked_at < self._revocation_check_interval:
+            return False
+        revoked = await auth_cache.is_token_revoked(entry.jti)
+        entry.checked_at = now
+        return bool(revoked)
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache the claims of a freshly verified token.
+
+        Args:
+            token: Raw JWT
+            payload: Claims returned by signature verification
+        """
+        if not self._enabled:
+            return
+
+        now = time.time()
+        expires_at = now + self._max_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        if expires_at <= now:
+            return
+
+        key = self._digest(token)
+        entry = _VerifiedToken(copy.deepcopy(payload), payload.get("jti"), expires_at, now)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._eviction_count += 1
+
+    def _drop(self, key: bytes) -> None:
+        """Remove an entry.
+
+        Args:
+            key: Token digest
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_jti(self, jti: str) -> None:
+        """Evict all cached tokens with a given jti (token revoked).
+
+        Args:
+            jti: JWT ID
+        """
+        self.invalidate_jtis((jti,))
+
+    def invalidate_jtis(self, jtis: Iterable[str]) -> None:
+        """Evict all cached tokens whose jti is in ``jtis``.
+
+        Args:
+            jtis: JWT IDs
+        """
+        revoked = set(jtis)
+        if not revoked:
+            return
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.jti in revoked]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            logger.debug(f"VerifiedTokenCache: Evicted {len(keys)} revoked token(s)")
+
+    def clear(self) -> None:
+        """Drop every entry (key rotation, configuration change)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts, hit rate, evictions and size
+
+        Examples:
+            >>> VerifiedTokenCache(enabled=True).stats()["size"]
+            0
+        """
+        total = self._hit_count + self._miss_count
+        return {
+            "enabled": self._enabled,
+            "hit_count": self._hit_count,
+            "miss_count": self._miss_count,
+            "hit_rate": self._hit_count / total if total > 0 else 0.0,
+            "expired_count": self._expired_count,
+            "revoked_count": self._revoked_count,
+            "eviction_count": self._eviction_count,
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "max_ttl": self._max_ttl,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters."""
+        self._hit_count = 0
+        self._miss_count = 0
+        self._expired_count = 0
+        self._revoked_count = 0
+        self._eviction_count = 0
+
+
+# Global singleton instance
+_verified_token_cache: Optional[VerifiedTokenCache] = None
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Get or create the singleton VerifiedTokenCache instance.
+
+    Returns:
+        VerifiedTokenCache: The singleton verified token cache instance
+
+    Examples:
+        >>> get_verified_token_cache() is get_verified_token_cache()
+        True
+    """
+    global _verified_token_cache  # pylint: disable=global-statement
+    if _verified_token_cache is None:
+        _verified_token_cache = VerifiedTokenCache()
+    return _verified_token_cache
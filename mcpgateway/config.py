@@ -1062,7 +1062,7 @@ class Settings(BaseSettings):
     observability_max_traces: int = Field(default=100000, ge=1000, description="Maximum number of traces to retain")
 
     # Sample rate (0.0 to 1.0) - 1.0 means trace everything
-    observability_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="Trace sampling rate (0.0-1.0)")
+    observability_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="Trace sampling rate (0.0-1.0), decided when a trace starts (requires the span recorder)")
 
     # Include paths for tracing (regex patterns)
     observability_include_paths: List[str] = Field(
@@ -1091,6 +1091,15 @@ class Settings(BaseSettings):
     # Enable span events
     observability_events_enabled: bool = Field(default=True, description="Enable event logging within spans")
 
+    # Write-behind span recorder (batched trace writes with head/tail sampling)
+    observability_buffer_enabled: bool = Field(default=False, description="Assemble traces in memory and write finished traces in background batches instead of committing every span")
+    observability_buffer_batch_size: int = Field(default=200, ge=1, description="Traces per bulk insert; a full batch triggers a flush")
+    observability_buffer_flush_interval: float = Field(default=2.0, gt=0, description="Maximum seconds between trace flushes")
+    observability_buffer_max_traces: int = Field(default=10000, ge=1, description="Maximum traces held in memory; new traces beyond this are dropped")
+    observability_buffer_trace_timeout: float = Field(default=300.0, gt=0, description="Seconds after which an unfinished trace is written as is")
+    observability_tail_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="Fraction of successful, fast finished traces kept (errors and slow traces are always kept)")
+    observability_tail_slow_threshold_ms: float = Field(default=1000.0, ge=0, description="Finished traces at least this slow (ms) are always kept")
+
     # Correlation ID Settings
     correlation_id_enabled: bool = Field(default=True, description="Enable automatic correlation ID tracking for requests")
     correlation_id_header: str = Field(default="X-Correlation-ID", description="HTTP header name for correlation ID")
@@ -1113,6 +1122,15 @@ class Settings(BaseSettings):
     structured_logging_enabled: bool = Field(default=True, description="Enable structured JSON logging with database persistence")
     structured_logging_database_enabled: bool = Field(default=False, description="Persist structured logs to database (enables /api/logs/* endpoints, impacts performance)")
     structured_logging_external_enabled: bool = Field(default=False, description="Send logs to external systems")
+    structured_logging_batch_enabled: bool = Field(default=True, description="Write structured logs to the database in background batches instead of one transaction per entry")
+    structured_logging_batch_size: int = Field(default=500, ge=1, description="Maximum log entries per bulk insert; queuing this many triggers a flush")
+    structured_logging_flush_interval: float = Field(default=1.0, gt=0, description="Maximum seconds between structured log flushes")
+    structured_logging_queue_max_size: int = Field(default=10000, ge=1, description="Maximum structured log entries queued before the overflow policy applies")
+    structured_logging_overflow_policy: Literal["drop_debug_first", "sample", "block"] = Field(
+        default="drop_debug_first", description="What to do with new log entries when the queue is full: drop_debug_first, sample or block"
+    )
+    structured_logging_overflow_sample_rate: float = Field(default=0.1, ge=0.0, le=1.0, description="Fraction of new entries kept when the queue is full (sample policy)")
+    structured_logging_block_timeout: float = Field(default=1.0, ge=0, description="Seconds a log call waits for queue space before dropping the entry (block policy)")
 
     # Performance Tracking Configuration
     performance_tracking_enabled: bool = Field(default=True, description="Enable performance tracking and metrics")
@@ -1121,6 +1139,9 @@ class Settings(BaseSettings):
     performance_threshold_resource_read_ms: float = Field(default=1000.0, description="Alert threshold for resource reads (ms)")
     performance_threshold_http_request_ms: float = Field(default=500.0, description="Alert threshold for HTTP requests (ms)")
     performance_degradation_multiplier: float = Field(default=1.5, description="Alert if performance degrades by this multiplier vs baseline")
+    performance_sketch_sync_interval: int = Field(
+        default=0, ge=0, le=3600, description="Seconds between publishing per-operation latency sketches to Redis for cluster-wide performance summaries (0 disables)"
+    )
 
     # Audit Trail Configuration
     # Audit trail logging is disabled by default for performance.
@@ -1155,6 +1176,11 @@ class Settings(BaseSettings):
     metrics_aggregation_backfill_hours: int = Field(default=6, ge=0, le=168, description="Hours of structured logs to backfill into performance metrics on startup")
     metrics_aggregation_window_minutes: int = Field(default=5, description="Time window for metrics aggregation (minutes)")
     metrics_aggregation_auto_start: bool = Field(default=False, description="Automatically run the log aggregation loop on application startup")
+    metrics_aggregation_incremental_enabled: bool = Field(
+        default=False,
+        description="Record per-minute duration sketches as structured logs are written and roll recent windows up from them instead of rescanning logs (single-worker deployments)",
+    )
+    metrics_aggregation_sketch_retention_minutes: int = Field(default=60, ge=1, le=1440, description="Minutes of per-minute duration sketches kept in memory for incremental aggregation")
     yield_batch_size: int = Field(
         default=1000,
         ge=100,
@@ -1177,6 +1203,13 @@ class Settings(BaseSettings):
     metrics_buffer_enabled: bool = Field(default=True, description="Enable buffered metrics writes (reduces DB pressure under load)")
     metrics_buffer_flush_interval: int = Field(default=60, ge=5, le=300, description="Seconds between automatic metrics buffer flushes")
     metrics_buffer_max_size: int = Field(default=1000, ge=100, le=10000, description="Maximum buffered metrics before forced flush")
+    metrics_buffer_spool_dir: str = Field(default="", description="Directory where metric batches that failed to flush are kept for retry (empty: <tmp>/mcpgateway-metrics-spool)")
+    metrics_buffer_spool_max_mb: int = Field(default=64, ge=0, le=4096, description="Maximum size of the metrics retry spool in MB (0 disables it; failed batches are dropped)")
+    metrics_preaggregation_enabled: bool = Field(
+        default=False,
+        description="Aggregate execution metrics in-process per entity and minute and merge them into the hourly rollup tables (requires METRICS_BUFFER_ENABLED); raw metric rows are only sampled",
+    )
+    metrics_preaggregation_raw_sample_rate: float = Field(default=0.01, ge=0.0, le=1.0, description="Fraction of executions still written as raw metric rows when metrics pre-aggregation is enabled")
 
     # Metrics Cache Configuration (for caching aggregate metrics queries)
     metrics_cache_enabled: bool = Field(default=True, description="Enable in-memory caching for aggregate metrics queries")
@@ -1207,6 +1240,15 @@ class Settings(BaseSettings):
     auth_cache_teams_enabled: bool = Field(default=True, description="Enable caching for get_user_teams() (default: true)")
     auth_cache_teams_ttl: int = Field(default=60, ge=10, le=300, description="TTL in seconds for user teams list cache")
     auth_cache_batch_queries: bool = Field(default=True, description="Batch auth DB queries into single call (reduces 3 queries to 1)")
+    permission_cache_enabled: bool = Field(default=True, description="Share compiled RBAC permission sets and admin flags across requests in each worker")
+    permission_cache_ttl: int = Field(default=60, ge=5, le=3600, description="TTL in seconds for cached permission sets (invalidated early on role, team and user changes)")
+    permission_cache_max_entries: int = Field(default=10000, ge=100, le=1000000, description="Maximum number of cached (user, team) permission sets per worker")
+    token_scoping_cache_enabled: bool = Field(default=True, description="Cache compiled token scopes (per jti) and entity visibility lookups in token scoping")
+    token_scoping_cache_ttl: int = Field(default=30, ge=1, le=3600, description="TTL in seconds for cached entity visibility/team/owner used by token scoping")
+    token_scoping_cache_max_entries: int = Field(default=10000, ge=100, le=1000000, description="Maximum compiled token scopes and cached entity lookups per worker")
+    jwt_verify_cache_enabled: bool = Field(default=True, description="Cache verified JWT claims across requests, keyed by a token digest, until exp or revocation")
+    jwt_verify_cache_max_size: int = Field(default=10000, ge=100, le=1000000, description="Maximum number of verified tokens cached per worker")
+    jwt_verify_cache_max_ttl: int = Field(default=300, ge=1, le=86400, description="Maximum seconds a verified token stays cached, even if its exp is later")
 
     # Registry Cache Configuration (reduces DB queries for list endpoints)
     registry_cache_enabled: bool = Field(default=True, description="Enable caching for registry list endpoints (tools, prompts, resources, etc.)")
@@ -1217,6 +1259,9 @@ class Settings(BaseSettings):
     registry_cache_servers_ttl: int = Field(default=20, ge=5, le=300, description="TTL in seconds for servers list cache")
     registry_cache_gateways_ttl: int = Field(default=20, ge=5, le=300, description="TTL in seconds for gateways list cache")
     registry_cache_catalog_ttl: int = Field(default=300, ge=60, le=600, description="TTL in seconds for catalog servers list cache (external catalog, changes infrequently)")
+    list_response_cache_enabled: bool = Field(default=True, description="Cache pre-serialized tools/list, prompts/list and resources/list results per caller scope")
+    list_response_cache_ttl: int = Field(default=20, ge=1, le=3600, description="TTL in seconds for cached list results (entries are also dropped on registry invalidation)")
+    list_response_cache_max_entries: int = Field(default=1000, ge=10, le=100000, description="Maximum cached list results per worker")
 
     # Tool Lookup Cache Configuration (reduces hot-path DB lookups in invoke_tool)
     tool_lookup_cache_enabled: bool = Field(default=True, description="Enable tool lookup cache (tool name -> tool config)")
@@ -1225,6 +1270,16 @@ class Settings(BaseSettings):
     tool_lookup_cache_l1_maxsize: int = Field(default=10000, ge=100, le=1000000, description="Max entries for in-memory tool lookup cache (L1)")
     tool_lookup_cache_l2_enabled: bool = Field(default=True, description="Enable Redis-backed tool lookup cache (L2) when cache_type=redis")
 
+    # Tool Schema Validation (validators are compiled once per tool and schema version)
+    tool_input_validation_enabled: bool = Field(default=False, description="Validate tool call arguments against the tool input schema before invocation")
+    tool_schema_validator_backend: Literal["jsonschema", "fastjsonschema"] = Field(
+        default="jsonschema", description="Backend for compiled tool schema validators (fastjsonschema generates Python code and requires the fastjsonschema package)"
+    )
+
+    # Request Coalescing (identical concurrent upstream calls share one in-flight request)
+    tool_coalescing_enabled: bool = Field(default=False, description="Coalesce identical concurrent calls to tools annotated readOnlyHint or idempotentHint")
+    resource_coalescing_enabled: bool = Field(default=False, description="Coalesce identical concurrent resources/read calls to gateway resources")
+
     # Admin Stats Cache Configuration (reduces dashboard query overhead)
     admin_stats_cache_enabled: bool = Field(default=True, description="Enable caching for admin dashboard statistics")
     admin_stats_cache_system_ttl: int = Field(default=60, ge=10, le=300, description="TTL in seconds for system stats cache")
@@ -1395,6 +1450,21 @@ class Settings(BaseSettings):
     # time - only cleanup of idle/released sessions. Increase if you see frequent
     # "cleanup timed out" warnings; decrease for faster recovery from spin loops.
     mcp_session_pool_cleanup_timeout: float = 5.0
+    # Max sessions in use per upstream URL across all users and gateways (0 = unlimited).
+    # Requests over the limit queue fairly per identity instead of one user starving others.
+    mcp_session_pool_upstream_max_concurrency: int = 0
+    # Adapt the upstream limit with AIMD: shrink when latency exceeds the tolerance times
+    # its smoothed baseline or sessions fail, grow back while requests are queued.
+    # Requires mcp_session_pool_upstream_max_concurrency > 0 (used as the upper bound).
+    mcp_session_pool_adaptive_concurrency: bool = False
+    mcp_session_pool_adaptive_min_concurrency: int = 1
+    mcp_session_pool_adaptive_latency_tolerance: float = 2.0
+    # Pre-warm sessions at startup for the N gateways with the most tool calls in the last 24h (0 = off).
+    # Sessions are created for each identity in mcp_session_pool_prewarm_identities
+    # (user emails; empty = anonymous) with the gateway's static auth headers.
+    mcp_session_pool_prewarm_gateways: int = 0
+    mcp_session_pool_prewarm_sessions: int = 1
+    mcp_session_pool_prewarm_identities: List[str] = []
 
     # Timeout for SSE task group cleanup (seconds).
     # When an SSE connection is cancelled, this controls how long to wait for
@@ -1562,6 +1632,16 @@ class Settings(BaseSettings):
     # streamable http transport
     use_stateful_sessions: bool = False  # Set to False to use stateless sessions without event store
     json_response_enabled: bool = True  # Enable JSON responses instead of SSE streams
+    streamable_http_event_store: Literal["memory", "redis"] = Field(
+        default="memory", description="Event store for resumable stateful sessions: memory (per worker) or redis (shared, requires CACHE_TYPE=redis)"
+    )
+    streamable_http_max_events_per_stream: int = Field(default=100, ge=1, description="Maximum number of events kept per stream for Last-Event-ID replay")
+    streamable_http_max_bytes_per_stream: int = Field(default=1_048_576, ge=0, description="Maximum serialized bytes kept per stream by the memory event store (0 = count limit only)")
+    streamable_http_event_ttl: int = Field(default=3600, ge=1, description="Seconds a Redis event stream is kept after its last event")
+
+    # JSON-RPC batches (/rpc and streamable HTTP)
+    jsonrpc_batch_max_size: int = Field(default=50, ge=0, le=1000, description="Maximum number of entries in a JSON-RPC batch request (0 disables batches)")
+    jsonrpc_batch_max_concurrency: int = Field(default=8, ge=1, le=100, description="Maximum number of entries of one JSON-RPC batch executed concurrently")
 
     # Core plugin settings
     plugins_enabled: bool = Field(default=False, description="Enable the plugin framework")
@@ -2204,6 +2204,7 @@ class ToolMetricsHourly(Base):
         p50_response_time: 50th percentile (median) response time.
         p95_response_time: 95th percentile response time.
         p99_response_time: 99th percentile response time.
+        latency_histogram: Mergeable latency sketch (set by in-process pre-aggregation).
         created_at: When this rollup was created.
     """
 
@@ -2226,6 +2227,7 @@ class ToolMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latency_histogram: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2251,6 +2253,7 @@ class ResourceMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latency_histogram: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2276,6 +2279,7 @@ class PromptMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latency_histogram: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2301,6 +2305,7 @@ class ServerMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latency_histogram: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
@@ -2327,6 +2332,7 @@ class A2AAgentMetricsHourly(Base):
     p50_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p95_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     p99_response_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    latency_histogram: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
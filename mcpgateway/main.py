@@ -28,10 +28,11 @@ Structure:
 
 # Standard
 import asyncio
-from contextlib import asynccontextmanager, suppress
+from contextlib import asynccontextmanager, contextmanager, suppress
 from datetime import datetime, timezone
 from functools import lru_cache
 import hashlib
+import math
 import os as _os  # local alias to avoid collisions
 import sys
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
@@ -67,6 +68,7 @@ from mcpgateway.admin import admin_router, set_logging_service
 from mcpgateway.auth import _check_token_revoked_sync, _lookup_api_token_sync, get_current_user, normalize_token_teams
 from mcpgateway.bootstrap_db import main as bootstrap_db
 from mcpgateway.cache import ResourceCache, SessionRegistry
+from mcpgateway.cache.list_response_cache import CachedListResponse, etag_matches, get_list_response_cache, serialize_result
 from mcpgateway.common.models import InitializeResult
 from mcpgateway.common.models import JSONRPCError as PydanticJSONRPCError
 from mcpgateway.common.models import ListResourceTemplatesResult, LogLevel, Root
@@ -84,7 +86,7 @@ from mcpgateway.middleware.security_headers import SecurityHeadersMiddleware
 from mcpgateway.middleware.token_scoping import token_scoping_middleware
 from mcpgateway.middleware.validation_middleware import ValidationMiddleware
 from mcpgateway.observability import init_telemetry
-from mcpgateway.plugins.framework import PluginError, PluginManager, PluginViolationError
+from mcpgateway.plugins.framework import PluginError, PluginManager, PluginViolation, PluginViolationError
 from mcpgateway.routers.server_well_known import router as server_well_known_router
 from mcpgateway.routers.well_known import router as well_known_router
 from mcpgateway.schemas import (
@@ -142,6 +144,7 @@ from mcpgateway.transports.sse_transport import SSETransport
 from mcpgateway.transports.streamablehttp_transport import SessionManagerWrapper, streamable_http_auth
 from mcpgateway.utils.db_isready import wait_for_db_ready
 from mcpgateway.utils.error_formatter import ErrorFormatter
+from mcpgateway.utils.jsonrpc_batch import check_batch, error_response, execute_batch
 from mcpgateway.utils.metadata_capture import MetadataCapture
 from mcpgateway.utils.orjson_response import ORJSONResponse
 from mcpgateway.utils.passthrough_headers import set_global_passthrough_headers
@@ -640,6 +643,10 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             # Configurable health check chain - ordered list of methods to try.
             health_check_methods=settings.mcp_session_pool_health_check_methods,
             health_check_timeout_seconds=settings.mcp_session_pool_health_check_timeout,
+            upstream_max_concurrency=settings.mcp_session_pool_upstream_max_concurrency,
+            adaptive_concurrency=settings.mcp_session_pool_adaptive_concurrency,
+            adaptive_min_concurrency=settings.mcp_session_pool_adaptive_min_concurrency,
+            adaptive_latency_tolerance=settings.mcp_session_pool_adaptive_latency_tolerance,
         )
         logger.info("MCP session pool initialized")
 
@@ -717,6 +724,29 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             else:
                 logger.info("Metrics buffer service initialized (recording disabled)")
 
+        # Publish performance sketches to Redis for cluster-wide summaries
+        if settings.performance_tracking_enabled and settings.performance_sketch_sync_interval:
+            # First-Party
+            from mcpgateway.services.performance_tracker import get_performance_tracker  # pylint: disable=import-outside-toplevel
+
+            await get_performance_tracker().start()
+
+        # Initialize write-behind span recorder for observability traces
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.observability_service import get_span_recorder  # pylint: disable=import-outside-toplevel
+
+            await get_span_recorder().start()
+            logger.info("Observability span recorder initialized")
+
+        # Initialize batched writer for structured log persistence
+        if settings.structured_logging_database_enabled and settings.structured_logging_batch_enabled:
+            # First-Party
+            from mcpgateway.services.structured_logger import get_structured_log_writer  # pylint: disable=import-outside-toplevel
+
+            await get_structured_log_writer().start()
+            logger.info("Structured log writer initialized")
+
         # Initialize metrics cleanup service for automatic deletion of old metrics
         if settings.metrics_cleanup_enabled:
             # First-Party
@@ -898,6 +928,27 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             metrics_cleanup_service = get_metrics_cleanup_service()
             services_to_shutdown.insert(2, metrics_cleanup_service)
 
+        # Publish the final performance sketches
+        if settings.performance_tracking_enabled and settings.performance_sketch_sync_interval:
+            # First-Party
+            from mcpgateway.services.performance_tracker import get_performance_tracker  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.append(get_performance_tracker())
+
+        # Write buffered traces after the services that record spans have stopped
+        if settings.observability_enabled and settings.observability_buffer_enabled:
+            # First-Party
+            from mcpgateway.services.observability_service import get_span_recorder  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.append(get_span_recorder())
+
+        # Flush queued structured logs last so shutdown logs of other services are persisted
+        if settings.structured_logging_database_enabled and settings.structured_logging_batch_enabled:
+            # First-Party
+            from mcpgateway.services.structured_logger import get_structured_log_writer  # pylint: disable=import-outside-toplevel
+
+            services_to_shutdown.append(get_structured_log_writer())
+
         await shutdown_services(services_to_shutdown)
 
         # Shutdown MCP session pool (before shared HTTP client)
@@ -1198,6 +1249,28 @@ async def database_exception_handler(_request: Request, exc: IntegrityError):
     return ORJSONResponse(status_code=409, content=ErrorFormatter.format_database_error(exc))
 
 
+def _retry_after_headers(violation: Optional[PluginViolation]) -> Optional[Dict[str, str]]:
+    """Build the ``Retry-After`` header of a violation that tells when to retry (e.g. a rate limit).
+
+    Args:
+        violation: The plugin violation, if any.
+
+    Returns:
+        The headers to add to the response, or None.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework.models import PluginViolation
+        >>> _retry_after_headers(PluginViolation(reason="r", description="d", code="RATE_LIMIT", details={"retry_after": 1.2}))
+        {'Retry-After': '2'}
+        >>> _retry_after_headers(PluginViolation(reason="r", description="d", code="DENIED")) is None
+        True
+    """
+    retry_after = (violation.details or {}).get("retry_after") if violation else None
+    if not isinstance(retry_after, (int, float)) or retry_after <= 0:
+        return None
+    return {"Retry-After": str(math.ceil(retry_after))}
+
+
 @app.exception_handler(PluginViolationError)
 async def plugin_violation_exception_handler(_request: Request, exc: PluginViolationError):
     """Handle plugins violations globally.
@@ -1254,7 +1327,7 @@ async def plugin_violation_exception_handler(_request: Request, exc: PluginViola
         if exc.violation.plugin_name:
             violation_details["plugin_name"] = exc.violation.plugin_name
     json_rpc_error = PydanticJSONRPCError(code=status_code, message="Plugin Violation: " + message, data=violation_details)
-    return ORJSONResponse(status_code=200, content={"error": json_rpc_error.model_dump()})
+    return ORJSONResponse(status_code=200, content={"error": json_rpc_error.model_dump()}, headers=_retry_after_headers(exc.violation))
 
 
 @app.exception_handler(PluginError)
@@ -4704,7 +4777,7 @@ async def get_prompt(
         logger.error(f"Could not retrieve prompt {prompt_id}: {ex}")
         if isinstance(ex, PluginViolationError):
             # Return the actual plugin violation message
-            return ORJSONResponse(content={"message": ex.message, "details": str(ex.violation) if hasattr(ex, "violation") else None}, status_code=422)
+            return ORJSONResponse(content={"message": ex.message, "details": str(ex.violation) if hasattr(ex, "violation") else None}, status_code=422, headers=_retry_after_headers(ex.violation))
         if isinstance(ex, (ValueError, PromptError)):
             # Return the actual error message
             return ORJSONResponse(content={"message": str(ex)}, status_code=422)
@@ -5395,8 +5468,181 @@ async def subscribe_roots_changes(
 async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user_with_permissions)):
     """Handle RPC requests.
 
+    The body is either a single JSON-RPC request object or a batch array, whose
+    entries are executed concurrently (see :func:`_handle_rpc_batch`).
+
+    Args:
+        request (Request): The incoming FastAPI request.
+        db (Session): Database session.
+        user: The authenticated user (dict with RBAC context).
+
+    Returns:
+        Response with the RPC result or error, or an array of them for a batch.
+    """
+    # Extract user identifier from either RBAC user object or JWT payload
+    if hasattr(user, "email"):
+        user_id = getattr(user, "email", None)  # RBAC user object
+    elif isinstance(user, dict):
+        user_id = user.get("sub") or user.get("email") or user.get("username", "unknown")  # JWT payload
+    else:
+        user_id = str(user)  # String username from basic auth
+
+    logger.debug(f"User {user_id} made an RPC request")
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return ORJSONResponse(
+            status_code=400,
+            content={
+                "jsonrpc": "2.0",
+                "error": {"code": -32700, "message": "Parse error"},
+                "id": None,
+            },
+        )
+    if isinstance(body, list):
+        return await _handle_rpc_batch(request, body, user)
+    return await _handle_rpc_message(request, body, db, user)
+
+
+async def _handle_rpc_batch(request: Request, batch: List[Any], user: Any) -> Any:
+    """Execute a JSON-RPC batch and return the responses in one array.
+
+    Authentication and RBAC were resolved once for the HTTP request; the entries
+    then run concurrently, at most ``JSONRPC_BATCH_MAX_CONCURRENCY`` at a time,
+    each with its own database session and plugin contexts (see
+    :func:`_batch_entry_request`). Plugin errors and violations become error
+    responses of their entry instead of failing the batch.
+
+    Args:
+        request: The incoming FastAPI request.
+        batch: Parsed batch array.
+        user: The authenticated user (dict with RBAC context).
+
+    Returns:
+        Array of responses, a single error response if the batch itself is invalid,
+        or 202 Accepted if it only contained notifications.
+    """
+    error = check_batch(batch, settings.jsonrpc_batch_max_size)
+    if error:
+        return ORJSONResponse(status_code=400, content=error)
+    # Entries are answered inside the batch array, never with 304 Not Modified
+    request.state.jsonrpc_batch = True
+
+    entry_indexes = {id(entry): i for i, entry in enumerate(batch)}
+
+    async def handle(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one batch entry in its own database session.
+
+        Args:
+            entry: JSON-RPC request object.
+
+        Returns:
+            The entry's JSON-RPC response.
+        """
+        entry_request = _batch_entry_request(request, entry_indexes[id(entry)])
+        with contextmanager(get_db)() as entry_db:
+            try:
+                response = await _handle_rpc_message(entry_request, entry, entry_db, user)
+            except PluginViolationError as e:
+                response = await plugin_violation_exception_handler(entry_request, e)
+            except PluginError as e:
+                response = await plugin_exception_handler(entry_request, e)
+        if isinstance(response, starletteResponse):
+            content = orjson.loads(response.body)
+            if "result" not in content and "error" not in content:
+                content = error_response(-32600, content.get("message", "Invalid Request"))
+            response = content
+        response["id"] = entry.get("id")
+        return response
+
+    responses = await execute_batch(batch, handle, settings.jsonrpc_batch_max_concurrency)
+    if not responses:
+        return starletteResponse(status_code=202)
+    return ORJSONResponse(content=responses)
+
+
+def _batch_entry_request(request: Request, index: int) -> Request:
+    """Give a batch entry its own view of the request state.
+
+    Entries run concurrently, and the tool path writes to the plugin global
+    context (``server_id``, tool and gateway metadata). Each entry therefore
+    gets a copy of it with the request id suffixed by the entry index, which
+    also keys the plugins' local contexts, and starts with no context table.
+
+    Args:
+        request: The batch's HTTP request.
+        index: Position of the entry in the batch.
+
+    Returns:
+        A request sharing the batch's scope but with its own state.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework import GlobalContext
+        >>> request = Request({"type": "http", "headers": []})
+        >>> request.state.plugin_global_context = GlobalContext(request_id="r", metadata={"k": 1})
+        >>> request.state.plugin_context_table = {"r-plugin": object()}
+        >>> entry = _batch_entry_request(request, 2)
+        >>> entry.state.plugin_global_context.request_id, entry.state.plugin_global_context.metadata
+        ('r:2', {'k': 1})
+        >>> entry.state.plugin_global_context.metadata["k"] = 2
+        >>> request.state.plugin_global_context.metadata, getattr(entry.state, "plugin_context_table", None)
+        ({'k': 1}, None)
+    """
+    state = dict(request.scope.get("state") or {})
+    global_context = state.get("plugin_global_context")
+    if global_context is not None:
+        state["plugin_global_context"] = global_context.model_copy(
+            update={
+                "request_id": f"{global_context.request_id}:{index}",
+                "user": dict(global_context.user) if isinstance(global_context.user, dict) else global_context.user,
+                "state": dict(global_context.state),
+                "metadata": dict(global_context.metadata),
+            }
+        )
+    state.pop("plugin_context_table", None)
+    return Request({**request.scope, "state": state}, request.receive)
+
+
+def _cached_list_response(request: Request, cached: CachedListResponse, req_id: Any) -> starletteResponse:
+    """Wrap a pre-serialized list result in a JSON-RPC response without re-encoding it.
+
+    Answers ``304 Not Modified`` when the client's ``If-None-Match`` matches the
+    result's ETag (not for batch entries, which always need a body).
+
+    Args:
+        request: The incoming FastAPI request.
+        cached: Serialized ``result`` object and its ETag.
+        req_id: JSON-RPC request ID.
+
+    Returns:
+        The JSON-RPC response carrying the ETag header.
+
+    Examples:
+        >>> from unittest.mock import MagicMock
+        >>> from mcpgateway.cache.list_response_cache import serialize_result
+        >>> request = MagicMock()
+        >>> request.headers = {}
+        >>> response = _cached_list_response(request, serialize_result({"tools": []}), 7)
+        >>> response.body
+        b'{"jsonrpc":"2.0","result":{"tools":[]},"id":7}'
+        >>> request.headers = {"if-none-match": response.headers["etag"]}
+        >>> request.state.jsonrpc_batch = False
+        >>> _cached_list_response(request, serialize_result({"tools": []}), 7).status_code
+        304
+    """
+    headers = {"ETag": cached.etag}
+    if not getattr(request.state, "jsonrpc_batch", False) and etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return starletteResponse(status_code=304, headers=headers)
+    body = b'{"jsonrpc":"2.0","result":' + cached.body + b',"id":' + orjson.dumps(req_id) + b"}"
+    return starletteResponse(content=body, media_type="application/json", headers=headers)
+
+
+async def _handle_rpc_message(request: Request, body: Dict[str, Any], db: Session, user: Any) -> Any:
+    """Handle a single JSON-RPC request object.
+
     Args:
         request (Request): The incoming FastAPI request.
+        body: The parsed JSON-RPC request object.
         db (Session): Database session.
         user: The authenticated user (dict with RBAC context).
 
@@ -5409,26 +5655,6 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
     """
     req_id = None
     try:
-        # Extract user identifier from either RBAC user object or JWT payload
-        if hasattr(user, "email"):
-            user_id = getattr(user, "email", None)  # RBAC user object
-        elif isinstance(user, dict):
-            user_id = user.get("sub") or user.get("email") or user.get("username", "unknown")  # JWT payload
-        else:
-            user_id = str(user)  # String username from basic auth
-
-        logger.debug(f"User {user_id} made an RPC request")
-        try:
-            body = orjson.loads(await request.body())
-        except orjson.JSONDecodeError:
-            return ORJSONResponse(
-                status_code=400,
-                content={
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32700, "message": "Parse error"},
-                    "id": None,
-                },
-            )
         method = body["method"]
         req_id = body.get("id")
         if req_id is None:
@@ -5454,20 +5680,27 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                 token_teams = None  # Admin unrestricted
             elif token_teams is None:
                 token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                tools = await tool_service.list_server_tools(db, server_id, cursor=cursor, user_email=user_email, token_teams=token_teams)
-                # Release DB connection early to prevent idle-in-transaction under load
-                db.commit()
-                db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-            else:
-                tools, next_cursor = await tool_service.list_tools(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
-                # Release DB connection early to prevent idle-in-transaction under load
-                db.commit()
-                db.close()
-                result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
+            # Serve the pre-serialized result for this caller scope when nothing changed
+            list_cache = get_list_response_cache()
+            cache_key = list_cache.make_key("tools", server_id, cursor, user_email, token_teams)
+            generation = list_cache.generation("tools")
+            result = list_cache.get(cache_key)
+            if result is None:
+                if server_id:
+                    tools = await tool_service.list_server_tools(db, server_id, cursor=cursor, user_email=user_email, token_teams=token_teams)
+                    # Release DB connection early to prevent idle-in-transaction under load
+                    db.commit()
+                    db.close()
+                    result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
+                else:
+                    tools, next_cursor = await tool_service.list_tools(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
+                    # Release DB connection early to prevent idle-in-transaction under load
+                    db.commit()
+                    db.close()
+                    result = {"tools": [t.model_dump(by_alias=True, exclude_none=True) for t in tools]}
+                    if next_cursor:
+                        result["nextCursor"] = next_cursor
+                result = list_cache.set(cache_key, serialize_result(result), generation)
         elif method == "list_tools":  # Legacy endpoint
             user_email, token_teams, is_admin = _get_rpc_filter_context(request, user)
             # Admin bypass - only when token has NO team restrictions (token_teams is None)
@@ -5514,18 +5747,24 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                 token_teams = None  # Admin unrestricted
             elif token_teams is None:
                 token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                resources = await resource_service.list_server_resources(db, server_id, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
-            else:
-                resources, next_cursor = await resource_service.list_resources(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
+            list_cache = get_list_response_cache()
+            cache_key = list_cache.make_key("resources", server_id, cursor, user_email, token_teams)
+            generation = list_cache.generation("resources")
+            result = list_cache.get(cache_key)
+            if result is None:
+                if server_id:
+                    resources = await resource_service.list_server_resources(db, server_id, user_email=user_email, token_teams=token_teams)
+                    db.commit()
+                    db.close()
+                    result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
+                else:
+                    resources, next_cursor = await resource_service.list_resources(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
+                    db.commit()
+                    db.close()
+                    result = {"resources": [r.model_dump(by_alias=True, exclude_none=True) for r in resources]}
+                    if next_cursor:
+                        result["nextCursor"] = next_cursor
+                result = list_cache.set(cache_key, serialize_result(result), generation)
         elif method == "resources/read":
             uri = params.get("uri")
             request_id = params.get("requestId", None)
@@ -5602,18 +5841,24 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                 token_teams = None  # Admin unrestricted
             elif token_teams is None:
                 token_teams = []  # Non-admin without teams = public-only (secure default)
-            if server_id:
-                prompts = await prompt_service.list_server_prompts(db, server_id, cursor=cursor, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
-            else:
-                prompts, next_cursor = await prompt_service.list_prompts(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
-                db.commit()
-                db.close()
-                result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
-                if next_cursor:
-                    result["nextCursor"] = next_cursor
+            list_cache = get_list_response_cache()
+            cache_key = list_cache.make_key("prompts", server_id, cursor, user_email, token_teams)
+            generation = list_cache.generation("prompts")
+            result = list_cache.get(cache_key)
+            if result is None:
+                if server_id:
+                    prompts = await prompt_service.list_server_prompts(db, server_id, cursor=cursor, user_email=user_email, token_teams=token_teams)
+                    db.commit()
+                    db.close()
+                    result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
+                else:
+                    prompts, next_cursor = await prompt_service.list_prompts(db, cursor=cursor, limit=0, user_email=user_email, token_teams=token_teams)
+                    db.commit()
+                    db.close()
+                    result = {"prompts": [p.model_dump(by_alias=True, exclude_none=True) for p in prompts]}
+                    if next_cursor:
+                        result["nextCursor"] = next_cursor
+                result = list_cache.set(cache_key, serialize_result(result), generation)
         elif method == "prompts/get":
             name = params.get("name")
             arguments = params.get("arguments", {})
@@ -5959,6 +6204,8 @@ async def handle_rpc(request: Request, db: Session = Depends(get_db), user=Depen
                     # If all else fails, return invalid method error
                     raise JSONRPCError(-32000, "Invalid method", params)
 
+        if isinstance(result, CachedListResponse):
+            return _cached_list_response(request, result, req_id)
         return {"jsonrpc": "2.0", "result": result, "id": req_id}
 
     except (PluginError, PluginViolationError):
@@ -11,10 +11,12 @@ and time-based restrictions.
 """
 
 # Standard
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime, timezone
 import ipaddress
 import re
-from typing import List, Optional, Pattern, Tuple
+from typing import Collection, Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
 # Third-Party
 from fastapi import HTTPException, Request, status
@@ -22,6 +24,8 @@ from fastapi.security import HTTPBearer
 
 # First-Party
 from mcpgateway.auth import normalize_token_teams
+from mcpgateway.cache.resource_access_cache import get_resource_access_cache, NOT_FOUND, ResourceScope
+from mcpgateway.config import settings
 from mcpgateway.db import Permissions
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.utils.orjson_response import ORJSONResponse
@@ -93,6 +97,151 @@ _PERMISSION_PATTERNS: List[Tuple[str, Pattern[str], str]] = [
     ("DELETE", re.compile(r"^/admin/[^/]+(?:$|/)"), Permissions.ADMIN_USER_MANAGEMENT),
 ]
 
+# Route tables: each pattern list above folded into one regex, so a path is
+# classified with a single match. Alternatives are tried in list order, which
+# keeps the first-match-wins semantics of the lists.
+
+# The server patterns are anchored, so at most one alternative can match
+_SERVER_PATH_ROUTE: Pattern[str] = re.compile("|".join(pattern.pattern for pattern in _SERVER_PATH_PATTERNS))
+
+# Resource patterns are searched anywhere in the path: each alternative is a lookahead
+_RESOURCE_ROUTE: Pattern[str] = re.compile("|".join(f"(?=.*?{pattern.pattern})" for pattern, _ in _RESOURCE_PATTERNS), re.DOTALL)
+_RESOURCE_ROUTE_TYPES: List[str] = [rtype for _, rtype in _RESOURCE_PATTERNS]
+
+
+def _compile_permission_routes() -> Dict[str, Tuple[Pattern[str], List[str]]]:
+    """Fold _PERMISSION_PATTERNS into one regex per HTTP method.
+
+    Returns:
+        Mapping of method to (combined pattern, required permission per alternative).
+
+    Examples:
+        >>> routes = _compile_permission_routes()
+        >>> pattern, required = routes["POST"]
+        >>> required[pattern.match("/gateways").lastindex - 1]
+        'gateways.create'
+        >>> required[pattern.match("/gateways/gw-1/toggle").lastindex - 1]
+        'gateways.update'
+    """
+    routes = {}
+    for method in dict.fromkeys(method for method, _, _ in _PERMISSION_PATTERNS):
+        entries = [(pattern, permission) for route_method, pattern, permission in _PERMISSION_PATTERNS if route_method == method]
+        routes[method] = (re.compile("|".join(f"({pattern.pattern})" for pattern, _ in entries)), [permission for _, permission in entries])
+    return routes
+
+
+_PERMISSION_ROUTES: Dict[str, Tuple[Pattern[str], List[str]]] = _compile_permission_routes()
+
+# Endpoints allowed for server-restricted tokens
+_GENERAL_ENDPOINTS: Tuple[str, ...] = ("/health", "/metrics", "/openapi.json", "/docs", "/redoc")
+
+# Truly public endpoints skipped by token scoping
+_SKIP_PATHS: Tuple[str, ...] = ("/health", "/metrics", "/openapi.json", "/docs", "/redoc", "/auth/email/login", "/auth/email/register", "/.well-known/")
+_SERVER_WELL_KNOWN_PATTERN: Pattern[str] = re.compile(r"^/servers/[^/]+/\.well-known/")
+
+
+class IPRestrictionMatcher:
+    """Token IP restrictions compiled into sorted, merged address intervals.
+
+    Membership is a binary search per request instead of parsing every
+    restriction string. Invalid restrictions are ignored.
+
+    Examples:
+        >>> matcher = IPRestrictionMatcher(["10.0.0.0/24", "10.0.1.0/24", "192.168.1.10", "2001:db8::/32", "bad"])
+        >>> "10.0.1.255" in matcher, "10.0.2.0" in matcher, "192.168.1.10" in matcher
+        (True, False, True)
+        >>> "2001:db8::1" in matcher, "unknown" in matcher
+        (True, False)
+        >>> matcher.intervals(4)
+        [(167772160, 167772671), (3232235786, 3232235786)]
+    """
+
+    __slots__ = ("_tables",)
+
+    def __init__(self, restrictions: Iterable[str]):
+        """Compile restrictions.
+
+        Args:
+            restrictions: Allowed IP addresses and CIDR ranges
+        """
+        ranges: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        for restriction in restrictions:
+            try:
+                if "/" in restriction:
+                    network = ipaddress.ip_network(restriction, strict=False)
+                else:
+                    network = ipaddress.ip_network(ipaddress.ip_address(restriction))
+            except (TypeError, ValueError):
+                continue
+            ranges[network.version].append((int(network.network_address), int(network.broadcast_address)))
+
+        self._tables: Dict[int, Tuple[List[int], List[int]]] = {}
+        for version, intervals in ranges.items():
+            merged: List[List[int]] = []
+            for start, end in sorted(intervals):
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            self._tables[version] = ([start for start, _ in merged], [end for _, end in merged])
+
+    def __contains__(self, client_ip: object) -> bool:
+        """Check whether an address falls within the restrictions.
+
+        Args:
+            client_ip: Client IP address string
+
+        Returns:
+            bool: True if the address is allowed
+        """
+        try:
+            address = ipaddress.ip_address(client_ip)
+        except ValueError:
+            return False
+        starts, ends = self._tables[address.version]
+        value = int(address)
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    def intervals(self, version: int) -> List[Tuple[int, int]]:
+        """Return the merged intervals of an IP version.
+
+        Args:
+            version: 4 or 6
+
+        Returns:
+            List of inclusive (start, end) integer address ranges
+        """
+        starts, ends = self._tables[version]
+        return list(zip(starts, ends))
+
+
+class CompiledTokenScopes:
+    """Scopes of a token in the form used by the per-request checks.
+
+    Examples:
+        >>> compiled = CompiledTokenScopes({"server_id": "s1", "ip_restrictions": ["10.0.0.0/8"], "permissions": ["tools.read"]})
+        >>> compiled.server_id, "10.1.2.3" in compiled.ip_matcher, compiled.permissions
+        ('s1', True, frozenset({'tools.read'}))
+        >>> CompiledTokenScopes({}).ip_matcher is None
+        True
+    """
+
+    __slots__ = ("source", "server_id", "ip_matcher", "time_restrictions", "permissions")
+
+    def __init__(self, scopes: dict):
+        """Compile a token's scopes claim.
+
+        Args:
+            scopes: The ``scopes`` claim of the token payload
+        """
+        self.source = scopes
+        self.server_id: Optional[str] = scopes.get("server_id")
+        ip_restrictions = scopes.get("ip_restrictions") or []
+        self.ip_matcher: Optional[IPRestrictionMatcher] = IPRestrictionMatcher(ip_restrictions) if ip_restrictions else None
+        self.time_restrictions: dict = scopes.get("time_restrictions") or {}
+        self.permissions: Collection[str] = frozenset(scopes.get("permissions") or ())
+
 
 class TokenScopingMiddleware:
     """Middleware to enforce token scoping restrictions.
@@ -111,6 +260,9 @@ class TokenScopingMiddleware:
             >>> hasattr(middleware, '_extract_token_scopes')
             True
         """
+        # jti -> compiled scopes (LRU); JWT claims are immutable for a given token
+        self._compiled_scopes: "OrderedDict[str, CompiledTokenScopes]" = OrderedDict()
+        self._compiled_scopes_max = settings.token_scoping_cache_max_entries
 
     def _normalize_teams(self, teams) -> list:
         """Normalize teams from token payload to list of team IDs.
@@ -138,6 +290,40 @@ class TokenScopingMiddleware:
                 normalized.append(team)
         return normalized
 
+    def _get_compiled_scopes(self, payload: dict) -> CompiledTokenScopes:
+        """Return the compiled scopes of a token, compiling them once per jti.
+
+        Args:
+            payload: Decoded JWT payload
+
+        Returns:
+            CompiledTokenScopes: Scopes ready for the per-request checks
+
+        Examples:
+            >>> m = TokenScopingMiddleware()
+            >>> payload = {"jti": "j1", "scopes": {"ip_restrictions": ["10.0.0.0/8"]}}
+            >>> m._get_compiled_scopes(payload) is m._get_compiled_scopes(dict(payload))
+            True
+            >>> m._get_compiled_scopes({"jti": "j1", "scopes": {}}).ip_matcher is None
+            True
+        """
+        scopes = payload.get("scopes") or {}
+        jti = payload.get("jti")
+        if not jti or not settings.token_scoping_cache_enabled:
+            return CompiledTokenScopes(scopes)
+
+        compiled = self._compiled_scopes.get(jti)
+        # Compare the source claim so a reused jti can never borrow another token's scopes
+        if compiled is not None and compiled.source == scopes:
+            self._compiled_scopes.move_to_end(jti)
+            return compiled
+
+        compiled = CompiledTokenScopes(scopes)
+        self._compiled_scopes[jti] = compiled
+        if len(self._compiled_scopes) > self._compiled_scopes_max:
+            self._compiled_scopes.popitem(last=False)
+        return compiled
+
     async def _extract_token_scopes(self, request: Request) -> Optional[dict]:
         """Extract token scopes from JWT in request.
 
@@ -187,12 +373,12 @@ class TokenScopingMiddleware:
         # Fall back to direct client IP
         return request.client.host if request.client else "unknown"
 
-    def _check_ip_restrictions(self, client_ip: str, ip_restrictions: list) -> bool:
+    def _check_ip_restrictions(self, client_ip: str, ip_restrictions: Union[list, IPRestrictionMatcher]) -> bool:
         """Check if client IP is allowed by restrictions.
 
         Args:
             client_ip: Client's IP address
-            ip_restrictions: List of allowed IP addresses/CIDR ranges
+            ip_restrictions: List of allowed IP addresses/CIDR ranges, or their compiled matcher
 
         Returns:
             bool: True if IP is allowed, False otherwise
@@ -218,27 +404,9 @@ class TokenScopingMiddleware:
         if not ip_restrictions:
             return True  # No restrictions
 
-        try:
-            client_ip_obj = ipaddress.ip_address(client_ip)
-
-            for restriction in ip_restrictions:
-                try:
-                    # Check if it's a CIDR range
-                    if "/" in restriction:
-                        network = ipaddress.ip_network(restriction, strict=False)
-                        if client_ip_obj in network:
-                            return True
-                    else:
-                        # Single IP address
-                        if client_ip_obj == ipaddress.ip_address(restriction):
-                            return True
-                except (ValueError, ipaddress.AddressValueError):
-                    continue
-
-        except (ValueError, ipaddress.AddressValueError):
-            return False
-
-        return False
+        if not isinstance(ip_restrictions, IPRestrictionMatcher):
+            ip_restrictions = IPRestrictionMatcher(ip_restrictions)
+        return client_ip in ip_restrictions
 
     def _check_time_restrictions(self, time_restrictions: dict) -> bool:
         """Check if current time is allowed by restrictions.
@@ -315,31 +483,23 @@ class TokenScopingMiddleware:
         if not server_id:
             return True  # No server restriction
 
-        # Extract server ID from path patterns (uses precompiled regex)
+        # Extract server ID from path patterns (uses precompiled route table)
         # /servers/{server_id}/...
         # /sse/{server_id}
         # /ws/{server_id}
-        for pattern in _SERVER_PATH_PATTERNS:
-            match = pattern.search(request_path)
-            if match:
-                path_server_id = match.group(1)
-                return path_server_id == server_id
+        match = _SERVER_PATH_ROUTE.match(request_path)
+        if match:
+            return match.group(match.lastindex) == server_id
 
         # If no server ID found in path, allow general endpoints
-        general_endpoints = ["/health", "/metrics", "/openapi.json", "/docs", "/redoc"]
-
         # Check exact root path separately
-        if request_path == "/":
+        if request_path == "/" or request_path.startswith(_GENERAL_ENDPOINTS):
             return True
 
-        for endpoint in general_endpoints:
-            if request_path.startswith(endpoint):
-                return True
-
         # Default deny for unmatched paths with server restrictions
         return False
 
-    def _check_permission_restrictions(self, request_path: str, request_method: str, permissions: list) -> bool:
+    def _check_permission_restrictions(self, request_path: str, request_method: str, permissions: Collection[str]) -> bool:
         """Check if request is allowed by permission restrictions.
 
         Args:
@@ -373,10 +533,12 @@ class TokenScopingMiddleware:
         if not permissions or "*" in permissions:
             return True  # No restrictions or full access
 
-        # Check each permission mapping (uses precompiled regex patterns)
-        for method, path_pattern, required_permission in _PERMISSION_PATTERNS:
-            if request_method == method and path_pattern.match(request_path):
-                return required_permission in permissions
+        # Find the first permission mapping for this method (uses precompiled route table)
+        route = _PERMISSION_ROUTES.get(request_method)
+        if route:
+            match = route[0].match(request_path)
+            if match:
+                return route[1][match.lastindex - 1] in permissions
 
         # Default allow for unmatched paths
         return True
@@ -505,6 +667,19 @@ class TokenScopingMiddleware:
 
         Returns:
             bool: True if resource access is allowed, False otherwise
+
+        Examples:
+            >>> from unittest.mock import MagicMock
+            >>> m = TokenScopingMiddleware()
+            >>> db = MagicMock()
+            >>> db.execute.return_value.scalar_one_or_none.return_value = MagicMock(visibility="team", team_id="t1", owner_email="a@example.com")
+            >>> m._check_resource_team_ownership("/tools/0a1b", ["t1"], db=db)
+            True
+            >>> m._check_resource_team_ownership("/tools/0a1b", ["t2"], db=db)  # cached scope, no query
+            False
+            >>> db.execute.call_count
+            1
+            >>> get_resource_access_cache().invalidate_type("tools")
         """
         # Normalize token_teams: extract team IDs from dict objects (backward compatibility)
         token_team_ids = []
@@ -522,274 +697,105 @@ class TokenScopingMiddleware:
         else:
             logger.debug(f"Processing request with TEAM-SCOPED token (teams: {token_teams})")
 
-        # Extract resource type and ID from path (uses precompiled regex patterns)
+        # Extract resource type and ID from path (uses precompiled route table)
         # IDs are UUID hex strings (32 chars) or UUID with dashes (36 chars)
-        resource_id = None
-        resource_type = None
-
-        for pattern, rtype in _RESOURCE_PATTERNS:
-            match = pattern.search(request_path)
-            if match:
-                resource_id = match.group(1)
-                resource_type = rtype
-                logger.debug(f"Extracted {rtype} ID: {resource_id} from path: {request_path}")
-                break
+        match = _RESOURCE_ROUTE.match(request_path)
 
         # If no resource ID in path, allow (general endpoints like /health, /tokens, /metrics)
-        if not resource_id or not resource_type:
+        if not match:
             logger.debug(f"No resource ID found in path {request_path}, allowing access")
             return True
 
-        # Import database models
+        resource_type = _RESOURCE_ROUTE_TYPES[match.lastindex - 1]
+        resource_id = match.group(match.lastindex)
+        logger.debug(f"Extracted {resource_type} ID: {resource_id} from path: {request_path}")
+
+        try:
+            scope = self._get_resource_scope(resource_type, resource_id, db)
+        except Exception as e:
+            logger.error(f"Error checking resource team ownership for {request_path}: {e}", exc_info=True)
+            # Fail securely - deny access on error
+            return False
+
+        label = resource_type.capitalize()
+
+        if scope is NOT_FOUND:
+            logger.warning(f"{label} {resource_id} not found in database")
+            return True
+
+        visibility = scope.visibility
+
+        # PUBLIC: Accessible by everyone (including public-only tokens)
+        if visibility == "public":
+            logger.debug(f"Access granted: {label} {resource_id} is PUBLIC")
+            return True
+
+        # PUBLIC-ONLY TOKEN: Can ONLY access public entities (strict public-only policy)
+        # No owner access - if user needs own resources, use a personal team-scoped token
+        if is_public_token:
+            logger.warning(f"Access denied: Public-only token cannot access {visibility} {resource_type} {resource_id}")
+            return False
+
+        # TEAM: Check if the entity belongs to one of the token's teams
+        if visibility == "team":
+            if scope.team_id and scope.team_id in token_team_ids:
+                logger.debug(f"Access granted: Team {resource_type} {resource_id} belongs to token's team {scope.team_id}")
+                return True
+
+            logger.warning(f"Access denied: {label} {resource_id} is team-scoped to '{scope.team_id}', token is scoped to teams {token_team_ids}")
+            return False
+
+        # PRIVATE: Owner-only access (per RBAC doc); servers do not use the legacy "user" visibility
+        private_visibilities = ("private",) if resource_type == "server" else ("private", "user")
+        if visibility in private_visibilities:
+            if scope.owner_email and scope.owner_email == _user_email:
+                logger.debug(f"Access granted: Private {resource_type} {resource_id} owned by {_user_email}")
+                return True
+
+            logger.warning(f"Access denied: {label} {resource_id} is {visibility}, owner is '{scope.owner_email}', requester is '{_user_email}'")
+            return False
+
+        # Unknown visibility - deny by default
+        logger.warning(f"Access denied: {label} {resource_id} has unknown visibility: {visibility}")
+        return False
+
+    def _get_resource_scope(self, resource_type: str, resource_id: str, db=None) -> ResourceScope:
+        """Load the visibility, team and owner of an entity, through the resource access cache.
+
+        Args:
+            resource_type: Entity type (server, tool, resource, prompt, gateway)
+            resource_id: Entity ID
+            db: Optional database session. If provided, caller manages lifecycle.
+                If None and the cache misses, creates and manages its own session.
+
+        Returns:
+            ResourceScope: The entity's scope, or ``NOT_FOUND``
+        """
+        cache = get_resource_access_cache()
+        scope = cache.get(resource_type, resource_id)
+        if scope is not None:
+            return scope
+
         # Third-Party
         from sqlalchemy import select  # pylint: disable=import-outside-toplevel
 
         # First-Party
         from mcpgateway.db import Gateway, get_db, Prompt, Resource, Server, Tool  # pylint: disable=import-outside-toplevel
 
+        model = {"server": Server, "tool": Tool, "resource": Resource, "prompt": Prompt, "gateway": Gateway}[resource_type]
+
         # Track if we own the session (and thus must clean it up)
         owns_session = db is None
         if owns_session:
             db = next(get_db())
 
         try:
-            # Check Virtual Servers
-            if resource_type == "server":
-                server = db.execute(select(Server).where(Server.id == resource_id)).scalar_one_or_none()
-
-                if not server:
-                    logger.warning(f"Server {resource_id} not found in database")
-                    return True
-
-                # Get server visibility (default to 'team' if field doesn't exist)
-                server_visibility = getattr(server, "visibility", "team")
-
-                # PUBLIC SERVERS: Accessible by everyone (including public-only tokens)
-                if server_visibility == "public":
-                    logger.debug(f"Access granted: Server {resource_id} is PUBLIC")
-                    return True
-
-                # PUBLIC-ONLY TOKEN: Can ONLY access public servers (strict public-only policy)
-                # No owner access - if user needs own resources, use a personal team-scoped token
-                if is_public_token:
-                    logger.warning(f"Access denied: Public-only token cannot access {server_visibility} server {resource_id}")
-                    return False
-
-                # TEAM-SCOPED SERVERS: Check if server belongs to token's teams
-                if server_visibility == "team":
-                    if server.team_id in token_team_ids:
-                        logger.debug(f"Access granted: Team server {resource_id} belongs to token's team {server.team_id}")
-                        return True
-
-                    logger.warning(f"Access denied: Server {resource_id} is team-scoped to '{server.team_id}', token is scoped to teams {token_team_ids}")
-                    return False
-
-                # PRIVATE SERVERS: Owner-only access (per RBAC doc)
-                if server_visibility == "private":
-                    server_owner = getattr(server, "owner_email", None)
-                    if server_owner and server_owner == _user_email:
-                        logger.debug(f"Access granted: Private server {resource_id} owned by {_user_email}")
-                        return True
-
-                    logger.warning(f"Access denied: Server {resource_id} is private, owner is '{server_owner}', requester is '{_user_email}'")
-                    return False
-
-                # Unknown visibility - deny by default
-                logger.warning(f"Access denied: Server {resource_id} has unknown visibility: {server_visibility}")
-                return False
-
-            # CHECK TOOLS
-            if resource_type == "tool":
-                tool = db.execute(select(Tool).where(Tool.id == resource_id)).scalar_one_or_none()
-
-                if not tool:
-                    logger.warning(f"Tool {resource_id} not found in database")
-                    return True
-
-                # Get tool visibility (default to 'team' if field doesn't exist)
-                tool_visibility = getattr(tool, "visibility", "team")
-
-                # PUBLIC TOOLS: Accessible by everyone (including public-only tokens)
-                if tool_visibility == "public":
-                    logger.debug(f"Access granted: Tool {resource_id} is PUBLIC")
-                    return True
-
-                # PUBLIC-ONLY TOKEN: Can ONLY access public tools (strict public-only policy)
-                # No owner access - if user needs own resources, use a personal team-scoped token
-                if is_public_token:
-                    logger.warning(f"Access denied: Public-only token cannot access {tool_visibility} tool {resource_id}")
-                    return False
-
-                # TEAM TOOLS: Check if tool's team matches token's teams
-                if tool_visibility == "team":
-                    tool_team_id = getattr(tool, "team_id", None)
-                    if tool_team_id and tool_team_id in token_team_ids:
-                        logger.debug(f"Access granted: Team tool {resource_id} belongs to token's team {tool_team_id}")
-                        return True
-
-                    logger.warning(f"Access denied: Tool {resource_id} is team-scoped to '{tool_team_id}', token is scoped to teams {token_team_ids}")
-                    return False
-
-                # PRIVATE TOOLS: Owner-only access (per RBAC doc)
-                if tool_visibility in ["private", "user"]:
-                    tool_owner = getattr(tool, "owner_email", None)
-                    if tool_owner and tool_owner == _user_email:
-                        logger.debug(f"Access granted: Private tool {resource_id} owned by {_user_email}")
-                        return True
-
-                    logger.warning(f"Access denied: Tool {resource_id} is {tool_visibility}, owner is '{tool_owner}', requester is '{_user_email}'")
-                    return False
-
-                # Unknown visibility - deny by default
-                logger.warning(f"Access denied: Tool {resource_id} has unknown visibility: {tool_visibility}")
-                return False
-
-            # CHECK RESOURCES
-            if resource_type == "resource":
-                resource = db.execute(select(Resource).where(Resource.id == resource_id)).scalar_one_or_none()
-
-                if not resource:
-                    logger.warning(f"Resource {resource_id} not found in database")
-                    return True
-
-                # Get resource visibility (default to 'team' if field doesn't exist)
-                resource_visibility = getattr(resource, "visibility", "team")
-
-                # PUBLIC RESOURCES: Accessible by everyone (including public-only tokens)
-                if resource_visibility == "public":
-                    logger.debug(f"Access granted: Resource {resource_id} is PUBLIC")
-                    return True
-
-                # PUBLIC-ONLY TOKEN: Can ONLY access public resources (strict public-only policy)
-                # No owner access - if user needs own resources, use a personal team-scoped token
-                if is_public_token:
-                    logger.warning(f"Access denied: Public-only token cannot access {resource_visibility} resource {resource_id}")
-                    return False
-
-                # TEAM RESOURCES: Check if resource's team matches token's teams
-                if resource_visibility == "team":
-                    resource_team_id = getattr(resource, "team_id", None)
-                    if resource_team_id and resource_team_id in token_team_ids:
-                        logger.debug(f"Access granted: Team resource {resource_id} belongs to token's team {resource_team_id}")
-                        return True
-
-                    logger.warning(f"Access denied: Resource {resource_id} is team-scoped to '{resource_team_id}', token is scoped to teams {token_team_ids}")
-                    return False
-
-                # PRIVATE RESOURCES: Owner-only access (per RBAC doc)
-                if resource_visibility in ["private", "user"]:
-                    resource_owner = getattr(resource, "owner_email", None)
-                    if resource_owner and resource_owner == _user_email:
-                        logger.debug(f"Access granted: Private resource {resource_id} owned by {_user_email}")
-                        return True
-
-                    logger.warning(f"Access denied: Resource {resource_id} is {resource_visibility}, owner is '{resource_owner}', requester is '{_user_email}'")
-                    return False
-
-                # Unknown visibility - deny by default
-                logger.warning(f"Access denied: Resource {resource_id} has unknown visibility: {resource_visibility}")
-                return False
-
-            # CHECK PROMPTS
-            if resource_type == "prompt":
-                prompt = db.execute(select(Prompt).where(Prompt.id == resource_id)).scalar_one_or_none()
-
-                if not prompt:
-                    logger.warning(f"Prompt {resource_id} not found in database")
-                    return True
-
-                # Get prompt visibility (default to 'team' if field doesn't exist)
-                prompt_visibility = getattr(prompt, "visibility", "team")
-
-                # PUBLIC PROMPTS: Accessible by everyone (including public-only tokens)
-                if prompt_visibility == "public":
-                    logger.debug(f"Access granted: Prompt {resource_id} is PUBLIC")
-                    return True
-
-                # PUBLIC-ONLY TOKEN: Can ONLY access public prompts (strict public-only policy)
-                # No owner access - if user needs own resources, use a personal team-scoped token
-                if is_public_token:
-                    logger.warning(f"Access denied: Public-only token cannot access {prompt_visibility} prompt {resource_id}")
-                    return False
-
-                # TEAM PROMPTS: Check if prompt's team matches token's teams
-                if prompt_visibility == "team":
-                    prompt_team_id = getattr(prompt, "team_id", None)
-                    if prompt_team_id and prompt_team_id in token_team_ids:
-                        logger.debug(f"Access granted: Team prompt {resource_id} belongs to token's team {prompt_team_id}")
-                        return True
-
-                    logger.warning(f"Access denied: Prompt {resource_id} is team-scoped to '{prompt_team_id}', token is scoped to teams {token_team_ids}")
-                    return False
-
-                # PRIVATE PROMPTS: Owner-only access (per RBAC doc)
-                if prompt_visibility in ["private", "user"]:
-                    prompt_owner = getattr(prompt, "owner_email", None)
-                    if prompt_owner and prompt_owner == _user_email:
-                        logger.debug(f"Access granted: Private prompt {resource_id} owned by {_user_email}")
-                        return True
-
-                    logger.warning(f"Access denied: Prompt {resource_id} is {prompt_visibility}, owner is '{prompt_owner}', requester is '{_user_email}'")
-                    return False
-
-                # Unknown visibility - deny by default
-                logger.warning(f"Access denied: Prompt {resource_id} has unknown visibility: {prompt_visibility}")
-                return False
-
-            # CHECK GATEWAYS
-            if resource_type == "gateway":
-                gateway = db.execute(select(Gateway).where(Gateway.id == resource_id)).scalar_one_or_none()
-
-                if not gateway:
-                    logger.warning(f"Gateway {resource_id} not found in database")
-                    return True
-
-                # Get gateway visibility (default to 'team' if field doesn't exist)
-                gateway_visibility = getattr(gateway, "visibility", "team")
-
-                # PUBLIC GATEWAYS: Accessible by everyone (including public-only tokens)
-                if gateway_visibility == "public":
-                    logger.debug(f"Access granted: Gateway {resource_id} is PUBLIC")
-                    return True
-
-                # PUBLIC-ONLY TOKEN: Can ONLY access public gateways (strict public-only policy)
-                # No owner access - if user needs own resources, use a personal team-scoped token
-                if is_public_token:
-                    logger.warning(f"Access denied: Public-only token cannot access {gateway_visibility} gateway {resource_id}")
-                    return False
-
-                # TEAM GATEWAYS: Check if gateway's team matches token's teams
-                if gateway_visibility == "team":
-                    gateway_team_id = getattr(gateway, "team_id", None)
-                    if gateway_team_id and gateway_team_id in token_team_ids:
-                        logger.debug(f"Access granted: Team gateway {resource_id} belongs to token's team {gateway_team_id}")
-                        return True
-
-                    logger.warning(f"Access denied: Gateway {resource_id} is team-scoped to '{gateway_team_id}', token is scoped to teams {token_team_ids}")
-                    return False
-
-                # PRIVATE GATEWAYS: Owner-only access (per RBAC doc)
-                if gateway_visibility in ["private", "user"]:
-                    gateway_owner = getattr(gateway, "owner_email", None)
-                    if gateway_owner and gateway_owner == _user_email:
-                        logger.debug(f"Access granted: Private gateway {resource_id} owned by {_user_email}")
-                        return True
-
-                    logger.warning(f"Access denied: Gateway {resource_id} is {gateway_visibility}, owner is '{gateway_owner}', requester is '{_user_email}'")
-                    return False
-
-                # Unknown visibility - deny by default
-                logger.warning(f"Access denied: Gateway {resource_id} has unknown visibility: {gateway_visibility}")
-                return False
-
-            # UNKNOWN RESOURCE TYPE
-            logger.warning(f"Unknown resource type '{resource_type}' for path: {request_path}")
-            return False
-
-        except Exception as e:
-            logger.error(f"Error checking resource team ownership for {request_path}: {e}", exc_info=True)
-            # Fail securely - deny access on error
-            return False
+            entity = db.execute(select(model).where(model.id == resource_id)).scalar_one_or_none()
+            if entity is None:
+                scope = NOT_FOUND
+            else:
+                # Default to 'team' visibility if the field doesn't exist
+                scope = ResourceScope(getattr(entity, "visibility", "team"), getattr(entity, "team_id", None), getattr(entity, "owner_email", None))
         finally:
             # Only commit/close if we created the session
             if owns_session:
@@ -798,6 +804,9 @@ class TokenScopingMiddleware:
                 finally:
                     db.close()
 
+        cache.set(resource_type, resource_id, scope)
+        return scope
+
     async def __call__(self, request: Request, call_next):
         """Middleware function to check token scoping including team-level validation.
 
@@ -823,26 +832,12 @@ class TokenScopingMiddleware:
             request.state._token_scoping_done = True
 
             # Skip scoping for certain paths (truly public endpoints only)
-            skip_paths = [
-                "/health",
-                "/metrics",
-                "/openapi.json",
-                "/docs",
-                "/redoc",
-                "/auth/email/login",
-                "/auth/email/register",
-                "/.well-known/",
-            ]
-
             # Check exact root path separately
-            if request.url.path == "/":
-                return await call_next(request)
-
-            if any(request.url.path.startswith(path) for path in skip_paths):
+            if request.url.path == "/" or request.url.path.startswith(_SKIP_PATHS):
                 return await call_next(request)
 
             # Skip server-specific well-known endpoints (RFC 9728)
-            if re.match(r"^/servers/[^/]+/\.well-known/", request.url.path):
+            if _SERVER_WELL_KNOWN_PATTERN.match(request.url.path):
                 return await call_next(request)
 
             # Extract full token payload (not just scopes)
@@ -902,32 +897,29 @@ class TokenScopingMiddleware:
                     logger.warning(f"Access denied: Resource does not belong to token's teams {token_teams}")
                     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied: You do not have permission to access this resource using the current token")
 
-            # Extract scopes from payload
-            scopes = payload.get("scopes", {})
+            # Scopes compiled once per token (jti)
+            scopes = self._get_compiled_scopes(payload)
 
             # Check server ID restriction
-            server_id = scopes.get("server_id")
+            server_id = scopes.server_id
             if not self._check_server_restriction(request.url.path, server_id):
                 logger.warning(f"Token not authorized for this server. Required: {server_id}")
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Token not authorized for this server. Required: {server_id}")
 
             # Check IP restrictions
-            ip_restrictions = scopes.get("ip_restrictions", [])
-            if ip_restrictions:
+            if scopes.ip_matcher is not None:
                 client_ip = self._get_client_ip(request)
-                if not self._check_ip_restrictions(client_ip, ip_restrictions):
+                if not self._check_ip_restrictions(client_ip, scopes.ip_matcher):
                     logger.warning(f"Request from IP {client_ip} not allowed by token restrictions")
                     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Request from IP {client_ip} not allowed by token restrictions")
 
             # Check time restrictions
-            time_restrictions = scopes.get("time_restrictions", {})
-            if not self._check_time_restrictions(time_restrictions):
+            if not self._check_time_restrictions(scopes.time_restrictions):
                 logger.warning("Request not allowed at this time by token restrictions")
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Request not allowed at this time by token restrictions")
 
             # Check permission restrictions
-            permissions = scopes.get("permissions", [])
-            if not self._check_permission_restrictions(request.url.path, request.method, permissions):
+            if not self._check_permission_restrictions(request.url.path, request.method, scopes.permissions):
                 logger.warning("Insufficient permissions for this operation")
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions for this operation")
 
@@ -92,6 +92,15 @@ class Plugin(ABC):
         """
         return self._config.priority
 
+    @property
+    def read_only(self) -> bool:
+        """Return whether the plugin declared itself non-mutating.
+
+        Returns:
+            True if the plugin never modifies the payload or global context.
+        """
+        return self._config.read_only
+
     @property
     def config(self) -> PluginConfig:
         """Return the plugin's configuration.
@@ -252,6 +261,8 @@ class PluginRef:
         32
         >>> ref.tags
         ['ref', 'test']
+        >>> ref.read_only
+        False
     """
 
     def __init__(self, plugin: Plugin):
@@ -318,6 +329,15 @@ class PluginRef:
         """
         return self._plugin.name
 
+    @property
+    def read_only(self) -> bool:
+        """Return whether the plugin declared itself non-mutating.
+
+        Returns:
+            True if the plugin never modifies the payload or global context.
+        """
+        return self._plugin.read_only
+
     @property
     def hooks(self) -> list[str]:
         """Returns the plugin's currently configured hooks.
@@ -46,3 +46,6 @@ GET_PLUGIN_CONFIGS = "get_plugin_configs"
 GET_PLUGIN_CONFIG = "get_plugin_config"
 HOOK_TYPE = "hook_type"
 INVOKE_HOOK = "invoke_hook"
+INVOKE_HOOKS = "invoke_hooks"
+CALLS = "calls"
+RESULTS = "results"
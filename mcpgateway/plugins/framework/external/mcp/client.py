@@ -30,7 +30,22 @@ import orjson
 from mcpgateway.common.models import TransportType
 from mcpgateway.config import settings
 from mcpgateway.plugins.framework.base import HookRef, Plugin, PluginRef
-from mcpgateway.plugins.framework.constants import CONTEXT, ERROR, GET_PLUGIN_CONFIG, HOOK_TYPE, IGNORE_CONFIG_EXTERNAL, INVOKE_HOOK, NAME, PAYLOAD, PLUGIN_NAME, PYTHON_SUFFIX, RESULT
+from mcpgateway.plugins.framework.constants import (
+    CALLS,
+    CONTEXT,
+    ERROR,
+    GET_PLUGIN_CONFIG,
+    HOOK_TYPE,
+    IGNORE_CONFIG_EXTERNAL,
+    INVOKE_HOOK,
+    INVOKE_HOOKS,
+    NAME,
+    PAYLOAD,
+    PLUGIN_NAME,
+    PYTHON_SUFFIX,
+    RESULT,
+    RESULTS,
+)
 from mcpgateway.plugins.framework.errors import convert_exception_to_error, PluginError
 from mcpgateway.plugins.framework.external.mcp.tls_utils import create_ssl_context
 from mcpgateway.plugins.framework.hooks.registry import get_hook_registry
@@ -39,6 +54,141 @@ from mcpgateway.plugins.framework.models import MCPClientTLSConfig, PluginConfig
 logger = logging.getLogger(__name__)
 
 
+class HookBatcher:
+    """Coalesces concurrent hook invocations bound for one plugin server into ``invoke_hooks`` calls.
+
+    Calls submitted while a batch is open are sent together in a single MCP
+    round-trip once the batch window elapses or the batch is full. Several
+    batches may be in flight at once, so a slow batch does not hold up the next.
+    Any attached session can carry a batch because every call names the plugin
+    it targets.
+
+    Examples:
+        >>> batcher = HookBatcher(window=0.0, max_size=8)
+        >>> batcher.stats()
+        {'batches': 0, 'calls': 0, 'largest_batch': 0, 'in_flight': 0, 'sessions': 0}
+    """
+
+    def __init__(self, window: float = 0.0, max_size: int = 32) -> None:
+        """Initialize the batcher.
+
+        Args:
+            window: Seconds to wait for more calls before sending a batch.
+            max_size: Maximum number of calls per batch.
+        """
+        self._window = window
+        self._max_size = max_size
+        self._sessions: list[ClientSession] = []
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._batches = 0
+        self._calls = 0
+        self._largest_batch = 0
+
+    def attach(self, session: ClientSession) -> None:
+        """Make a session available for sending batches.
+
+        Args:
+            session: An initialized MCP client session to the plugin server.
+        """
+        if session not in self._sessions:
+            self._sessions.append(session)
+
+    def detach(self, session: ClientSession) -> bool:
+        """Stop using a session for sending batches.
+
+        Args:
+            session: A previously attached session.
+
+        Returns:
+            True if no session remains attached.
+        """
+        if session in self._sessions:
+            self._sessions.remove(session)
+        return not self._sessions
+
+    def stats(self) -> dict[str, int]:
+        """Return batching counters.
+
+        Returns:
+            Number of batches and calls sent, the largest batch, batches in flight and attached sessions.
+        """
+        return {
+            "batches": self._batches,
+            "calls": self._calls,
+            "largest_batch": self._largest_batch,
+            "in_flight": len(self._in_flight),
+            "sessions": len(self._sessions),
+        }
+
+    async def submit(self, call: dict[str, Any]) -> dict[str, Any]:
+        """Queue a hook invocation and wait for its result.
+
+        Args:
+            call: The ``invoke_hook`` arguments (hook_type, plugin_name, payload, context).
+
+        Returns:
+            The server's result dictionary for this call.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((call, future))
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self._window > 0:
+                self._flush_handle = loop.call_later(self._window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send the pending calls as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self._batches += 1
+        self._calls += len(batch)
+        self._largest_batch = max(self._largest_batch, len(batch))
+        task = asyncio.create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        """Send a batch and resolve the futures of its calls.
+
+        Args:
+            batch: The calls and the futures waiting on them.
+        """
+        try:
+            if not self._sessions:
+                raise PluginError(error=PluginErrorModel(message="No plugin session available for batched hook invocation", plugin_name=str(batch[0][0].get(PLUGIN_NAME))))
+            session = self._sessions[self._batches % len(self._sessions)]
+            result = await session.call_tool(INVOKE_HOOKS, {CALLS: [call for call, _ in batch]})
+            results = None
+            for content in result.content:
+                if isinstance(content, TextContent):
+                    results = orjson.loads(content.text).get(RESULTS)
+                    break
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise PluginError(error=PluginErrorModel(message=f"Received invalid batch response. Result = {result}", plugin_name=str(batch[0][0].get(PLUGIN_NAME))))
+            for (_, future), res in zip(batch, results):
+                if not future.done():
+                    future.set_result(res)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+# Batchers shared by every external plugin served by the same streamable HTTP endpoint
+_HTTP_BATCHERS: dict[str, HookBatcher] = {}
+
+
 class ExternalPlugin(Plugin):
     """External plugin object for pre/post processing of inputs and outputs at various locations throughout the gateway.
 
@@ -66,6 +216,9 @@ class ExternalPlugin(Plugin):
         self._get_session_id: Optional[Callable[[], str | None]] = None
         self._session_id: Optional[str] = None
         self._http_client_factory: Optional[Callable[..., httpx.AsyncClient]] = None
+        self._server_tools: set[str] = set()
+        self._batcher: Optional[HookBatcher] = None
+        self._batcher_key: Optional[str] = None
 
     async def initialize(self) -> None:
         """Initialize the plugin's connection to the MCP server.
@@ -98,6 +251,7 @@ class ExternalPlugin(Plugin):
             context = {IGNORE_CONFIG_EXTERNAL: True}
 
             self._config = PluginConfig.model_validate(remote_config, context=context)
+            self.__setup_batching()
         except PluginError as pe:
             try:
                 await self.shutdown()
@@ -113,6 +267,34 @@ class ExternalPlugin(Plugin):
             logger.exception(e)
             raise PluginError(error=convert_exception_to_error(e, plugin_name=self.name))
 
+    def __setup_batching(self) -> None:
+        """Attach the plugin session to a hook batcher when batching is configured and supported by the server."""
+        mcp = self._config.mcp
+        if not mcp or not mcp.batch_hooks or not self._session:
+            return
+        if INVOKE_HOOKS not in self._server_tools:
+            logger.warning("External plugin %s: server does not provide %s, hook batching disabled", self.name, INVOKE_HOOKS)
+            return
+        window = mcp.batch_window_ms / 1000.0
+        if mcp.proto == TransportType.STREAMABLEHTTP and mcp.url:
+            # Plugins hosted on the same server share one batcher so their hooks travel together
+            self._batcher_key = f"{mcp.uds or ''}|{mcp.url}"
+            batcher = _HTTP_BATCHERS.get(self._batcher_key)
+            if batcher is None:
+                batcher = _HTTP_BATCHERS[self._batcher_key] = HookBatcher(window=window, max_size=mcp.batch_max_size)
+            self._batcher = batcher
+        else:
+            self._batcher = HookBatcher(window=window, max_size=mcp.batch_max_size)
+        self._batcher.attach(self._session)
+
+    def __teardown_batching(self) -> None:
+        """Detach the plugin session from its hook batcher."""
+        if self._batcher and self._session:
+            if self._batcher.detach(self._session) and self._batcher_key:
+                _HTTP_BATCHERS.pop(self._batcher_key, None)
+        self._batcher = None
+        self._batcher_key = None
+
     def __resolve_stdio_command(self, script_path: str | None, cmd: list[str] | None, cwd: str | None) -> tuple[str, list[str]]:
         """Resolve the stdio command + args from config.
 
@@ -187,6 +369,7 @@ class ExternalPlugin(Plugin):
 
             response = await self._session.list_tools()
             tools = response.tools
+            self._server_tools = {tool.name for tool in tools}
             logger.info("\nConnected to plugin MCP server (stdio) with tools: %s", " ".join([tool.name for tool in tools]))
         except Exception as e:
             self._stdio_error = e
@@ -322,6 +505,7 @@ class ExternalPlugin(Plugin):
                 self._session_id = self._get_session_id() if self._get_session_id else None
                 response = await self._session.list_tools()
                 tools = response.tools
+                self._server_tools = {tool.name for tool in tools}
                 logger.info(
                     "Successfully connected to plugin MCP server with tools: %s",
                     " ".join([tool.name for tool in tools]),
@@ -365,7 +549,15 @@ class ExternalPlugin(Plugin):
             raise PluginError(error=PluginErrorModel(message="Plugin session not initialized", plugin_name=self.name))
 
         try:
-            result = await self._session.call_tool(INVOKE_HOOK, {HOOK_TYPE: hook_type, PLUGIN_NAME: self.name, PAYLOAD: payload, CONTEXT: context})
+            call = {HOOK_TYPE: hook_type, PLUGIN_NAME: self.name, PAYLOAD: payload, CONTEXT: context}
+            if self._batcher:
+                res = await self._batcher.submit(call)
+                hook_result = self.__process_hook_response(res, context, result_type)
+                if hook_result is not None:
+                    return hook_result
+                raise PluginError(error=PluginErrorModel(message=f"Received invalid response. Result = {res}", plugin_name=self.name))
+
+            result = await self._session.call_tool(INVOKE_HOOK, call)
             for content in result.content:
                 if not isinstance(content, TextContent):
                     continue
@@ -373,16 +565,9 @@ class ExternalPlugin(Plugin):
                     res = orjson.loads(content.text)
                 except orjson.JSONDecodeError:
                     raise PluginError(error=PluginErrorModel(message=f"Error trying to decode json: {content.text}", code="JSON_DECODE_ERROR", plugin_name=self.name))
-                if CONTEXT in res:
-                    cxt = PluginContext.model_validate(res[CONTEXT])
-                    context.state = cxt.state
-                    context.metadata = cxt.metadata
-                    context.global_context.state = cxt.global_context.state
-                if RESULT in res:
-                    return result_type.model_validate(res[RESULT])
-                if ERROR in res:
-                    error = PluginErrorModel.model_validate(res[ERROR])
-                    raise PluginError(error)
+                hook_result = self.__process_hook_response(res, context, result_type)
+                if hook_result is not None:
+                    return hook_result
         except PluginError as pe:
             logger.exception(pe)
             raise
@@ -391,6 +576,32 @@ class ExternalPlugin(Plugin):
             raise PluginError(error=convert_exception_to_error(e, plugin_name=self.name))
         raise PluginError(error=PluginErrorModel(message=f"Received invalid response. Result = {result}", plugin_name=self.name))
 
+    def __process_hook_response(self, res: dict[str, Any], context: PluginContext, result_type: type[PluginResult]) -> PluginResult | None:
+        """Apply an ``invoke_hook`` response to the caller's context and build the hook result.
+
+        Args:
+            res: The decoded response of the plugin server.
+            context: The plugin context passed to the run; updated in place.
+            result_type: The result model of the hook.
+
+        Returns:
+            The hook result, or None if the response carries neither a result nor an error.
+
+        Raises:
+            PluginError: if the plugin server returned an error.
+        """
+        if CONTEXT in res:
+            cxt = PluginContext.model_validate(res[CONTEXT])
+            context.state = cxt.state
+            context.metadata = cxt.metadata
+            context.global_context.state = cxt.global_context.state
+        if RESULT in res:
+            return result_type.model_validate(res[RESULT])
+        if ERROR in res:
+            error = PluginErrorModel.model_validate(res[ERROR])
+            raise PluginError(error)
+        return None
+
     async def __get_plugin_config(self) -> PluginConfig | None:
         """Retrieve plugin configuration for the current plugin on the remote MCP server.
 
@@ -419,6 +630,7 @@ class ExternalPlugin(Plugin):
 
     async def shutdown(self) -> None:
         """Plugin cleanup code."""
+        self.__teardown_batching()
         if self._stdio_task:
             if self._stdio_stop:
                 self._stdio_stop.set()
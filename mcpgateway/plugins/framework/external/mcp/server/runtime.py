@@ -60,7 +60,7 @@ import asyncio
 import logging
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Third-Party
 from mcp.server.fastmcp import FastMCP
@@ -69,7 +69,7 @@ import uvicorn
 
 # First-Party
 from mcpgateway.plugins.framework import ExternalPluginServer, MCPServerConfig
-from mcpgateway.plugins.framework.constants import GET_PLUGIN_CONFIG, GET_PLUGIN_CONFIGS, INVOKE_HOOK, MCP_SERVER_INSTRUCTIONS, MCP_SERVER_NAME
+from mcpgateway.plugins.framework.constants import GET_PLUGIN_CONFIG, GET_PLUGIN_CONFIGS, INVOKE_HOOK, INVOKE_HOOKS, MCP_SERVER_INSTRUCTIONS, MCP_SERVER_NAME, RESULTS
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +158,32 @@ async def invoke_hook(hook_type: str, plugin_name: str, payload: Dict[str, Any],
     return await SERVER.invoke_hook(hook_type, plugin_name, payload, context)
 
 
+async def invoke_hooks(calls: List[Dict[str, Any]]) -> dict:
+    """Execute a batch of hooks, fanning them out concurrently on the server.
+
+    Args:
+        calls: Hook invocations, each with hook_type, plugin_name, payload and context.
+
+    Returns:
+        Dictionary whose ``results`` list holds one result per call, in order.
+
+    Raises:
+        RuntimeError: If plugin server not initialized.
+
+    Examples:
+        Function raises RuntimeError when server is not initialized:
+
+        >>> import asyncio
+        >>> asyncio.run(invoke_hooks([]))  # doctest: +SKIP
+        Traceback (most recent call last):
+        ...
+        RuntimeError: Plugin server not initialized
+    """
+    if not SERVER:
+        raise RuntimeError("Plugin server not initialized")
+    return {RESULTS: await SERVER.invoke_hooks(calls)}
+
+
 class SSLCapableFastMCP(FastMCP):
     """FastMCP server with SSL/TLS support using MCPServerConfig.
 
@@ -447,6 +473,7 @@ async def run() -> None:
             mcp.tool(name=GET_PLUGIN_CONFIGS)(get_plugin_configs)
             mcp.tool(name=GET_PLUGIN_CONFIG)(get_plugin_config)
             mcp.tool(name=INVOKE_HOOK)(invoke_hook)
+            mcp.tool(name=INVOKE_HOOKS)(invoke_hooks)
 
             # Run with stdio transport
             logger.info("Starting MCP plugin server with FastMCP (stdio transport)")
@@ -464,6 +491,7 @@ async def run() -> None:
             mcp.tool(name=GET_PLUGIN_CONFIGS)(get_plugin_configs)
             mcp.tool(name=GET_PLUGIN_CONFIG)(get_plugin_config)
             mcp.tool(name=INVOKE_HOOK)(invoke_hook)
+            mcp.tool(name=INVOKE_HOOKS)(invoke_hooks)
 
             # Run with streamable-http transport
             logger.info("Starting MCP plugin server with FastMCP (HTTP transport)")
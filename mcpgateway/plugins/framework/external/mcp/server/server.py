@@ -62,6 +62,7 @@ Examples:
 """
 
 # Standard
+import asyncio
 import logging
 import os
 from typing import Any, Dict, TypeVar
@@ -70,7 +71,7 @@ from typing import Any, Dict, TypeVar
 from pydantic import BaseModel
 
 # First-Party
-from mcpgateway.plugins.framework.constants import CONTEXT, ERROR, PLUGIN_NAME, RESULT
+from mcpgateway.plugins.framework.constants import CONTEXT, ERROR, HOOK_TYPE, PAYLOAD, PLUGIN_NAME, RESULT
 from mcpgateway.plugins.framework.errors import convert_exception_to_error, PluginError
 from mcpgateway.plugins.framework.loader.config import ConfigLoader
 from mcpgateway.plugins.framework.manager import PluginManager
@@ -226,6 +227,58 @@ class ExternalPluginServer:
             result_payload[ERROR] = convert_exception_to_error(ex, plugin_name=plugin_name).model_dump()
             return result_payload
 
+    async def invoke_hooks(self, calls: list[Dict[str, Any]]) -> list[dict]:
+        """Invoke a batch of plugin hooks concurrently.
+
+        Each call carries the same fields as :meth:`invoke_hook`. A failing call
+        reports its error in its own slot and does not affect the others.
+
+        Args:
+            calls: Hook invocations, each with ``hook_type``, ``plugin_name``, ``payload`` and ``context`` keys.
+
+        Returns:
+            One result dictionary per call, in the order the calls were given.
+
+        Examples:
+            >>> import asyncio
+            >>> import os
+            >>> os.environ["PYTHONPATH"] = "."
+            >>> from mcpgateway.plugins.framework import GlobalContext, PromptHookType, PromptPrehookPayload, PluginContext, PluginManager
+            >>> PluginManager.reset()
+            >>> server = ExternalPluginServer(config_path="./tests/unit/mcpgateway/plugins/fixtures/configs/valid_single_plugin.yaml")
+            >>> context = PluginContext(global_context=GlobalContext(request_id="1", server_id="2")).model_dump()
+            >>> calls = [
+            ...     {"hook_type": PromptHookType.PROMPT_PRE_FETCH, "plugin_name": "ReplaceBadWordsPlugin",
+            ...      "payload": PromptPrehookPayload(prompt_id="1", name="test_prompt", args={"user": text}).model_dump(), "context": context}
+            ...     for text in ("crap", "fine")
+            ... ]
+            >>> asyncio.run(server.initialize())
+            True
+            >>> results = asyncio.run(server.invoke_hooks(calls))
+            >>> [r["result"]["modified_payload"]["args"]["user"] for r in results]
+            ['yikes', 'fine']
+            >>> asyncio.run(server.invoke_hooks([{"hook_type": "prompt_pre_fetch"}]))[0]["error"]["plugin_name"]
+            'unknown'
+        """
+
+        async def _invoke(call: Dict[str, Any]) -> dict:
+            """Invoke a single call from the batch.
+
+            Args:
+                call: The hook invocation.
+
+            Returns:
+                The result dictionary for the call.
+            """
+            plugin_name = call.get(PLUGIN_NAME) or "unknown"
+            try:
+                return await self.invoke_hook(call[HOOK_TYPE], plugin_name, call[PAYLOAD], call[CONTEXT])
+            except Exception as ex:
+                logger.exception(ex)
+                return {PLUGIN_NAME: plugin_name, ERROR: convert_exception_to_error(ex, plugin_name=plugin_name).model_dump()}
+
+        return list(await asyncio.gather(*(_invoke(call) for call in calls)))
+
     async def initialize(self) -> bool:
         """Initialize the plugin server.
 
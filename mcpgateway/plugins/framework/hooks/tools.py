@@ -95,7 +95,25 @@ class ToolPostInvokePayload(PluginPayload):
     result: Any
 
 
-ToolPreInvokeResult = PluginResult[ToolPreInvokePayload]
+class ToolPreInvokeResult(PluginResult[ToolPreInvokePayload]):
+    """A result of the tool pre-invoke hook.
+
+    Attributes:
+        result: Final tool result. When set, the gateway skips the upstream call and
+            returns this result instead (post-invoke hooks still run). The first
+            plugin in priority order that sets it wins.
+
+    Examples:
+        >>> ToolPreInvokeResult().result is None
+        True
+        >>> hit = ToolPreInvokeResult(result={"content": [{"type": "text", "text": "cached"}]})
+        >>> hit.continue_processing, hit.result["content"][0]["text"]
+        (True, 'cached')
+    """
+
+    result: Optional[Any] = None
+
+
 ToolPostInvokeResult = PluginResult[ToolPostInvokePayload]
 
 
@@ -12,6 +12,7 @@ This module provides the core plugin management functionality including:
 - Timeout protection for plugin execution
 - Context management with automatic cleanup
 - Priority-based plugin ordering
+- Concurrent execution of consecutive read-only plugins
 - Conditional plugin execution based on prompts/servers/tenants
 
 Examples:
@@ -145,7 +146,10 @@ class PluginExecutor:
         res_local_contexts = {}
         combined_metadata: dict[str, Any] = {}
         current_payload: PluginPayload | None = None
+        # First result that carries a final hook result (e.g. a cached tool result)
+        short_circuit: PluginResult | None = None
 
+        active_refs = []
         for hook_ref in hook_refs:
             # Skip disabled plugins
             if hook_ref.plugin_ref.mode == PluginMode.DISABLED:
@@ -155,23 +159,28 @@ class PluginExecutor:
             if hook_ref.plugin_ref.conditions and not payload_matches(payload, hook_type, hook_ref.plugin_ref.conditions, global_context):
                 logger.debug("Skipping plugin %s - conditions not met", hook_ref.plugin_ref.name)
                 continue
+            active_refs.append(hook_ref)
+
+        for group in self._group_hook_refs(active_refs):
+            if len(group) > 1:
+                result, group_payload, group_short_circuit = await self._execute_group(
+                    group,
+                    current_payload or payload,
+                    global_context,
+                    local_contexts,
+                    res_local_contexts,
+                    violations_as_exceptions,
+                    combined_metadata,
+                )
+                if result is not None:
+                    return (result, res_local_contexts)
+                if group_payload is not None:
+                    current_payload = group_payload
+                short_circuit = short_circuit or group_short_circuit
+                continue
 
-            tmp_global_context = GlobalContext(
-                request_id=global_context.request_id,
-                user=global_context.user,
-                tenant_id=global_context.tenant_id,
-                server_id=global_context.server_id,
-                state={} if not global_context.state else copyonwrite(global_context.state),
-                metadata={} if not global_context.metadata else copyonwrite(global_context.metadata),
-            )
-            # Get or create local context for this plugin
-            local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
-            if local_contexts and local_context_key in local_contexts:
-                local_context = local_contexts[local_context_key]
-                local_context.global_context = tmp_global_context
-            else:
-                local_context = PluginContext(global_context=tmp_global_context)
-            res_local_contexts[local_context_key] = local_context
+            hook_ref = group[0]
+            local_context = self._prepare_local_context(hook_ref, global_context, local_contexts, res_local_contexts)
 
             # Execute plugin with timeout protection
             result = await self.execute_plugin(
@@ -179,7 +188,8 @@ class PluginExecutor:
                 current_payload or payload,
                 local_context,
                 violations_as_exceptions,
-                global_context,
+                # Read-only plugins share the global context, nothing to merge back
+                None if hook_ref.plugin_ref.read_only else global_context,
                 combined_metadata,
             )
             # Track payload modifications
@@ -187,12 +197,154 @@ class PluginExecutor:
                 current_payload = result.modified_payload
             if not result.continue_processing and hook_ref.plugin_ref.plugin.mode == PluginMode.ENFORCE:
                 return (result, res_local_contexts)
-
+            if short_circuit is None and getattr(result, "result", None) is not None:
+                short_circuit = result
+
+        if short_circuit is not None:
+            # Keep the hook-specific result type and its final result; later plugins still ran
+            # so they could block the request or record state for the post hook
+            return (
+                short_circuit.model_copy(update={"continue_processing": True, "modified_payload": current_payload, "violation": None, "metadata": combined_metadata}),
+                res_local_contexts,
+            )
         return (
             PluginResult(continue_processing=True, modified_payload=current_payload, violation=None, metadata=combined_metadata),
             res_local_contexts,
         )
 
+    def _group_hook_refs(self, hook_refs: list[HookRef]) -> list[list[HookRef]]:
+        """Split priority-ordered hook references into groups that may run concurrently.
+
+        Consecutive read-only plugins share a group, whatever their priority: none
+        of them can change what the next one sees. Every mutating plugin forms a
+        group of its own so the plugins after it still observe its payload and
+        context changes.
+
+        Args:
+            hook_refs: Hook references to execute, in priority order.
+
+        Returns:
+            Ordered list of groups; each multi-plugin group is run with ``asyncio.gather``.
+
+        Examples:
+            >>> from unittest.mock import MagicMock
+            >>> def ref(read_only):
+            ...     hook_ref = MagicMock()
+            ...     hook_ref.plugin_ref.read_only = read_only
+            ...     return hook_ref
+            >>> refs = [ref(True), ref(True), ref(False), ref(False), ref(True)]
+            >>> [len(group) for group in PluginExecutor()._group_hook_refs(refs)]
+            [2, 1, 1, 1]
+        """
+        groups: list[list[HookRef]] = []
+        for hook_ref in hook_refs:
+            if groups and hook_ref.plugin_ref.read_only and groups[-1][-1].plugin_ref.read_only:
+                groups[-1].append(hook_ref)
+            else:
+                groups.append([hook_ref])
+        return groups
+
+    def _prepare_local_context(
+        self,
+        hook_ref: HookRef,
+        global_context: GlobalContext,
+        local_contexts: Optional[PluginContextTable],
+        res_local_contexts: PluginContextTable,
+    ) -> PluginContext:
+        """Get or create the local context a plugin runs with.
+
+        Mutating plugins get a copy-on-write view of the global state and
+        metadata; read-only plugins see the global context directly.
+
+        Args:
+            hook_ref: The hook reference about to run.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Context table being built for this execution; updated in place.
+
+        Returns:
+            The plugin's local context.
+        """
+        if hook_ref.plugin_ref.read_only:
+            tmp_global_context = global_context
+        else:
+            tmp_global_context = GlobalContext(
+                request_id=global_context.request_id,
+                user=global_context.user,
+                tenant_id=global_context.tenant_id,
+                server_id=global_context.server_id,
+                state={} if not global_context.state else copyonwrite(global_context.state),
+                metadata={} if not global_context.metadata else copyonwrite(global_context.metadata),
+            )
+        # Get or create local context for this plugin
+        local_context_key = global_context.request_id + hook_ref.plugin_ref.uuid
+        if local_contexts and local_context_key in local_contexts:
+            local_context = local_contexts[local_context_key]
+            local_context.global_context = tmp_global_context
+        else:
+            local_context = PluginContext(global_context=tmp_global_context)
+        res_local_contexts[local_context_key] = local_context
+        return local_context
+
+    async def _execute_group(
+        self,
+        group: list[HookRef],
+        payload: PluginPayload,
+        global_context: GlobalContext,
+        local_contexts: Optional[PluginContextTable],
+        res_local_contexts: PluginContextTable,
+        violations_as_exceptions: bool,
+        combined_metadata: dict[str, Any],
+    ) -> tuple[Optional[PluginResult], Optional[PluginPayload], Optional[PluginResult]]:
+        """Run a group of read-only plugins concurrently and merge their results in priority order.
+
+        Results are folded in list order once every plugin has finished, so the
+        aggregated metadata and the reported violation or exception do not
+        depend on which plugin completed first.
+
+        Args:
+            group: Read-only hook references to run concurrently, in priority order.
+            payload: The payload entering the group.
+            global_context: Shared context for all plugins containing request metadata.
+            local_contexts: Optional existing contexts from previous hook executions.
+            res_local_contexts: Context table being built for this execution; updated in place.
+            violations_as_exceptions: Raise violations as exceptions rather than as returns.
+            combined_metadata: combination of the metadata of all plugins; updated in place.
+
+        Returns:
+            A tuple of the blocking result (or None if processing continues), the
+            modified payload (or None if no plugin in the group modified it) and the
+            first result carrying a final hook result (or None).
+
+        Raises:
+            BaseException: The exception of the first plugin, in priority order, that raised.
+        """
+        contexts = [self._prepare_local_context(hook_ref, global_context, local_contexts, res_local_contexts) for hook_ref in group]
+        outcomes = await asyncio.gather(
+            *(self.execute_plugin(hook_ref, payload, context, violations_as_exceptions) for hook_ref, context in zip(group, contexts)),
+            return_exceptions=True,
+        )
+
+        modified_payload: PluginPayload | None = None
+        short_circuit: PluginResult | None = None
+        for hook_ref, outcome in zip(group, outcomes):
+            if isinstance(outcome, BaseException):
+                raise outcome
+            if outcome.metadata:
+                combined_metadata.update(outcome.metadata)
+            if not outcome.continue_processing and hook_ref.plugin_ref.plugin.mode == PluginMode.ENFORCE:
+                return (
+                    PluginResult(continue_processing=False, modified_payload=payload, violation=outcome.violation, metadata=combined_metadata),
+                    modified_payload,
+                    None,
+                )
+            if outcome.modified_payload is not None:
+                logger.warning("Plugin %s is declared read_only but modified the payload", hook_ref.plugin_ref.name)
+                modified_payload = outcome.modified_payload
+            if short_circuit is None and getattr(outcome, "result", None) is not None:
+                short_circuit = outcome
+        return (None, modified_payload, short_circuit)
+
     async def execute_plugin(
         self,
         hook_ref: HookRef,
@@ -527,6 +527,9 @@ class MCPClientConfig(BaseModel):
         cwd (Optional[str]): Working directory for STDIO server process.
         uds (Optional[str]): Unix domain socket path for streamable HTTP.
         tls (Optional[MCPClientTLSConfig]): Client-side TLS configuration for mTLS.
+        batch_hooks (bool): Coalesce concurrent hook invocations for the same plugin server into one ``invoke_hooks`` call.
+        batch_window_ms (float): How long to wait for more invocations before sending a batch. 0 batches only calls issued together.
+        batch_max_size (int): Maximum number of hook invocations carried by a single batch.
     """
 
     proto: TransportType
@@ -537,6 +540,9 @@ class MCPClientConfig(BaseModel):
     cwd: Optional[str] = None
     uds: Optional[str] = None
     tls: Optional[MCPClientTLSConfig] = None
+    batch_hooks: bool = False
+    batch_window_ms: float = Field(default=0.0, ge=0)
+    batch_max_size: int = Field(default=32, ge=1)
 
     @field_validator(URL, mode="after")
     @classmethod
@@ -741,6 +747,7 @@ class PluginConfig(BaseModel):
         tags (list[str]): a list of tags for making the plugin searchable.
         mode (bool): whether the plugin is active.
         priority (int): indicates the order in which the plugin is run. Lower = higher priority. Default: 100.
+        read_only (bool): the plugin never modifies the payload or the global context, so it may run concurrently with its neighbours. Default: False.
         conditions (Optional[list[PluginCondition]]): the conditions on which the plugin is run.
         applied_to (Optional[list[AppliedTo]]): the tools, fields, that the plugin is applied to.
         config (dict[str, Any]): the plugin specific configurations.
@@ -757,6 +764,7 @@ class PluginConfig(BaseModel):
     tags: list[str] = Field(default_factory=list)
     mode: PluginMode = PluginMode.ENFORCE
     priority: int = 100  # Lower = higher priority
+    read_only: bool = False  # Never modifies payload or global context
     conditions: list[PluginCondition] = Field(default_factory=list)  # When to apply
     applied_to: Optional[AppliedTo] = None  # Fields to apply to.
     config: Optional[dict[str, Any]] = None
@@ -1025,6 +1025,16 @@ class EmailAuthService:
 
             self.db.commit()
 
+            if is_admin is not None:
+                try:
+                    # First-Party
+                    from mcpgateway.cache.auth_cache import auth_cache  # pylint: disable=import-outside-toplevel
+
+                    # The admin flag is cached by the permission service
+                    await auth_cache.invalidate_user(email)
+                except Exception as cache_error:
+                    logger.debug(f"Failed to invalidate auth cache on admin change: {cache_error}")
+
             return user
 
         except Exception as e:
@@ -41,7 +41,7 @@ Examples:
 # Standard
 import asyncio
 import binascii
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import logging
 import mimetypes
 import os
@@ -59,7 +59,7 @@ from mcp import ClientSession
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
 from pydantic import ValidationError
-from sqlalchemy import and_, delete, desc, or_, select, update
+from sqlalchemy import and_, delete, desc, func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload, selectinload, Session
 
@@ -84,7 +84,7 @@ from mcpgateway.db import PromptMetric
 from mcpgateway.db import Resource as DbResource
 from mcpgateway.db import ResourceMetric, ResourceSubscription, server_prompt_association, server_resource_association, server_tool_association, SessionLocal
 from mcpgateway.db import Tool as DbTool
-from mcpgateway.db import ToolMetric
+from mcpgateway.db import ToolMetric, ToolMetricsHourly
 from mcpgateway.observability import create_span
 from mcpgateway.schemas import GatewayCreate, GatewayRead, GatewayUpdate, PromptCreate, ResourceCreate, ToolCreate
 
@@ -375,6 +375,7 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
         self._http_client = ResilientHttpClient(client_args={"timeout": settings.federation_timeout, "verify": not settings.skip_ssl_verify})
         self._health_check_interval = GW_HEALTH_CHECK_INTERVAL
         self._health_check_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
         self._active_gateways: Set[str] = set()  # Track active gateway URLs
         self._stream_response = None
         self._pending_responses = {}
@@ -511,6 +512,10 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             # Always create the health check task in filelock mode; leader check is handled inside.
             self._health_check_task = asyncio.create_task(self._run_health_checks(user_email))
 
+        # Pre-warm pooled sessions for hot gateways in the background (every worker has its own pool)
+        if settings.mcp_session_pool_enabled and settings.mcp_session_pool_prewarm_gateways > 0:
+            self._prewarm_task = asyncio.create_task(self.prewarm_session_pool())
+
     async def shutdown(self) -> None:
         """Shutdown the service.
 
@@ -534,6 +539,13 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
             except asyncio.CancelledError:
                 pass
 
+        if getattr(self, "_prewarm_task", None):
+            self._prewarm_task.cancel()
+            try:
+                await self._prewarm_task
+            except asyncio.CancelledError:
+                pass
+
         # Cancel leader heartbeat task if running
         if getattr(self, "_leader_heartbeat_task", None):
             self._leader_heartbeat_task.cancel()
@@ -3463,6 +3475,104 @@ class GatewayService:  # pylint: disable=too-many-instance-attributes
 
         return True
 
+    async def prewarm_session_pool(self) -> int:
+        """Pre-create pooled MCP sessions for the most used gateways.
+
+        Gateways are ranked by tool invocations over the last 24 hours of
+        hourly metric rollups. Gateways with OAuth, query parameter auth or a
+        custom CA certificate are skipped because their sessions depend on
+        per-request credentials or SSL contexts.
+
+        Returns:
+            Number of sessions created.
+
+        Examples:
+            >>> import asyncio
+            >>> from unittest.mock import patch
+            >>> service = GatewayService()
+            >>> with patch("mcpgateway.services.gateway_service.get_mcp_session_pool", side_effect=RuntimeError("not initialized")):
+            ...     asyncio.run(service.prewarm_session_pool())
+            0
+        """
+        try:
+            pool = get_mcp_session_pool()
+        except RuntimeError:
+            return 0
+
+        since = datetime.now(timezone.utc) - timedelta(hours=24)
+        targets = []
+        with fresh_db_session() as db:
+            calls = func.sum(ToolMetricsHourly.total_count).label("calls")
+            hot_ids = [
+                row.gateway_id
+                for row in db.execute(
+                    select(DbTool.gateway_id, calls)
+                    .join(ToolMetricsHourly, ToolMetricsHourly.tool_id == DbTool.id)
+                    .where(DbTool.gateway_id.isnot(None), ToolMetricsHourly.hour_start >= since)
+                    .group_by(DbTool.gateway_id)
+                    .order_by(desc(calls))
+                    .limit(settings.mcp_session_pool_prewarm_gateways)
+                ).all()
+            ]
+            gateways = db.execute(select(DbGateway).where(DbGateway.id.in_(hot_ids), DbGateway.enabled.is_(True), DbGateway.reachable.is_(True))).scalars().all() if hot_ids else []
+            for gateway in sorted(gateways, key=lambda gw: hot_ids.index(gw.id)):
+                transport = (gateway.transport or "").lower()
+                if transport not in ("sse", "streamablehttp") or gateway.auth_type in ("oauth", "query_param") or gateway.ca_certificate:
+                    continue
+                auth_value = gateway.auth_value
+                headers = decode_auth(auth_value) if isinstance(auth_value, str) else {str(k): str(v) for k, v in (auth_value or {}).items()}
+                targets.append((str(gateway.id), gateway.url, TransportType.SSE if transport == "sse" else TransportType.STREAMABLE_HTTP, headers))
+            db.commit()
+
+        def get_httpx_client_factory(
+            headers: dict[str, str] | None = None,
+            timeout: httpx.Timeout | None = None,
+            auth: httpx.Auth | None = None,
+        ) -> httpx.AsyncClient:
+            """Factory function to create httpx.AsyncClient for pre-warmed sessions.
+
+            Args:
+                headers: Optional headers for the client
+                timeout: Optional timeout for the client
+                auth: Optional auth for the client
+
+            Returns:
+                httpx.AsyncClient: Configured HTTPX async client
+            """
+            return httpx.AsyncClient(
+                verify=get_default_verify(),
+                follow_redirects=True,
+                headers=headers,
+                timeout=timeout if timeout else get_http_timeout(),
+                auth=auth,
+                limits=httpx.Limits(
+                    max_connections=settings.httpx_max_connections,
+                    max_keepalive_connections=settings.httpx_max_keepalive_connections,
+                    keepalive_expiry=settings.httpx_keepalive_expiry,
+                ),
+            )
+
+        identities = settings.mcp_session_pool_prewarm_identities or [None]
+        results = await asyncio.gather(
+            *(
+                pool.prewarm(
+                    url,
+                    headers=headers,
+                    transport_type=transport_type,
+                    count=settings.mcp_session_pool_prewarm_sessions,
+                    httpx_client_factory=get_httpx_client_factory,
+                    user_identity=identity,
+                    gateway_id=gateway_id,
+                )
+                for gateway_id, url, transport_type, headers in targets
+                for identity in identities
+            ),
+            return_exceptions=True,
+        )
+        created = sum(result for result in results if isinstance(result, int))
+        logger.info(f"Pre-warmed {created} MCP session(s) for {len(targets)} hot gateway(s)")
+        return created
+
     async def _check_single_gateway_health(self, gateway: DbGateway, user_email: Optional[str] = None) -> None:
         """Check health of a single gateway.
 
@@ -7,6 +7,13 @@ Log Aggregation Service.
 
 This module provides aggregation of performance metrics from structured logs
 into time-windowed statistics for analysis and monitoring.
+
+Durations are folded into mergeable per-window statistics (exact values for
+small windows, a DDSketch beyond that), so windows are computed in one pass
+over the log rows and larger windows are built by merging smaller ones. With
+``metrics_aggregation_incremental_enabled``, entries are also recorded per
+minute as they are logged, and recent windows are rolled up from those
+minutes without reading the log table.
 """
 
 # Standard
@@ -14,7 +21,9 @@ from datetime import datetime, timedelta, timezone
 import logging
 import math
 import statistics
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Third-Party
 from sqlalchemy import and_, func, select, text
@@ -23,9 +32,15 @@ from sqlalchemy.orm import Session
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import engine, PerformanceMetric, SessionLocal, StructuredLogEntry
+from mcpgateway.utils.quantile_sketch import DDSketch
 
 logger = logging.getLogger(__name__)
 
+# Windows keep exact durations up to this many samples, then switch to a sketch
+_EXACT_SAMPLE_LIMIT = 1024
+_SKETCH_RELATIVE_ACCURACY = 0.01
+_ERROR_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
 
 def _is_postgresql() -> bool:
     """Check if the database backend is PostgreSQL.
@@ -36,6 +51,252 @@ def _is_postgresql() -> bool:
     return engine.dialect.name == "postgresql"
 
 
+def _is_error_entry(level: Optional[str], has_error_details: Any) -> bool:
+    """Check whether a log entry counts as an error for aggregation.
+
+    Args:
+        level: Log level name
+        has_error_details: Truthy when the entry carries error details
+
+    Returns:
+        True for ERROR/CRITICAL entries and entries with error details
+
+    Examples:
+        >>> _is_error_entry("error", None), _is_error_entry("INFO", {"error_type": "X"}), _is_error_entry(None, None)
+        (True, True, False)
+    """
+    return bool((level and level.upper() in _ERROR_LEVELS) or has_error_details)
+
+
+def _minute_of(ts: datetime) -> int:
+    """Return the minute number (minutes since the epoch) of a timestamp.
+
+    Args:
+        ts: Timestamp; naive values are taken as UTC
+
+    Returns:
+        Minute number
+
+    Examples:
+        >>> _minute_of(datetime(1970, 1, 1, 0, 2, 59, tzinfo=timezone.utc))
+        2
+    """
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp() // 60)
+
+
+class WindowStats:
+    """Mergeable duration statistics of one component/operation in a window.
+
+    Keeps exact durations for small windows, so their percentiles match the
+    exact computation, and switches to a DDSketch once a window exceeds
+    ``_EXACT_SAMPLE_LIMIT`` samples. The sketch of an exact window is built
+    once and reused, so minute statistics are cheap to merge repeatedly into
+    large windows.
+
+    Examples:
+        >>> first, second = WindowStats(), WindowStats()
+        >>> for value in (1.0, 2.0, 3.0):
+        ...     first.add(value, is_error=False)
+        >>> second.add(4.0, is_error=True)
+        >>> stats = first.merge(second).to_stats()
+        >>> stats["count"], stats["p50"], stats["error_count"], stats["max_duration"]
+        (4, 2.5, 1, 4.0)
+    """
+
+    __slots__ = ("count", "total", "min", "max", "error_count", "_values", "_sketch", "_values_sketch")
+
+    def __init__(self) -> None:
+        """Create empty statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.error_count = 0
+        self._values: Optional[List[float]] = []
+        self._sketch: Optional[DDSketch] = None
+        self._values_sketch: Optional[DDSketch] = None
+
+    def add(self, duration: float, is_error: bool) -> None:
+        """Record one duration.
+
+        Args:
+            duration: Duration in milliseconds
+            is_error: Whether the entry was an error
+        """
+        duration = float(duration)
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        if is_error:
+            self.error_count += 1
+        if self._values is not None:
+            self._values.append(duration)
+            self._values_sketch = None
+            if len(self._values) > _EXACT_SAMPLE_LIMIT:
+                self._to_sketch()
+        else:
+            self._sketch.add(duration)  # type: ignore[union-attr]
+
+    def merge(self, other: "WindowStats") -> "WindowStats":
+        """Add another window's statistics to this one.
+
+        Args:
+            other: Statistics to merge
+
+        Returns:
+            This object
+        """
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.error_count += other.error_count
+        # pylint: disable=protected-access
+        if self._values is not None and other._values is not None and len(self._values) + len(other._values) <= _EXACT_SAMPLE_LIMIT:
+            self._values.extend(other._values)
+            return self
+        if self._sketch is None:
+            self._to_sketch()
+        self._sketch.merge(other._as_sketch())  # type: ignore[union-attr]
+        return self
+
+    def _as_sketch(self) -> DDSketch:
+        """Return a sketch of the durations without converting this window.
+
+        Returns:
+            The window's sketch, or a cached sketch of its exact values
+        """
+        if self._sketch is not None:
+            return self._sketch
+        if self._values_sketch is None:
+            self._values_sketch = DDSketch(_SKETCH_RELATIVE_ACCURACY)
+            self._values_sketch.update(self._values or ())
+        return self._values_sketch
+
+    def _to_sketch(self) -> None:
+        """Move the exact values into a sketch."""
+        self._sketch = self._as_sketch().copy()
+        self._values = None
+        self._values_sketch = None
+
+    def to_stats(self) -> Dict[str, Any]:
+        """Return the statistics in the shape produced by ``_compute_stats_python``.
+
+        Returns:
+            Dictionary with count, avg/min/max duration, p50/p95/p99 and error_count
+        """
+        if self._values is not None:
+            ordered = sorted(self._values)
+            p50, p95, p99 = (LogAggregator._percentile(ordered, q) for q in (0.5, 0.95, 0.99))  # pylint: disable=protected-access
+        else:
+            p50, p95, p99 = (self._sketch.quantile(q) for q in (0.5, 0.95, 0.99))  # type: ignore[union-attr]
+        return {
+            "count": self.count,
+            "avg_duration": self.total / self.count if self.count else 0.0,
+            "min_duration": self.min if self.count else 0.0,
+            "max_duration": self.max if self.count else 0.0,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "error_count": self.error_count,
+        }
+
+
+class SlidingWindowAggregator:
+    """Per-minute ``WindowStats`` of each component/operation, fed as entries are logged.
+
+    Windows starting at or after the first complete minute since creation are
+    rolled up by merging minute statistics. Minutes older than the retention
+    are dropped as new entries arrive.
+
+    Examples:
+        >>> agg = SlidingWindowAggregator(retention_minutes=60)
+        >>> agg._started_minute = 0  # pretend we have been recording since the epoch
+        >>> t0 = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        >>> for minute, duration in ((0, 10.0), (1, 20.0), (5, 99.0)):
+        ...     agg.record("api", "GET", t0 + timedelta(minutes=minute), duration, is_error=False)
+        >>> window = agg.window_stats(t0, t0 + timedelta(minutes=5))
+        >>> window[("api", "GET")].to_stats()["count"], agg.covers(t0)
+        (2, True)
+    """
+
+    def __init__(self, retention_minutes: int = 60):
+        """Initialize the sliding window aggregator.
+
+        Args:
+            retention_minutes: Minutes of per-minute statistics to keep
+        """
+        self._retention_minutes = max(1, retention_minutes)
+        self._minutes: Dict[int, Dict[Tuple[str, str], WindowStats]] = {}
+        # Entries are only complete from the first full minute after creation
+        self._started_minute = int(time.time() // 60) + 1
+        self._latest_minute = 0
+        self._lock = threading.Lock()
+
+    def record(self, component: str, operation_type: str, timestamp: Optional[datetime], duration_ms: float, is_error: bool) -> None:
+        """Record one log entry.
+
+        Args:
+            component: Component name
+            operation_type: Operation name
+            timestamp: Entry timestamp (defaults to now)
+            duration_ms: Duration in milliseconds
+            is_error: Whether the entry counts as an error
+        """
+        minute = _minute_of(timestamp) if timestamp is not None else int(time.time() // 60)
+        with self._lock:
+            buckets = self._minutes.get(minute)
+            if buckets is None:
+                buckets = self._minutes[minute] = {}
+                if minute > self._latest_minute:
+                    self._latest_minute = minute
+                    self._prune()
+            stats = buckets.get((component, operation_type))
+            if stats is None:
+                stats = buckets[(component, operation_type)] = WindowStats()
+            stats.add(duration_ms, is_error)
+
+    def _prune(self) -> None:
+        """Drop minutes older than the retention. Caller holds the lock."""
+        cutoff = self._latest_minute - self._retention_minutes
+        for minute in [minute for minute in self._minutes if minute < cutoff]:
+            del self._minutes[minute]
+
+    def covers(self, window_start: datetime) -> bool:
+        """Check whether every entry of a window starting at ``window_start`` was recorded.
+
+        Args:
+            window_start: Window start
+
+        Returns:
+            True if the window lies within the recorded, retained minutes
+        """
+        minute = _minute_of(window_start)
+        return minute >= self._started_minute and minute >= self._latest_minute - self._retention_minutes
+
+    def window_stats(self, window_start: datetime, window_end: datetime) -> Dict[Tuple[str, str], WindowStats]:
+        """Merge the minute statistics of ``[window_start, window_end)``.
+
+        Args:
+            window_start: Window start (inclusive)
+            window_end: Window end (exclusive)
+
+        Returns:
+            Merged statistics per (component, operation)
+        """
+        merged: Dict[Tuple[str, str], WindowStats] = {}
+        with self._lock:
+            for minute in range(_minute_of(window_start), _minute_of(window_end)):
+                for key, stats in self._minutes.get(minute, {}).items():
+                    merged.setdefault(key, WindowStats()).merge(stats)
+        return merged
+
+
 class LogAggregator:
     """Aggregates structured logs into performance metrics."""
 
@@ -44,6 +305,30 @@ class LogAggregator:
         self.aggregation_window_minutes = getattr(settings, "metrics_aggregation_window_minutes", 5)
         self.enabled = getattr(settings, "metrics_aggregation_enabled", True)
         self._use_sql_percentiles = _is_postgresql()
+        self.incremental_enabled = self.enabled and getattr(settings, "metrics_aggregation_incremental_enabled", False) is True
+        self._sliding: Optional[SlidingWindowAggregator] = None
+        if self.incremental_enabled:
+            retention = getattr(settings, "metrics_aggregation_sketch_retention_minutes", 60)
+            self._sliding = SlidingWindowAggregator(retention_minutes=max(retention, self.aggregation_window_minutes))
+
+    def record_entry(self, entry: Dict[str, Any]) -> None:
+        """Record a structured log entry in the per-minute statistics.
+
+        Called by the structured log router for every entry; entries without
+        a duration, component or operation are ignored.
+
+        Args:
+            entry: Structured log entry
+        """
+        if self._sliding is None:
+            return
+        duration = entry.get("duration_ms")
+        component = entry.get("component")
+        operation = entry.get("operation_type")
+        if duration is None or not component or not operation:
+            return
+        has_error_details = entry.get("error_type") or entry.get("error_message") or entry.get("error_stack_trace") or entry.get("error_context")
+        self._sliding.record(component, operation, entry.get("timestamp"), duration, _is_error_entry(entry.get("level"), has_error_details))
 
     def aggregate_performance_metrics(
         self, component: Optional[str], operation_type: Optional[str], window_start: Optional[datetime] = None, window_end: Optional[datetime] = None, db: Optional[Session] = None
@@ -322,55 +607,16 @@ class LogAggregator:
                 if not entries:
                     continue
 
-                # Bucket entries into windows
-                buckets: Dict[datetime, List[StructuredLogEntry]] = {}
-                for e in entries:
-                    ts = e.timestamp if e.timestamp.tzinfo else e.timestamp.replace(tzinfo=timezone.utc)
-                    bucket_start = _align_to_window_local(ts, window_minutes)
-                    if bucket_start not in buckets:
-                        buckets[bucket_start] = []
-                    buckets[bucket_start].append(e)
+                # Fold entries into mergeable per-window statistics (single pass, no sorting)
+                buckets = self._bucket_entries(entries, window_minutes, _align_to_window_local)
 
                 # For each requested window, compute stats if we have data
                 for window_start in window_starts:
-                    bucket_entries = buckets.get(window_start)
-                    if not bucket_entries:
+                    bucket = buckets.get(window_start)
+                    if bucket is None:
                         continue
-
-                    durations = sorted([b.duration_ms for b in bucket_entries if b.duration_ms is not None])
-                    if not durations:
-                        continue
-
-                    count = len(durations)
-                    avg_duration = float(sum(durations) / count) if count else 0.0
-                    min_duration = float(durations[0])
-                    max_duration = float(durations[-1])
-                    p50 = float(self._percentile(durations, 0.5))
-                    p95 = float(self._percentile(durations, 0.95))
-                    p99 = float(self._percentile(durations, 0.99))
-                    error_count = self._calculate_error_count(bucket_entries)
-
                     try:
-                        metric = self._upsert_metric(
-                            component=component,
-                            operation_type=operation,
-                            window_start=window_start,
-                            window_end=window_start + window_delta,
-                            request_count=count,
-                            error_count=error_count,
-                            error_rate=(error_count / count) if count else 0.0,
-                            avg_duration_ms=avg_duration,
-                            min_duration_ms=min_duration,
-                            max_duration_ms=max_duration,
-                            p50_duration_ms=p50,
-                            p95_duration_ms=p95,
-                            p99_duration_ms=p99,
-                            metric_metadata={
-                                "sample_size": count,
-                                "generated_at": datetime.now(timezone.utc).isoformat(),
-                            },
-                            db=db,
-                        )
+                        metric = self._upsert_window_stats(component, operation, window_start, window_start + window_delta, bucket.to_stats(), db)
                         if metric:
                             created_metrics.append(metric)
                     except Exception:
@@ -412,6 +658,12 @@ class LogAggregator:
         try:
             window_start, window_end = self._resolve_window_bounds(window_start, window_end)
 
+            if self._sliding is not None and self._sliding.covers(window_start):
+                metrics = self._aggregate_from_sliding(window_start, window_end, db)
+                if should_close:
+                    db.commit()
+                return metrics
+
             stmt = (
                 select(StructuredLogEntry.component, StructuredLogEntry.operation_type)
                 .where(
@@ -599,19 +851,22 @@ class LogAggregator:
 
         try:
             _, latest_end = self._resolve_window_bounds(None, None)
-            current_start = latest_end - (window_delta * total_windows)
-            processed = 0
-
-            while current_start < latest_end:
-                current_end = current_start + window_delta
-                created = self.aggregate_all_components(
-                    window_start=current_start,
-                    window_end=current_end,
-                    db=db,
-                )
-                if created:
-                    processed += 1
-                current_start = current_end
+            window_starts = [latest_end - (window_delta * (total_windows - i)) for i in range(total_windows)]
+
+            # Recent windows come from the per-minute statistics; the rest are
+            # aggregated from the log table in a single batch
+            processed_starts = set()
+            uncovered = []
+            for window_start in window_starts:
+                if self._sliding is not None and self._sliding.covers(window_start):
+                    if self._aggregate_from_sliding(window_start, window_start + window_delta, db):
+                        processed_starts.add(window_start)
+                else:
+                    uncovered.append(window_start)
+            if uncovered:
+                for metric in self.aggregate_all_components_batch(uncovered, window_minutes, db=db):
+                    processed_starts.add(metric.window_start)
+            processed = len(processed_starts)
 
             if should_close:
                 db.commit()  # Commit on success
@@ -626,6 +881,85 @@ class LogAggregator:
             if should_close:
                 db.close()
 
+    def _aggregate_from_sliding(self, window_start: datetime, window_end: datetime, db: Session) -> List[PerformanceMetric]:
+        """Write metrics for a window rolled up from the per-minute statistics.
+
+        Args:
+            window_start: Window start
+            window_end: Window end
+            db: Database session
+
+        Returns:
+            List of created/updated PerformanceMetric records
+        """
+        metrics = []
+        for (component, operation), stats in self._sliding.window_stats(window_start, window_end).items():  # type: ignore[union-attr]
+            metric = self._upsert_window_stats(component, operation, window_start, window_end, stats.to_stats(), db)
+            if metric:
+                metrics.append(metric)
+        return metrics
+
+    @staticmethod
+    def _bucket_entries(entries: Iterable[Any], window_minutes: int, align: Any) -> Dict[datetime, WindowStats]:
+        """Fold log entries into per-window statistics.
+
+        Args:
+            entries: Rows with timestamp, duration_ms, level and error_details
+            window_minutes: Window size in minutes
+            align: Function mapping (timestamp, window_minutes) to the window start
+
+        Returns:
+            Statistics per window start
+        """
+        buckets: Dict[datetime, WindowStats] = {}
+        for entry in entries:
+            if entry.duration_ms is None:
+                continue
+            ts = entry.timestamp if entry.timestamp.tzinfo else entry.timestamp.replace(tzinfo=timezone.utc)
+            bucket_start = align(ts, window_minutes)
+            stats = buckets.get(bucket_start)
+            if stats is None:
+                stats = buckets[bucket_start] = WindowStats()
+            stats.add(entry.duration_ms, _is_error_entry(entry.level, entry.error_details))
+        return buckets
+
+    def _upsert_window_stats(self, component: str, operation_type: str, window_start: datetime, window_end: datetime, stats: Dict[str, Any], db: Session) -> PerformanceMetric:
+        """Upsert a metric from a statistics dictionary.
+
+        Args:
+            component: Component name
+            operation_type: Operation name
+            window_start: Window start
+            window_end: Window end
+            stats: Output of ``WindowStats.to_stats``
+            db: Database session
+
+        Returns:
+            PerformanceMetric: Created or updated metric
+        """
+        count = stats["count"]
+        error_count = stats["error_count"]
+        return self._upsert_metric(
+            component=component,
+            operation_type=operation_type,
+            window_start=window_start,
+            window_end=window_end,
+            request_count=count,
+            error_count=error_count,
+            error_rate=(error_count / count) if count else 0.0,
+            avg_duration_ms=float(stats["avg_duration"]),
+            min_duration_ms=float(stats["min_duration"]),
+            max_duration_ms=float(stats["max_duration"]),
+            p50_duration_ms=float(stats["p50"]),
+            p95_duration_ms=float(stats["p95"]),
+            p99_duration_ms=float(stats["p99"]),
+            metric_metadata={
+                "sample_size": count,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+            },
+            db=db,
+        )
+
     @staticmethod
     def _percentile(sorted_values: List[float], percentile: float) -> float:
         """Calculate percentile from sorted values.
@@ -806,36 +1140,15 @@ class LogAggregator:
         if not results:
             return None
 
-        # Extract durations
-        durations = sorted(r.duration_ms for r in results if r.duration_ms is not None)
+        window = WindowStats()
+        for result in results:
+            if result.duration_ms is not None:
+                window.add(result.duration_ms, _is_error_entry(result.level, result.error_details))
 
-        if not durations:
+        if not window.count:
             return None
 
-        # Calculate statistics
-        count = len(durations)
-        avg_duration = statistics.fmean(durations) if hasattr(statistics, "fmean") else statistics.mean(durations)
-        min_duration = durations[0]
-        max_duration = durations[-1]
-
-        # Calculate percentiles
-        p50 = self._percentile(durations, 0.50)
-        p95 = self._percentile(durations, 0.95)
-        p99 = self._percentile(durations, 0.99)
-
-        # Count errors
-        error_count = self._calculate_error_count(results)
-
-        return {
-            "count": count,
-            "avg_duration": avg_duration,
-            "min_duration": min_duration,
-            "max_duration": max_duration,
-            "p50": p50,
-            "p95": p95,
-            "p99": p99,
-            "error_count": error_count,
-        }
+        return window.to_stats()
 
     def _resolve_window_bounds(
         self,
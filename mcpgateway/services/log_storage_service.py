@@ -7,20 +7,44 @@ Authors: Mihai Criveti
 Log Storage Service Implementation.
 This service provides in-memory storage for recent logs with entity context,
 supporting filtering, pagination, and real-time streaming.
+
+Entries live in a ring buffer and get a monotonically increasing sequence
+number. The entity, request and level indices hold ascending sequence numbers
+in lists with a head offset, so evicting the oldest entry is amortized O(1)
+and a sequence range is found by binary search. Time ranges are resolved by
+binary search over a timestamp column.
 """
 
 # Standard
 import asyncio
+from bisect import bisect_left, bisect_right
 from collections import deque
 from datetime import datetime, timezone
+import heapq
+from itertools import islice
 import sys
-from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, TypedDict
+from typing import Any, AsyncGenerator, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict
 import uuid
 
 # First-Party
 from mcpgateway.common.models import LogLevel
 from mcpgateway.config import settings
 
+# Severity order used by level filters
+_LEVEL_VALUES: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.NOTICE: 2,
+    LogLevel.WARNING: 3,
+    LogLevel.ERROR: 4,
+    LogLevel.CRITICAL: 5,
+    LogLevel.ALERT: 6,
+    LogLevel.EMERGENCY: 7,
+}
+
+# Evicted head slots are compacted once there are at least this many
+_COMPACT_THRESHOLD = 1024
+
 
 class LogEntryDict(TypedDict, total=False):
     """TypedDict for LogEntry serialization."""
@@ -51,9 +75,10 @@ class LogEntry:
         logger: Logger name/source
         data: Additional structured data
         request_id: Associated request ID for tracing
+        seq: Sequence number assigned when stored (-1 until then)
     """
 
-    __slots__ = ("id", "timestamp", "level", "entity_type", "entity_id", "entity_name", "message", "logger", "data", "request_id", "_size")
+    __slots__ = ("id", "timestamp", "level", "entity_type", "entity_id", "entity_name", "message", "logger", "data", "request_id", "seq", "_size")
 
     def __init__(  # pylint: disable=too-many-positional-arguments
         self,
@@ -88,6 +113,7 @@ class LogEntry:
         self.logger = logger
         self.data = data
         self.request_id = request_id
+        self.seq = -1
 
         # Estimate memory size (rough approximation)
         self._size = sys.getsizeof(self.id)
@@ -138,6 +164,249 @@ class LogEntry:
         }
 
 
+class _LogRing:
+    """Ring buffer of log entries addressed by sequence number.
+
+    Entries and their timestamps are stored in parallel lists. Evicted head
+    slots are released in bulk, so ``append`` and ``popleft`` are amortized
+    O(1), and entry ``seq`` lives at ``head + seq - first_seq``.
+
+    Examples:
+        >>> ring = _LogRing()
+        >>> for i in range(3):
+        ...     ring.append(LogEntry(LogLevel.INFO, f"m{i}"))
+        >>> ring.popleft().message, len(ring), ring.first_seq
+        ('m0', 2, 1)
+        >>> ring.get(2).message, ring[-1].seq
+        ('m2', 2)
+    """
+
+    __slots__ = ("_entries", "_times", "_head", "_next_seq")
+
+    def __init__(self) -> None:
+        """Initialize an empty ring."""
+        self._entries: List[Optional[LogEntry]] = []
+        self._times: List[float] = []
+        self._head = 0
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries.
+
+        Returns:
+            Number of entries
+        """
+        return len(self._entries) - self._head
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """Iterate from oldest to newest.
+
+        Returns:
+            Iterator over the stored entries
+        """
+        return islice(self._entries, self._head, None)  # type: ignore[arg-type]
+
+    def __getitem__(self, index: int) -> LogEntry:
+        """Return the entry at a position (negative positions count from the newest).
+
+        Args:
+            index: Position in the buffer
+
+        Returns:
+            The log entry
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("log buffer index out of range")
+        return self._entries[self._head + index]  # type: ignore[return-value]
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest stored entry.
+
+        Returns:
+            The oldest sequence number (equal to ``next_seq`` when empty)
+        """
+        return self._next_seq - len(self)
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended entry will get.
+
+        Returns:
+            The next sequence number
+        """
+        return self._next_seq
+
+    def append(self, entry: LogEntry) -> None:
+        """Append an entry and assign its sequence number.
+
+        Args:
+            entry: Log entry to store
+        """
+        entry.seq = self._next_seq
+        self._next_seq += 1
+        self._entries.append(entry)
+        self._times.append(entry.timestamp.timestamp())
+
+    def popleft(self) -> LogEntry:
+        """Remove and return the oldest entry.
+
+        Returns:
+            The evicted entry
+        """
+        entry = self._entries[self._head]
+        self._entries[self._head] = None
+        self._head += 1
+        if self._head >= _COMPACT_THRESHOLD and self._head * 2 >= len(self._entries):
+            del self._entries[: self._head]
+            del self._times[: self._head]
+            self._head = 0
+        return entry  # type: ignore[return-value]
+
+    def get(self, seq: int) -> LogEntry:
+        """Return the entry with a sequence number.
+
+        Args:
+            seq: Sequence number between ``first_seq`` and ``next_seq - 1``
+
+        Returns:
+            The log entry
+        """
+        return self._entries[self._head + seq - self.first_seq]  # type: ignore[return-value]
+
+    def seq_range(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> Tuple[int, int]:
+        """Find the sequence numbers of entries within a time range.
+
+        Entries are appended in timestamp order, so this is a binary search
+        over the timestamp column.
+
+        Args:
+            start_time: Inclusive lower bound, or None
+            end_time: Inclusive upper bound, or None
+
+        Returns:
+            Half-open ``(first, stop)`` range of sequence numbers
+        """
+        lo, hi = self._head, len(self._entries)
+        if start_time is not None:
+            lo = bisect_left(self._times, start_time.timestamp(), lo, hi)
+        if end_time is not None:
+            hi = bisect_right(self._times, end_time.timestamp(), lo, hi)
+        base = self.first_seq - self._head
+        return base + lo, base + hi
+
+    def clear(self) -> None:
+        """Drop all entries; sequence numbers keep increasing."""
+        self._entries.clear()
+        self._times.clear()
+        self._head = 0
+
+
+class _SeqIndex:
+    """Ascending sequence numbers of the entries sharing one index key.
+
+    Stored in a list with a head offset rather than a deque, so that range
+    lookups can bisect it in O(log n). Dropping the oldest number only moves
+    the head; dropped slots are released once they make up half the list,
+    which keeps ``append`` and ``pop_oldest`` amortized O(1).
+
+    Examples:
+        >>> index = _SeqIndex([1, 4, 6, 9])
+        >>> list(index.slice(2, 9, descending=True))
+        [6, 4]
+        >>> index.pop_oldest(1), index.pop_oldest(6), len(index), 1 in index, 4 in index
+        (True, False, 3, False, True)
+    """
+
+    __slots__ = ("_seqs", "_head")
+
+    def __init__(self, seqs: Iterable[int] = ()) -> None:
+        """Initialize the index.
+
+        Args:
+            seqs: Initial sequence numbers in ascending order
+        """
+        self._seqs: List[int] = list(seqs)
+        self._head = 0
+
+    def __len__(self) -> int:
+        """Return the number of sequence numbers.
+
+        Returns:
+            Number of stored sequence numbers
+        """
+        return len(self._seqs) - self._head
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate in ascending order.
+
+        Returns:
+            Iterator over the sequence numbers
+        """
+        return islice(self._seqs, self._head, None)
+
+    def __contains__(self, seq: object) -> bool:
+        """Check whether a sequence number is stored.
+
+        Args:
+            seq: Sequence number
+
+        Returns:
+            True if stored
+        """
+        i = bisect_left(self._seqs, seq, self._head)  # type: ignore[call-overload]
+        return i < len(self._seqs) and self._seqs[i] == seq
+
+    def append(self, seq: int) -> None:
+        """Add a sequence number larger than every stored one.
+
+        Args:
+            seq: Sequence number
+        """
+        self._seqs.append(seq)
+
+    def pop_oldest(self, seq: int) -> bool:
+        """Drop the oldest sequence number if it is ``seq``.
+
+        Args:
+            seq: Sequence number of an evicted entry
+
+        Returns:
+            True if it was dropped
+        """
+        if self._head >= len(self._seqs) or self._seqs[self._head] != seq:
+            return False
+        self._head += 1
+        if self._head * 2 >= len(self._seqs):
+            del self._seqs[: self._head]
+            self._head = 0
+        return True
+
+    def slice(self, first: int, stop: int, descending: bool) -> Iterable[int]:
+        """Select the sequence numbers within ``[first, stop)``.
+
+        Args:
+            first: Lowest sequence number to include
+            stop: Sequence number to stop before
+            descending: Yield newest first
+
+        Returns:
+            Iterable over the selected sequence numbers
+        """
+        seqs = self._seqs
+        lo = bisect_left(seqs, first, self._head)
+        hi = bisect_left(seqs, stop, lo)
+        if descending:
+            return map(seqs.__getitem__, range(hi - 1, lo - 1, -1))
+        return islice(seqs, lo, hi)
+
+
 class LogStorageMessage(TypedDict):
     """TypedDict for messages sent to subscribers."""
 
@@ -149,7 +418,7 @@ class LogStorageService:
     """Service for storing and retrieving log entries in memory.
 
     Provides:
-    - Size-limited circular buffer (default 1MB)
+    - Size-limited ring buffer (default 1MB) with sequence numbers
     - Entity context tracking
     - Real-time streaming
     - Filtering and pagination
@@ -161,13 +430,18 @@ class LogStorageService:
         self._max_size_bytes = int(settings.log_buffer_size_mb * 1024 * 1024)
         self._current_size_bytes = 0
 
-        # Use deque for efficient append/pop operations
-        self._buffer: Deque[LogEntry] = deque()
+        self._buffer = _LogRing()
         self._subscribers: List[asyncio.Queue[LogStorageMessage]] = []
 
-        # Indices for efficient filtering
-        self._entity_index: Dict[str, List[str]] = {}  # entity_key -> [log_ids]
-        self._request_index: Dict[str, List[str]] = {}  # request_id -> [log_ids]
+        # Entries waiting to be fanned out to subscribers
+        self._pending: Deque[LogEntry] = deque()
+        self._fan_out_scheduled = False
+
+        # Indices for efficient filtering (ascending sequence numbers)
+        self._entity_index: Dict[str, _SeqIndex] = {}  # entity_key -> seqs
+        self._request_index: Dict[str, _SeqIndex] = {}  # request_id -> seqs
+        self._level_index: Dict[LogLevel, _SeqIndex] = {}  # level -> seqs
+        self._entity_type_counts: Dict[str, int] = {}
 
     async def add_log(  # pylint: disable=too-many-positional-arguments
         self,
@@ -211,16 +485,14 @@ class LogStorageService:
         self._current_size_bytes += log_entry._size  # pylint: disable=protected-access
 
         # Update indices BEFORE eviction so they can be cleaned up properly
+        seq = log_entry.seq
         if entity_id:
-            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
-            if key not in self._entity_index:
-                self._entity_index[key] = []
-            self._entity_index[key].append(log_entry.id)
-
+            self._entity_index.setdefault(self._entity_key(entity_type, entity_id), _SeqIndex()).append(seq)
         if request_id:
-            if request_id not in self._request_index:
-                self._request_index[request_id] = []
-            self._request_index[request_id].append(log_entry.id)
+            self._request_index.setdefault(request_id, _SeqIndex()).append(seq)
+        self._level_index.setdefault(level, _SeqIndex()).append(seq)
+        if entity_type:
+            self._entity_type_counts[entity_type] = self._entity_type_counts.get(entity_type, 0) + 1
 
         # Remove old entries if size limit exceeded
         while self._current_size_bytes > self._max_size_bytes and self._buffer:
@@ -228,39 +500,84 @@ class LogStorageService:
             self._current_size_bytes -= old_entry._size  # pylint: disable=protected-access
             self._remove_from_indices(old_entry)
 
-        # Notify subscribers
-        await self._notify_subscribers(log_entry)
+        # Notify subscribers without waiting for them
+        if self._subscribers:
+            self._schedule_fan_out(log_entry)
 
         return log_entry
 
+    @staticmethod
+    def _entity_key(entity_type: Optional[str], entity_id: str) -> str:
+        """Build the entity index key.
+
+        Args:
+            entity_type: Type of entity, if known
+            entity_id: ID of the entity
+
+        Returns:
+            ``type:id``, or the bare ID without a type
+
+        Examples:
+            >>> LogStorageService._entity_key("tool", "t1"), LogStorageService._entity_key(None, "t1")
+            ('tool:t1', 't1')
+        """
+        return f"{entity_type}:{entity_id}" if entity_type else entity_id
+
+    @staticmethod
+    def _pop_oldest(index: Dict[Any, _SeqIndex], key: Any, seq: int) -> None:
+        """Drop an evicted sequence number from an index.
+
+        Evictions happen oldest first, so the sequence number is the oldest
+        one of its key.
+
+        Args:
+            index: Index to update
+            key: Index key of the evicted entry
+            seq: Sequence number of the evicted entry
+        """
+        seqs = index.get(key)
+        if seqs is not None and seqs.pop_oldest(seq) and not seqs:
+            del index[key]
+
     def _remove_from_indices(self, entry: LogEntry) -> None:
         """Remove entry from indices when evicted from buffer.
 
         Args:
             entry: LogEntry to remove from indices
         """
-        # Remove from entity index
         if entry.entity_id:
-            key = f"{entry.entity_type}:{entry.entity_id}" if entry.entity_type else entry.entity_id
-            if key in self._entity_index:
-                try:
-                    self._entity_index[key].remove(entry.id)
-                    if not self._entity_index[key]:
-                        del self._entity_index[key]
-                except ValueError:
-                    pass
-
-        # Remove from request index
-        if entry.request_id and entry.request_id in self._request_index:
-            try:
-                self._request_index[entry.request_id].remove(entry.id)
-                if not self._request_index[entry.request_id]:
-                    del self._request_index[entry.request_id]
-            except ValueError:
-                pass
+            self._pop_oldest(self._entity_index, self._entity_key(entry.entity_type, entry.entity_id), entry.seq)
+        if entry.request_id:
+            self._pop_oldest(self._request_index, entry.request_id, entry.seq)
+        self._pop_oldest(self._level_index, entry.level, entry.seq)
+        if entry.entity_type and entry.entity_type in self._entity_type_counts:
+            self._entity_type_counts[entry.entity_type] -= 1
+            if not self._entity_type_counts[entry.entity_type]:
+                del self._entity_type_counts[entry.entity_type]
+
+    def _schedule_fan_out(self, log_entry: LogEntry) -> None:
+        """Queue an entry for delivery to subscribers on the next loop iteration.
+
+        Args:
+            log_entry: New log entry
+        """
+        self._pending.append(log_entry)
+        if self._fan_out_scheduled:
+            return
+        try:
+            asyncio.get_running_loop().call_soon(self._fan_out)
+            self._fan_out_scheduled = True
+        except RuntimeError:
+            self._fan_out()
 
-    async def _notify_subscribers(self, log_entry: LogEntry) -> None:
-        """Notify subscribers of new log entry.
+    def _fan_out(self) -> None:
+        """Deliver all pending entries to subscribers."""
+        self._fan_out_scheduled = False
+        while self._pending:
+            self._publish(self._pending.popleft())
+
+    def _publish(self, log_entry: LogEntry) -> None:
+        """Send a log entry to every subscriber queue.
 
         Args:
             log_entry: New log entry
@@ -317,48 +634,71 @@ class LogStorageService:
         Returns:
             List of matching log entries as dictionaries
         """
-        # Start with all logs or filtered by indices
+        if limit <= 0:
+            return []
+
+        descending = order == "desc"
+        # Time range -> sequence range, then candidates from the narrowest index
+        first, stop = self._buffer.seq_range(start_time, end_time)
         if entity_id:
-            key = f"{entity_type}:{entity_id}" if entity_type else entity_id
-            log_ids = set(self._entity_index.get(key, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
+            seqs = self._slice_seqs(self._entity_index.get(self._entity_key(entity_type, entity_id)), first, stop, descending)
         elif request_id:
-            log_ids = set(self._request_index.get(request_id, []))
-            candidates = [log for log in self._buffer if log.id in log_ids]
+            seqs = self._slice_seqs(self._request_index.get(request_id), first, stop, descending)
+        elif level:
+            min_value = _LEVEL_VALUES.get(level, 0)
+            per_level = [self._slice_seqs(seqs, first, stop, descending) for lvl, seqs in self._level_index.items() if _LEVEL_VALUES.get(lvl, 0) >= min_value]
+            seqs = heapq.merge(*per_level, reverse=descending)
         else:
-            candidates = list(self._buffer)
+            seqs = reversed(range(first, stop)) if descending else range(first, stop)
 
-        # Apply filters
-        filtered = []
-        for log in candidates:
-            # Entity type filter
+        search_lower = search.lower() if search else None
+        results: List[LogEntryDict] = []
+        skipped = 0
+        for seq in seqs:
+            log = self._buffer.get(seq)
+
+            # Remaining filters
             if entity_type and log.entity_type != entity_type:
                 continue
-
-            # Level filter
             if level and not self._meets_level_threshold(log.level, level):
                 continue
-
-            # Time range filters
             if start_time and log.timestamp < start_time:
                 continue
             if end_time and log.timestamp > end_time:
                 continue
+            if search_lower and search_lower not in log.message.lower():
+                continue
 
-            # Search filter
-            if search and search.lower() not in log.message.lower():
+            # Paginate
+            if skipped < offset:
+                skipped += 1
                 continue
+            results.append(log.to_dict())
+            if len(results) >= limit:
+                break
 
-            filtered.append(log)
+        return results
 
-        # Sort
-        filtered.sort(key=lambda x: x.timestamp, reverse=order == "desc")
+    @staticmethod
+    def _slice_seqs(seqs: Optional[_SeqIndex], first: int, stop: int, descending: bool) -> Iterable[int]:
+        """Select the sequence numbers of an index key within ``[first, stop)``.
 
-        # Paginate
-        paginated = filtered[offset : offset + limit]  # noqa: E203
+        Args:
+            seqs: Sequence numbers of the key, or None if the key is absent
+            first: Lowest sequence number to include
+            stop: Sequence number to stop before
+            descending: Yield newest first
 
-        # Convert to dictionaries
-        return [log.to_dict() for log in paginated]
+        Returns:
+            Iterable over the selected sequence numbers
+
+        Examples:
+            >>> list(LogStorageService._slice_seqs(_SeqIndex([1, 4, 6, 9]), 2, 9, True))
+            [6, 4]
+            >>> list(LogStorageService._slice_seqs(None, 2, 9, False))
+            []
+        """
+        return seqs.slice(first, stop, descending) if seqs is not None else ()
 
     def _meets_level_threshold(self, log_level: LogLevel, min_level: LogLevel) -> bool:
         """Check if log level meets minimum threshold.
@@ -382,18 +722,7 @@ class LogStorageService:
             >>> service._meets_level_threshold(LogLevel.DEBUG, LogLevel.DEBUG)
             True
         """
-        level_values = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.NOTICE: 2,
-            LogLevel.WARNING: 3,
-            LogLevel.ERROR: 4,
-            LogLevel.CRITICAL: 5,
-            LogLevel.ALERT: 6,
-            LogLevel.EMERGENCY: 7,
-        }
-
-        return level_values.get(log_level, 0) >= level_values.get(min_level, 0)
+        return _LEVEL_VALUES.get(log_level, 0) >= _LEVEL_VALUES.get(min_level, 0)
 
     async def subscribe(self) -> AsyncGenerator[LogStorageMessage, None]:
         """Subscribe to real-time log updates.
@@ -432,16 +761,8 @@ class LogStorageService:
             >>> stats['unique_requests']
             0
         """
-        level_counts: Dict[LogLevel, int] = {}
-        entity_counts: Dict[str, int] = {}
-
-        for log in self._buffer:
-            # Count by level
-            level_counts[log.level] = level_counts.get(log.level, 0) + 1
-
-            # Count by entity type
-            if log.entity_type:
-                entity_counts[log.entity_type] = entity_counts.get(log.entity_type, 0) + 1
+        level_counts = {level: len(seqs) for level, seqs in self._level_index.items()}
+        entity_counts = dict(self._entity_type_counts)
 
         return {
             "total_logs": len(self._buffer),
@@ -453,6 +774,8 @@ class LogStorageService:
             "unique_requests": len(self._request_index),
             "level_distribution": level_counts,
             "entity_distribution": entity_counts,
+            "first_seq": self._buffer.first_seq,
+            "next_seq": self._buffer.next_seq,
         }
 
     def clear(self) -> int:
@@ -477,5 +800,7 @@ class LogStorageService:
         self._buffer.clear()
         self._entity_index.clear()
         self._request_index.clear()
+        self._level_index.clear()
+        self._entity_type_counts.clear()
         self._current_size_bytes = 0
         return count
@@ -27,13 +27,14 @@ from __future__ import annotations
 
 # Standard
 import asyncio
+from collections import deque, OrderedDict
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
 import logging
 import time
-from typing import Any, Callable, Dict, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 # Third-Party
 import anyio
@@ -105,6 +106,8 @@ class PooledSession:
     created_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
     use_count: int = 0
+    acquired_at: float = 0.0  # Monotonic time of the last acquire (upstream latency sample)
+    upstream_slot: bool = field(default=False, repr=False)  # Holds an upstream concurrency slot
     _closed: bool = field(default=False, repr=False)
 
     @property
@@ -139,6 +142,227 @@ class PooledSession:
         self._closed = True
 
 
+class WaitHistogram:
+    """Cumulative histogram of acquire wait times (Prometheus-style buckets).
+
+    Examples:
+        >>> histogram = WaitHistogram(buckets=(0.01, 0.1))
+        >>> for value in (0.005, 0.05, 0.5):
+        ...     histogram.observe(value)
+        >>> snapshot = histogram.snapshot()
+        >>> snapshot["buckets"]
+        {'0.01': 1, '0.1': 2, '+Inf': 3}
+        >>> snapshot["count"], round(snapshot["sum"], 3)
+        (3, 0.555)
+    """
+
+    DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted upper bounds in seconds.
+        """
+        self._buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one wait time.
+
+        Args:
+            value: Wait time in seconds.
+        """
+        self._sum += value
+        for index, bound in enumerate(self._buckets):
+            if value <= bound:
+                self._counts[index] += 1
+                return
+        self._counts[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return cumulative bucket counts, total count and sum.
+
+        Returns:
+            Dict with buckets, count and sum.
+        """
+        buckets: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self._buckets, self._counts):
+            running += count
+            buckets[str(bound)] = running
+        running += self._counts[-1]
+        buckets["+Inf"] = running
+        return {"buckets": buckets, "count": running, "sum": self._sum}
+
+
+class UpstreamLimiter:
+    """Concurrency limit for one upstream server with fair queueing across identities.
+
+    Callers over the limit wait in a FIFO per identity; freed slots are handed
+    to the identities round-robin, so one identity's burst cannot starve the
+    others.
+
+    When adaptive, the limit follows AIMD on the observed upstream latency
+    (how long sessions are held): a sample above ``latency_tolerance`` times the
+    smoothed baseline, or a failure, multiplies the limit by ``backoff``; a
+    healthy sample while callers are queued raises it by about one slot per
+    limit's worth of releases, up to ``max_limit``.
+
+    Examples:
+        >>> limiter = UpstreamLimiter(max_limit=4, min_limit=1, adaptive=True)
+        >>> for _ in range(4):
+        ...     limiter.release(latency=0.1)  # no slots held, only trains the baseline
+        >>> limiter.in_flight
+        0
+        >>> limiter.release(latency=1.0)  # 10x the baseline: multiplicative decrease
+        >>> limiter.stats()["limit"]
+        3.6
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, adaptive: bool = False, latency_tolerance: float = 2.0, backoff: float = 0.9, smoothing: float = 0.1):
+        """Initialize the limiter.
+
+        Args:
+            max_limit: Upper bound (and starting value) of the concurrency limit.
+            min_limit: Lower bound of the adaptive limit.
+            adaptive: Adjust the limit from latency and failures.
+            latency_tolerance: Latency/baseline ratio treated as congestion.
+            backoff: Multiplicative decrease factor.
+            smoothing: EWMA weight of new latency samples in the baseline.
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.adaptive = adaptive
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._baseline: Optional[float] = None
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._increases = 0
+        self._decreases = 0
+        self._closed: Optional[BaseException] = None
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of queued callers.
+
+        Returns:
+            int: Number of callers waiting for a slot.
+        """
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, identity: str) -> None:
+        """Wait for a slot, queueing fairly behind other identities.
+
+        Args:
+            identity: Fair-queueing key of the caller.
+
+        Raises:
+            BaseException: The close exception, if the limiter was closed.
+        """
+        if self._closed is not None:
+            raise self._closed
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(identity, deque()).append(future)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Slot was granted as we were cancelled: hand it on
+                self.in_flight -= 1
+                self._wake()
+            else:
+                queue = self._waiters.get(identity)
+                if queue and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del self._waiters[identity]
+            raise
+
+    def release(self, latency: Optional[float] = None, failed: bool = False) -> None:
+        """Return a slot and feed the latency sample to the adaptive limit.
+
+        Args:
+            latency: Seconds the slot was held, if it completed.
+            failed: Whether the upstream call or session creation failed.
+        """
+        if self.adaptive:
+            self._adjust(latency, failed)
+        if self.in_flight > 0:
+            self.in_flight -= 1
+        self._wake()
+
+    def close(self, exc: BaseException) -> None:
+        """Fail all queued callers.
+
+        Args:
+            exc: Exception raised in the waiting and any later callers.
+        """
+        self._closed = exc
+        for queue in self._waiters.values():
+            for future in queue:
+                if not future.done():
+                    future.set_exception(exc)
+        self._waiters.clear()
+
+    def _adjust(self, latency: Optional[float], failed: bool) -> None:
+        """Apply one AIMD step.
+
+        Args:
+            latency: Latency sample in seconds, if any.
+            failed: Whether the sample is a failure.
+        """
+        congested = failed or (latency is not None and self._baseline is not None and latency > self._baseline * self.latency_tolerance)
+        if congested:
+            self.limit = max(float(self.min_limit), self.limit * self.backoff)
+            self._decreases += 1
+        elif self._waiters and self.limit < self.max_limit:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._increases += 1
+        if latency is not None and not failed:
+            self._baseline = latency if self._baseline is None else self._baseline + self.smoothing * (latency - self._baseline)
+
+    def _wake(self) -> None:
+        """Hand free slots to queued callers, one identity at a time."""
+        while self._waiters and self.in_flight < int(self.limit):
+            identity, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(identity)
+            else:
+                del self._waiters[identity]
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return limiter state for metrics.
+
+        Returns:
+            Dict with limit, bounds, in-flight and waiting counts and AIMD steps.
+        """
+        return {
+            "limit": round(self.limit, 2),
+            "max_limit": self.max_limit,
+            "min_limit": self.min_limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "waiting_identities": len(self._waiters),
+            "latency_baseline": self._baseline,
+            "increases": self._increases,
+            "decreases": self._decreases,
+        }
+
+
 # Type aliases
 # Pool key includes transport type and gateway_id to prevent returning wrong transport for same URL
 # and to ensure correct notification attribution when notifications are enabled
@@ -196,9 +420,12 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         - Health checks on acquire for stale sessions
         - Configurable pool size per URL+identity+transport
         - Circuit breaker for failing endpoints
+        - Optional per-upstream concurrency limit with fair queueing across
+          identities, adapted with AIMD from observed upstream latency
+        - Pre-warming of sessions ahead of traffic
         - Idle pool key eviction to prevent unbounded growth
         - Custom identity extractor for rotating tokens (e.g., JWT decode)
-        - Metrics for monitoring (hits, misses, evictions)
+        - Metrics for monitoring (hits, misses, evictions, acquire wait histogram)
         - Graceful shutdown with close_all()
 
     Usage:
@@ -248,6 +475,10 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         health_check_methods: Optional[list[str]] = None,
         health_check_timeout_seconds: float = 5.0,
         message_handler_factory: Optional[MessageHandlerFactory] = None,
+        upstream_max_concurrency: int = 0,
+        adaptive_concurrency: bool = False,
+        adaptive_min_concurrency: int = 1,
+        adaptive_latency_tolerance: float = 2.0,
     ):
         """
         Initialize the session pool.
@@ -273,6 +504,14 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             message_handler_factory: Optional factory for creating message handlers.
                                     Called with (url, gateway_id) to create handlers for
                                     each new session. Enables notification handling.
+            upstream_max_concurrency: Max sessions in use per upstream URL across all identities
+                                      and gateways (0 = unlimited). Callers over the limit queue
+                                      fairly per identity.
+            adaptive_concurrency: Adjust the upstream limit with AIMD between
+                                  adaptive_min_concurrency and upstream_max_concurrency.
+            adaptive_min_concurrency: Lower bound of the adaptive upstream limit.
+            adaptive_latency_tolerance: Latency over this multiple of the smoothed baseline
+                                        decreases the adaptive limit.
         """
         # Configuration
         self._max_sessions = max_sessions_per_key
@@ -289,6 +528,10 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._health_check_methods = health_check_methods or ["ping", "skip"]
         self._health_check_timeout = health_check_timeout_seconds
         self._message_handler_factory = message_handler_factory
+        self._upstream_max_concurrency = upstream_max_concurrency
+        self._adaptive_concurrency = adaptive_concurrency
+        self._adaptive_min_concurrency = adaptive_min_concurrency
+        self._adaptive_latency_tolerance = adaptive_latency_tolerance
 
         # State - protected by _global_lock for creation, per-key locks for access
         self._global_lock = asyncio.Lock()
@@ -302,6 +545,9 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._failures: Dict[str, int] = {}  # url -> consecutive failure count
         self._circuit_open_until: Dict[str, float] = {}  # url -> timestamp
 
+        # Per-upstream concurrency limiters (url -> limiter), only when upstream_max_concurrency > 0
+        self._upstream_limiters: Dict[str, UpstreamLimiter] = {}
+
         # Eviction throttling - only run eviction once per interval
         self._last_eviction_run: float = 0.0
         self._eviction_run_interval: float = 60.0  # Run eviction at most every 60 seconds
@@ -315,6 +561,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         self._pool_keys_evicted = 0
         self._sessions_reaped = 0  # Sessions closed during background eviction
         self._anonymous_identity_count = 0  # Count of requests with no identity headers
+        self._acquire_wait = WaitHistogram()  # Time until a session slot is obtained
 
         # Lifecycle
         self._closed = False
@@ -457,6 +704,30 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         """Record a success, resetting failure count."""
         self._failures[url] = 0
 
+    def _get_upstream_limiter(self, url: str) -> Optional[UpstreamLimiter]:
+        """Get or create the concurrency limiter of an upstream URL (None when unlimited)."""
+        if self._upstream_max_concurrency <= 0:
+            return None
+        limiter = self._upstream_limiters.get(url)
+        if limiter is None:
+            limiter = UpstreamLimiter(
+                max_limit=self._upstream_max_concurrency,
+                min_limit=self._adaptive_min_concurrency,
+                adaptive=self._adaptive_concurrency,
+                latency_tolerance=self._adaptive_latency_tolerance,
+            )
+            self._upstream_limiters[url] = limiter
+        return limiter
+
+    def _release_upstream_slot(self, pooled: PooledSession) -> None:
+        """Return the upstream slot held by a session, reporting how long it was held."""
+        if not pooled.upstream_slot:
+            return
+        pooled.upstream_slot = False
+        limiter = self._upstream_limiters.get(pooled.url)
+        if limiter is not None:
+            limiter.release(latency=time.monotonic() - pooled.acquired_at)
+
     async def acquire(
         self,
         url: str,
@@ -496,11 +767,60 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         if self._is_circuit_open(url):
             raise RuntimeError(f"Circuit breaker open for {url}")
 
+        wait_start = time.monotonic()
+        user_id = user_identity or "anonymous"
+        pool_key = self._make_pool_key(url, headers, transport_type, user_id, gateway_id)
+
+        # Per-upstream limit: queue fairly per identity (user + auth) before taking a session
+        limiter = self._get_upstream_limiter(url)
+        if limiter is not None:
+            try:
+                await asyncio.wait_for(limiter.acquire(f"{pool_key[0]}|{pool_key[2]}"), timeout=self._acquire_timeout)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"Timeout waiting for upstream concurrency slot for {sanitize_url_for_logging(url)}") from None
+
+        try:
+            pooled = await self._acquire_session(url, headers, transport_type, httpx_client_factory, timeout, user_id, gateway_id, pool_key, wait_start)
+        except BaseException as e:
+            if limiter is not None:
+                limiter.release(failed=not isinstance(e, asyncio.CancelledError))
+            raise
+
+        pooled.acquired_at = time.monotonic()
+        pooled.upstream_slot = limiter is not None
+        return pooled
+
+    async def _acquire_session(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        transport_type: TransportType,
+        httpx_client_factory: Optional[HttpxClientFactory],
+        timeout: Optional[float],
+        user_id: str,
+        gateway_id: Optional[str],
+        pool_key: PoolKey,
+        wait_start: float,
+    ) -> PooledSession:
+        """Take an idle session from the pool key or create one within the per-key limit.
+
+        Args:
+            url: The MCP server URL.
+            headers: Request headers.
+            transport_type: The transport type.
+            httpx_client_factory: Optional factory for httpx clients.
+            timeout: Optional timeout in seconds for transport connection.
+            user_id: User identity (``anonymous`` if unknown).
+            gateway_id: Optional gateway ID.
+            pool_key: Pool key of the session.
+            wait_start: Monotonic start of the acquire, for the wait histogram.
+
+        Returns:
+            PooledSession ready for use.
+        """
         # Use default timeout if not provided
         effective_timeout = timeout if timeout is not None else self._default_transport_timeout
 
-        user_id = user_identity or "anonymous"
-        pool_key = self._make_pool_key(url, headers, transport_type, user_id, gateway_id)
         pool = await self._get_or_create_pool(pool_key)
 
         # Update pool key last used time IMMEDIATELY after getting pool
@@ -532,6 +852,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 pooled.last_used = time.time()
                 pooled.use_count += 1
                 self._hits += 1
+                self._acquire_wait.observe(time.monotonic() - wait_start)
                 async with lock:
                     self._active[pool_key].add(pooled)
                 logger.debug(f"Pool hit for {sanitize_url_for_logging(url)} (identity={pool_key[2][:8]}, transport={transport_type.value})")
@@ -550,6 +871,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 raise asyncio.TimeoutError("Failed to acquire session slot")
         except asyncio.TimeoutError:
             raise asyncio.TimeoutError(f"Timeout waiting for available session for {sanitize_url_for_logging(url)}") from None
+        self._acquire_wait.observe(time.monotonic() - wait_start)
 
         # Create new session (semaphore acquired)
         try:
@@ -582,6 +904,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         Args:
             pooled: The session to release.
         """
+        self._release_upstream_slot(pooled)
+
         if pooled.is_closed:
             logger.warning("Attempted to release already-closed session")
             return
@@ -979,6 +1303,10 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             self._locks.clear()
             self._semaphores.clear()
 
+            for limiter in self._upstream_limiters.values():
+                limiter.close(RuntimeError("Session pool is closed"))
+            self._upstream_limiters.clear()
+
         logger.info("All sessions closed")
 
     def get_metrics(self) -> Dict[str, Any]:
@@ -986,7 +1314,8 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
         Return pool metrics for monitoring.
 
         Returns:
-            Dict with hits, misses, evictions, hit_rate, and per-pool stats.
+            Dict with hits, misses, evictions, hit_rate, acquire wait histogram,
+            and per-pool and per-upstream stats.
         """
         total_requests = self._hits + self._misses
         return {
@@ -1000,6 +1329,7 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
             "anonymous_identity_count": self._anonymous_identity_count,
             "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
             "pool_key_count": len(self._pools),
+            "acquire_wait_seconds": self._acquire_wait.snapshot(),
             "pools": {
                 f"{url}|{identity[:8]}|{transport}|{user}|{gw_id[:8] if gw_id else 'none'}": {
                     "available": pool.qsize(),
@@ -1015,8 +1345,61 @@ class MCPSessionPool:  # pylint: disable=too-many-instance-attributes
                 }
                 for url in set(self._failures.keys()) | set(self._circuit_open_until.keys())
             },
+            "upstreams": {url: limiter.stats() for url, limiter in self._upstream_limiters.items()},
         }
 
+    async def prewarm(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        transport_type: TransportType = TransportType.STREAMABLE_HTTP,
+        count: int = 1,
+        httpx_client_factory: Optional[HttpxClientFactory] = None,
+        user_identity: Optional[str] = None,
+        gateway_id: Optional[str] = None,
+    ) -> int:
+        """
+        Create idle sessions ahead of traffic so the first requests hit the pool.
+
+        Sessions are created for the exact pool key later requests will use, so
+        url, headers, user_identity and gateway_id must match those requests.
+        They bypass the per-upstream limiter: warm-up sessions carry no traffic,
+        so they neither hold its permits nor feed latency samples to its
+        adaptive limit. Failures are logged and not raised.
+
+        Args:
+            url: The MCP server URL.
+            headers: Request headers (identity-relevant headers select the pool key).
+            transport_type: Transport type to use.
+            count: Number of idle sessions wanted for the pool key.
+            httpx_client_factory: Optional factory for httpx clients.
+            user_identity: Optional user identity of the pool key.
+            gateway_id: Optional gateway ID of the pool key.
+
+        Returns:
+            Number of sessions created.
+        """
+        user_id = user_identity or "anonymous"
+        pool_key = self._make_pool_key(url, headers, transport_type, user_id, gateway_id)
+        sessions: List[PooledSession] = []
+        misses = self._misses
+        try:
+            if self._closed:
+                raise RuntimeError("Session pool is closed")
+            if self._is_circuit_open(url):
+                raise RuntimeError(f"Circuit breaker open for {url}")
+            for _ in range(min(count, self._max_sessions)):
+                sessions.append(await self._acquire_session(url, headers, transport_type, httpx_client_factory, None, user_id, gateway_id, pool_key, time.monotonic()))
+        except Exception as e:
+            logger.warning(f"Failed to pre-warm session for {sanitize_url_for_logging(url)}: {e}")
+        finally:
+            for pooled in sessions:
+                await self.release(pooled)
+        created = self._misses - misses
+        if created:
+            logger.info(f"Pre-warmed {created} session(s) for {sanitize_url_for_logging(url)} (transport={transport_type.value})")
+        return created
+
     @asynccontextmanager
     async def session(
         self,
@@ -1089,6 +1472,10 @@ def init_mcp_session_pool(
     message_handler_factory: Optional[MessageHandlerFactory] = None,
     enable_notifications: bool = True,
     notification_debounce_seconds: float = 5.0,
+    upstream_max_concurrency: int = 0,
+    adaptive_concurrency: bool = False,
+    adaptive_min_concurrency: int = 1,
+    adaptive_latency_tolerance: float = 2.0,
 ) -> MCPSessionPool:
     """Initialize the global MCP session pool.
 
@@ -1144,6 +1531,10 @@ def init_mcp_session_pool(
         health_check_methods=health_check_methods,
         health_check_timeout_seconds=health_check_timeout_seconds,
         message_handler_factory=effective_handler_factory,
+        upstream_max_concurrency=upstream_max_concurrency,
+        adaptive_concurrency=adaptive_concurrency,
+        adaptive_min_concurrency=adaptive_min_concurrency,
+        adaptive_latency_tolerance=adaptive_latency_tolerance,
     )
     logger.info("MCP session pool initialized")
     return _mcp_session_pool
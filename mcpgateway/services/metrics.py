@@ -19,6 +19,9 @@ Supported Metrics:
 - http_request_duration_seconds: Histogram of request processing times
 - http_request_size_bytes: Histogram of incoming request payload sizes
 - http_response_size_bytes: Histogram of outgoing response payload sizes
+- tool_schema_validation_duration_seconds: Histogram of tool input/output schema validation times
+- mcpgateway_operation_duration_seconds: Histogram of tracked operation durations, exported from
+  the PerformanceTracker sketches
 - app_info: Gauge with custom static labels for application metadata
 
 Environment Variables:
@@ -44,11 +47,13 @@ import re
 
 # Third-Party
 from fastapi import Response, status
-from prometheus_client import Counter, Gauge, REGISTRY
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY
+from prometheus_client.core import HistogramMetricFamily
 from prometheus_fastapi_instrumentator import Instrumentator
 
 # First-Party
 from mcpgateway.config import settings
+from mcpgateway.services.performance_tracker import get_performance_tracker
 
 # Global Metrics
 # Exposed for import by services/plugins to increment counters
@@ -64,6 +69,58 @@ circuit_breaker_open_counter = Counter(
     ["tool_name"],
 )
 
+tool_schema_validation_histogram = Histogram(
+    "tool_schema_validation_duration_seconds",
+    "Time spent validating tool arguments and structured results against tool schemas",
+    ["direction", "backend"],
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05),
+)
+
+upstream_requests_coalesced_counter = Counter(
+    "upstream_requests_coalesced_total",
+    "Total number of requests served by joining an identical in-flight upstream call",
+    ["kind"],
+)
+
+# Bucket bounds (seconds) of the operation duration histograms built from the tracker sketches
+OPERATION_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PerformanceSketchCollector:
+    """Prometheus collector exposing the PerformanceTracker sketches as histograms.
+
+    Buckets are computed from the sketches at scrape time, so tracking an
+    operation costs no more than recording it in the tracker.
+
+    Examples:
+        >>> from mcpgateway.services.performance_tracker import PerformanceTracker
+        >>> tracker = PerformanceTracker()
+        >>> tracker.record_timing("lookup", 0.02)
+        >>> family = next(PerformanceSketchCollector(tracker).collect())
+        >>> family.name, [s.value for s in family.samples if s.name.endswith("_count")]
+        ('mcpgateway_operation_duration_seconds', [1])
+    """
+
+    def __init__(self, tracker=None):
+        """Create the collector.
+
+        Args:
+            tracker: PerformanceTracker to export (default: the global tracker)
+        """
+        self._tracker = tracker
+
+    def collect(self):
+        """Collect one histogram per tracked operation.
+
+        Yields:
+            HistogramMetricFamily: Operation duration histograms
+        """
+        tracker = self._tracker or get_performance_tracker()
+        family = HistogramMetricFamily("mcpgateway_operation_duration_seconds", "Duration of operations tracked by the performance tracker", labels=["operation"])
+        for operation, buckets, total in tracker.export_histograms(OPERATION_DURATION_BUCKETS):
+            family.add_metric([operation], buckets, total)
+        yield family
+
 
 def setup_metrics(app):
     """
@@ -174,6 +231,12 @@ def setup_metrics(app):
         # Make the update function available at module level for lifespan calls
         app.state.update_http_pool_metrics = update_http_pool_metrics
 
+        # Export the performance tracker sketches as histograms
+        try:
+            REGISTRY.register(PerformanceSketchCollector())
+        except ValueError:
+            pass  # Already registered (setup_metrics called again)
+
         # Create instrumentator instance
         instrumentator = Instrumentator(
             should_group_status_codes=False,
@@ -4,95 +4,457 @@
 This service accumulates metrics in memory and flushes them to the database
 periodically, reducing DB write pressure under high load.
 
+Metrics are buffered in per-thread shards of column arrays, so recording only
+takes a lock that the flusher contends for once per flush, and flushing
+inserts each table from its columns with one executemany (COPY on
+PostgreSQL with psycopg). Batches that fail to flush are written to a
+bounded spool directory and retried on later flushes.
+
+With pre-aggregation enabled, each shard also keeps per-entity, per-minute
+aggregates (counts, min/max/sum and a mergeable latency sketch) that are
+merged into the hourly rollup tables on flush, and only a sample of the
+executions is kept as raw rows.
+
 Copyright 2025
 SPDX-License-Identifier: Apache-2.0
 """
 
 # Standard
+from array import array
 import asyncio
-from collections import deque
-from dataclasses import dataclass
 from datetime import datetime, timezone
 import logging
+import os
+import random
+import tempfile
 import threading
 import time
-from typing import Deque, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-Party
+import orjson
+from sqlalchemy import insert
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.db import A2AAgentMetric, fresh_db_session, PromptMetric, ResourceMetric, ServerMetric, ToolMetric
+from mcpgateway.utils.psycopg3_optimizations import bulk_insert_with_copy, is_psycopg3_backend
+from mcpgateway.utils.quantile_sketch import DDSketch
 
 logger = logging.getLogger(__name__)
 
+# Metric kind -> (model, entity id column)
+_METRIC_TABLES: Dict[str, Tuple[Any, str]] = {
+    "tool": (ToolMetric, "tool_id"),
+    "resource": (ResourceMetric, "resource_id"),
+    "prompt": (PromptMetric, "prompt_id"),
+    "server": (ServerMetric, "server_id"),
+    "a2a_agent": (A2AAgentMetric, "a2a_agent_id"),
+}
+
+# Spooled files not released within this many seconds belong to a crashed worker
+_STALE_CLAIM_SECONDS = 600
+_SPOOL_REPLAY_BATCHES = 10
+
+# Aggregate key: (kind, entity id, interaction type, minute start in epoch seconds)
+_AggregateKey = Tuple[str, str, Optional[str], int]
+
+
+class _MetricColumns:
+    """Column arrays of buffered metrics of one kind.
+
+    Examples:
+        >>> columns = _MetricColumns()
+        >>> columns.append("tool-1", 0.0, 0.25, True, None, None)
+        1
+        >>> columns.append("tool-2", 60.0, 1.5, False, "boom", None)
+        2
+        >>> len(columns), columns.rows(with_interaction_type=False)[1]
+        (2, ('tool-2', datetime.datetime(1970, 1, 1, 0, 1, tzinfo=datetime.timezone.utc), 1.5, False, 'boom'))
+        >>> _MetricColumns.from_dict(columns.to_dict()).rows(with_interaction_type=False) == columns.rows(with_interaction_type=False)
+        True
+    """
+
+    __slots__ = ("entity_ids", "timestamps", "response_times", "successes", "error_messages", "interaction_types")
+
+    def __init__(self) -> None:
+        """Create empty columns."""
+        self.entity_ids: List[str] = []
+        self.timestamps = array("d")
+        self.response_times = array("d")
+        self.successes = array("b")
+        self.error_messages: List[Optional[str]] = []
+        self.interaction_types: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        """Return the number of buffered metrics.
+
+        Returns:
+            Number of rows
+        """
+        return len(self.entity_ids)
+
+    def append(self, entity_id: str, timestamp: float, response_time: float, success: bool, error_message: Optional[str], interaction_type: Optional[str]) -> int:
+        """Append one metric.
+
+        Args:
+            entity_id: ID of the tool, resource, prompt, server or agent
+            timestamp: Epoch seconds
+            response_time: Response time in seconds
+            success: Whether the operation succeeded
+            error_message: Error message if failed
+            interaction_type: A2A interaction type (None for other kinds)
+
+        Returns:
+            Number of rows after the append
+        """
+        self.entity_ids.append(entity_id)
+        self.timestamps.append(timestamp)
+        self.response_times.append(response_time)
+        self.successes.append(success)
+        self.error_messages.append(error_message)
+        self.interaction_types.append(interaction_type)
+        return len(self.entity_ids)
+
+    def extend(self, other: "_MetricColumns") -> None:
+        """Append all rows of another column set.
+
+        Args:
+            other: Columns to append
+        """
+        self.entity_ids.extend(other.entity_ids)
+        self.timestamps.extend(other.timestamps)
+        self.response_times.extend(other.response_times)
+        self.successes.extend(other.successes)
+        self.error_messages.extend(other.error_messages)
+        self.interaction_types.extend(other.interaction_types)
+
+    def rows(self, with_interaction_type: bool) -> List[Tuple[Any, ...]]:
+        """Return the rows in ``_metric_columns`` order.
+
+        Args:
+            with_interaction_type: Include the A2A interaction type column
+
+        Returns:
+            Row tuples ready for executemany/COPY
+        """
+        timestamps = [datetime.fromtimestamp(ts, tz=timezone.utc) for ts in self.timestamps]
+        successes = [bool(flag) for flag in self.successes]
+        if with_interaction_type:
+            interaction_types = [kind or "invoke" for kind in self.interaction_types]
+            return list(zip(self.entity_ids, timestamps, self.response_times, successes, self.error_messages, interaction_types))
+        return list(zip(self.entity_ids, timestamps, self.response_times, successes, self.error_messages))
+
+    def to_dict(self) -> Dict[str, list]:
+        """Serialize the columns for the retry spool.
+
+        Returns:
+            Dictionary of column lists
+        """
+        return {name: list(getattr(self, name)) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, list]) -> "_MetricColumns":
+        """Rebuild columns serialized with ``to_dict``.
+
+        Args:
+            data: Dictionary of column lists
+
+        Returns:
+            The columns
+        """
+        columns = cls()
+        columns.entity_ids = list(data["entity_ids"])
+        columns.timestamps = array("d", data["timestamps"])
+        columns.response_times = array("d", data["response_times"])
+        columns.successes = array("b", data["successes"])
+        columns.error_messages = list(data["error_messages"])
+        columns.interaction_types = list(data["interaction_types"])
+        return columns
+
+
+def _metric_columns(kind: str) -> Tuple[str, ...]:
+    """Return the table columns written for a metric kind.
+
+    Args:
+        kind: Metric kind
+
+    Returns:
+        Column names in row order
+
+    Examples:
+        >>> _metric_columns("tool")
+        ('tool_id', 'timestamp', 'response_time', 'is_success', 'error_message')
+        >>> _metric_columns("a2a_agent")[-1]
+        'interaction_type'
+    """
+    columns = (_METRIC_TABLES[kind][1], "timestamp", "response_time", "is_success", "error_message")
+    return columns + ("interaction_type",) if kind == "a2a_agent" else columns
+
+
+class _MetricAggregate:
+    """Pre-aggregated executions of one entity in one minute.
+
+    Count, sum, min and max come from the latency sketch.
+
+    Examples:
+        >>> agg = _MetricAggregate()
+        >>> agg.add(0.2, True)
+        >>> agg.add(0.4, False)
+        >>> other = _MetricAggregate()
+        >>> other.add(0.6, True)
+        >>> agg.merge(other)
+        >>> agg.sketch.count, agg.success_count, round(agg.sketch.mean, 3), agg.sketch.max
+        (3, 2, 0.4, 0.6)
+    """
+
+    __slots__ = ("success_count", "sketch")
+
+    def __init__(self) -> None:
+        """Create an empty aggregate."""
+        self.success_count = 0
+        self.sketch = DDSketch()
+
+    def add(self, response_time: float, success: bool) -> None:
+        """Record one execution.
+
+        Args:
+            response_time: Response time in seconds
+            success: Whether the operation succeeded
+        """
+        self.sketch.add(max(response_time, 0.0))
+        if success:
+            self.success_count += 1
+
+    def merge(self, other: "_MetricAggregate") -> None:
+        """Merge another aggregate into this one.
+
+        Args:
+            other: Aggregate to merge
+        """
+        self.sketch.merge(other.sketch)
+        self.success_count += other.success_count
 
-@dataclass
-class BufferedToolMetric:
-    """Buffered tool metric entry."""
 
-    tool_id: str
-    timestamp: datetime
-    response_time: float
-    is_success: bool
-    error_message: Optional[str] = None
+class _MetricShard:
+    """Buffers of one recording thread.
+
+    The lock is only contended when the flusher swaps the buffers out.
+    """
+
+    __slots__ = ("lock", "buffers", "aggregates", "recorded")
+
+    def __init__(self) -> None:
+        """Create an empty shard."""
+        self.lock = threading.Lock()
+        self.buffers: Dict[str, _MetricColumns] = {kind: _MetricColumns() for kind in _METRIC_TABLES}
+        self.aggregates: Dict[_AggregateKey, _MetricAggregate] = {}
+        self.recorded = 0
+
+
+def _file_size(entry: os.DirEntry) -> int:
+    """Return the size of a spool file, or 0 if it is already gone.
+
+    Args:
+        entry: Directory entry
+
+    Returns:
+        Size in bytes
+    """
+    try:
+        return entry.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+class _RetrySpool:
+    """Bounded on-disk spool of metric batches that failed to flush.
+
+    Each batch is one JSON file. Files are claimed by renaming them before a
+    retry, so several workers can share the directory.
+
+    Examples:
+        >>> import tempfile
+        >>> spool = _RetrySpool(tempfile.mkdtemp(), max_bytes=1 << 20)
+        >>> columns = _MetricColumns()
+        >>> _ = columns.append("tool-1", 0.0, 0.1, True, None, None)
+        >>> spool.write({"tool": columns})
+        True
+        >>> [len(batch["tool"]) for _, batch in spool.claim(10)]
+        [1]
+    """
 
+    def __init__(self, directory: str, max_bytes: int):
+        """Initialize the spool.
 
-@dataclass
-class BufferedResourceMetric:
-    """Buffered resource metric entry."""
+        Args:
+            directory: Spool directory (created on first write)
+            max_bytes: Maximum total size of spooled files; 0 disables spooling
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.spooled_batches = 0
+        self.dropped_batches = 0
+        self.replayed_batches = 0
+        self._lock = threading.Lock()
 
-    resource_id: str
-    timestamp: datetime
-    response_time: float
-    is_success: bool
-    error_message: Optional[str] = None
+    @property
+    def enabled(self) -> bool:
+        """Whether failed batches are spooled.
 
+        Returns:
+            True if spooling is enabled
+        """
+        return self.max_bytes > 0
 
-@dataclass
-class BufferedPromptMetric:
-    """Buffered prompt metric entry."""
+    def _files(self) -> List[os.DirEntry]:
+        """List the spool files.
 
-    prompt_id: str
-    timestamp: datetime
-    response_time: float
-    is_success: bool
-    error_message: Optional[str] = None
+        Returns:
+            Directory entries of spooled and claimed batches
+        """
+        try:
+            return [entry for entry in os.scandir(self.directory) if entry.name.startswith("batch-") and entry.is_file()]
+        except FileNotFoundError:
+            return []
 
+    def write(self, batches: Dict[str, _MetricColumns]) -> bool:
+        """Spool a batch that failed to flush.
 
-@dataclass
-class BufferedServerMetric:
-    """Buffered server metric entry."""
+        Args:
+            batches: Columns per metric kind
 
-    server_id: str
-    timestamp: datetime
-    response_time: float
-    is_success: bool
-    error_message: Optional[str] = None
+        Returns:
+            True if the batch was spooled, False if it was dropped
+        """
+        if not self.enabled:
+            self.dropped_batches += 1
+            return False
+        data = orjson.dumps({kind: columns.to_dict() for kind, columns in batches.items() if len(columns)})
+        with self._lock:
+            try:
+                used = sum(entry.stat().st_size for entry in self._files())
+                if used + len(data) > self.max_bytes:
+                    logger.warning(f"Metrics spool full ({used} bytes), dropping batch")
+                    self.dropped_batches += 1
+                    return False
+                os.makedirs(self.directory, exist_ok=True)
+                path = os.path.join(self.directory, f"batch-{time.time_ns()}-{os.getpid()}.json")
+                with open(path + ".tmp", "wb") as handle:
+                    handle.write(data)
+                os.replace(path + ".tmp", path)
+            except OSError as e:
+                logger.error(f"Failed to spool metrics batch: {e}")
+                self.dropped_batches += 1
+                return False
+            self.spooled_batches += 1
+            return True
+
+    def claim(self, limit: int) -> List[Tuple[str, Dict[str, _MetricColumns]]]:
+        """Claim up to ``limit`` spooled batches, oldest first.
 
+        Args:
+            limit: Maximum number of batches
 
-@dataclass
-class BufferedA2AAgentMetric:
-    """Buffered A2A agent metric entry."""
+        Returns:
+            (claimed path, batch) pairs; pass each path to ``release``
+        """
+        now = time.time()
+        claimed: List[Tuple[str, Dict[str, _MetricColumns]]] = []
+        for entry in sorted(self._files(), key=lambda e: e.name):
+            if len(claimed) >= limit:
+                break
+            path = entry.path
+            if not path.endswith((".json", ".claimed")):
+                continue
+            try:
+                if path.endswith(".claimed"):
+                    # Left behind by a worker that died during a retry
+                    if now - entry.stat().st_mtime < _STALE_CLAIM_SECONDS:
+                        continue
+                    path = path[: -len(".claimed")]
+                    os.replace(entry.path, path)
+                os.rename(path, path + ".claimed")
+                os.utime(path + ".claimed")
+                with open(path + ".claimed", "rb") as handle:
+                    data = orjson.loads(handle.read())
+                batch = {kind: _MetricColumns.from_dict(columns) for kind, columns in data.items()}
+            except FileNotFoundError:
+                continue  # Claimed by another worker
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.error(f"Discarding unreadable metrics spool file {path}: {e}")
+                self._discard(path + ".claimed")
+                continue
+            claimed.append((path + ".claimed", batch))
+        return claimed
+
+    def _discard(self, claimed_path: str) -> None:
+        """Delete a claimed batch that cannot be retried and count it as dropped.
 
-    a2a_agent_id: str
-    timestamp: datetime
-    response_time: float
-    is_success: bool
-    interaction_type: str = "invoke"
-    error_message: Optional[str] = None
+        Args:
+            claimed_path: Path of the claimed batch
+        """
+        self.dropped_batches += 1
+        try:
+            os.remove(claimed_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove metrics spool file {claimed_path}: {e}")
+
+    def release(self, claimed_path: str, done: bool) -> None:
+        """Delete a retried batch, or return it to the spool.
+
+        Args:
+            claimed_path: Path returned by ``claim``
+            done: True if the batch was written
+        """
+        try:
+            if done:
+                os.remove(claimed_path)
+                self.replayed_batches += 1
+            else:
+                os.replace(claimed_path, claimed_path[: -len(".claimed")])
+        except OSError as e:
+            logger.error(f"Failed to release metrics spool file {claimed_path}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get spool statistics.
+
+        Returns:
+            Dictionary with pending files/bytes and batch counters
+        """
+        files = self._files()
+        return {
+            "enabled": self.enabled,
+            "directory": self.directory,
+            "pending_batches": len(files),
+            "pending_bytes": sum(_file_size(entry) for entry in files),
+            "max_bytes": self.max_bytes,
+            "spooled_batches": self.spooled_batches,
+            "replayed_batches": self.replayed_batches,
+            "dropped_batches": self.dropped_batches,
+        }
 
 
 class MetricsBufferService:
     """Service for buffering and batching metrics writes to the database.
 
     This service provides:
-    - Thread-safe buffering of tool, resource, prompt, server, and A2A agent metrics
-    - Periodic flushing to database (configurable interval)
+    - Per-thread sharded, columnar buffering of tool, resource, prompt, server, and A2A agent metrics
+    - Periodic flushing to database (configurable interval), or sooner when a shard holds max_buffer_size metrics
+    - A bounded on-disk retry spool for batches that fail to flush
+    - Optional pre-aggregation into the hourly rollup tables, with sampled raw rows
     - Graceful shutdown with final flush
 
     Configuration (via environment variables):
     - METRICS_BUFFER_ENABLED: Enable buffered metrics (default: True)
     - METRICS_BUFFER_FLUSH_INTERVAL: Seconds between flushes (default: 60)
     - METRICS_BUFFER_MAX_SIZE: Max entries before forced flush (default: 1000)
+    - METRICS_BUFFER_SPOOL_DIR: Retry spool directory (default: <tmp>/mcpgateway-metrics-spool)
+    - METRICS_BUFFER_SPOOL_MAX_MB: Retry spool size limit, 0 disables it (default: 64)
+    - METRICS_PREAGGREGATION_ENABLED: Merge per-minute aggregates into the hourly rollups (default: False)
+    - METRICS_PREAGGREGATION_RAW_SAMPLE_RATE: Fraction of executions kept as raw rows (default: 0.01)
     """
 
     def __init__(
@@ -100,6 +462,10 @@ class MetricsBufferService:
         flush_interval: Optional[int] = None,
         max_buffer_size: Optional[int] = None,
         enabled: Optional[bool] = None,
+        spool_dir: Optional[str] = None,
+        spool_max_bytes: Optional[int] = None,
+        preaggregation_enabled: Optional[bool] = None,
+        raw_sample_rate: Optional[float] = None,
     ):
         """Initialize the metrics buffer service.
 
@@ -107,34 +473,64 @@ class MetricsBufferService:
             flush_interval: Seconds between automatic flushes (default: from settings or 60)
             max_buffer_size: Maximum buffer entries before forced flush (default: from settings or 1000)
             enabled: Whether buffering is enabled (default: from settings or True)
+            spool_dir: Directory for batches that failed to flush (default: from settings or a temp directory)
+            spool_max_bytes: Maximum spool size in bytes, 0 disables it (default: from settings or 64 MB)
+            preaggregation_enabled: Aggregate per entity and minute into the hourly rollups (default: from settings or False)
+            raw_sample_rate: Fraction of executions kept as raw rows when pre-aggregating (default: from settings or 0.01)
         """
         self.flush_interval = flush_interval or getattr(settings, "metrics_buffer_flush_interval", 60)
         self.max_buffer_size = max_buffer_size or getattr(settings, "metrics_buffer_max_size", 1000)
         self.enabled = enabled if enabled is not None else getattr(settings, "metrics_buffer_enabled", True)
         self.recording_enabled = getattr(settings, "db_metrics_recording_enabled", True)
+        if preaggregation_enabled is None:
+            preaggregation_enabled = getattr(settings, "metrics_preaggregation_enabled", False) is True
+        self.preaggregation_enabled = preaggregation_enabled
+        self.raw_sample_rate = raw_sample_rate if raw_sample_rate is not None else getattr(settings, "metrics_preaggregation_raw_sample_rate", 0.01)
 
-        # Thread-safe buffers using deque with locks
-        self._tool_metrics: Deque[BufferedToolMetric] = deque()
-        self._resource_metrics: Deque[BufferedResourceMetric] = deque()
-        self._prompt_metrics: Deque[BufferedPromptMetric] = deque()
-        self._server_metrics: Deque[BufferedServerMetric] = deque()
-        self._a2a_agent_metrics: Deque[BufferedA2AAgentMetric] = deque()
-        self._lock = threading.Lock()
+        # Per-thread buffers; the registry is only locked when a thread records its first metric
+        self._local = threading.local()
+        self._shards: List[_MetricShard] = []
+        self._shards_lock = threading.Lock()
+
+        spool_dir = spool_dir or getattr(settings, "metrics_buffer_spool_dir", "") or os.path.join(tempfile.gettempdir(), "mcpgateway-metrics-spool")
+        if spool_max_bytes is None:
+            spool_max_bytes = getattr(settings, "metrics_buffer_spool_max_mb", 64) * 1024 * 1024
+        self._spool = _RetrySpool(spool_dir, spool_max_bytes)
 
         # Background flush task
         self._flush_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
+        self._flush_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Aggregates whose merge into the rollup tables failed, retried on the next flush
+        self._unflushed_aggregates: Dict[_AggregateKey, _MetricAggregate] = {}
 
         # Stats for monitoring
-        self._total_buffered = 0
         self._total_flushed = 0
         self._flush_count = 0
+        self._failed_flush_count = 0
+        self._last_flush_duration = 0.0
+        self._max_flush_duration = 0.0
+        self._total_flush_duration = 0.0
+        self._total_aggregated = 0
+        self._aggregate_flush_failures = 0
 
         logger.info(
             f"MetricsBufferService initialized: recording_enabled={self.recording_enabled}, "
-            f"buffer_enabled={self.enabled}, flush_interval={self.flush_interval}s, max_buffer_size={self.max_buffer_size}"
+            f"buffer_enabled={self.enabled}, flush_interval={self.flush_interval}s, max_buffer_size={self.max_buffer_size}, "
+            f"preaggregation_enabled={self.preaggregation_enabled}"
         )
 
+    @property
+    def _total_buffered(self) -> int:
+        """Total number of metrics buffered since startup.
+
+        Returns:
+            Sum of the per-shard counters
+        """
+        return sum(shard.recorded for shard in self._shards)
+
     async def start(self) -> None:
         """Start the background flush task."""
         if not self.recording_enabled:
@@ -146,6 +542,7 @@ class MetricsBufferService:
 
         if self._flush_task is None or self._flush_task.done():
             self._shutdown_event.clear()
+            self._loop = asyncio.get_running_loop()
             self._flush_task = asyncio.create_task(self._flush_loop())
             logger.info("MetricsBufferService flush task started")
 
@@ -155,6 +552,7 @@ class MetricsBufferService:
 
         # Signal shutdown
         self._shutdown_event.set()
+        self._flush_event.set()
 
         # Cancel the flush task
         if self._flush_task:
@@ -169,6 +567,62 @@ class MetricsBufferService:
 
         logger.info(f"MetricsBufferService shutdown complete: " f"total_buffered={self._total_buffered}, total_flushed={self._total_flushed}, " f"flush_count={self._flush_count}")
 
+    def _shard(self) -> _MetricShard:
+        """Return the calling thread's shard, creating it on first use.
+
+        Returns:
+            The thread's shard
+        """
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _MetricShard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _buffer(self, kind: str, entity_id: str, response_time: float, success: bool, error_message: Optional[str], interaction_type: Optional[str] = None) -> None:
+        """Buffer one metric in the calling thread's shard.
+
+        With pre-aggregation enabled, the metric is added to the shard's aggregate
+        for its entity and minute, and only kept as a raw row with probability
+        ``raw_sample_rate``.
+
+        Args:
+            kind: Metric kind (key of ``_METRIC_TABLES``)
+            entity_id: ID of the tool, resource, prompt, server or agent
+            response_time: Response time in seconds
+            success: Whether the operation succeeded
+            error_message: Error message if failed
+            interaction_type: A2A interaction type
+        """
+        shard = self._shard()
+        now = time.time()
+        size = 0
+        with shard.lock:
+            if self.preaggregation_enabled:
+                key = (kind, entity_id, interaction_type, int(now // 60) * 60)
+                aggregate = shard.aggregates.get(key)
+                if aggregate is None:
+                    aggregate = shard.aggregates[key] = _MetricAggregate()
+                aggregate.add(response_time, success)
+                if random.random() < self.raw_sample_rate:  # nosec B311 - sampling, not security
+                    size = shard.buffers[kind].append(entity_id, now, response_time, success, error_message, interaction_type)
+            else:
+                size = shard.buffers[kind].append(entity_id, now, response_time, success, error_message, interaction_type)
+            shard.recorded += 1
+        if size >= self.max_buffer_size:
+            self._request_flush()
+
+    def _request_flush(self) -> None:
+        """Wake the flush loop before the flush interval elapses."""
+        loop = self._loop
+        if loop is None or self._flush_event.is_set():
+            return
+        try:
+            loop.call_soon_threadsafe(self._flush_event.set)
+        except RuntimeError:
+            pass  # Loop closed
+
     def record_tool_metric(
         self,
         tool_id: str,
@@ -191,17 +645,7 @@ class MetricsBufferService:
             self._write_tool_metric_immediately(tool_id, start_time, success, error_message)
             return
 
-        metric = BufferedToolMetric(
-            tool_id=tool_id,
-            timestamp=datetime.now(timezone.utc),
-            response_time=time.monotonic() - start_time,
-            is_success=success,
-            error_message=error_message,
-        )
-
-        with self._lock:
-            self._tool_metrics.append(metric)
-            self._total_buffered += 1
+        self._buffer("tool", tool_id, time.monotonic() - start_time, success, error_message)
 
     def record_resource_metric(
         self,
@@ -224,17 +668,7 @@ class MetricsBufferService:
             self._write_resource_metric_immediately(resource_id, start_time, success, error_message)
             return
 
-        metric = BufferedResourceMetric(
-            resource_id=resource_id,
-            timestamp=datetime.now(timezone.utc),
-            response_time=time.monotonic() - start_time,
-            is_success=success,
-            error_message=error_message,
-        )
-
-        with self._lock:
-            self._resource_metrics.append(metric)
-            self._total_buffered += 1
+        self._buffer("resource", resource_id, time.monotonic() - start_time, success, error_message)
 
     def record_prompt_metric(
         self,
@@ -257,17 +691,7 @@ class MetricsBufferService:
             self._write_prompt_metric_immediately(prompt_id, start_time, success, error_message)
             return
 
-        metric = BufferedPromptMetric(
-            prompt_id=prompt_id,
-            timestamp=datetime.now(timezone.utc),
-            response_time=time.monotonic() - start_time,
-            is_success=success,
-            error_message=error_message,
-        )
-
-        with self._lock:
-            self._prompt_metrics.append(metric)
-            self._total_buffered += 1
+        self._buffer("prompt", prompt_id, time.monotonic() - start_time, success, error_message)
 
     def record_server_metric(
         self,
@@ -290,17 +714,7 @@ class MetricsBufferService:
             self._write_server_metric_immediately(server_id, start_time, success, error_message)
             return
 
-        metric = BufferedServerMetric(
-            server_id=server_id,
-            timestamp=datetime.now(timezone.utc),
-            response_time=time.monotonic() - start_time,
-            is_success=success,
-            error_message=error_message,
-        )
-
-        with self._lock:
-            self._server_metrics.append(metric)
-            self._total_buffered += 1
+        self._buffer("server", server_id, time.monotonic() - start_time, success, error_message)
 
     def record_a2a_agent_metric(
         self,
@@ -325,18 +739,7 @@ class MetricsBufferService:
             self._write_a2a_agent_metric_immediately(a2a_agent_id, start_time, success, interaction_type, error_message)
             return
 
-        metric = BufferedA2AAgentMetric(
-            a2a_agent_id=a2a_agent_id,
-            timestamp=datetime.now(timezone.utc),
-            response_time=time.monotonic() - start_time,
-            is_success=success,
-            interaction_type=interaction_type,
-            error_message=error_message,
-        )
-
-        with self._lock:
-            self._a2a_agent_metrics.append(metric)
-            self._total_buffered += 1
+        self._buffer("a2a_agent", a2a_agent_id, time.monotonic() - start_time, success, error_message, interaction_type)
 
     def record_a2a_agent_metric_with_duration(
         self,
@@ -361,18 +764,7 @@ class MetricsBufferService:
             self._write_a2a_agent_metric_with_duration_immediately(a2a_agent_id, response_time, success, interaction_type, error_message)
             return
 
-        metric = BufferedA2AAgentMetric(
-            a2a_agent_id=a2a_agent_id,
-            timestamp=datetime.now(timezone.utc),
-            response_time=response_time,
-            is_success=success,
-            interaction_type=interaction_type,
-            error_message=error_message,
-        )
-
-        with self._lock:
-            self._a2a_agent_metrics.append(metric)
-            self._total_buffered += 1
+        self._buffer("a2a_agent", a2a_agent_id, response_time, success, error_message, interaction_type)
 
     async def _flush_loop(self) -> None:
         """Background task that periodically flushes buffered metrics.
@@ -384,17 +776,18 @@ class MetricsBufferService:
 
         while not self._shutdown_event.is_set():
             try:
-                # Wait for flush interval or shutdown
+                # Wait for flush interval, a full shard or shutdown
                 try:
                     await asyncio.wait_for(
-                        self._shutdown_event.wait(),
+                        self._flush_event.wait(),
                         timeout=self.flush_interval,
                     )
-                    # Shutdown signaled
-                    break
                 except asyncio.TimeoutError:
                     # Normal timeout, proceed to flush
                     pass
+                self._flush_event.clear()
+                if self._shutdown_event.is_set():
+                    break
 
                 await self._flush_all()
 
@@ -406,156 +799,196 @@ class MetricsBufferService:
                 # Continue the loop despite errors
                 await asyncio.sleep(5)
 
+    def _drain(self) -> Dict[str, _MetricColumns]:
+        """Swap out the buffers of every shard.
+
+        Returns:
+            Buffered columns per metric kind
+        """
+        with self._shards_lock:
+            shards = list(self._shards)
+        batches = {kind: _MetricColumns() for kind in _METRIC_TABLES}
+        for shard in shards:
+            with shard.lock:
+                buffers = shard.buffers
+                shard.buffers = {kind: _MetricColumns() for kind in _METRIC_TABLES}
+            for kind, columns in buffers.items():
+                if len(columns):
+                    batches[kind].extend(columns)
+        return batches
+
+    def _drain_aggregates(self) -> Dict[_AggregateKey, _MetricAggregate]:
+        """Swap out the aggregates of every shard, merged with previously unflushed ones.
+
+        Returns:
+            Aggregates per (kind, entity, interaction type, minute)
+        """
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged = self._unflushed_aggregates
+        self._unflushed_aggregates = {}
+        for shard in shards:
+            with shard.lock:
+                aggregates = shard.aggregates
+                shard.aggregates = {}
+            for key, aggregate in aggregates.items():
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = aggregate
+                else:
+                    existing.merge(aggregate)
+        return merged
+
     async def _flush_all(self) -> None:
         """Flush all buffered metrics to the database."""
-        # Swap out buffers atomically
-        with self._lock:
-            tool_metrics = list(self._tool_metrics)
-            resource_metrics = list(self._resource_metrics)
-            prompt_metrics = list(self._prompt_metrics)
-            server_metrics = list(self._server_metrics)
-            a2a_agent_metrics = list(self._a2a_agent_metrics)
-            self._tool_metrics.clear()
-            self._resource_metrics.clear()
-            self._prompt_metrics.clear()
-            self._server_metrics.clear()
-            self._a2a_agent_metrics.clear()
-
-        total = len(tool_metrics) + len(resource_metrics) + len(prompt_metrics) + len(server_metrics) + len(a2a_agent_metrics)
+        aggregates = self._drain_aggregates()
+        if aggregates:
+            if await asyncio.to_thread(self._flush_aggregates_to_db, aggregates):
+                self._total_aggregated += sum(aggregate.sketch.count for aggregate in aggregates.values())
+            else:
+                self._aggregate_flush_failures += 1
+                # Merged with the shards again on the next flush
+                self._unflushed_aggregates = aggregates
+
+        batches = self._drain()
+        counts = {kind: len(columns) for kind, columns in batches.items()}
+        total = sum(counts.values())
         if total == 0:
+            if self._spool.enabled:
+                await asyncio.to_thread(self._replay_spool)
             return
 
-        logger.debug(
-            f"Flushing {total} metrics: "
-            f"tools={len(tool_metrics)}, resources={len(resource_metrics)}, prompts={len(prompt_metrics)}, "
-            f"servers={len(server_metrics)}, a2a_agents={len(a2a_agent_metrics)}"
-        )
+        logger.debug(f"Flushing {total} metrics: {counts}")
 
         # Flush in thread to avoid blocking event loop
-        await asyncio.to_thread(
-            self._flush_to_db,
-            tool_metrics,
-            resource_metrics,
-            prompt_metrics,
-            server_metrics,
-            a2a_agent_metrics,
-        )
+        started = time.perf_counter()
+        flushed = await asyncio.to_thread(self._flush_to_db, batches)
+        duration = time.perf_counter() - started
 
-        self._total_flushed += total
         self._flush_count += 1
+        self._last_flush_duration = duration
+        self._max_flush_duration = max(self._max_flush_duration, duration)
+        self._total_flush_duration += duration
+        if not flushed:
+            self._failed_flush_count += 1
+            return
+        self._total_flushed += total
 
-        logger.info(
-            f"Metrics flush #{self._flush_count}: wrote {total} records "
-            f"(tools={len(tool_metrics)}, resources={len(resource_metrics)}, prompts={len(prompt_metrics)}, "
-            f"servers={len(server_metrics)}, a2a={len(a2a_agent_metrics)})"
-        )
+        logger.info(f"Metrics flush #{self._flush_count}: wrote {total} records in {duration * 1000:.1f}ms {counts}")
 
-    def _flush_to_db(
-        self,
-        tool_metrics: list[BufferedToolMetric],
-        resource_metrics: list[BufferedResourceMetric],
-        prompt_metrics: list[BufferedPromptMetric],
-        server_metrics: list[BufferedServerMetric],
-        a2a_agent_metrics: list[BufferedA2AAgentMetric],
-    ) -> None:
+        if self._spool.enabled:
+            await asyncio.to_thread(self._replay_spool)
+
+    @staticmethod
+    def _insert_batches(db: Any, batches: Dict[str, _MetricColumns]) -> None:
+        """Insert metric columns with one executemany (or COPY) per table.
+
+        Args:
+            db: Database session
+            batches: Columns per metric kind
+        """
+        use_copy = is_psycopg3_backend()
+        for kind, columns in batches.items():
+            if not len(columns):
+                continue
+            model = _METRIC_TABLES[kind][0]
+            names = _metric_columns(kind)
+            rows = columns.rows(with_interaction_type=kind == "a2a_agent")
+            if use_copy:
+                bulk_insert_with_copy(db, model.__tablename__, names, rows)
+            else:
+                db.execute(insert(model), [dict(zip(names, row)) for row in rows])
+
+    def _flush_to_db(self, batches: Dict[str, _MetricColumns]) -> bool:
         """Write buffered metrics to database (runs in thread).
 
+        A batch that fails to write is moved to the retry spool.
+
         Args:
-            tool_metrics: List of buffered tool metrics to write.
-            resource_metrics: List of buffered resource metrics to write.
-            prompt_metrics: List of buffered prompt metrics to write.
-            server_metrics: List of buffered server metrics to write.
-            a2a_agent_metrics: List of buffered A2A agent metrics to write.
+            batches: Columns per metric kind
+
+        Returns:
+            True if the batch was written
         """
         try:
             with fresh_db_session() as db:
-                # Bulk insert tool metrics
-                if tool_metrics:
-                    db.bulk_insert_mappings(
-                        ToolMetric,
-                        [
-                            {
-                                "tool_id": m.tool_id,
-                                "timestamp": m.timestamp,
-                                "response_time": m.response_time,
-                                "is_success": m.is_success,
-                                "error_message": m.error_message,
-                            }
-                            for m in tool_metrics
-                        ],
-                    )
-
-                # Bulk insert resource metrics
-                if resource_metrics:
-                    db.bulk_insert_mappings(
-                        ResourceMetric,
-                        [
-                            {
-                                "resource_id": m.resource_id,
-                                "timestamp": m.timestamp,
-                                "response_time": m.response_time,
-                                "is_success": m.is_success,
-                                "error_message": m.error_message,
-                            }
-                            for m in resource_metrics
-                        ],
-                    )
+                self._insert_batches(db, batches)
+                db.commit()
+            return True
+        except Exception as e:
+            spooled = self._spool.write(batches)
+            logger.error(f"Failed to flush metrics to database ({'spooled for retry' if spooled else 'batch dropped'}): {e}", exc_info=True)
+            return False
 
-                # Bulk insert prompt metrics
-                if prompt_metrics:
-                    db.bulk_insert_mappings(
-                        PromptMetric,
-                        [
-                            {
-                                "prompt_id": m.prompt_id,
-                                "timestamp": m.timestamp,
-                                "response_time": m.response_time,
-                                "is_success": m.is_success,
-                                "error_message": m.error_message,
-                            }
-                            for m in prompt_metrics
-                        ],
-                    )
+    def _flush_aggregates_to_db(self, aggregates: Dict[_AggregateKey, _MetricAggregate]) -> bool:
+        """Merge per-minute aggregates into the hourly rollup tables (runs in thread).
 
-                # Bulk insert server metrics
-                if server_metrics:
-                    db.bulk_insert_mappings(
-                        ServerMetric,
-                        [
-                            {
-                                "server_id": m.server_id,
-                                "timestamp": m.timestamp,
-                                "response_time": m.response_time,
-                                "is_success": m.is_success,
-                                "error_message": m.error_message,
-                            }
-                            for m in server_metrics
-                        ],
-                    )
+        Args:
+            aggregates: Aggregates per (kind, entity, interaction type, minute)
 
-                # Bulk insert A2A agent metrics
-                if a2a_agent_metrics:
-                    db.bulk_insert_mappings(
-                        A2AAgentMetric,
-                        [
-                            {
-                                "a2a_agent_id": m.a2a_agent_id,
-                                "timestamp": m.timestamp,
-                                "response_time": m.response_time,
-                                "is_success": m.is_success,
-                                "interaction_type": m.interaction_type,
-                                "error_message": m.error_message,
-                            }
-                            for m in a2a_agent_metrics
-                        ],
-                    )
+        Returns:
+            True if the aggregates were written
+        """
+        # First-Party
+        from mcpgateway.services.metrics_rollup_service import get_metrics_rollup_service, HourlyAggregation  # pylint: disable=import-outside-toplevel
+
+        hourly: Dict[Tuple[str, str, Optional[str], int], _MetricAggregate] = {}
+        for (kind, entity_id, interaction_type, minute), aggregate in aggregates.items():
+            key = (kind, entity_id, interaction_type, minute - minute % 3600)
+            existing = hourly.get(key)
+            if existing is None:
+                existing = hourly[key] = _MetricAggregate()
+            existing.merge(aggregate)
+
+        by_table: Dict[str, List[Any]] = {}
+        for (kind, entity_id, interaction_type, hour), aggregate in hourly.items():
+            sketch = aggregate.sketch
+            by_table.setdefault(_METRIC_TABLES[kind][0].__tablename__, []).append(
+                HourlyAggregation(
+                    entity_id=entity_id,
+                    entity_name="",
+                    hour_start=datetime.fromtimestamp(hour, tz=timezone.utc),
+                    total_count=sketch.count,
+                    success_count=aggregate.success_count,
+                    failure_count=sketch.count - aggregate.success_count,
+                    min_response_time=sketch.min,
+                    max_response_time=sketch.max,
+                    avg_response_time=sketch.mean,
+                    p50_response_time=sketch.quantile(0.50),
+                    p95_response_time=sketch.quantile(0.95),
+                    p99_response_time=sketch.quantile(0.99),
+                    interaction_type=(interaction_type or "invoke") if kind == "a2a_agent" else None,
+                    latency_histogram=sketch.to_dict(),
+                )
+            )
 
+        try:
+            rollup_service = get_metrics_rollup_service()
+            with fresh_db_session() as db:
+                for table_name, aggregations in by_table.items():
+                    rollup_service.merge_preaggregated(db, table_name, aggregations)
                 db.commit()
-
+            logger.debug(f"Merged {len(hourly)} pre-aggregated hourly metrics into rollups")
+            return True
         except Exception as e:
-            logger.error(f"Failed to flush metrics to database: {e}", exc_info=True)
-            # Metrics are lost on failure - acceptable trade-off for performance
-            # Could implement retry queue if needed
+            logger.error(f"Failed to merge pre-aggregated metrics, retrying on next flush: {e}", exc_info=True)
+            return False
+
+    def _replay_spool(self) -> None:
+        """Retry spooled batches until one fails (runs in thread)."""
+        claimed = self._spool.claim(_SPOOL_REPLAY_BATCHES)
+        for index, (claimed_path, batches) in enumerate(claimed):
+            try:
+                with fresh_db_session() as db:
+                    self._insert_batches(db, batches)
+                    db.commit()
+            except Exception as e:
+                logger.warning(f"Retrying spooled metrics failed, keeping them for later: {e}")
+                for path, _ in claimed[index:]:
+                    self._spool.release(path, done=False)
+                break
+            self._spool.release(claimed_path, done=True)
+            self._total_flushed += sum(len(columns) for columns in batches.values())
 
     def _write_tool_metric_immediately(
         self,
@@ -741,10 +1174,14 @@ class MetricsBufferService:
         """Get buffer statistics for monitoring.
 
         Returns:
-            dict: Buffer statistics including enabled state, sizes, and counts.
+            dict: Buffer statistics including enabled state, sizes, occupancy, flush latency and spool state.
         """
-        with self._lock:
-            current_size = len(self._tool_metrics) + len(self._resource_metrics) + len(self._prompt_metrics) + len(self._server_metrics) + len(self._a2a_agent_metrics)
+        with self._shards_lock:
+            shards = list(self._shards)
+        shard_sizes = [sum(len(columns) for columns in shard.buffers.values()) for shard in shards]
+        current_size = sum(shard_sizes)
+        largest_shard = max(shard_sizes, default=0)
+        completed = self._flush_count
 
         return {
             "recording_enabled": self.recording_enabled,
@@ -752,9 +1189,21 @@ class MetricsBufferService:
             "flush_interval": self.flush_interval,
             "max_buffer_size": self.max_buffer_size,
             "current_buffer_size": current_size,
+            "shard_count": len(shards),
+            "buffer_occupancy": largest_shard / self.max_buffer_size if self.max_buffer_size else 0.0,
             "total_buffered": self._total_buffered,
             "total_flushed": self._total_flushed,
-            "flush_count": self._flush_count,
+            "flush_count": completed,
+            "failed_flush_count": self._failed_flush_count,
+            "last_flush_ms": self._last_flush_duration * 1000,
+            "avg_flush_ms": (self._total_flush_duration / completed * 1000) if completed else 0.0,
+            "max_flush_ms": self._max_flush_duration * 1000,
+            "spool": self._spool.stats(),
+            "preaggregation_enabled": self.preaggregation_enabled,
+            "raw_sample_rate": self.raw_sample_rate,
+            "pending_aggregates": sum(len(shard.aggregates) for shard in shards) + len(self._unflushed_aggregates),
+            "total_aggregated": self._total_aggregated,
+            "failed_aggregate_flush_count": self._aggregate_flush_failures,
         }
 
 
@@ -182,9 +182,16 @@ def get_retention_cutoff() -> datetime:
     - Raw data uses: timestamp >= cutoff (data from cutoff hour onward)
     - Rollups use: hour_start < cutoff (rollups before cutoff hour)
 
+    With metrics pre-aggregation the rollups are written as executions are
+    flushed and raw rows are only a sample, so every hour, including the current
+    one, comes from rollups.
+
     Returns:
         datetime: The cutoff point (hour-aligned) - data older than this comes from rollups.
     """
+    if getattr(settings, "metrics_preaggregation_enabled", False) is True:
+        return get_current_hour_start() + timedelta(hours=1)
+
     retention_days = getattr(settings, "metrics_retention_days", 7)
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(days=retention_days)
@@ -360,7 +367,7 @@ def aggregate_metrics_combined(
 
     # Query 3: Current hour raw metrics (timestamp >= current_hour_start)
     # This provides immediate visibility into metrics that haven't been rolled up yet
-    current_filters = [raw_model.timestamp >= current_hour_start]
+    current_filters = [raw_model.timestamp >= max(current_hour_start, cutoff)]
     if entity_id is not None:
         current_filters.append(getattr(raw_model, id_col) == entity_id)
 
@@ -508,7 +515,7 @@ def get_top_entities_combined(
             func.avg(raw_model.response_time).label("avg_rt"),
             func.max(raw_model.timestamp).label("last_time"),
         )
-        .where(raw_model.timestamp >= current_hour_start)
+        .where(raw_model.timestamp >= max(current_hour_start, cutoff))
         .group_by(getattr(raw_model, id_col))
         .subquery()
     )
@@ -6,9 +6,13 @@ enabling efficient historical queries without scanning millions of raw records.
 
 Features:
 - Hourly aggregation with percentile calculation
+- Vectorized (NumPy) columnar aggregation when percentiles cannot be pushed into SQL
 - Upsert logic to handle re-runs safely
 - Background task for periodic rollup
 - Optional deletion of raw metrics after rollup
+- Merging of in-process pre-aggregated counters into the hourly tables
+  (``METRICS_PREAGGREGATION_ENABLED``); raw rows are then only a sample and
+  are not rolled up
 - PostgreSQL and SQLite support
 
 Copyright 2025
@@ -52,9 +56,101 @@ from mcpgateway.db import (
     ToolMetric,
     ToolMetricsHourly,
 )
+from mcpgateway.utils.quantile_sketch import DDSketch
+
+# Optional columnar engine for percentile aggregation
+try:
+    # Third-Party
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_PERCENTILES = (50, 95, 99)
+
+# Entity ID column -> preserved name column of the hourly tables
+_HOURLY_NAME_COLUMNS = {
+    "tool_id": "tool_name",
+    "resource_id": "resource_name",
+    "prompt_id": "prompt_name",
+    "server_id": "server_name",
+    "a2a_agent_id": "agent_name",
+}
+
+
+def grouped_response_time_stats(codes: "np.ndarray", response_times: "np.ndarray", successes: "np.ndarray", groups: int) -> Dict[str, "np.ndarray"]:
+    """Compute per-group count, success count and response time statistics with grouped array operations.
+
+    Response times that are NaN (NULL in the database) count towards ``count``
+    but are ignored by min, max, avg and the percentiles, like SQL aggregates.
+    Percentiles use the same linear interpolation as
+    :meth:`MetricsRollupService._percentile`.
+
+    Args:
+        codes: Group code (0..groups-1) of each row.
+        response_times: Response time of each row (float, NaN for missing).
+        successes: Success flag of each row.
+        groups: Number of groups.
+
+    Returns:
+        Dict of per-group arrays: count, success, valid (non-NaN response times),
+        min, max, avg, p50, p95 and p99. Statistics are NaN for groups without
+        response times.
+
+    Examples:
+        >>> codes, rts = np.array([0, 1, 0, 0, 1]), np.array([3.0, 10.0, 1.0, 2.0, np.nan])  # doctest: +SKIP
+        >>> stats = grouped_response_time_stats(codes, rts, np.array([1, 1, 0, 1, 1], dtype=bool), 2)  # doctest: +SKIP
+        >>> stats["count"].tolist(), stats["success"].tolist(), stats["p50"].tolist()  # doctest: +SKIP
+        ([3, 2], [2, 2], [2.0, 10.0])
+    """
+    counts = np.bincount(codes, minlength=groups)
+    success_counts = np.bincount(codes, weights=successes.astype(np.float64), minlength=groups).astype(np.int64)
+    valid = ~np.isnan(response_times)
+    valid_counts = np.bincount(codes, weights=valid.astype(np.float64), minlength=groups).astype(np.int64)
+    sums = np.bincount(codes, weights=np.where(valid, response_times, 0.0), minlength=groups)
+
+    # Bucket rows by group (stable radix sort on a narrow code dtype), then sort
+    # each group's response times in place: NaNs sort last inside their group
+    code_dtype = np.uint16 if groups <= np.iinfo(np.uint16).max else np.int64
+    sorted_rt = response_times[np.argsort(codes.astype(code_dtype), kind="stable")]
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    for group in range(groups):
+        sorted_rt[bounds[group] : bounds[group + 1]].sort()
+    starts = bounds[:-1]
+    has_values = valid_counts > 0
+    last = np.maximum(valid_counts - 1, 0)
+
+    def pick(offsets: "np.ndarray") -> "np.ndarray":
+        """Return the sorted value at each group's offset, NaN for groups without values.
+
+        Args:
+            offsets: Offset inside each group.
+
+        Returns:
+            Per-group values.
+        """
+        return np.where(has_values, sorted_rt[np.minimum(starts + offsets, len(sorted_rt) - 1)], np.nan)
+
+    stats = {
+        "count": counts,
+        "success": success_counts,
+        "valid": valid_counts,
+        "min": pick(np.zeros_like(last)),
+        "max": pick(last),
+        "avg": np.where(has_values, sums / np.maximum(valid_counts, 1), np.nan),
+    }
+    for percentile in _PERCENTILES:
+        k = last * percentile / 100
+        floor = np.floor(k).astype(np.int64)
+        ceil = np.minimum(floor + 1, last)
+        low = pick(floor)
+        stats[f"p{percentile}"] = low + (k - floor) * (pick(ceil) - low)
+    return stats
+
 
 @dataclass
 class RollupResult:
@@ -101,6 +197,7 @@ class HourlyAggregation:
     p95_response_time: Optional[float]
     p99_response_time: Optional[float]
     interaction_type: Optional[str] = None  # For A2A agents
+    latency_histogram: Optional[Dict[str, Any]] = None  # Serialized DDSketch (pre-aggregated metrics)
 
 
 class MetricsRollupService:
@@ -118,6 +215,7 @@ class MetricsRollupService:
     - METRICS_ROLLUP_INTERVAL_HOURS: Hours between rollup runs (default: 1)
     - METRICS_DELETE_RAW_AFTER_ROLLUP: Delete raw after rollup (default: True)
     - METRICS_DELETE_RAW_AFTER_ROLLUP_HOURS: Hours after which to delete if rollup exists (default: 1)
+    - METRICS_PREAGGREGATION_ENABLED: Hourly tables are fed by the metrics buffer; raw rows are not rolled up (default: False)
     """
 
     # Table configuration: (name, raw_model, hourly_model, entity_model, entity_id_col, entity_name_col)
@@ -148,6 +246,7 @@ class MetricsRollupService:
         self.enabled = enabled if enabled is not None else getattr(settings, "metrics_rollup_enabled", True)
         self.delete_raw_after_rollup = delete_raw_after_rollup if delete_raw_after_rollup is not None else getattr(settings, "metrics_delete_raw_after_rollup", True)
         self.delete_raw_after_rollup_hours = delete_raw_after_rollup_hours or getattr(settings, "metrics_delete_raw_after_rollup_hours", 1)
+        self.preaggregated = getattr(settings, "metrics_preaggregation_enabled", False) is True
 
         # Check if using PostgreSQL
         self._is_postgresql = settings.database_url.startswith("postgresql")
@@ -476,7 +575,8 @@ class MetricsRollupService:
                         or 0
                     )
 
-                    if raw_count > 0:
+                    # Pre-aggregated rollups are written by the metrics buffer; raw rows are only a sample
+                    if raw_count > 0 and not self.preaggregated:
                         # Always re-aggregate when there's raw data, even if rollup exists.
                         # This ensures late-arriving metrics (buffer flush, ingestion lag) are included.
                         # The _aggregate_hour queries ALL raw data for the hour, and _upsert_rollup
@@ -508,6 +608,7 @@ class MetricsRollupService:
 
                         hours_processed += 1
 
+                    if raw_count > 0:
                         # Delete raw metrics if configured
                         if self.delete_raw_after_rollup:
                             delete_cutoff = datetime.now(timezone.utc) - timedelta(hours=self.delete_raw_after_rollup_hours)
@@ -552,9 +653,13 @@ class MetricsRollupService:
     ) -> List[HourlyAggregation]:
         """Aggregate raw metrics for a single hour using optimized bulk queries.
 
-        Uses a single GROUP BY query to get basic aggregations (count, min, max, avg,
-        success count) for all entities at once, minimizing database round trips.
-        Percentiles are calculated by loading response times in a single bulk query.
+        On PostgreSQL (with ``use_postgresdb_percentiles``) everything, including
+        ``percentile_cont``, is computed in a single GROUP BY query. Otherwise, when
+        NumPy is available the raw rows are streamed once in chunks into columnar
+        arrays and aggregated with grouped array operations (see
+        :meth:`_aggregate_hour_vectorized`). Without NumPy, a GROUP BY query gets the
+        basic aggregations and percentiles are calculated in Python from a second,
+        ordered bulk query.
 
         Args:
             db: Database session
@@ -634,6 +739,8 @@ class MetricsRollupService:
                             interaction_type=row.interaction_type if is_a2a else None,
                         )
                     )
+            elif NUMPY_AVAILABLE:
+                aggregations = self._aggregate_hour_vectorized(db, raw_model, entity_model, entity_id_col, entity_name_col, hour_start, hour_end, is_a2a)
             else:
                 # Build group by columns
                 if is_a2a:
@@ -764,6 +871,101 @@ class MetricsRollupService:
             )
             raise
 
+    def _aggregate_hour_vectorized(
+        self,
+        db: Session,
+        raw_model: Type,
+        entity_model: Type,
+        entity_id_col: str,
+        entity_name_col: str,
+        hour_start: datetime,
+        hour_end: datetime,
+        is_a2a: bool,
+    ) -> List[HourlyAggregation]:
+        """Aggregate one hour of raw metrics with NumPy.
+
+        Rows are fetched in ``yield_batch_size`` chunks without ORDER BY, and each
+        chunk is converted to columnar arrays (group code, response time, success).
+        Only these compact arrays are kept, instead of one Python float per row,
+        and all statistics are computed with :func:`grouped_response_time_stats`.
+
+        Args:
+            db: Database session
+            raw_model: SQLAlchemy model for raw metrics
+            entity_model: SQLAlchemy model for the entity
+            entity_id_col: Name of the entity ID column
+            entity_name_col: Name of the entity name column
+            hour_start: Start of the hour
+            hour_end: End of the hour
+            is_a2a: Whether this is A2A agent metrics (has interaction_type)
+
+        Returns:
+            List[HourlyAggregation]: Aggregated metrics for each entity
+        """
+        entity_id_attr = getattr(raw_model, entity_id_col)
+        key_cols = [entity_id_attr, raw_model.interaction_type] if is_a2a else [entity_id_attr]
+        query = select(*key_cols, raw_model.response_time, raw_model.is_success).where(
+            and_(
+                raw_model.timestamp >= hour_start,
+                raw_model.timestamp < hour_end,
+            )
+        )
+
+        group_codes: Dict[Any, int] = {}
+        code_chunks: List["np.ndarray"] = []
+        rt_chunks: List["np.ndarray"] = []
+        success_chunks: List["np.ndarray"] = []
+        for partition in db.execute(query).yield_per(settings.yield_batch_size).partitions():
+            columns = list(zip(*partition))
+            keys = zip(columns[0], columns[1]) if is_a2a else columns[0]
+            code_chunks.append(np.fromiter((group_codes.setdefault(key, len(group_codes)) for key in keys), dtype=np.int64, count=len(partition)))
+            rt_chunks.append(np.array(columns[-2], dtype=np.float64))
+            success_chunks.append(np.array(columns[-1], dtype=bool))
+
+        if not group_codes:
+            return []
+
+        stats = grouped_response_time_stats(np.concatenate(code_chunks), np.concatenate(rt_chunks), np.concatenate(success_chunks), len(group_codes))
+
+        entity_ids = list({key[0] if is_a2a else key for key in group_codes})
+        entity_names = {e[0]: e[1] for e in db.execute(select(entity_model.id, getattr(entity_model, entity_name_col)).where(entity_model.id.in_(entity_ids)))}
+
+        def value(name: str, code: int) -> Optional[float]:
+            """Return a statistic as a Python float, None for groups without response times.
+
+            Args:
+                name: Statistic name.
+                code: Group code.
+
+            Returns:
+                The statistic, or None.
+            """
+            return float(stats[name][code]) if stats["valid"][code] else None
+
+        aggregations = []
+        for key, code in group_codes.items():
+            entity_id, interaction_type = key if is_a2a else (key, None)
+            total_count = int(stats["count"][code])
+            success_count = int(stats["success"][code])
+            aggregations.append(
+                HourlyAggregation(
+                    entity_id=entity_id,
+                    entity_name=entity_names.get(entity_id, "unknown"),
+                    hour_start=hour_start,
+                    total_count=total_count,
+                    success_count=success_count,
+                    failure_count=total_count - success_count,
+                    min_response_time=value("min", code),
+                    max_response_time=value("max", code),
+                    avg_response_time=value("avg", code),
+                    p50_response_time=value("p50", code),
+                    p95_response_time=value("p95", code),
+                    p99_response_time=value("p99", code),
+                    interaction_type=interaction_type,
+                )
+            )
+        return aggregations
+
     def _percentile(self, sorted_data: List[float], percentile: int) -> float:
         """Calculate percentile from sorted data.
 
@@ -815,13 +1017,7 @@ class MetricsRollupService:
         """
         try:
             # Resolve name column
-            name_col_map = {
-                "tool_id": "tool_name",
-                "resource_id": "resource_name",
-                "prompt_id": "prompt_name",
-                "server_id": "server_name",
-            }
-            name_col = name_col_map.get(entity_id_col, "agent_name")
+            name_col = _HOURLY_NAME_COLUMNS.get(entity_id_col, "agent_name")
 
             # Normalizing
             hour_start = agg.hour_start.replace(minute=0, second=0, microsecond=0)
@@ -947,6 +1143,136 @@ class MetricsRollupService:
             )
             raise
 
+    def merge_preaggregated(self, db: Session, table_name: str, aggregations: List[HourlyAggregation]) -> Tuple[int, int]:
+        """Merge pre-aggregated hourly metrics into the hourly rollup table.
+
+        Unlike :meth:`_upsert_rollup`, which replaces a rollup with a full
+        re-aggregation of the raw rows, this adds the given counts to the existing
+        rollup and merges the latency sketches, so several workers and successive
+        flushes can contribute to the same hour. Entity names are resolved in bulk
+        when the aggregations do not carry one. The caller commits.
+
+        Args:
+            db: Database session
+            table_name: Raw metrics table name, as in :attr:`METRIC_TABLES` (e.g. "tool_metrics")
+            aggregations: Pre-aggregated metrics, ``latency_histogram`` holding a serialized DDSketch
+
+        Returns:
+            Tuple[int, int]: (created_count, updated_count)
+
+        Raises:
+            ValueError: If ``table_name`` is not a known metrics table.
+        """
+        for name, _raw_model, hourly_model, entity_model, entity_id_col, entity_name_col in self.METRIC_TABLES:
+            if name == table_name:
+                break
+        else:
+            raise ValueError(f"Unknown metrics table: {table_name}")
+
+        unnamed = {agg.entity_id for agg in aggregations if not agg.entity_name}
+        names: Dict[str, str] = {}
+        if unnamed:
+            names = {row[0]: row[1] for row in db.execute(select(entity_model.id, getattr(entity_model, entity_name_col)).where(entity_model.id.in_(unnamed)))}
+
+        is_a2a = table_name == "a2a_agent_metrics"
+        created = updated = 0
+        for agg in aggregations:
+            if not agg.entity_name:
+                agg.entity_name = names.get(agg.entity_id, "unknown")
+            c, u = self._merge_rollup(db, hourly_model, entity_id_col, agg, is_a2a)
+            created += c
+            updated += u
+        self._total_rollups += created + updated
+        return created, updated
+
+    def _merge_rollup(
+        self,
+        db: Session,
+        hourly_model: Type,
+        entity_id_col: str,
+        agg: HourlyAggregation,
+        is_a2a: bool,
+    ) -> Tuple[int, int]:
+        """Add one pre-aggregated hour to its rollup record, inserting it if missing.
+
+        The existing row is locked (``SELECT ... FOR UPDATE`` where supported) and
+        counts, min/max and the weighted average are combined; percentiles are
+        recomputed from the merged latency sketch. Rows rolled up from raw metrics
+        have no sketch, in which case the incoming sketch is kept and percentiles
+        are approximate for that hour. A concurrent insert of the same key is
+        handled by retrying as a merge.
+
+        Args:
+            db: Database session
+            hourly_model: SQLAlchemy model for hourly rollups
+            entity_id_col: Name of the entity ID column
+            agg: Pre-aggregated metrics for a single entity and hour
+            is_a2a: Whether interaction_type is part of the uniqueness key
+
+        Returns:
+            Tuple[int, int]: (inserted_count, updated_count)
+        """
+        hour_start = agg.hour_start.replace(minute=0, second=0, microsecond=0)
+        filters = [getattr(hourly_model, entity_id_col) == agg.entity_id, hourly_model.hour_start == hour_start]
+        if is_a2a:
+            filters.append(hourly_model.interaction_type == agg.interaction_type)
+        query = select(hourly_model).where(and_(*filters)).with_for_update()
+
+        existing = db.execute(query).scalar_one_or_none()
+        if existing is None:
+            values = {
+                entity_id_col: agg.entity_id,
+                _HOURLY_NAME_COLUMNS.get(entity_id_col, "agent_name"): agg.entity_name,
+                "hour_start": hour_start,
+                "total_count": agg.total_count,
+                "success_count": agg.success_count,
+                "failure_count": agg.failure_count,
+                "min_response_time": agg.min_response_time,
+                "max_response_time": agg.max_response_time,
+                "avg_response_time": agg.avg_response_time,
+                "p50_response_time": agg.p50_response_time,
+                "p95_response_time": agg.p95_response_time,
+                "p99_response_time": agg.p99_response_time,
+                "latency_histogram": agg.latency_histogram,
+            }
+            if is_a2a:
+                values["interaction_type"] = agg.interaction_type
+            savepoint = db.begin_nested()
+            try:
+                db.add(hourly_model(**values))
+                db.flush()
+                savepoint.commit()
+                return (1, 0)
+            except IntegrityError:
+                savepoint.rollback()
+                existing = db.execute(query).scalar_one()
+
+        total = existing.total_count + agg.total_count
+        if agg.avg_response_time is not None:
+            if existing.avg_response_time is None or not existing.total_count:
+                existing.avg_response_time = agg.avg_response_time
+            else:
+                existing.avg_response_time = (existing.avg_response_time * existing.total_count + agg.avg_response_time * agg.total_count) / total
+        if agg.min_response_time is not None:
+            existing.min_response_time = agg.min_response_time if existing.min_response_time is None else min(existing.min_response_time, agg.min_response_time)
+        if agg.max_response_time is not None:
+            existing.max_response_time = agg.max_response_time if existing.max_response_time is None else max(existing.max_response_time, agg.max_response_time)
+        existing.total_count = total
+        existing.success_count += agg.success_count
+        existing.failure_count += agg.failure_count
+
+        if agg.latency_histogram:
+            sketch = DDSketch.from_dict(agg.latency_histogram)
+            if existing.latency_histogram:
+                merged = DDSketch.from_dict(existing.latency_histogram)
+                merged.merge(sketch)
+                sketch = merged
+            existing.latency_histogram = sketch.to_dict()
+            existing.p50_response_time = sketch.quantile(0.50)
+            existing.p95_response_time = sketch.quantile(0.95)
+            existing.p99_response_time = sketch.quantile(0.99)
+        return (0, 1)
+
     def _delete_raw_metrics(
         self,
         db: Session,
@@ -986,6 +1312,7 @@ class MetricsRollupService:
             "rollup_interval_hours": self.rollup_interval_hours,
             "delete_raw_after_rollup": self.delete_raw_after_rollup,
             "delete_raw_after_rollup_hours": self.delete_raw_after_rollup_hours,
+            "preaggregated": self.preaggregated,
             "total_rollups": self._total_rollups,
             "rollup_runs": self._rollup_runs,
             "is_postgresql": self._is_postgresql,
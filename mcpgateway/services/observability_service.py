@@ -15,6 +15,7 @@ It includes:
 - Metrics collection and storage
 - Query and filtering capabilities
 - Integration with FastAPI middleware
+- Write-behind span recorder with head and tail sampling
 
 Examples:
     >>> from mcpgateway.services.observability_service import ObservabilityService  # doctest: +SKIP
@@ -26,22 +27,28 @@ Examples:
 """
 
 # Standard
+import asyncio
+from collections import deque, OrderedDict
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
 import logging
+import random
 import re
+import threading
+import time
 import traceback
-from typing import Any, Dict, List, Optional, Pattern, Tuple
+from typing import Any, Deque, Dict, List, Optional, Pattern, Tuple
 import uuid
 
 # Third-Party
-from sqlalchemy import desc
+from sqlalchemy import desc, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload, Session
 
 # First-Party
-from mcpgateway.db import ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.config import settings
+from mcpgateway.db import ObservabilityEvent, ObservabilityMetric, ObservabilitySpan, ObservabilityTrace, SessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +172,498 @@ def format_traceparent(trace_id: str, span_id: str, sampled: bool = True) -> str
     return f"00-{trace_id}-{span_id}-{flags}"
 
 
+class _BufferedTrace:
+    """A trace tree assembled in memory by the :class:`SpanRecorder`."""
+
+    __slots__ = ("row", "spans", "span_ids", "events", "sampled", "has_error", "started", "state")
+
+    def __init__(self, row: Dict[str, Any], sampled: bool):
+        """Initialize the buffered trace.
+
+        Args:
+            row: ``observability_traces`` column values
+            sampled: False when head sampling or overflow dropped the trace; its spans are discarded
+        """
+        self.row = row
+        self.spans: Dict[str, Dict[str, Any]] = {}
+        self.span_ids: List[str] = []
+        self.events: List[Dict[str, Any]] = []
+        self.sampled = sampled
+        self.has_error = False
+        self.started = time.monotonic()
+        self.state = "active" if sampled else "dropped"  # active -> queued -> flushed, or dropped
+
+
+class SpanRecorder:
+    """Write-behind recorder assembling traces in memory and writing them in bulk.
+
+    While the recorder runs, :class:`ObservabilityService` records traces, spans
+    and events here instead of committing each one. When a trace ends, the
+    whole tree is kept or discarded:
+
+    - Head sampling: only ``head_sample_rate`` of new traces are recorded at all.
+    - Tail sampling: a finished trace is kept if it (or any span or event)
+      errored, if it took at least ``slow_threshold_ms``, or otherwise with
+      probability ``tail_sample_rate``.
+
+    Kept traces are written by a background task, ``batch_size`` traces per
+    transaction (one executemany per table), when a batch is full or every
+    ``flush_interval`` seconds. Traces still open after ``trace_timeout``
+    seconds are written as they are. At most ``max_traces`` traces are held in
+    memory; new traces beyond that are dropped.
+
+    Updates for traces the recorder does not know (started before it ran, or
+    already written) fall back to the database.
+
+    Examples:
+        >>> recorder = SpanRecorder(tail_sample_rate=0.0, slow_threshold_ms=60000)
+        >>> recorder._running = True
+        >>> for trace_id, status in (("t-ok", "ok"), ("t-err", "ok")):
+        ...     recorder.start_trace({"trace_id": trace_id, "start_time": utc_now(), "attributes": {}})
+        ...     _ = recorder.start_span({"span_id": trace_id + "-s", "trace_id": trace_id, "start_time": utc_now(), "attributes": {}})
+        >>> recorder.end_span("t-err-s", status="error")
+        True
+        >>> [recorder.end_trace(trace_id, status="ok") for trace_id in ("t-ok", "t-err")]
+        [True, True]
+        >>> [trace.row["trace_id"] for trace in recorder._queue]
+        ['t-err']
+        >>> stats = recorder.get_stats()
+        >>> stats["kept_error"], stats["sampled_out_tail"], stats["queued_traces"]
+        (1, 1, 1)
+        >>> recorder.end_span("unknown-span")
+        False
+    """
+
+    _FINISHED_HISTORY = 10000  # finished traces remembered for late span updates
+
+    def __init__(
+        self,
+        head_sample_rate: Optional[float] = None,
+        tail_sample_rate: Optional[float] = None,
+        slow_threshold_ms: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_traces: Optional[int] = None,
+        trace_timeout: Optional[float] = None,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            head_sample_rate: Fraction of new traces recorded (default: from settings)
+            tail_sample_rate: Fraction of successful, fast finished traces kept (default: from settings)
+            slow_threshold_ms: Finished traces at least this slow are always kept (default: from settings)
+            batch_size: Traces per bulk insert; a full batch triggers a flush (default: from settings)
+            flush_interval: Maximum seconds between flushes (default: from settings)
+            max_traces: Maximum traces held in memory (default: from settings)
+            trace_timeout: Seconds after which an unfinished trace is written as is (default: from settings)
+        """
+        self.head_sample_rate = head_sample_rate if head_sample_rate is not None else getattr(settings, "observability_sample_rate", 1.0)
+        self.tail_sample_rate = tail_sample_rate if tail_sample_rate is not None else getattr(settings, "observability_tail_sample_rate", 1.0)
+        self.slow_threshold_ms = slow_threshold_ms if slow_threshold_ms is not None else getattr(settings, "observability_tail_slow_threshold_ms", 1000.0)
+        self.batch_size = batch_size or getattr(settings, "observability_buffer_batch_size", 200)
+        self.flush_interval = flush_interval or getattr(settings, "observability_buffer_flush_interval", 2.0)
+        self.max_traces = max_traces or getattr(settings, "observability_buffer_max_traces", 10000)
+        self.trace_timeout = trace_timeout or getattr(settings, "observability_buffer_trace_timeout", 300.0)
+
+        self._active: Dict[str, _BufferedTrace] = {}
+        self._finished: "OrderedDict[str, _BufferedTrace]" = OrderedDict()
+        self._spans: Dict[str, _BufferedTrace] = {}
+        self._queue: Deque[_BufferedTrace] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        self._running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._wake_pending = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self._counters: Dict[str, int] = dict.fromkeys(
+            (
+                "recorded",
+                "sampled_out_head",
+                "sampled_out_tail",
+                "kept_error",
+                "kept_slow",
+                "kept_sampled",
+                "timed_out",
+                "dropped_overflow",
+                "dropped_spans",
+                "written_traces",
+                "written_spans",
+                "written_events",
+                "failed_traces",
+                "flush_count",
+            ),
+            0,
+        )
+        self._last_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the recorder is accepting traces.
+
+        Returns:
+            True between :meth:`start` and :meth:`shutdown`.
+        """
+        return self._running
+
+    async def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._flush_task is None or self._flush_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._wake_pending = False
+            self._running = True
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(
+                f"SpanRecorder started: head_sample_rate={self.head_sample_rate}, tail_sample_rate={self.tail_sample_rate}, "
+                f"slow_threshold_ms={self.slow_threshold_ms}, batch_size={self.batch_size}, flush_interval={self.flush_interval}s"
+            )
+
+    async def shutdown(self) -> None:
+        """Stop recording and write every kept and unfinished trace."""
+        self._running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        with self._lock:
+            for trace in list(self._active.values()):
+                self._finish(trace, keep=True)
+        await asyncio.to_thread(self.flush)
+        logger.info(f"SpanRecorder shutdown complete: {self.get_stats()}")
+
+    # ------------------------------------------------------------------
+    # Recording (called by ObservabilityService, any thread)
+    # ------------------------------------------------------------------
+
+    def start_trace(self, row: Dict[str, Any]) -> None:
+        """Start recording a trace, subject to head sampling and the memory bound.
+
+        Args:
+            row: ``observability_traces`` column values
+        """
+        sampled = random.random() < self.head_sample_rate  # nosec B311 - sampling, not security
+        with self._lock:
+            if not sampled:
+                self._counters["sampled_out_head"] += 1
+            elif len(self._active) + len(self._queue) >= self.max_traces:
+                self._counters["dropped_overflow"] += 1
+                sampled = False
+            else:
+                self._counters["recorded"] += 1
+            trace = _BufferedTrace(row, sampled)
+            if sampled:
+                self._active[row["trace_id"]] = trace
+            else:
+                self._remember(trace)
+
+    def _lookup(self, trace_id: str) -> Optional[_BufferedTrace]:
+        """Find a trace still handled by the recorder. Caller holds the lock.
+
+        Args:
+            trace_id: Trace ID
+
+        Returns:
+            The buffered trace, or None if it is unknown or already written.
+        """
+        trace = self._active.get(trace_id) or self._finished.get(trace_id)
+        if trace is None or trace.state == "flushed":
+            return None
+        return trace
+
+    def start_span(self, row: Dict[str, Any]) -> bool:
+        """Add a span to its buffered trace.
+
+        Args:
+            row: ``observability_spans`` column values
+
+        Returns:
+            False if the trace is not handled by the recorder and the span must be written directly.
+        """
+        with self._lock:
+            trace = self._lookup(row["trace_id"])
+            if trace is None:
+                return False
+            self._spans[row["span_id"]] = trace
+            trace.span_ids.append(row["span_id"])
+            if trace.state == "dropped":
+                self._counters["dropped_spans"] += 1
+            else:
+                trace.spans[row["span_id"]] = row
+            return True
+
+    def end_span(self, span_id: str, status: str = "ok", status_message: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None) -> bool:
+        """End a buffered span.
+
+        Args:
+            span_id: Span ID
+            status: Span status (ok, error)
+            status_message: Optional status message
+            attributes: Additional attributes to merge
+
+        Returns:
+            False if the span is not handled by the recorder and must be updated directly.
+        """
+        with self._lock:
+            trace = self._spans.get(span_id)
+            if trace is None or trace.state == "flushed":
+                return False
+            span = trace.spans.get(span_id)
+            if span is not None:
+                end_time = utc_now()
+                span["end_time"] = end_time
+                span["duration_ms"] = (end_time - span["start_time"]).total_seconds() * 1000
+                span["status"] = status
+                span["status_message"] = status_message
+                if attributes:
+                    span["attributes"] = {**(span["attributes"] or {}), **attributes}
+                if status == "error":
+                    trace.has_error = True
+            return True
+
+    def add_event(self, row: Dict[str, Any]) -> bool:
+        """Add an event to its buffered span.
+
+        Args:
+            row: ``observability_events`` column values
+
+        Returns:
+            False if the span is not handled by the recorder and the event must be written directly.
+        """
+        with self._lock:
+            trace = self._spans.get(row["span_id"])
+            if trace is None or trace.state == "flushed":
+                return False
+            if trace.state != "dropped":
+                trace.events.append(row)
+                if row.get("severity") in ("error", "critical"):
+                    trace.has_error = True
+            return True
+
+    def end_trace(
+        self,
+        trace_id: str,
+        status: str = "ok",
+        status_message: Optional[str] = None,
+        http_status_code: Optional[int] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """End a buffered trace and apply tail sampling.
+
+        Args:
+            trace_id: Trace ID
+            status: Trace status (ok, error)
+            status_message: Optional status message
+            http_status_code: HTTP response status code
+            attributes: Additional attributes to merge
+
+        Returns:
+            False if the trace is not handled by the recorder and must be updated directly.
+        """
+        wake = False
+        with self._lock:
+            trace = self._active.pop(trace_id, None)
+            if trace is None:
+                return self._lookup(trace_id) is not None
+
+            row = trace.row
+            end_time = utc_now()
+            row["end_time"] = end_time
+            row["duration_ms"] = (end_time - row["start_time"]).total_seconds() * 1000
+            row["status"] = status
+            row["status_message"] = status_message
+            if http_status_code is not None:
+                row["http_status_code"] = http_status_code
+            if attributes:
+                row["attributes"] = {**(row["attributes"] or {}), **attributes}
+
+            if status == "error" or trace.has_error:
+                keep, reason = True, "kept_error"
+            elif row["duration_ms"] >= self.slow_threshold_ms:
+                keep, reason = True, "kept_slow"
+            else:
+                keep = random.random() < self.tail_sample_rate  # nosec B311 - sampling, not security
+                reason = "kept_sampled" if keep else "sampled_out_tail"
+            self._counters[reason] += 1
+            wake = self._finish(trace, keep)
+
+        if wake:
+            self._wake_flush()
+        return True
+
+    def _finish(self, trace: _BufferedTrace, keep: bool) -> bool:
+        """Queue or drop a finished trace. Caller holds the lock.
+
+        Args:
+            trace: Finished trace
+            keep: Whether to write it
+
+        Returns:
+            True if a full batch is queued and no flush was requested yet.
+        """
+        self._active.pop(trace.row["trace_id"], None)
+        if keep:
+            trace.state = "queued"
+            self._queue.append(trace)
+        else:
+            trace.state = "dropped"
+            trace.spans.clear()
+            trace.events.clear()
+        self._remember(trace)
+        if len(self._queue) >= self.batch_size and not self._wake_pending:
+            self._wake_pending = True
+            return True
+        return False
+
+    def _remember(self, trace: _BufferedTrace) -> None:
+        """Remember a finished trace for late updates, forgetting the oldest. Caller holds the lock.
+
+        Args:
+            trace: Finished or dropped trace
+        """
+        self._finished[trace.row["trace_id"]] = trace
+        while len(self._finished) > self._FINISHED_HISTORY:
+            _, old = self._finished.popitem(last=False)
+            for span_id in old.span_ids:
+                self._spans.pop(span_id, None)
+
+    def _wake_flush(self) -> None:
+        """Wake the flush task from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except (AttributeError, RuntimeError):  # Not started or loop closed; the next timed or final flush writes the batch
+            pass
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _take_batch(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Take up to batch_size queued traces, finishing timed-out traces first.
+
+        Returns:
+            Tuple of (trace rows, span rows, event rows); spans are in start order so parents precede children.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for trace in [t for t in self._active.values() if now - t.started >= self.trace_timeout]:
+                self._counters["timed_out"] += 1
+                self._finish(trace, keep=True)
+
+            traces, spans, events = [], [], []
+            while self._queue and len(traces) < self.batch_size:
+                trace = self._queue.popleft()
+                trace.state = "flushed"
+                traces.append(dict(trace.row))
+                spans.extend(dict(span) for span in trace.spans.values())
+                events.extend(trace.events)
+            self._wake_pending = False
+            return traces, spans, events
+
+    def flush(self) -> int:
+        """Write every queued trace to the database.
+
+        Blocking; called from a worker thread by the flush task.
+
+        Returns:
+            Number of traces written.
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                traces, spans, events = self._take_batch()
+                if not traces:
+                    return written
+                start = time.monotonic()
+                if self._write_batch(traces, spans, events):
+                    written += len(traces)
+                    self._counters["written_traces"] += len(traces)
+                    self._counters["written_spans"] += len(spans)
+                    self._counters["written_events"] += len(events)
+                else:
+                    self._counters["failed_traces"] += len(traces)
+                self._counters["flush_count"] += 1
+                self._last_flush_ms = (time.monotonic() - start) * 1000
+
+    def _write_batch(self, traces: List[Dict[str, Any]], spans: List[Dict[str, Any]], events: List[Dict[str, Any]]) -> bool:
+        """Insert traces, spans and events with one executemany per table in one transaction.
+
+        Args:
+            traces: Trace rows
+            spans: Span rows
+            events: Event rows
+
+        Returns:
+            True if the batch was committed.
+        """
+        db = SessionLocal()
+        try:
+            for model, rows in ((ObservabilityTrace, traces), (ObservabilitySpan, spans), (ObservabilityEvent, events)):
+                if rows:
+                    db.execute(insert(model), rows)
+            db.commit()
+            return True
+        except Exception as exc:
+            logger.warning(f"Failed to write {len(traces)} buffered traces: {exc}")
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    async def _flush_loop(self) -> None:
+        """Flush when a batch is full or the flush interval elapsed.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await asyncio.to_thread(self.flush)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Error in span recorder flush loop: {exc}", exc_info=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recorder statistics for monitoring.
+
+        Returns:
+            Dict with in-memory trace counts, sampling decisions, dropped and written counts.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            stats.update(running=self._running, active_traces=len(self._active), queued_traces=len(self._queue))
+        stats["last_flush_ms"] = round(self._last_flush_ms, 3)
+        return stats
+
+
+# Singleton instance
+_span_recorder: Optional[SpanRecorder] = None
+
+
+def get_span_recorder() -> SpanRecorder:
+    """Get or create the singleton SpanRecorder instance.
+
+    Returns:
+        SpanRecorder: The singleton span recorder.
+    """
+    global _span_recorder  # pylint: disable=global-statement
+    if _span_recorder is None:
+        _span_recorder = SpanRecorder()
+    return _span_recorder
+
+
 class ObservabilityService:
     """Service for managing observability traces, spans, events, and metrics.
 
@@ -254,22 +753,30 @@ class ObservabilityService:
         if parent_span_id:
             attrs["parent_span_id"] = parent_span_id
 
-        trace = ObservabilityTrace(
-            trace_id=trace_id,
-            name=name,
-            start_time=utc_now(),
-            status="unset",
-            http_method=http_method,
-            http_url=http_url,
-            user_email=user_email,
-            user_agent=user_agent,
-            ip_address=ip_address,
-            attributes=attrs,
-            resource_attributes=resource_attributes or {},
-            created_at=utc_now(),
-        )
-        db.add(trace)
-        self._safe_commit(db, "start_trace")
+        row = {
+            "trace_id": trace_id,
+            "name": name,
+            "start_time": utc_now(),
+            "end_time": None,
+            "duration_ms": None,
+            "status": "unset",
+            "status_message": None,
+            "http_method": http_method,
+            "http_url": http_url,
+            "http_status_code": None,
+            "user_email": user_email,
+            "user_agent": user_agent,
+            "ip_address": ip_address,
+            "attributes": attrs,
+            "resource_attributes": resource_attributes or {},
+            "created_at": utc_now(),
+        }
+        recorder = get_span_recorder()
+        if recorder.running:
+            recorder.start_trace(row)
+        else:
+            db.add(ObservabilityTrace(**row))
+            self._safe_commit(db, "start_trace")
         logger.debug(f"Started trace {trace_id}: {name}")
         return trace_id
 
@@ -300,6 +807,11 @@ class ObservabilityService:
             ...     http_status_code=200
             ... )
         """
+        recorder = get_span_recorder()
+        if recorder.running and recorder.end_trace(trace_id, status=status, status_message=status_message, http_status_code=http_status_code, attributes=attributes):
+            logger.debug(f"Ended buffered trace {trace_id}: {status}")
+            return
+
         trace = db.query(ObservabilityTrace).filter_by(trace_id=trace_id).first()
         if not trace:
             logger.warning(f"Trace {trace_id} not found")
@@ -386,23 +898,28 @@ class ObservabilityService:
             ... )
         """
         span_id = str(uuid.uuid4())
-        span = ObservabilitySpan(
-            span_id=span_id,
-            trace_id=trace_id,
-            parent_span_id=parent_span_id,
-            name=name,
-            kind=kind,
-            start_time=utc_now(),
-            status="unset",
-            resource_name=resource_name,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            attributes=attributes or {},
-            created_at=utc_now(),
-        )
-        db.add(span)
-        if commit:
-            self._safe_commit(db, "start_span")
+        row = {
+            "span_id": span_id,
+            "trace_id": trace_id,
+            "parent_span_id": parent_span_id,
+            "name": name,
+            "kind": kind,
+            "start_time": utc_now(),
+            "end_time": None,
+            "duration_ms": None,
+            "status": "unset",
+            "status_message": None,
+            "resource_name": resource_name,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "attributes": attributes or {},
+            "created_at": utc_now(),
+        }
+        recorder = get_span_recorder()
+        if not (recorder.running and recorder.start_span(row)):
+            db.add(ObservabilitySpan(**row))
+            if commit:
+                self._safe_commit(db, "start_span")
         logger.debug(f"Started span {span_id}: {name} (trace={trace_id})")
         return span_id
 
@@ -429,6 +946,11 @@ class ObservabilityService:
         Examples:
             >>> service.end_span(db, span_id, status="ok")  # doctest: +SKIP
         """
+        recorder = get_span_recorder()
+        if recorder.running and recorder.end_span(span_id, status=status, status_message=status_message, attributes=attributes):
+            logger.debug(f"Ended buffered span {span_id}: {status}")
+            return
+
         span = db.query(ObservabilitySpan).filter_by(span_id=span_id).first()
         if not span:
             logger.warning(f"Span {span_id} not found")
@@ -605,7 +1127,7 @@ class ObservabilityService:
             attributes: Additional event attributes
 
         Returns:
-            Event ID
+            Event ID (0 if the commit failed or the event is buffered by the span recorder)
 
         Examples:
             >>> event_id = service.add_event(  # doctest: +SKIP
@@ -616,18 +1138,24 @@ class ObservabilityService:
             ...     message="Failed to connect to database"  # doctest: +SKIP
             ... )  # doctest: +SKIP
         """
-        event = ObservabilityEvent(
-            span_id=span_id,
-            name=name,
-            timestamp=utc_now(),
-            severity=severity,
-            message=message,
-            exception_type=exception_type,
-            exception_message=exception_message,
-            exception_stacktrace=exception_stacktrace,
-            attributes=attributes or {},
-            created_at=utc_now(),
-        )
+        row = {
+            "span_id": span_id,
+            "name": name,
+            "timestamp": utc_now(),
+            "severity": severity,
+            "message": message,
+            "exception_type": exception_type,
+            "exception_message": exception_message,
+            "exception_stacktrace": exception_stacktrace,
+            "attributes": attributes or {},
+            "created_at": utc_now(),
+        }
+        recorder = get_span_recorder()
+        if recorder.running and recorder.add_event(row):
+            logger.debug(f"Added buffered event to span {span_id}: {name}")
+            return 0
+
+        event = ObservabilityEvent(**row)
         db.add(event)
         if not self._safe_commit(db, "add_event"):
             return 0
@@ -8,22 +8,41 @@ Performance Tracking Service.
 This module provides performance tracking and analytics for all operations
 across the MCP Gateway, enabling identification of bottlenecks and
 optimization opportunities.
+
+Durations are summarized per operation in mergeable quantile sketches
+(DDSketch), so summaries cost the same regardless of how many samples were
+recorded, workers can merge their sketches through Redis, and the sketches
+can be exported as Prometheus histograms.
 """
 
 # Standard
+import asyncio
 from collections import defaultdict, deque, OrderedDict
 from contextlib import contextmanager
 import logging
-import statistics
+import os
+import socket
 import time
-from typing import Any, Dict, Generator, Optional, Tuple
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple
+
+# Third-Party
+import orjson
 
 # First-Party
 from mcpgateway.config import settings
 from mcpgateway.utils.correlation_id import get_correlation_id
+from mcpgateway.utils.quantile_sketch import DDSketch
+from mcpgateway.utils.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Redis hash per worker: operation name -> serialized sketch
+_SKETCH_KEY_PREFIX = "mcpgw:perf:sketches:"
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# Number of most recent samples compared against the baseline in check_performance_degradation
+_RECENT_SAMPLES = 10
+
 
 class PerformanceTracker:
     """Tracks and analyzes performance metrics across requests.
@@ -37,6 +56,11 @@ class PerformanceTracker:
     - Cache entries store the version at computation time
     - Entries are valid only if versions match (no TTL-based expiry)
 
+    Summaries and degradation checks are computed from a DDSketch per
+    operation, which covers every sample since the last clear_stats() in
+    bounded memory; the most recent ``max_samples`` raw durations are kept
+    alongside for inspection.
+
     Note: Internal state (_operation_timings, _op_version, etc.) should not be
     accessed directly. Use record_timing() or track_operation() to add data.
     """
@@ -55,6 +79,7 @@ class PerformanceTracker:
         # Use deque with maxlen for O(1) automatic eviction instead of O(n) pop(0)
         # Private to ensure all mutations go through record_timing/track_operation (version tracking)
         self._operation_timings: Dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._operation_sketches: Dict[str, DDSketch] = defaultdict(DDSketch)
 
         # Performance thresholds (seconds) from settings or defaults
         self.performance_thresholds = {
@@ -76,6 +101,23 @@ class PerformanceTracker:
         # For specific ops: version is op_version; for all ops: version is global_version
         self._summary_cache: OrderedDict[Tuple[str, int], Tuple[int, Dict[str, Any]]] = OrderedDict()
 
+        # Periodic publication of the sketches to Redis for cluster-wide summaries
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def _record(self, operation_name: str, duration: float) -> None:
+        """Add a duration to the operation's recent samples and sketch.
+
+        Args:
+            operation_name: Name of the operation
+            duration: Duration in seconds
+        """
+        # Record timing (deque automatically evicts oldest when at maxlen)
+        self._operation_timings[operation_name].append(duration)
+        self._operation_sketches[operation_name].add(duration)
+
+        # Increment version to invalidate cached summaries
+        self._increment_version(operation_name)
+
     def _increment_version(self, operation_name: Optional[str] = None) -> None:
         """Increment version counters to invalidate cached summaries.
 
@@ -119,12 +161,7 @@ class PerformanceTracker:
             raise
         finally:
             duration = time.time() - start_time
-
-            # Record timing (deque automatically evicts oldest when at maxlen)
-            self._operation_timings[operation_name].append(duration)
-
-            # Increment version to invalidate cached summaries
-            self._increment_version(operation_name)
+            self._record(operation_name, duration)
 
             # Check threshold and log if needed
             threshold = self.performance_thresholds.get(operation_name, float("inf"))
@@ -154,11 +191,7 @@ class PerformanceTracker:
             component: Component/module name
             extra_context: Additional context
         """
-        # Record timing (deque automatically evicts oldest when at maxlen)
-        self._operation_timings[operation_name].append(duration)
-
-        # Increment version to invalidate cached summaries
-        self._increment_version(operation_name)
+        self._record(operation_name, duration)
 
         # Check threshold
         threshold = self.performance_thresholds.get(operation_name, float("inf"))
@@ -193,7 +226,7 @@ class PerformanceTracker:
         """
         # Determine if we're summarizing a specific operation or all operations
         # Normalize cache key: use _ALL_OPERATIONS_KEY if operation doesn't exist or None was passed
-        is_specific_op = operation_name and operation_name in self._operation_timings
+        is_specific_op = operation_name and operation_name in self._operation_sketches
         cache_key = (operation_name if is_specific_op else self._ALL_OPERATIONS_KEY, min_samples)
 
         # Get current version for cache validation
@@ -207,49 +240,9 @@ class PerformanceTracker:
                 self._summary_cache.move_to_end(cache_key)
                 return {k: dict(v) for k, v in cached_summary.items()}
 
-        # Compute summary
-        summary = {}
-
-        operations = {operation_name: self._operation_timings[operation_name]} if is_specific_op else self._operation_timings
-
-        for op_name, timings in operations.items():
-            if len(timings) < min_samples:
-                continue
-
-            # Calculate percentiles
-            sorted_timings = sorted(timings)
-            count = len(sorted_timings)
-
-            def percentile(p: float, *, sorted_vals=sorted_timings, n=count) -> float:
-                """Calculate percentile value.
-
-                Args:
-                    p: Percentile to calculate (0.0 to 1.0)
-                    sorted_vals: Sorted list of values
-                    n: Number of values
-
-                Returns:
-                    float: Calculated percentile value
-                """
-                k = (n - 1) * p
-                f = int(k)
-                c = k - f
-                if f + 1 < n:
-                    return sorted_vals[f] * (1 - c) + sorted_vals[f + 1] * c
-                return sorted_vals[f]
-
-            summary[op_name] = {
-                "count": count,
-                "avg_duration_ms": statistics.mean(timings) * 1000,
-                "min_duration_ms": min(timings) * 1000,
-                "max_duration_ms": max(timings) * 1000,
-                "p50_duration_ms": percentile(0.5) * 1000,
-                "p95_duration_ms": percentile(0.95) * 1000,
-                "p99_duration_ms": percentile(0.99) * 1000,
-                "threshold_ms": self.performance_thresholds.get(op_name, float("inf")) * 1000,
-                "threshold_violations": sum(1 for t in timings if t > self.performance_thresholds.get(op_name, float("inf"))),
-                "violation_rate": sum(1 for t in timings if t > self.performance_thresholds.get(op_name, float("inf"))) / count,
-            }
+        # Compute summary from the sketches (cost independent of the sample count)
+        operations = {operation_name: self._operation_sketches[operation_name]} if is_specific_op else self._operation_sketches
+        summary = {op_name: self._summarize(op_name, sketch) for op_name, sketch in operations.items() if sketch.count and sketch.count >= min_samples}
 
         # Store a copy in cache with current version
         # Only evict if adding a new key (not updating existing) and at capacity (LRU)
@@ -265,6 +258,144 @@ class PerformanceTracker:
 
         return summary
 
+    def _summarize(self, operation_name: str, sketch: DDSketch) -> Dict[str, Any]:
+        """Build the summary of one operation from its sketch.
+
+        Percentiles are within the sketch's relative accuracy (1%) and threshold
+        violations are counted at bucket resolution.
+
+        Args:
+            operation_name: Name of the operation
+            sketch: Non-empty sketch of the operation's durations
+
+        Returns:
+            Summary statistics in milliseconds
+        """
+        threshold = self.performance_thresholds.get(operation_name, float("inf"))
+        violations = sketch.count - sketch.cumulative_counts([threshold])[0]
+        return {
+            "count": sketch.count,
+            "avg_duration_ms": sketch.mean * 1000,
+            "min_duration_ms": sketch.min * 1000,
+            "max_duration_ms": sketch.max * 1000,
+            "p50_duration_ms": sketch.quantile(0.5) * 1000,
+            "p95_duration_ms": sketch.quantile(0.95) * 1000,
+            "p99_duration_ms": sketch.quantile(0.99) * 1000,
+            "threshold_ms": threshold * 1000,
+            "threshold_violations": violations,
+            "violation_rate": violations / sketch.count,
+        }
+
+    def export_histograms(self, buckets: Sequence[float]) -> List[Tuple[str, List[Tuple[str, int]], float]]:
+        """Export the sketches as cumulative Prometheus histogram buckets.
+
+        Args:
+            buckets: Upper bounds in seconds, ascending (``+Inf`` is appended)
+
+        Returns:
+            ``(operation, [(le, cumulative_count), ...], sum_seconds)`` per operation
+
+        Example:
+            >>> tracker = PerformanceTracker()
+            >>> tracker.record_timing("lookup", 0.02)
+            >>> tracker.record_timing("lookup", 0.3)
+            >>> tracker.export_histograms([0.1, 1.0])
+            [('lookup', [('0.1', 1), ('1.0', 2), ('+Inf', 2)], 0.32)]
+        """
+        histograms = []
+        for operation_name, sketch in sorted(self._operation_sketches.items()):
+            if not sketch.count:
+                continue
+            counts = sketch.cumulative_counts(buckets)
+            histograms.append((operation_name, [(str(float(bound)), count) for bound, count in zip(buckets, counts)] + [("+Inf", sketch.count)], sketch.sum))
+        return histograms
+
+    async def publish_sketches(self) -> bool:
+        """Publish this worker's sketches to Redis for cluster-wide summaries.
+
+        Each worker writes one hash that expires unless it is refreshed, so
+        sketches of stopped workers age out.
+
+        Returns:
+            True if the sketches were published
+        """
+        redis = await get_redis_client()
+        if redis is None:
+            return False
+        key = f"{_SKETCH_KEY_PREFIX}{WORKER_ID}"
+        payload = {op: orjson.dumps(sketch.to_dict()) for op, sketch in self._operation_sketches.items() if sketch.count}
+        ttl = max(60, 3 * getattr(settings, "performance_sketch_sync_interval", 0))
+        try:
+            pipe = redis.pipeline()
+            pipe.delete(key)
+            if payload:
+                pipe.hset(key, mapping=payload)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish performance sketches to Redis: {e}")
+            return False
+
+    async def get_cluster_performance_summary(self, min_samples: int = 1) -> Dict[str, Any]:
+        """Get the performance summary merged across all workers.
+
+        Publishes this worker's sketches, then merges the sketches published by
+        every worker. Falls back to the local summary without Redis.
+
+        Args:
+            min_samples: Minimum samples required to include an operation
+
+        Returns:
+            Dictionary containing performance statistics per operation
+        """
+        redis = await get_redis_client()
+        if redis is None or not await self.publish_sketches():
+            return self.get_performance_summary(min_samples=min_samples)
+
+        merged: Dict[str, DDSketch] = {}
+        try:
+            async for key in redis.scan_iter(match=f"{_SKETCH_KEY_PREFIX}*"):
+                for op_name, raw in (await redis.hgetall(key)).items():
+                    op_name = op_name.decode() if isinstance(op_name, bytes) else op_name
+                    sketch = DDSketch.from_dict(orjson.loads(raw))
+                    if op_name in merged:
+                        merged[op_name].merge(sketch)
+                    else:
+                        merged[op_name] = sketch
+        except Exception as e:
+            logger.warning(f"Failed to read performance sketches from Redis: {e}")
+            return self.get_performance_summary(min_samples=min_samples)
+
+        return {op_name: self._summarize(op_name, sketch) for op_name, sketch in merged.items() if sketch.count >= min_samples}
+
+    async def start(self) -> None:
+        """Start publishing sketches to Redis every ``PERFORMANCE_SKETCH_SYNC_INTERVAL`` seconds."""
+        interval = getattr(settings, "performance_sketch_sync_interval", 0)
+        if not interval or (self._sync_task and not self._sync_task.done()):
+            return
+
+        async def sync_loop() -> None:
+            """Publish the sketches periodically."""
+            while True:
+                await asyncio.sleep(interval)
+                await self.publish_sketches()
+
+        self._sync_task = asyncio.create_task(sync_loop())
+        logger.info(f"Performance sketch sync started (interval={interval}s)")
+
+    async def shutdown(self) -> None:
+        """Stop the sync task and publish the final sketches."""
+        if self._sync_task is None:
+            return
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+        await self.publish_sketches()
+
     def get_operation_stats(self, operation_name: str) -> Optional[Dict[str, Any]]:
         """Get statistics for a specific operation.
 
@@ -274,20 +405,17 @@ class PerformanceTracker:
         Returns:
             Statistics dictionary or None if no data
         """
-        if operation_name not in self._operation_timings:
-            return None
-
-        timings = self._operation_timings[operation_name]
-        if not timings:
+        sketch = self._operation_sketches.get(operation_name)
+        if sketch is None or not sketch.count:
             return None
 
         return {
             "operation": operation_name,
-            "sample_count": len(timings),
-            "avg_duration_ms": statistics.mean(timings) * 1000,
-            "min_duration_ms": min(timings) * 1000,
-            "max_duration_ms": max(timings) * 1000,
-            "total_time_ms": sum(timings) * 1000,
+            "sample_count": sketch.count,
+            "avg_duration_ms": sketch.mean * 1000,
+            "min_duration_ms": sketch.min * 1000,
+            "max_duration_ms": sketch.max * 1000,
+            "total_time_ms": sketch.sum * 1000,
             "threshold_ms": self.performance_thresholds.get(operation_name, float("inf")) * 1000,
         }
 
@@ -300,10 +428,13 @@ class PerformanceTracker:
         if operation_name:
             if operation_name in self._operation_timings:
                 self._operation_timings[operation_name].clear()
+            if operation_name in self._operation_sketches:
+                self._operation_sketches[operation_name] = DDSketch()
             # Increment version to invalidate cached summaries
             self._increment_version(operation_name)
         else:
             self._operation_timings.clear()
+            self._operation_sketches.clear()
             # Clear all version tracking and cache on full reset
             self._global_version += 1
             self._op_version.clear()
@@ -324,6 +455,10 @@ class PerformanceTracker:
     def check_performance_degradation(self, operation_name: str, baseline_multiplier: float = 2.0) -> Dict[str, Any]:
         """Check if performance has degraded compared to baseline.
 
+        The mean of the 10 most recent samples is compared to the mean of all
+        earlier samples since the last clear_stats(), taken from the sketch's
+        running sum, so the check costs the same regardless of history size.
+
         Args:
             operation_name: Name of the operation to check
             baseline_multiplier: Multiplier for degradation detection
@@ -331,25 +466,23 @@ class PerformanceTracker:
         Returns:
             Dictionary with degradation analysis
         """
-        if operation_name not in self._operation_timings:
+        sketch = self._operation_sketches.get(operation_name)
+        if sketch is None:
             return {"degraded": False, "reason": "no_data"}
 
         timings = self._operation_timings[operation_name]
-        if len(timings) < 10:
+        if sketch.count < _RECENT_SAMPLES or len(timings) < _RECENT_SAMPLES:
             return {"degraded": False, "reason": "insufficient_samples"}
 
-        # Compare recent timings to overall average
-        # Convert deque to list for slicing operations
-        timings_list = list(timings)
-        recent_count = min(10, len(timings_list))
-        recent_timings = timings_list[-recent_count:]
-        historical_timings = timings_list[:-recent_count] if len(timings_list) > recent_count else timings_list
-
-        if not historical_timings:
-            return {"degraded": False, "reason": "insufficient_historical_data"}
-
-        recent_avg = statistics.mean(recent_timings)
-        historical_avg = statistics.mean(historical_timings)
+        # Compare recent timings to the average of everything before them
+        recent_sum = sum(timings[-i] for i in range(1, _RECENT_SAMPLES + 1))
+        recent_avg = recent_sum / _RECENT_SAMPLES
+        historical_count = sketch.count - _RECENT_SAMPLES
+        if historical_count <= 0:
+            # Only the recent samples: compare them to themselves, as before
+            historical_avg = recent_avg
+        else:
+            historical_avg = (sketch.sum - recent_sum) / historical_count
 
         degraded = recent_avg > (historical_avg * baseline_multiplier)
 
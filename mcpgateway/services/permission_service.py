@@ -13,13 +13,14 @@ It handles role-based permission validation, permission auditing, and caching.
 # Standard
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional, Set
+from typing import AbstractSet, Dict, List, Optional
 
 # Third-Party
 from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import contains_eager, Session
 
 # First-Party
+from mcpgateway.cache.permission_cache import get_permission_cache
 from mcpgateway.config import settings
 from mcpgateway.db import PermissionAuditLog, Permissions, Role, UserRole, utc_now
 
@@ -61,7 +62,7 @@ class PermissionService:
         if audit_enabled is None:
             audit_enabled = settings.permission_audit_enabled
         self.audit_enabled = audit_enabled
-        self._permission_cache: Dict[str, Set[str]] = {}
+        self._permission_cache: Dict[str, AbstractSet[str]] = {}
         self._roles_cache: Dict[str, List[UserRole]] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
         self.cache_ttl = 300  # 5 minutes
@@ -189,18 +190,20 @@ class PermissionService:
             logger.error(f"Error checking admin permission for {user_email}: {e}")
             return False
 
-    async def get_user_permissions(self, user_email: str, team_id: Optional[str] = None) -> Set[str]:
+    async def get_user_permissions(self, user_email: str, team_id: Optional[str] = None) -> AbstractSet[str]:
         """Get all effective permissions for a user.
 
         Collects permissions from all user's roles across applicable scopes.
-        Includes role inheritance and handles permission caching.
+        Includes role inheritance and handles permission caching. Unless auditing
+        is enabled (the audit log needs the role rows), compiled permission sets are
+        shared across requests through the process-wide permission cache.
 
         Args:
             user_email: Email of the user
             team_id: Optional team context
 
         Returns:
-            Set[str]: All effective permissions for the user
+            AbstractSet[str]: All effective permissions for the user (read-only)
 
         Examples:
             Key shapes and coroutine check:
@@ -218,6 +221,15 @@ class PermissionService:
         if self._is_cache_valid(cache_key):
             return self._permission_cache[cache_key]
 
+        shared_cache = None if self.audit_enabled else get_permission_cache()
+        if shared_cache is not None:
+            cached = shared_cache.get_permissions(user_email, team_id)
+            if cached is not None:
+                self._permission_cache[cache_key] = cached
+                self._cache_timestamps[cache_key] = utc_now()
+                return cached
+            generation = shared_cache.generation
+
         permissions = set()
 
         # Get all active roles for the user (with eager-loaded role relationship)
@@ -228,6 +240,9 @@ class PermissionService:
             role_permissions = user_role.role.get_effective_permissions()
             permissions.update(role_permissions)
 
+        if shared_cache is not None:
+            permissions = shared_cache.set_permissions(user_email, team_id, permissions, generation)
+
         # Cache both permissions and roles (roles reused by _get_roles_for_audit)
         self._permission_cache[cache_key] = permissions
         self._roles_cache[cache_key] = user_roles
@@ -543,8 +558,16 @@ class PermissionService:
         if user_email == getattr(settings, "platform_admin_email", ""):
             return True
 
+        shared_cache = get_permission_cache()
+        cached = shared_cache.get_admin(user_email)
+        if cached is not None:
+            return cached
+        generation = shared_cache.generation
+
         user = self.db.execute(select(EmailUser).where(EmailUser.email == user_email)).scalar_one_or_none()
-        return bool(user and user.is_admin)
+        is_admin = bool(user and user.is_admin)
+        shared_cache.set_admin(user_email, is_admin, generation)
+        return is_admin
 
     async def _check_team_fallback_permissions(self, user_email: str, permission: str, team_id: Optional[str]) -> bool:
         """Check fallback team permissions for users without explicit RBAC roles.
@@ -67,8 +67,10 @@ from mcpgateway.services.structured_logger import get_structured_logger
 from mcpgateway.utils.metrics_common import build_top_performers
 from mcpgateway.utils.pagination import unified_paginate
 from mcpgateway.utils.services_auth import decode_auth
+from mcpgateway.utils.single_flight import make_flight_key, SingleFlight
 from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
 from mcpgateway.utils.ssl_context_cache import get_cached_ssl_context
+from mcpgateway.utils.uri_template_index import build_template_regex, UriTemplateIndex
 from mcpgateway.utils.url_auth import apply_query_param_auth, sanitize_exception_message
 from mcpgateway.utils.validate_signature import validate_signature
 
@@ -81,6 +83,9 @@ try:
 except ImportError:
     PLUGINS_AVAILABLE = False
 
+# Identical concurrent reads of a gateway resource share one upstream call
+resource_read_flights = SingleFlight("resource")
+
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
 
@@ -167,6 +172,7 @@ class ResourceService:
         """Initialize the resource service."""
         self._event_service = EventService(channel_name="mcpgateway:resource_events")
         self._template_cache: Dict[str, ResourceTemplate] = {}
+        self._template_index: Optional[UriTemplateIndex] = None
         self.oauth_manager = OAuthManager(request_timeout=int(os.getenv("OAUTH_REQUEST_TIMEOUT", "30")), max_retries=int(os.getenv("OAUTH_MAX_RETRIES", "3")))
 
         # Initialize plugin manager if plugins are enabled in settings
@@ -827,6 +833,9 @@ class ResourceService:
                 stats["errors"].append(f"Chunk processing failed: {str(e)}")
                 continue
 
+        # Bulk registration does not emit per-resource events; drop templates explicitly
+        self._invalidate_template_cache()
+
         # Final structured logging
         structured_logger.log(
             level="INFO",
@@ -1899,13 +1908,23 @@ class ResourceService:
                             span.set_attribute("success", True)
                             span.set_attribute("duration.ms", (time.monotonic() - start_time) * 1000)
 
-                        resource_text = ""
-                        if (gateway_transport).lower() == "sse":
+                        async def read_upstream() -> str | None:
+                            """Read the resource from the gateway over its transport.
+
+                            Returns:
+                                str | None: Text content of the resource, or None on failure.
+                            """
+                            if (gateway_transport).lower() == "sse":
+                                # Note: meta_data not passed - MCP SDK 1.25.0 read_resource() doesn't support it
+                                return await connect_to_sse_session(server_url=gateway_url, authentication=headers, uri=uri)
                             # Note: meta_data not passed - MCP SDK 1.25.0 read_resource() doesn't support it
-                            resource_text = await connect_to_sse_session(server_url=gateway_url, authentication=headers, uri=uri)
+                            return await connect_to_streamablehttp_server(server_url=gateway_url, authentication=headers, uri=uri)
+
+                        resource_text = ""
+                        if settings.resource_coalescing_enabled:
+                            resource_text = await resource_read_flights.do(make_flight_key(gateway_url, uri, headers, pool_user_identity), read_upstream)
                         else:
-                            # Note: meta_data not passed - MCP SDK 1.25.0 read_resource() doesn't support it
-                            resource_text = await connect_to_streamablehttp_server(server_url=gateway_url, authentication=headers, uri=uri)
+                            resource_text = await read_upstream()
                         success = True  # Mark as successful before returning
                         return resource_text
                     except Exception as e:
@@ -3193,16 +3212,13 @@ class ResourceService:
             NotImplementedError: If a binary template resource is encountered.
         """
         # Find matching template # DRT BREAKPOINT
-        template = None
         if not self._template_cache:
             logger.info("_template_cache is empty, fetching exisitng resource templates")
             resource_templates = await self.list_resource_templates(db=db, include_inactive=include_inactive)
             for i in resource_templates:
                 self._template_cache[i.name] = i
-        for cached in self._template_cache.values():
-            if self._uri_matches_template(uri, cached.uri_template):
-                template = cached
-                break
+            self._template_index = None
+        template = self._get_template_index().match(uri)
 
         if template:
             check_inactivity = db.execute(select(DbResource).where(DbResource.id == str(template.id)).where(not_(DbResource.enabled))).scalar_one_or_none()
@@ -3226,6 +3242,53 @@ class ResourceService:
         except Exception as e:
             raise ResourceError(f"Failed to process template: {str(e)}") from e
 
+    def _get_template_index(self) -> UriTemplateIndex:
+        """
+        Return the compiled index over ``_template_cache``, building it if needed.
+
+        The index is dropped by :meth:`_invalidate_template_cache` (or when the
+        cache no longer has the same number of entries) and rebuilt on the next
+        templated read, so lookups stay sub-linear in the number of cached
+        templates.
+
+        Returns:
+            UriTemplateIndex resolving URIs to the most specific cached template.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> service = ResourceService()
+            >>> service._template_cache = {
+            ...     "any": SimpleNamespace(uri_template="files://{path*}"),
+            ...     "doc": SimpleNamespace(uri_template="files://docs/{name}"),
+            ... }
+            >>> service._get_template_index().match("files://docs/a.md").uri_template
+            'files://docs/{name}'
+        """
+        index = self._template_index
+        if index is None or len(index) != len(self._template_cache):
+            index = UriTemplateIndex()
+            for cached in self._template_cache.values():
+                index.add(cached.uri_template, cached)
+            self._template_index = index
+        return index
+
+    def _invalidate_template_cache(self) -> None:
+        """
+        Drop cached resource templates and their compiled index.
+
+        Called whenever resources change so the next templated read reloads
+        templates from the database.
+
+        Examples:
+            >>> service = ResourceService()
+            >>> service._template_cache = {"t": object()}
+            >>> service._invalidate_template_cache()
+            >>> service._template_cache, service._template_index
+            ({}, None)
+        """
+        self._template_cache.clear()
+        self._template_index = None
+
     @staticmethod
     @lru_cache(maxsize=256)
     def _build_regex(template: str) -> re.Pattern:
@@ -3264,22 +3327,7 @@ class ResourceService:
             Results are cached using LRU cache (maxsize=256) to avoid
             recompiling the same template pattern repeatedly.
         """
-        # Remove query parameter syntax for path matching
-        template_without_query = re.sub(r"\{\?[^}]+\}", "", template)
-
-        parts = re.split(r"(\{[^}]+\})", template_without_query)
-        pattern = ""
-        for part in parts:
-            if part.startswith("{") and part.endswith("}"):
-                name = part[1:-1]
-                if name.endswith("*"):
-                    name = name[:-1]
-                    pattern += f"(?P<{name}>.+)"
-                else:
-                    pattern += f"(?P<{name}>[^/]+)"
-            else:
-                pattern += re.escape(part)
-        return re.compile(f"^{pattern}$")
+        return build_template_regex(template)
 
     @staticmethod
     @lru_cache(maxsize=256)
@@ -3380,6 +3428,9 @@ class ResourceService:
         Args:
             event: Event to publish
         """
+        # Every resource add/update/state change/delete is announced here, so
+        # this is the single place the template index needs to be dropped.
+        self._invalidate_template_cache()
         await self._event_service.publish_event(event)
 
     # --- Resource templates ---
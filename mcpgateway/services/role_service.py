@@ -20,6 +20,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 # First-Party
+from mcpgateway.cache.auth_cache import auth_cache
 from mcpgateway.db import Permissions, Role, UserRole, utc_now
 
 logger = logging.getLogger(__name__)
@@ -466,6 +467,12 @@ class RoleService:
         self.db.commit()
         self.db.refresh(role)
 
+        # Compiled permission sets of affected users are cached across requests and workers
+        try:
+            await auth_cache.invalidate_permissions()
+        except Exception as cache_error:
+            logger.debug(f"Failed to invalidate permission cache on role update: {cache_error}")
+
         logger.info(f"Updated role: {role.name} (id: {role.id})")
         return role
 
@@ -523,6 +530,11 @@ class RoleService:
 
         self.db.commit()
 
+        try:
+            await auth_cache.invalidate_permissions()
+        except Exception as cache_error:
+            logger.debug(f"Failed to invalidate permission cache on role delete: {cache_error}")
+
         logger.info(f"Deleted role: {role.name} (id: {role.id})")
         return True
 
@@ -625,6 +637,11 @@ class RoleService:
         self.db.commit()
         self.db.refresh(user_role)
 
+        try:
+            await auth_cache.invalidate_permissions(user_email)
+        except Exception as cache_error:
+            logger.debug(f"Failed to invalidate permission cache on role assignment: {cache_error}")
+
         logger.info(f"Assigned role {role.name} to {user_email} (scope: {scope}, scope_id: {scope_id})")
         return user_role
 
@@ -668,6 +685,11 @@ class RoleService:
         user_role.is_active = False
         self.db.commit()
 
+        try:
+            await auth_cache.invalidate_permissions(user_email)
+        except Exception as cache_error:
+            logger.debug(f"Failed to invalidate permission cache on role revocation: {cache_error}")
+
         logger.info(f"Revoked role {role_id} from {user_email} (scope: {scope}, scope_id: {scope_id})")
         return True
 
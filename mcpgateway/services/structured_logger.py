@@ -10,15 +10,22 @@ automatic enrichment, intelligent routing, and database persistence.
 """
 
 # Standard
+import asyncio
+from collections import deque
 from datetime import datetime, timezone
 from enum import Enum
+import heapq
 import logging
 import os
+import random
 import socket
+import threading
+import time
 import traceback
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 # Third-Party
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 # First-Party
@@ -69,6 +76,15 @@ class LogCategory(str, Enum):
     SYSTEM = "system"
 
 
+class SubmitStatus(str, Enum):
+    """Outcome of handing a log entry to the batched writer."""
+
+    QUEUED = "queued"
+    DEFERRED = "deferred"
+    DROPPED = "dropped"
+    STOPPED = "stopped"
+
+
 # Log level numeric values for comparison (matches Python logging module)
 _LOG_LEVEL_VALUES: Dict[str, int] = {
     "DEBUG": logging.DEBUG,  # 10
@@ -151,6 +167,537 @@ class LogEnricher:
         return entry
 
 
+def build_log_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an enriched log entry to ``StructuredLogEntry`` column values.
+
+    Every column is always present so rows can be inserted together in one
+    executemany batch.
+
+    Args:
+        entry: Enriched log entry
+
+    Returns:
+        Column values for a ``structured_log_entries`` row
+
+    Examples:
+        >>> row = build_log_row({"level": "ERROR", "component": "c", "message": "m", "error_type": "ValueError", "security_threat_score": 0.9})
+        >>> row["error_details"]["error_type"], row["threat_indicators"], row["is_security_event"]
+        ('ValueError', {'security_threat_score': 0.9}, True)
+        >>> row["context"] is None and row["performance_metrics"] is None
+        True
+    """
+    # Build error_details JSON from error-related fields
+    error_details = None
+    if any([entry.get("error_type"), entry.get("error_message"), entry.get("error_stack_trace"), entry.get("error_context")]):
+        error_details = {
+            "error_type": entry.get("error_type"),
+            "error_message": entry.get("error_message"),
+            "error_stack_trace": entry.get("error_stack_trace"),
+            "error_context": entry.get("error_context"),
+        }
+
+    # Build performance_metrics JSON from performance-related fields
+    performance_metrics = None
+    perf_fields = {
+        "database_query_count": entry.get("database_query_count"),
+        "database_query_duration_ms": entry.get("database_query_duration_ms"),
+        "cache_hits": entry.get("cache_hits"),
+        "cache_misses": entry.get("cache_misses"),
+        "external_api_calls": entry.get("external_api_calls"),
+        "external_api_duration_ms": entry.get("external_api_duration_ms"),
+        "memory_usage_mb": entry.get("memory_usage_mb"),
+        "cpu_usage_percent": entry.get("cpu_usage_percent"),
+    }
+    if any(v is not None for v in perf_fields.values()):
+        performance_metrics = {k: v for k, v in perf_fields.items() if v is not None}
+
+    # Build threat_indicators JSON from security-related fields
+    threat_indicators = None
+    security_fields = {
+        "security_event_type": entry.get("security_event_type"),
+        "security_threat_score": entry.get("security_threat_score"),
+        "security_action_taken": entry.get("security_action_taken"),
+    }
+    if any(v is not None for v in security_fields.values()):
+        threat_indicators = {k: v for k, v in security_fields.items() if v is not None}
+
+    # Build context JSON from remaining fields
+    context_fields = {
+        "team_id": entry.get("team_id"),
+        "request_query": entry.get("request_query"),
+        "request_headers": entry.get("request_headers"),
+        "request_body_size": entry.get("request_body_size"),
+        "response_status_code": entry.get("response_status_code"),
+        "response_body_size": entry.get("response_body_size"),
+        "response_headers": entry.get("response_headers"),
+        "business_event_type": entry.get("business_event_type"),
+        "business_entity_type": entry.get("business_entity_type"),
+        "business_entity_id": entry.get("business_entity_id"),
+        "resource_type": entry.get("resource_type"),
+        "resource_id": entry.get("resource_id"),
+        "resource_action": entry.get("resource_action"),
+        "category": entry.get("category"),
+        "custom_fields": entry.get("custom_fields"),
+        "tags": entry.get("tags"),
+        "metadata": entry.get("metadata"),
+    }
+    context = {k: v for k, v in context_fields.items() if v is not None}
+
+    # Determine if this is a security event
+    is_security_event = entry.get("is_security_event", False) or bool(threat_indicators)
+    security_severity = entry.get("security_severity")
+
+    return {
+        "timestamp": entry.get("timestamp", datetime.now(timezone.utc)),
+        "level": entry.get("level", "INFO"),
+        "component": entry.get("component"),
+        "message": entry.get("message", ""),
+        "correlation_id": entry.get("correlation_id"),
+        "request_id": entry.get("request_id"),
+        "trace_id": entry.get("trace_id"),
+        "span_id": entry.get("span_id"),
+        "user_id": entry.get("user_id"),
+        "user_email": entry.get("user_email"),
+        "client_ip": entry.get("client_ip"),
+        "user_agent": entry.get("user_agent"),
+        "request_method": entry.get("request_method"),
+        "request_path": entry.get("request_path"),
+        "duration_ms": entry.get("duration_ms"),
+        "operation_type": entry.get("operation_type"),
+        "is_security_event": is_security_event,
+        "security_severity": security_severity,
+        "threat_indicators": threat_indicators,
+        "context": context if context else None,
+        "error_details": error_details,
+        "performance_metrics": performance_metrics,
+        "hostname": entry.get("hostname"),
+        "process_id": entry.get("process_id"),
+        "thread_id": entry.get("thread_id"),
+        "environment": entry.get("environment", getattr(settings, "environment", "development")),
+        "version": entry.get("version", getattr(settings, "version", "unknown")),
+    }
+
+
+class StructuredLogWriter:
+    """Background writer batching structured log entries into bulk inserts.
+
+    Entries are queued in memory per level and written by a background task in
+    ``executemany`` batches of up to ``batch_size`` rows, one transaction per
+    batch. A flush starts when ``batch_size`` entries are queued or every
+    ``flush_interval`` seconds, whichever comes first, and always on shutdown.
+
+    The queue is bounded by ``max_queue_size``. When it is full the overflow
+    policy decides what happens to a new entry:
+
+    - ``drop_debug_first``: evict the oldest queued entry of the lowest level
+      not above the new entry's level; drop the new entry if every queued
+      entry is more severe.
+    - ``sample``: keep ``sample_rate`` of the new entries, evicting the oldest
+      entry of the lowest queued level for each kept entry.
+    - ``block``: wait up to ``block_timeout`` seconds for a flush to free space
+      (the entry is dropped on timeout). On the event loop thread ``submit``
+      cannot block, so it wakes the flush task and hands the entry to a task
+      that awaits space instead.
+
+    Examples:
+        >>> writer = StructuredLogWriter(batch_size=10, max_queue_size=2, overflow_policy="drop_debug_first")
+        >>> writer.submit({"level": "INFO", "message": "not started"}).value
+        'stopped'
+        >>> writer._running = True
+        >>> [writer.submit({"level": level, "message": level}).value for level in ("DEBUG", "INFO", "ERROR", "DEBUG")]
+        ['queued', 'queued', 'queued', 'dropped']
+        >>> [entry["level"] for entry in writer._drain()]
+        ['INFO', 'ERROR']
+        >>> stats = writer.get_stats()
+        >>> stats["enqueued"], stats["dropped"], stats["dropped_by_level"], stats["queue_size"]
+        (3, 2, {'DEBUG': 2}, 0)
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        block_timeout: Optional[float] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            batch_size: Maximum rows per insert; queuing this many entries triggers a flush (default: from settings)
+            flush_interval: Maximum seconds between flushes (default: from settings)
+            max_queue_size: Maximum queued entries before the overflow policy applies (default: from settings)
+            overflow_policy: ``drop_debug_first``, ``sample`` or ``block`` (default: from settings)
+            sample_rate: Fraction of new entries kept by the ``sample`` policy (default: from settings)
+            block_timeout: Seconds the ``block`` policy waits for space (default: from settings)
+
+        Raises:
+            ValueError: If the overflow policy is unknown.
+        """
+        self.batch_size = batch_size or getattr(settings, "structured_logging_batch_size", 500)
+        self.flush_interval = flush_interval or getattr(settings, "structured_logging_flush_interval", 1.0)
+        self.max_queue_size = max_queue_size or getattr(settings, "structured_logging_queue_max_size", 10000)
+        self.overflow_policy = overflow_policy or getattr(settings, "structured_logging_overflow_policy", "drop_debug_first")
+        self.sample_rate = sample_rate if sample_rate is not None else getattr(settings, "structured_logging_overflow_sample_rate", 0.1)
+        self.block_timeout = block_timeout if block_timeout is not None else getattr(settings, "structured_logging_block_timeout", 1.0)
+        if self.overflow_policy not in ("drop_debug_first", "sample", "block"):
+            raise ValueError(f"Unknown structured log overflow policy: {self.overflow_policy}")
+
+        # One FIFO of (enqueue monotonic time, entry) per level, most verbose level first
+        self._queues: Dict[str, Deque[Tuple[float, Dict[str, Any]]]] = {level: deque() for level in _LOG_LEVEL_VALUES}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+
+        self._running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._wake_pending = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set from the flush thread when a drain frees space; ``block`` waiters on the loop await it
+        self._space_freed: Optional[asyncio.Event] = None
+        self._blocked_tasks: Set[asyncio.Task] = set()
+
+        # Stats for monitoring
+        self._enqueued = 0
+        self._written = 0
+        self._failed = 0
+        self._dropped_by_level: Dict[str, int] = {}
+        self._block_waits = 0
+        self._flush_count = 0
+        self._last_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_queue_latency_ms = 0.0
+        self._max_queue_latency_ms = 0.0
+
+    async def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._flush_task is None or self._flush_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._wake = asyncio.Event()
+            self._wake_pending = False
+            self._space_freed = asyncio.Event()
+            self._running = True
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(
+                f"StructuredLogWriter started: batch_size={self.batch_size}, flush_interval={self.flush_interval}s, max_queue_size={self.max_queue_size}, overflow_policy={self.overflow_policy}"
+            )
+
+    async def shutdown(self) -> None:
+        """Stop the flush task and write every queued entry."""
+        self._running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        # Entries waiting for space are queued without a bound once stopped
+        if self._blocked_tasks:
+            self._space_freed.set()
+            await asyncio.gather(*self._blocked_tasks, return_exceptions=True)
+
+        # Final flush: entries submitted before shutdown are never lost to it
+        await asyncio.to_thread(self.flush)
+        stats = self.get_stats()
+        logger.info(f"StructuredLogWriter shutdown complete: written={stats['written']}, dropped={stats['dropped']}, failed={stats['failed']}")
+
+    def submit(self, entry: Dict[str, Any], on_queued: Optional[Callable[[Dict[str, Any]], None]] = None) -> SubmitStatus:
+        """Queue a log entry for the next batch.
+
+        Safe to call from any thread.
+
+        Args:
+            entry: Enriched log entry
+            on_queued: For a ``DEFERRED`` entry, called with the entry once it is queued; not called if it is dropped
+
+        Returns:
+            ``QUEUED`` if the entry was queued, ``DEFERRED`` if it waits on the event loop for space (``block``),
+            ``DROPPED`` if the overflow policy dropped it, or ``STOPPED`` if the writer is not running and the
+            caller must persist the entry itself.
+        """
+        if not self._running:
+            return SubmitStatus.STOPPED
+
+        level = entry.get("level", "INFO")
+        if level not in self._queues:
+            level = "INFO"
+
+        wait_on_loop = False
+        with self._lock:
+            if self._size >= self.max_queue_size and not self._make_room(level):
+                if self.overflow_policy != "block":
+                    self._record_drop(level)
+                    return SubmitStatus.DROPPED
+                self._block_waits += 1
+                if threading.get_ident() == self._loop_thread_id:
+                    wait_on_loop = True
+                elif not self._space.wait_for(lambda: self._size < self.max_queue_size, timeout=self.block_timeout):
+                    self._record_drop(level)
+                    return SubmitStatus.DROPPED
+
+            if wait_on_loop:
+                wake = not self._wake_pending
+            else:
+                self._enqueue(level, entry)
+                wake = self._size >= self.batch_size and not self._wake_pending
+            if wake:
+                self._wake_pending = True
+
+        if wait_on_loop:
+            if wake:
+                self._wake.set()
+            task = self._loop.create_task(self._enqueue_when_space(level, entry, on_queued))
+            self._blocked_tasks.add(task)
+            task.add_done_callback(self._blocked_tasks.discard)
+            return SubmitStatus.DEFERRED
+
+        if wake:
+            try:
+                self._loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:  # Event loop closed during shutdown; the final flush writes the entry
+                pass
+        return SubmitStatus.QUEUED
+
+    async def _enqueue_when_space(self, level: str, entry: Dict[str, Any], on_queued: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+        """Queue an entry once a flush frees space, for ``block`` on the event loop.
+
+        Args:
+            level: Normalized log level
+            entry: Log entry
+            on_queued: Called with the entry once it is queued
+        """
+        deadline = self._loop.time() + self.block_timeout
+        while True:
+            self._space_freed.clear()
+            with self._lock:
+                queued = self._size < self.max_queue_size or not self._running
+                if queued:
+                    self._enqueue(level, entry)
+            if queued:
+                if on_queued is not None:
+                    on_queued(entry)
+                return
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._space_freed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+        with self._lock:
+            self._record_drop(level)
+
+    def _enqueue(self, level: str, entry: Dict[str, Any]) -> None:
+        """Append an entry to its level queue. Caller holds the lock.
+
+        Args:
+            level: Normalized log level
+            entry: Log entry
+        """
+        self._queues[level].append((time.monotonic(), entry))
+        self._size += 1
+        self._enqueued += 1
+
+    def _make_room(self, level: str) -> bool:
+        """Evict a queued entry for a new entry of the given level. Caller holds the lock.
+
+        Args:
+            level: Level of the new entry
+
+        Returns:
+            True if an entry was evicted and the new entry can be queued.
+        """
+        if self.overflow_policy == "block":
+            return False
+        if self.overflow_policy == "sample" and random.random() >= self.sample_rate:  # nosec B311 - sampling, not security
+            return False
+
+        max_value = _LOG_LEVEL_VALUES[level] if self.overflow_policy == "drop_debug_first" else logging.CRITICAL
+        for queued_level, queue in self._queues.items():
+            if _LOG_LEVEL_VALUES[queued_level] > max_value:
+                break
+            if queue:
+                queue.popleft()
+                self._size -= 1
+                self._record_drop(queued_level)
+                return True
+        return False
+
+    def _record_drop(self, level: str) -> None:
+        """Count a dropped entry.
+
+        Args:
+            level: Level of the dropped entry
+        """
+        self._dropped_by_level[level] = self._dropped_by_level.get(level, 0) + 1
+
+    def _drain_queued(self) -> List[Tuple[float, Dict[str, Any]]]:
+        """Take every queued entry in submission order and wake blocked producers.
+
+        Returns:
+            List of (enqueue monotonic time, entry) tuples.
+        """
+        with self._lock:
+            queues = [queue for queue in self._queues.values() if queue]
+            self._queues = {level: deque() for level in _LOG_LEVEL_VALUES}
+            self._size = 0
+            self._wake_pending = False
+            self._space.notify_all()
+        if self._blocked_tasks:
+            try:
+                self._loop.call_soon_threadsafe(self._space_freed.set)
+            except RuntimeError:  # Event loop closed during shutdown
+                pass
+        return list(heapq.merge(*queues, key=lambda item: item[0]))
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Take every queued entry in submission order.
+
+        Returns:
+            List of log entries.
+        """
+        return [entry for _, entry in self._drain_queued()]
+
+    def flush(self) -> int:
+        """Write every queued entry to the database in batches.
+
+        Blocking; called from a worker thread by the flush task.
+
+        Returns:
+            Number of rows written.
+        """
+        with self._flush_lock:
+            queued = self._drain_queued()
+            if not queued:
+                return 0
+
+            written = 0
+            for offset in range(0, len(queued), self.batch_size):
+                batch = queued[offset : offset + self.batch_size]
+                start = time.monotonic()
+                if self._write_batch([build_log_row(entry) for _, entry in batch]):
+                    written += len(batch)
+                    self._record_latency(start, batch)
+                else:
+                    self._failed += len(batch)
+                elapsed_ms = (time.monotonic() - start) * 1000
+                self._flush_count += 1
+                self._last_flush_ms = elapsed_ms
+                self._total_flush_ms += elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+
+            self._written += written
+            return written
+
+    def _record_latency(self, written_at: float, batch: List[Tuple[float, Dict[str, Any]]]) -> None:
+        """Record how long the entries of a written batch waited in the queue.
+
+        Args:
+            written_at: Monotonic time the batch write started
+            batch: Written (enqueue monotonic time, entry) tuples
+        """
+        oldest_ms = (written_at - batch[0][0]) * 1000
+        self._max_queue_latency_ms = max(self._max_queue_latency_ms, oldest_ms)
+        self._total_queue_latency_ms += sum(written_at - enqueued for enqueued, _ in batch) * 1000
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> bool:
+        """Insert rows with a single executemany in one transaction.
+
+        Args:
+            rows: Column values built by :func:`build_log_row`
+
+        Returns:
+            True if the rows were committed.
+        """
+        db = SessionLocal()
+        try:
+            db.execute(insert(StructuredLogEntry), rows)
+            db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist {len(rows)} structured log entries to database: {e}")
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    async def _flush_loop(self) -> None:
+        """Flush when a batch is full or the flush interval elapsed.
+
+        Raises:
+            asyncio.CancelledError: When the flush loop is cancelled.
+        """
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await asyncio.to_thread(self.flush)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in structured log flush loop: {e}", exc_info=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics for monitoring.
+
+        Returns:
+            Dict with queue size, enqueued/written/dropped/failed counts, flush durations
+            and queue latency (time from submit to the start of the batch write).
+        """
+        with self._lock:
+            queue_size = self._size
+            dropped_by_level = dict(self._dropped_by_level)
+        written = self._written
+        flush_count = self._flush_count
+        return {
+            "running": self._running,
+            "overflow_policy": self.overflow_policy,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "max_queue_size": self.max_queue_size,
+            "queue_size": queue_size,
+            "enqueued": self._enqueued,
+            "written": written,
+            "failed": self._failed,
+            "dropped": sum(dropped_by_level.values()),
+            "dropped_by_level": dropped_by_level,
+            "block_waits": self._block_waits,
+            "flush_count": flush_count,
+            "last_flush_ms": round(self._last_flush_ms, 3),
+            "avg_flush_ms": round(self._total_flush_ms / flush_count, 3) if flush_count else 0.0,
+            "max_flush_ms": round(self._max_flush_ms, 3),
+            "avg_queue_latency_ms": round(self._total_queue_latency_ms / written, 3) if written else 0.0,
+            "max_queue_latency_ms": round(self._max_queue_latency_ms, 3),
+        }
+
+
+# Singleton instance
+_structured_log_writer: Optional[StructuredLogWriter] = None
+
+
+def get_structured_log_writer() -> StructuredLogWriter:
+    """Get or create the singleton StructuredLogWriter instance.
+
+    Returns:
+        StructuredLogWriter: The singleton structured log writer.
+    """
+    global _structured_log_writer  # pylint: disable=global-statement
+    if _structured_log_writer is None:
+        _structured_log_writer = StructuredLogWriter()
+    return _structured_log_writer
+
+
 class LogRouter:
     """Routes log entries to appropriate destinations."""
 
@@ -158,6 +705,8 @@ class LogRouter:
         """Initialize log router."""
         self.database_enabled = getattr(settings, "structured_logging_database_enabled", True)
         self.external_enabled = getattr(settings, "structured_logging_external_enabled", False)
+        self.batch_enabled = getattr(settings, "structured_logging_batch_enabled", True)
+        self.incremental_aggregation = getattr(settings, "metrics_aggregation_enabled", True) is True and getattr(settings, "metrics_aggregation_incremental_enabled", False) is True
 
     def route(self, entry: Dict[str, Any], db: Optional[Session] = None) -> None:
         """Route log entry to configured destinations.
@@ -169,9 +718,18 @@ class LogRouter:
         # Always log to standard Python logger
         self._log_to_python_logger(entry)
 
-        # Persist to database if enabled
+        # Persist to database if enabled; entries without a caller session go
+        # through the batched writer when it is running. The per-minute
+        # performance statistics only count entries that were persisted or
+        # queued, not those the writer dropped under backpressure.
         if self.database_enabled:
-            self._persist_to_database(entry, db)
+            record = self._record_performance if self.incremental_aggregation and entry.get("duration_ms") is not None else None
+            status = SubmitStatus.STOPPED if db is not None or not self.batch_enabled else get_structured_log_writer().submit(entry, on_queued=record)
+            stored = status is SubmitStatus.QUEUED
+            if status is SubmitStatus.STOPPED:
+                stored = self._persist_to_database(entry, db)
+            if stored and record is not None:
+                record(entry)
 
         # Send to external systems if enabled
         if self.external_enabled:
@@ -196,12 +754,27 @@ class LogRouter:
 
         logger.log(level, log_message, extra=extra)
 
-    def _persist_to_database(self, entry: Dict[str, Any], db: Optional[Session] = None) -> None:
+    @staticmethod
+    def _record_performance(entry: Dict[str, Any]) -> None:
+        """Feed a stored entry to the incremental performance aggregation.
+
+        Args:
+            entry: Log entry with a ``duration_ms``
+        """
+        # First-Party
+        from mcpgateway.services.log_aggregator import get_log_aggregator  # pylint: disable=import-outside-toplevel
+
+        get_log_aggregator().record_entry(entry)
+
+    def _persist_to_database(self, entry: Dict[str, Any], db: Optional[Session] = None) -> bool:
         """Persist log entry to database.
 
         Args:
             entry: Log entry
             db: Optional database session
+
+        Returns:
+            True if the entry was committed.
         """
         should_close = False
         if db is None:
@@ -209,99 +782,10 @@ class LogRouter:
             should_close = True
 
         try:
-            # Build error_details JSON from error-related fields
-            error_details = None
-            if any([entry.get("error_type"), entry.get("error_message"), entry.get("error_stack_trace"), entry.get("error_context")]):
-                error_details = {
-                    "error_type": entry.get("error_type"),
-                    "error_message": entry.get("error_message"),
-                    "error_stack_trace": entry.get("error_stack_trace"),
-                    "error_context": entry.get("error_context"),
-                }
-
-            # Build performance_metrics JSON from performance-related fields
-            performance_metrics = None
-            perf_fields = {
-                "database_query_count": entry.get("database_query_count"),
-                "database_query_duration_ms": entry.get("database_query_duration_ms"),
-                "cache_hits": entry.get("cache_hits"),
-                "cache_misses": entry.get("cache_misses"),
-                "external_api_calls": entry.get("external_api_calls"),
-                "external_api_duration_ms": entry.get("external_api_duration_ms"),
-                "memory_usage_mb": entry.get("memory_usage_mb"),
-                "cpu_usage_percent": entry.get("cpu_usage_percent"),
-            }
-            if any(v is not None for v in perf_fields.values()):
-                performance_metrics = {k: v for k, v in perf_fields.items() if v is not None}
-
-            # Build threat_indicators JSON from security-related fields
-            threat_indicators = None
-            security_fields = {
-                "security_event_type": entry.get("security_event_type"),
-                "security_threat_score": entry.get("security_threat_score"),
-                "security_action_taken": entry.get("security_action_taken"),
-            }
-            if any(v is not None for v in security_fields.values()):
-                threat_indicators = {k: v for k, v in security_fields.items() if v is not None}
-
-            # Build context JSON from remaining fields
-            context_fields = {
-                "team_id": entry.get("team_id"),
-                "request_query": entry.get("request_query"),
-                "request_headers": entry.get("request_headers"),
-                "request_body_size": entry.get("request_body_size"),
-                "response_status_code": entry.get("response_status_code"),
-                "response_body_size": entry.get("response_body_size"),
-                "response_headers": entry.get("response_headers"),
-                "business_event_type": entry.get("business_event_type"),
-                "business_entity_type": entry.get("business_entity_type"),
-                "business_entity_id": entry.get("business_entity_id"),
-                "resource_type": entry.get("resource_type"),
-                "resource_id": entry.get("resource_id"),
-                "resource_action": entry.get("resource_action"),
-                "category": entry.get("category"),
-                "custom_fields": entry.get("custom_fields"),
-                "tags": entry.get("tags"),
-                "metadata": entry.get("metadata"),
-            }
-            context = {k: v for k, v in context_fields.items() if v is not None}
-
-            # Determine if this is a security event
-            is_security_event = entry.get("is_security_event", False) or bool(threat_indicators)
-            security_severity = entry.get("security_severity")
-
-            log_entry = StructuredLogEntry(
-                timestamp=entry.get("timestamp", datetime.now(timezone.utc)),
-                level=entry.get("level", "INFO"),
-                component=entry.get("component"),
-                message=entry.get("message", ""),
-                correlation_id=entry.get("correlation_id"),
-                request_id=entry.get("request_id"),
-                trace_id=entry.get("trace_id"),
-                span_id=entry.get("span_id"),
-                user_id=entry.get("user_id"),
-                user_email=entry.get("user_email"),
-                client_ip=entry.get("client_ip"),
-                user_agent=entry.get("user_agent"),
-                request_method=entry.get("request_method"),
-                request_path=entry.get("request_path"),
-                duration_ms=entry.get("duration_ms"),
-                operation_type=entry.get("operation_type"),
-                is_security_event=is_security_event,
-                security_severity=security_severity,
-                threat_indicators=threat_indicators,
-                context=context if context else None,
-                error_details=error_details,
-                performance_metrics=performance_metrics,
-                hostname=entry.get("hostname"),
-                process_id=entry.get("process_id"),
-                thread_id=entry.get("thread_id"),
-                environment=entry.get("environment", getattr(settings, "environment", "development")),
-                version=entry.get("version", getattr(settings, "version", "unknown")),
-            )
-
+            log_entry = StructuredLogEntry(**build_log_row(entry))
             db.add(log_entry)
             db.commit()
+            return True
 
         except Exception as e:
             logger.error(f"Failed to persist log entry to database: {e}", exc_info=True)
@@ -310,6 +794,7 @@ class LogRouter:
             traceback.print_exc()
             if db:
                 db.rollback()
+            return False
 
         finally:
             if should_close:
@@ -20,6 +20,7 @@ import base64
 import binascii
 from datetime import datetime, timezone
 from functools import lru_cache
+import hashlib
 import os
 import re
 import ssl
@@ -89,11 +90,25 @@ from mcpgateway.utils.pagination import decode_cursor, encode_cursor, unified_pa
 from mcpgateway.utils.passthrough_headers import compute_passthrough_headers_cached
 from mcpgateway.utils.retry_manager import ResilientHttpClient
 from mcpgateway.utils.services_auth import decode_auth
+from mcpgateway.utils.single_flight import make_flight_key, SingleFlight
 from mcpgateway.utils.sqlalchemy_modifier import json_contains_tag_expr
 from mcpgateway.utils.ssl_context_cache import get_cached_ssl_context
 from mcpgateway.utils.url_auth import apply_query_param_auth, sanitize_exception_message, sanitize_url_for_logging
 from mcpgateway.utils.validate_signature import validate_signature
 
+# Optional code-generating JSON Schema backend
+try:
+    # Third-Party
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    fastjsonschema = None  # type: ignore
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Identical concurrent calls to read-only/idempotent tools share one upstream call
+tool_call_flights = SingleFlight("tool")
+
 # Cache import (lazy to avoid circular dependencies)
 _REGISTRY_CACHE = None
 _TOOL_LOOKUP_CACHE = None
@@ -237,6 +252,112 @@ def _validate_with_cached_schema(instance: Any, schema: dict) -> None:
         raise error
 
 
+def _schema_version(schema: Any) -> Optional[str]:
+    """Return a short content hash identifying a version of a schema.
+
+    Args:
+        schema: The JSON Schema dictionary.
+
+    Returns:
+        Hex digest of the canonical schema, or None if there is no usable schema.
+
+    Examples:
+        >>> _schema_version({"type": "object", "required": ["a"]}) == _schema_version({"required": ["a"], "type": "object"})
+        True
+        >>> len(_schema_version({"type": "string"}))
+        16
+        >>> _schema_version(None) is None
+        True
+    """
+    if not isinstance(schema, dict) or not schema:
+        return None
+    try:
+        return hashlib.blake2b(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+    except TypeError:
+        return None
+
+
+class CompiledSchemaValidator:
+    """JSON Schema validator compiled once and reused for every call.
+
+    Unlike :func:`_validate_with_cached_schema`, the schema is neither
+    re-serialized nor re-instantiated per call. jsonschema validators are
+    immutable, so one instance is safely shared. With the ``fastjsonschema``
+    backend valid instances are checked by generated code; invalid ones are
+    re-checked with jsonschema so error reporting stays identical.
+
+    Examples:
+        >>> validator = CompiledSchemaValidator({"type": "object", "required": ["a"]})
+        >>> validator.backend
+        'jsonschema'
+        >>> validator.validate({"a": 1})
+        >>> validator.validate({})
+        Traceback (most recent call last):
+        ...
+        jsonschema.exceptions.ValidationError: 'a' is a required property
+        ...
+    """
+
+    __slots__ = ("backend", "_validator", "_fast_validate")
+
+    def __init__(self, schema: dict, backend: str = "jsonschema"):
+        """Compile the validator.
+
+        Args:
+            schema: The JSON Schema to validate against.
+            backend: ``jsonschema`` or ``fastjsonschema``; falls back to jsonschema
+                if fastjsonschema is not installed or cannot compile the schema.
+        """
+        validator_cls, checked_schema = _get_validator_class_and_check(_canonicalize_schema(schema))
+        self._validator = validator_cls(checked_schema)
+        self._fast_validate = None
+        self.backend = "jsonschema"
+        if backend == "fastjsonschema" and FASTJSONSCHEMA_AVAILABLE:
+            try:
+                self._fast_validate = fastjsonschema.compile(checked_schema)
+                self.backend = "fastjsonschema"
+            except Exception as exc:
+                logger.debug(f"fastjsonschema cannot compile schema, using jsonschema: {exc}")
+
+    def validate(self, instance: Any) -> None:
+        # noqa: DAR401
+        """Validate an instance.
+
+        Args:
+            instance: The data to validate.
+
+        Raises:
+            jsonschema.exceptions.ValidationError: If validation fails.
+        """
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(instance)
+                return
+            except fastjsonschema.JsonSchemaException:
+                pass
+        error = jsonschema.exceptions.best_match(self._validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+
+def _record_schema_validation(direction: str, backend: str, duration: float) -> None:
+    """Report the cost of one tool schema validation.
+
+    Args:
+        direction: ``input`` or ``output``.
+        backend: Validator backend used.
+        duration: Validation time in seconds.
+    """
+    perf_tracker.record_timing(f"tool_{direction}_validation", duration, component="tool_service")
+    try:
+        # First-Party
+        from mcpgateway.services.metrics import tool_schema_validation_histogram  # pylint: disable=import-outside-toplevel
+
+        tool_schema_validation_histogram.labels(direction=direction, backend=backend).observe(duration)
+    except Exception as exc:
+        logger.debug(f"Failed to record tool schema validation metric: {exc}")
+
+
 def extract_using_jq(data, jq_filter=""):
     """
     Extracts data from a given input (string, dict, or list) using a jq filter string.
@@ -291,6 +412,37 @@ def extract_using_jq(data, jq_filter=""):
     return result
 
 
+def tool_result_from_pre_invoke(pre_result: Any) -> Optional[ToolResult]:
+    """Extract the result a tool pre-invoke hook returned in place of the upstream call.
+
+    Args:
+        pre_result: Result of the ``tool_pre_invoke`` hook
+
+    Returns:
+        The tool result to use, or None if the call must go upstream.
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> tool_result_from_pre_invoke(SimpleNamespace(result=None)) is None
+        True
+        >>> r = ToolResult(content=[TextContent(type="text", text="hi")])
+        >>> tool_result_from_pre_invoke(SimpleNamespace(result=r)) is r
+        True
+        >>> tool_result_from_pre_invoke(SimpleNamespace(result=r.model_dump(by_alias=True))).content[0].text
+        'hi'
+        >>> tool_result_from_pre_invoke(SimpleNamespace(result=42)).content[0].text
+        '42'
+    """
+    value = getattr(pre_result, "result", None)
+    if value is None:
+        return None
+    if isinstance(value, ToolResult):
+        return value
+    if isinstance(value, dict):
+        return ToolResult.model_validate(value)
+    return ToolResult(content=[TextContent(type="text", text=str(value))])
+
+
 class ToolError(Exception):
     """Base class for tool-related errors.
 
@@ -519,6 +671,7 @@ class ToolService:
         Returns:
             Cache payload dict for tool lookup.
         """
+        input_schema = tool.input_schema or {"type": "object", "properties": {}}
         tool_payload = {
             "id": str(tool.id),
             "name": tool.name,
@@ -528,8 +681,10 @@ class ToolService:
             "integration_type": tool.integration_type,
             "request_type": tool.request_type,
             "headers": tool.headers or {},
-            "input_schema": tool.input_schema or {"type": "object", "properties": {}},
+            "input_schema": input_schema,
             "output_schema": tool.output_schema,
+            "input_schema_version": _schema_version(input_schema),
+            "output_schema_version": _schema_version(tool.output_schema),
             "annotations": tool.annotations or {},
             "auth_type": tool.auth_type,
             "auth_value": tool.auth_value,
@@ -842,6 +997,94 @@ class ToolService:
                 error_message=error_message,
             )
 
+    def _validate_tool_schema(self, tool: Any, direction: str, schema: dict, instance: Any) -> None:
+        # noqa: DAR401
+        """Validate an instance with the tool's compiled schema validator and record the cost.
+
+        The validator is looked up by tool id and ``<direction>_schema_version``
+        in the tool lookup cache, so it is compiled once per schema version.
+        Tools without an id fall back to the shared validator class cache.
+
+        Args:
+            tool: Tool (ORM object or cached payload namespace).
+            direction: ``input`` or ``output``.
+            schema: The JSON Schema to validate against.
+            instance: The data to validate.
+
+        Raises:
+            jsonschema.exceptions.ValidationError: If validation fails.
+
+        Examples:
+            >>> from types import SimpleNamespace
+            >>> service = ToolService()
+            >>> schema = {"type": "object", "required": ["q"]}
+            >>> tool = SimpleNamespace(id="doc-tool", input_schema_version=_schema_version(schema))
+            >>> service._validate_tool_schema(tool, "input", schema, {"q": "x"})
+            >>> service._validate_tool_schema(tool, "input", schema, {})
+            Traceback (most recent call last):
+            ...
+            jsonschema.exceptions.ValidationError: 'q' is a required property
+            ...
+        """
+        tool_id = getattr(tool, "id", None)
+        version = getattr(tool, f"{direction}_schema_version", None) or _schema_version(schema)
+        backend = "jsonschema"
+        start = time.perf_counter()
+        try:
+            if tool_id and version:
+                validator = _get_tool_lookup_cache().get_validator(str(tool_id), direction, version, lambda: CompiledSchemaValidator(schema, settings.tool_schema_validator_backend))
+                backend = validator.backend
+                validator.validate(instance)
+            else:
+                _validate_with_cached_schema(instance, schema)
+        finally:
+            _record_schema_validation(direction, backend, time.perf_counter() - start)
+
+    @staticmethod
+    def _validation_error_details(error: jsonschema.exceptions.ValidationError) -> Dict[str, Any]:
+        """Build the compact error description returned for schema validation failures.
+
+        Args:
+            error: The validation error.
+
+        Returns:
+            Dict with code, expected, received, path and message.
+
+        Examples:
+            >>> error = jsonschema.exceptions.ValidationError("bad", validator="type", schema={"type": "string"}, instance=1, path=["a"])
+            >>> ToolService._validation_error_details(error)
+            {'code': 'type', 'expected': 'string', 'received': 'int', 'path': ['a'], 'message': 'bad'}
+        """
+        return {
+            "code": getattr(error, "validator", "validation_error"),
+            "expected": error.schema.get("type") if isinstance(error.schema, dict) and "type" in error.schema else None,
+            "received": type(error.instance).__name__.lower() if error.instance is not None else None,
+            "path": list(error.absolute_path) if hasattr(error, "absolute_path") else list(error.path or []),
+            "message": error.message,
+        }
+
+    @staticmethod
+    def _is_coalescable(annotations: Optional[Dict[str, Any]]) -> bool:
+        """Return whether identical concurrent calls of a tool may share one upstream call.
+
+        Args:
+            annotations: Tool annotations.
+
+        Returns:
+            True if the tool is annotated read-only or idempotent.
+
+        Examples:
+            >>> ToolService._is_coalescable({"readOnlyHint": True})
+            True
+            >>> ToolService._is_coalescable({"idempotentHint": True, "readOnlyHint": False})
+            True
+            >>> ToolService._is_coalescable({"destructiveHint": True})
+            False
+            >>> ToolService._is_coalescable(None)
+            False
+        """
+        return bool(annotations) and (annotations.get("readOnlyHint") is True or annotations.get("idempotentHint") is True)
+
     def _extract_and_validate_structured_content(self, tool: DbTool, tool_result: "ToolResult", candidate: Optional[Any] = None) -> bool:
         """
         Extract structured content (if any) and validate it against ``tool.output_schema``.
@@ -959,18 +1202,12 @@ class ToolService:
             except Exception:
                 logger.debug("Failed to set structured_content on ToolResult")
 
-            # Validate using cached schema validator
+            # Validate using the tool's compiled schema validator
             try:
-                _validate_with_cached_schema(structured, output_schema)
+                self._validate_tool_schema(tool, "output", output_schema, structured)
                 return True
             except jsonschema.exceptions.ValidationError as e:
-                details = {
-                    "code": getattr(e, "validator", "validation_error"),
-                    "expected": e.schema.get("type") if isinstance(e.schema, dict) and "type" in e.schema else None,
-                    "received": type(e.instance).__name__.lower() if e.instance is not None else None,
-                    "path": list(e.absolute_path) if hasattr(e, "absolute_path") else list(e.path or []),
-                    "message": e.message,
-                }
+                details = self._validation_error_details(e)
                 try:
                     tool_result.content = [TextContent(type="text", text=orjson.dumps(details).decode())]
                 except Exception:
@@ -2597,6 +2834,7 @@ class ToolService:
         # Extract A2A-related data from annotations (will be used after db.close() if A2A tool)
         tool_annotations = tool_payload.get("annotations") or {}
         tool_integration_type = tool_payload.get("integration_type")
+        coalesce = settings.tool_coalescing_enabled and self._is_coalescable(tool_annotations)
 
         # Get passthrough headers from in-memory cache (Issue #1715)
         # This eliminates 42,000+ redundant DB queries under load
@@ -2620,6 +2858,7 @@ class ToolService:
         tool_auth_type = tool_payload.get("auth_type")
         tool_auth_value = tool_payload.get("auth_value")
         tool_jsonpath_filter = tool_payload.get("jsonpath_filter")
+        tool_input_schema = tool_payload.get("input_schema")
         tool_output_schema = tool_payload.get("output_schema")
         tool_oauth_config = tool_payload.get("oauth_config")
         tool_gateway_id = tool_payload.get("gateway_id")
@@ -2674,7 +2913,14 @@ class ToolService:
                 if has_gateway and gateway_payload:
                     gateway_metadata = self._pydantic_gateway_from_payload(gateway_payload)
 
-        tool_for_validation = tool if tool is not None else SimpleNamespace(output_schema=tool_output_schema, name=tool_name_computed)
+        # Schema versions select the compiled validators cached per worker
+        tool_for_validation = SimpleNamespace(
+            id=tool_id,
+            name=tool_name_computed,
+            output_schema=tool_output_schema,
+            input_schema_version=tool_payload.get("input_schema_version"),
+            output_schema_version=tool_payload.get("output_schema_version"),
+        )
 
         # ═══════════════════════════════════════════════════════════════════════════
         # A2A Agent Data Extraction (must happen before db.close())
@@ -2794,6 +3040,16 @@ class ToolService:
             },
         ) as span:
             try:
+                cached_result: Optional[ToolResult] = None
+                # Reject invalid arguments before any plugin or upstream work
+                if settings.tool_input_validation_enabled and tool_input_schema:
+                    try:
+                        self._validate_tool_schema(tool_for_validation, "input", tool_input_schema, arguments or {})
+                    except jsonschema.exceptions.ValidationError as e:
+                        details = self._validation_error_details(e)
+                        error_message = f"Invalid arguments: {details['message']}"
+                        return ToolResult(content=[TextContent(type="text", text=orjson.dumps(details).decode())], is_error=True)
+
                 # Get combined headers for the tool including base headers, auth, and passthrough headers
                 headers = tool_headers.copy()
                 if tool_integration_type == "REST":
@@ -2838,111 +3094,124 @@ class ToolService:
                             arguments = payload.args
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
+                        cached_result = tool_result_from_pre_invoke(pre_result)
+
+                    if cached_result is None:
+                        # Build the payload based on integration type
+                        payload = arguments.copy()
+
+                        # Handle URL path parameter substitution (using local variable)
+                        final_url = tool_url
+                        if "{" in tool_url and "}" in tool_url:
+                            # Extract path parameters from URL template and arguments
+                            url_params = re.findall(r"\{(\w+)\}", tool_url)
+                            url_substitutions = {}
+
+                            for param in url_params:
+                                if param in payload:
+                                    url_substitutions[param] = payload.pop(param)  # Remove from payload
+                                    final_url = final_url.replace(f"{{{param}}}", str(url_substitutions[param]))
+                                else:
+                                    raise ToolInvocationError(f"Required URL parameter '{param}' not found in arguments")
 
-                    # Build the payload based on integration type
-                    payload = arguments.copy()
+                        # --- Extract query params from URL ---
+                        parsed = urlparse(final_url)
+                        final_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
-                    # Handle URL path parameter substitution (using local variable)
-                    final_url = tool_url
-                    if "{" in tool_url and "}" in tool_url:
-                        # Extract path parameters from URL template and arguments
-                        url_params = re.findall(r"\{(\w+)\}", tool_url)
-                        url_substitutions = {}
+                        query_params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
 
-                        for param in url_params:
-                            if param in payload:
-                                url_substitutions[param] = payload.pop(param)  # Remove from payload
-                                final_url = final_url.replace(f"{{{param}}}", str(url_substitutions[param]))
-                            else:
-                                raise ToolInvocationError(f"Required URL parameter '{param}' not found in arguments")
+                        # Merge leftover payload + query params
+                        payload.update(query_params)
 
-                    # --- Extract query params from URL ---
-                    parsed = urlparse(final_url)
-                    final_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+                        # Use the tool's request_type rather than defaulting to POST (using local variable)
+                        method = tool_request_type.upper() if tool_request_type else "POST"
 
-                    query_params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                        async def send_rest_request() -> httpx.Response:
+                            """Send the REST request to the tool endpoint.
 
-                    # Merge leftover payload + query params
-                    payload.update(query_params)
+                            Returns:
+                                httpx.Response: Upstream response.
+                            """
+                            if method == "GET":
+                                return await asyncio.wait_for(self._http_client.get(final_url, params=payload, headers=headers), timeout=effective_timeout)
+                            return await asyncio.wait_for(self._http_client.request(method, final_url, json=payload, headers=headers), timeout=effective_timeout)
 
-                    # Use the tool's request_type rather than defaulting to POST (using local variable)
-                    method = tool_request_type.upper() if tool_request_type else "POST"
-                    rest_start_time = time.time()
-                    try:
-                        if method == "GET":
-                            response = await asyncio.wait_for(self._http_client.get(final_url, params=payload, headers=headers), timeout=effective_timeout)
-                        else:
-                            response = await asyncio.wait_for(self._http_client.request(method, final_url, json=payload, headers=headers), timeout=effective_timeout)
-                    except (asyncio.TimeoutError, httpx.TimeoutException):
-                        rest_elapsed_ms = (time.time() - rest_start_time) * 1000
-                        structured_logger.log(
-                            level="WARNING",
-                            message=f"REST tool invocation timed out: {tool_name_computed}",
-                            component="tool_service",
-                            correlation_id=get_correlation_id(),
-                            duration_ms=rest_elapsed_ms,
-                            metadata={"event": "tool_timeout", "tool_name": tool_name_computed, "timeout_seconds": effective_timeout},
-                        )
-
-                        # Manually trigger circuit breaker (or other plugins) on timeout
+                        rest_start_time = time.time()
                         try:
-                            # First-Party
-                            from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
-
-                            tool_timeout_counter.labels(tool_name=name).inc()
-                        except Exception as exc:
-                            logger.debug(
-                                "Failed to increment tool_timeout_counter for %s: %s",
-                                name,
-                                exc,
-                                exc_info=True,
+                            if coalesce:
+                                response = await tool_call_flights.do(make_flight_key(tool_id, method, final_url, payload, headers, app_user_email), send_rest_request)
+                            else:
+                                response = await send_rest_request()
+                        except (asyncio.TimeoutError, httpx.TimeoutException):
+                            rest_elapsed_ms = (time.time() - rest_start_time) * 1000
+                            structured_logger.log(
+                                level="WARNING",
+                                message=f"REST tool invocation timed out: {tool_name_computed}",
+                                component="tool_service",
+                                correlation_id=get_correlation_id(),
+                                duration_ms=rest_elapsed_ms,
+                                metadata={"event": "tool_timeout", "tool_name": tool_name_computed, "timeout_seconds": effective_timeout},
                             )
 
-                        if self._plugin_manager:
-                            if context_table:
-                                for ctx in context_table.values():
-                                    ctx.set_state("cb_timeout_failure", True)
-
-                            if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
-                                timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
-                                await self._plugin_manager.invoke_hook(
-                                    ToolHookType.TOOL_POST_INVOKE,
-                                    payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
-                                    global_context=global_context,
-                                    local_contexts=context_table,
-                                    violations_as_exceptions=False,
+                            # Manually trigger circuit breaker (or other plugins) on timeout
+                            try:
+                                # First-Party
+                                from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
+
+                                tool_timeout_counter.labels(tool_name=name).inc()
+                            except Exception as exc:
+                                logger.debug(
+                                    "Failed to increment tool_timeout_counter for %s: %s",
+                                    name,
+                                    exc,
+                                    exc_info=True,
                                 )
 
-                        raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
-                    response.raise_for_status()
+                            if self._plugin_manager:
+                                if context_table:
+                                    for ctx in context_table.values():
+                                        ctx.set_state("cb_timeout_failure", True)
 
-                    # Handle 204 No Content responses that have no body
-                    if response.status_code == 204:
-                        tool_result = ToolResult(content=[TextContent(type="text", text="Request completed successfully (No Content)")])
-                        success = True
-                    elif response.status_code not in [200, 201, 202, 206]:
-                        try:
-                            result = response.json()
-                        except orjson.JSONDecodeError:
-                            result = {"response_text": response.text} if response.text else {}
-                        tool_result = ToolResult(
-                            content=[TextContent(type="text", text=str(result["error"]) if "error" in result else "Tool error encountered")],
-                            is_error=True,
-                        )
-                        # Don't mark as successful for error responses - success remains False
-                    else:
-                        try:
-                            result = response.json()
-                        except orjson.JSONDecodeError:
-                            result = {"response_text": response.text} if response.text else {}
-                        logger.debug(f"REST API tool response: {result}")
-                        filtered_response = extract_using_jq(result, tool_jsonpath_filter)
-                        tool_result = ToolResult(content=[TextContent(type="text", text=orjson.dumps(filtered_response, option=orjson.OPT_INDENT_2).decode())])
-                        success = True
-                        # If output schema is present, validate and attach structured content
-                        if tool_output_schema:
-                            valid = self._extract_and_validate_structured_content(tool_for_validation, tool_result, candidate=filtered_response)
-                            success = bool(valid)
+                                if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
+                                    timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
+                                    await self._plugin_manager.invoke_hook(
+                                        ToolHookType.TOOL_POST_INVOKE,
+                                        payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
+                                        global_context=global_context,
+                                        local_contexts=context_table,
+                                        violations_as_exceptions=False,
+                                    )
+
+                            raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
+                        response.raise_for_status()
+
+                        # Handle 204 No Content responses that have no body
+                        if response.status_code == 204:
+                            tool_result = ToolResult(content=[TextContent(type="text", text="Request completed successfully (No Content)")])
+                            success = True
+                        elif response.status_code not in [200, 201, 202, 206]:
+                            try:
+                                result = response.json()
+                            except orjson.JSONDecodeError:
+                                result = {"response_text": response.text} if response.text else {}
+                            tool_result = ToolResult(
+                                content=[TextContent(type="text", text=str(result["error"]) if "error" in result else "Tool error encountered")],
+                                is_error=True,
+                            )
+                            # Don't mark as successful for error responses - success remains False
+                        else:
+                            try:
+                                result = response.json()
+                            except orjson.JSONDecodeError:
+                                result = {"response_text": response.text} if response.text else {}
+                            logger.debug(f"REST API tool response: {result}")
+                            filtered_response = extract_using_jq(result, tool_jsonpath_filter)
+                            tool_result = ToolResult(content=[TextContent(type="text", text=orjson.dumps(filtered_response, option=orjson.OPT_INDENT_2).decode())])
+                            success = True
+                            # If output schema is present, validate and attach structured content
+                            if tool_output_schema:
+                                valid = self._extract_and_validate_structured_content(tool_for_validation, tool_result, candidate=filtered_response)
+                                success = bool(valid)
                 elif tool_integration_type == "MCP":
                     transport = tool_request_type.lower() if tool_request_type else "sse"
 
@@ -3369,25 +3638,40 @@ class ToolService:
                             arguments = payload.args
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
+                        cached_result = tool_result_from_pre_invoke(pre_result)
+
+                    if cached_result is None:
+
+                        async def call_mcp_tool():
+                            """Call the tool on the gateway over its transport.
 
-                    tool_call_result = ToolResult(content=[TextContent(text="", type="text")])
-                    if transport == "sse":
-                        tool_call_result = await connect_to_sse_server(gateway_url, headers=headers)
-                    elif transport == "streamablehttp":
-                        tool_call_result = await connect_to_streamablehttp_server(gateway_url, headers=headers)
-                    dump = tool_call_result.model_dump(by_alias=True, mode="json")
-                    logger.debug(f"Tool call result dump: {dump}")
-                    content = dump.get("content", [])
-                    # Accept both alias and pythonic names for structured content
-                    structured = dump.get("structuredContent") or dump.get("structured_content")
-                    filtered_response = extract_using_jq(content, tool_jsonpath_filter)
-
-                    is_err = getattr(tool_call_result, "is_error", None)
-                    if is_err is None:
-                        is_err = getattr(tool_call_result, "isError", False)
-                    tool_result = ToolResult(content=filtered_response, structured_content=structured, is_error=is_err, meta=getattr(tool_call_result, "meta", None))
-                    success = not is_err
-                    logger.debug(f"Final tool_result: {tool_result}")
+                            Returns:
+                                The upstream tool call result.
+                            """
+                            if transport == "sse":
+                                return await connect_to_sse_server(gateway_url, headers=headers)
+                            if transport == "streamablehttp":
+                                return await connect_to_streamablehttp_server(gateway_url, headers=headers)
+                            return ToolResult(content=[TextContent(text="", type="text")])
+
+                        if coalesce:
+                            flight_key = make_flight_key(tool_id, tool_name_original, arguments, meta_data, gateway_url, headers, app_user_email)
+                            tool_call_result = await tool_call_flights.do(flight_key, call_mcp_tool)
+                        else:
+                            tool_call_result = await call_mcp_tool()
+                        dump = tool_call_result.model_dump(by_alias=True, mode="json")
+                        logger.debug(f"Tool call result dump: {dump}")
+                        content = dump.get("content", [])
+                        # Accept both alias and pythonic names for structured content
+                        structured = dump.get("structuredContent") or dump.get("structured_content")
+                        filtered_response = extract_using_jq(content, tool_jsonpath_filter)
+
+                        is_err = getattr(tool_call_result, "is_error", None)
+                        if is_err is None:
+                            is_err = getattr(tool_call_result, "isError", False)
+                        tool_result = ToolResult(content=filtered_response, structured_content=structured, is_error=is_err, meta=getattr(tool_call_result, "meta", None))
+                        success = not is_err
+                        logger.debug(f"Final tool_result: {tool_result}")
                 elif tool_integration_type == "A2A" and a2a_agent_endpoint_url:
                     # A2A tool invocation using pre-extracted agent data (extracted in Phase 2 before db.close())
                     headers = {"Content-Type": "application/json"}
@@ -3409,100 +3693,107 @@ class ToolService:
                             arguments = payload.args
                             if payload.headers is not None:
                                 headers = payload.headers.model_dump()
-
-                    # Build request data based on agent type
-                    endpoint_url = a2a_agent_endpoint_url
-                    if a2a_agent_type in ["generic", "jsonrpc"] or endpoint_url.endswith("/"):
-                        # JSONRPC agents: Convert flat query to nested message structure
-                        params = None
-                        if isinstance(arguments, dict) and "query" in arguments and isinstance(arguments["query"], str):
-                            message_id = f"admin-test-{int(time.time())}"
-                            params = {"message": {"messageId": message_id, "role": "user", "parts": [{"type": "text", "text": arguments["query"]}]}}
-                            method = arguments.get("method", "message/send")
+                        cached_result = tool_result_from_pre_invoke(pre_result)
+
+                    if cached_result is None:
+                        # Build request data based on agent type
+                        endpoint_url = a2a_agent_endpoint_url
+                        if a2a_agent_type in ["generic", "jsonrpc"] or endpoint_url.endswith("/"):
+                            # JSONRPC agents: Convert flat query to nested message structure
+                            params = None
+                            if isinstance(arguments, dict) and "query" in arguments and isinstance(arguments["query"], str):
+                                message_id = f"admin-test-{int(time.time())}"
+                                params = {"message": {"messageId": message_id, "role": "user", "parts": [{"type": "text", "text": arguments["query"]}]}}
+                                method = arguments.get("method", "message/send")
+                            else:
+                                params = arguments.get("params", arguments) if isinstance(arguments, dict) else arguments
+                                method = arguments.get("method", "message/send") if isinstance(arguments, dict) else "message/send"
+                            request_data = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
                         else:
-                            params = arguments.get("params", arguments) if isinstance(arguments, dict) else arguments
-                            method = arguments.get("method", "message/send") if isinstance(arguments, dict) else "message/send"
-                        request_data = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
-                    else:
-                        # Custom agents: Pass parameters directly
-                        params = arguments if isinstance(arguments, dict) else {}
-                        request_data = {"interaction_type": params.get("interaction_type", "query"), "parameters": params, "protocol_version": a2a_agent_protocol_version}
-
-                    # Add authentication
-                    if a2a_agent_auth_type == "api_key" and a2a_agent_auth_value:
-                        headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
-                    elif a2a_agent_auth_type == "bearer" and a2a_agent_auth_value:
-                        headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
-                    elif a2a_agent_auth_type == "query_param" and a2a_agent_auth_query_params:
-                        auth_query_params_decrypted: dict[str, str] = {}
-                        for param_key, encrypted_value in a2a_agent_auth_query_params.items():
-                            if encrypted_value:
-                                try:
-                                    decrypted = decode_auth(encrypted_value)
-                                    auth_query_params_decrypted[param_key] = decrypted.get(param_key, "")
-                                except Exception:
-                                    logger.debug(f"Failed to decrypt query param for key '{param_key}'")
-                        if auth_query_params_decrypted:
-                            endpoint_url = apply_query_param_auth(endpoint_url, auth_query_params_decrypted)
-
-                    # Make HTTP request with timeout enforcement
-                    logger.info(f"Calling A2A agent '{a2a_agent_name}' at {endpoint_url}")
-                    a2a_start_time = time.time()
-                    try:
-                        http_response = await asyncio.wait_for(self._http_client.post(endpoint_url, json=request_data, headers=headers), timeout=effective_timeout)
-                    except (asyncio.TimeoutError, httpx.TimeoutException):
-                        a2a_elapsed_ms = (time.time() - a2a_start_time) * 1000
-                        structured_logger.log(
-                            level="WARNING",
-                            message=f"A2A tool invocation timed out: {name}",
-                            component="tool_service",
-                            correlation_id=get_correlation_id(),
-                            duration_ms=a2a_elapsed_ms,
-                            metadata={"event": "tool_timeout", "tool_name": name, "a2a_agent": a2a_agent_name, "timeout_seconds": effective_timeout},
-                        )
-
-                        # Increment timeout counter
+                            # Custom agents: Pass parameters directly
+                            params = arguments if isinstance(arguments, dict) else {}
+                            request_data = {"interaction_type": params.get("interaction_type", "query"), "parameters": params, "protocol_version": a2a_agent_protocol_version}
+
+                        # Add authentication
+                        if a2a_agent_auth_type == "api_key" and a2a_agent_auth_value:
+                            headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
+                        elif a2a_agent_auth_type == "bearer" and a2a_agent_auth_value:
+                            headers["Authorization"] = f"Bearer {a2a_agent_auth_value}"
+                        elif a2a_agent_auth_type == "query_param" and a2a_agent_auth_query_params:
+                            auth_query_params_decrypted: dict[str, str] = {}
+                            for param_key, encrypted_value in a2a_agent_auth_query_params.items():
+                                if encrypted_value:
+                                    try:
+                                        decrypted = decode_auth(encrypted_value)
+                                        auth_query_params_decrypted[param_key] = decrypted.get(param_key, "")
+                                    except Exception:
+                                        logger.debug(f"Failed to decrypt query param for key '{param_key}'")
+                            if auth_query_params_decrypted:
+                                endpoint_url = apply_query_param_auth(endpoint_url, auth_query_params_decrypted)
+
+                        # Make HTTP request with timeout enforcement
+                        logger.info(f"Calling A2A agent '{a2a_agent_name}' at {endpoint_url}")
+                        a2a_start_time = time.time()
                         try:
-                            # First-Party
-                            from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
-
-                            tool_timeout_counter.labels(tool_name=name).inc()
-                        except Exception as exc:
-                            logger.debug("Failed to increment tool_timeout_counter for %s: %s", name, exc, exc_info=True)
-
-                        # Trigger circuit breaker on timeout
-                        if self._plugin_manager:
-                            if context_table:
-                                for ctx in context_table.values():
-                                    ctx.set_state("cb_timeout_failure", True)
-
-                            if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
-                                timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
-                                await self._plugin_manager.invoke_hook(
-                                    ToolHookType.TOOL_POST_INVOKE,
-                                    payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
-                                    global_context=global_context,
-                                    local_contexts=context_table,
-                                    violations_as_exceptions=False,
-                                )
+                            http_response = await asyncio.wait_for(self._http_client.post(endpoint_url, json=request_data, headers=headers), timeout=effective_timeout)
+                        except (asyncio.TimeoutError, httpx.TimeoutException):
+                            a2a_elapsed_ms = (time.time() - a2a_start_time) * 1000
+                            structured_logger.log(
+                                level="WARNING",
+                                message=f"A2A tool invocation timed out: {name}",
+                                component="tool_service",
+                                correlation_id=get_correlation_id(),
+                                duration_ms=a2a_elapsed_ms,
+                                metadata={"event": "tool_timeout", "tool_name": name, "a2a_agent": a2a_agent_name, "timeout_seconds": effective_timeout},
+                            )
+
+                            # Increment timeout counter
+                            try:
+                                # First-Party
+                                from mcpgateway.services.metrics import tool_timeout_counter  # pylint: disable=import-outside-toplevel
+
+                                tool_timeout_counter.labels(tool_name=name).inc()
+                            except Exception as exc:
+                                logger.debug("Failed to increment tool_timeout_counter for %s: %s", name, exc, exc_info=True)
 
-                        raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
+                            # Trigger circuit breaker on timeout
+                            if self._plugin_manager:
+                                if context_table:
+                                    for ctx in context_table.values():
+                                        ctx.set_state("cb_timeout_failure", True)
 
-                    if http_response.status_code == 200:
-                        response_data = http_response.json()
-                        if isinstance(response_data, dict) and "response" in response_data:
-                            content = [TextContent(type="text", text=str(response_data["response"]))]
+                                if self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
+                                    timeout_error_result = ToolResult(content=[TextContent(type="text", text=f"Tool invocation timed out after {effective_timeout}s")], is_error=True)
+                                    await self._plugin_manager.invoke_hook(
+                                        ToolHookType.TOOL_POST_INVOKE,
+                                        payload=ToolPostInvokePayload(name=name, result=timeout_error_result.model_dump(by_alias=True)),
+                                        global_context=global_context,
+                                        local_contexts=context_table,
+                                        violations_as_exceptions=False,
+                                    )
+
+                            raise ToolTimeoutError(f"Tool invocation timed out after {effective_timeout}s")
+
+                        if http_response.status_code == 200:
+                            response_data = http_response.json()
+                            if isinstance(response_data, dict) and "response" in response_data:
+                                content = [TextContent(type="text", text=str(response_data["response"]))]
+                            else:
+                                content = [TextContent(type="text", text=str(response_data))]
+                            tool_result = ToolResult(content=content, is_error=False)
+                            success = True
                         else:
-                            content = [TextContent(type="text", text=str(response_data))]
-                        tool_result = ToolResult(content=content, is_error=False)
-                        success = True
-                    else:
-                        error_message = f"HTTP {http_response.status_code}: {http_response.text}"
-                        content = [TextContent(type="text", text=f"A2A agent error: {error_message}")]
-                        tool_result = ToolResult(content=content, is_error=True)
+                            error_message = f"HTTP {http_response.status_code}: {http_response.text}"
+                            content = [TextContent(type="text", text=f"A2A agent error: {error_message}")]
+                            tool_result = ToolResult(content=content, is_error=True)
                 else:
                     tool_result = ToolResult(content=[TextContent(type="text", text="Invalid tool type")], is_error=True)
 
+                # A pre-invoke hook returned the final result (e.g. a cache hit): no upstream call was made
+                if cached_result is not None:
+                    tool_result = cached_result
+                    success = not tool_result.is_error
+
                 # Plugin hook: tool post-invoke
                 if self._plugin_manager and self._plugin_manager.has_hooks_for(ToolHookType.TOOL_POST_INVOKE):
                     post_result, _ = await self._plugin_manager.invoke_hook(
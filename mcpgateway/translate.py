@@ -117,13 +117,14 @@ from __future__ import annotations
 # Standard
 import argparse
 import asyncio
+from collections import deque
 from contextlib import suppress
 import logging
 import os
 import shlex
 import signal
 import sys
-from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 import uuid
 
@@ -179,17 +180,110 @@ KEEP_ALIVE_INTERVAL = DEFAULT_KEEP_ALIVE_INTERVAL  # seconds - from config or fa
 # Set to 16MB to handle tools that return large amounts of data (e.g., search results)
 STDIO_BUFFER_LIMIT = 16 * 1024 * 1024  # 16MB
 
+# Worker pool defaults (--pool-size > 1)
+DEFAULT_POOL_MAX_INFLIGHT = 32  # concurrent requests per child before backpressure kicks in
+DEFAULT_POOL_SATURATION_TIMEOUT = 30.0  # seconds to wait for a free child before rejecting
+POOL_RESTART_MAX_BACKOFF = 30.0  # seconds
+
+# Per-subscriber routing and memory bounds
+SUBSCRIBER_QUEUE_MAX_BYTES = 16 * 1024 * 1024  # queued UTF-8 bytes per SSE subscriber before messages are dropped
+PUBSUB_MAX_PENDING_ROUTES = 10_000  # outstanding routed requests before the oldest are forgotten
+ROUTED_ID_PREFIX = "mcpgw-"  # prefix of JSON-RPC ids rewritten for session routing
+
 __all__ = ["main"]  # for console-script entry-point
 
 
 # ---------------------------------------------------------------------------#
 # Helpers - trivial in-process Pub/Sub                                       #
 # ---------------------------------------------------------------------------#
+def _utf8_len(data: str) -> int:
+    """Return the UTF-8 encoded size of a string without encoding ASCII text.
+
+    Args:
+        data: Text to measure.
+
+    Returns:
+        Size in bytes.
+
+    Examples:
+        >>> _utf8_len("abc"), _utf8_len("héllo"), _utf8_len("日本")
+        (3, 6, 6)
+    """
+    return len(data) if data.isascii() else len(data.encode("utf-8"))
+
+
+class _SubscriberQueue(asyncio.Queue):  # type: ignore[type-arg]
+    """Subscriber queue that tracks the UTF-8 bytes it holds and the messages it dropped.
+
+    Examples:
+        >>> q = _SubscriberQueue(maxsize=4, max_bytes=10)
+        >>> q.put_nowait("12345")
+        >>> q.queued_bytes
+        5
+        >>> q.has_room_for("12345"), q.has_room_for("日日")  # 6 bytes in 2 characters
+        (True, False)
+        >>> q.get_nowait()
+        '12345'
+        >>> q.queued_bytes, q.has_room_for("x" * 100)  # an empty queue always accepts one message
+        (0, True)
+    """
+
+    def __init__(self, maxsize: int = 0, max_bytes: int = 0) -> None:
+        """Create the queue.
+
+        Args:
+            maxsize: Maximum number of queued messages (0 = unbounded).
+            max_bytes: Maximum queued UTF-8 bytes (0 = unbounded).
+        """
+        super().__init__(maxsize=maxsize)
+        self.max_bytes = max_bytes
+        self.queued_bytes = 0
+        self.dropped = 0
+        self._sizes: Deque[int] = deque()
+
+    def has_room_for(self, data: str) -> bool:
+        """Check whether queueing ``data`` keeps the subscriber within its memory bound.
+
+        Args:
+            data: Message about to be queued.
+
+        Returns:
+            True if the message fits (or the queue is empty).
+        """
+        return not self.max_bytes or self.empty() or self.queued_bytes + _utf8_len(data) <= self.max_bytes
+
+    def _put(self, item: str) -> None:
+        """Queue an item and account for its size.
+
+        Args:
+            item: Message to queue.
+        """
+        super()._put(item)  # type: ignore[misc]
+        size = _utf8_len(item)
+        self._sizes.append(size)
+        self.queued_bytes += size
+
+    def _get(self) -> str:
+        """Dequeue an item and release its size.
+
+        Returns:
+            The oldest queued message.
+        """
+        item = super()._get()  # type: ignore[misc]
+        self.queued_bytes -= self._sizes.popleft()
+        return item
+
+
 class _PubSub:
-    """Very small fan-out helper - one async Queue per subscriber.
+    """Session-aware fan-out helper - one async Queue per subscriber.
 
-    This class implements a simple publish-subscribe pattern using asyncio queues
-    for distributing messages from stdio subprocess to multiple SSE clients.
+    Lines from the stdio subprocess are broadcast to every subscriber, except
+    JSON-RPC responses to requests registered through :meth:`route_outgoing`:
+    those carry a rewritten id and are delivered, with the client's id
+    restored, only to the session that sent the request. Each subscriber is
+    bounded both by message count (a full queue means the client is gone and it
+    is unsubscribed) and by queued bytes (messages over the bound are dropped and
+    counted). :meth:`stats` reports delivery and drop counters.
 
     Examples:
         >>> import asyncio
@@ -202,14 +296,27 @@ class _PubSub:
         ...     return result
         >>> asyncio.run(test_pubsub())
         'hello'
+
+        >>> async def test_routing():
+        ...     pubsub = _PubSub()
+        ...     alice, bob = pubsub.subscribe("alice"), pubsub.subscribe("bob")
+        ...     sent = pubsub.route_outgoing('{"jsonrpc":"2.0","id":1,"method":"ping"}', "alice")
+        ...     routed_id = orjson.loads(sent)["id"]
+        ...     await pubsub.publish(orjson.dumps({"jsonrpc": "2.0", "id": routed_id, "result": {}}).decode())
+        ...     return orjson.loads(alice.get_nowait())["id"], bob.empty()
+        >>> asyncio.run(test_routing())
+        (1, True)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_queue_bytes: int = SUBSCRIBER_QUEUE_MAX_BYTES) -> None:
         """Initialize a new publish-subscribe system.
 
         Creates an empty list of subscriber queues. Each subscriber will
         receive their own asyncio.Queue for receiving published messages.
 
+        Args:
+            max_queue_bytes: Per-subscriber bound on queued UTF-8 message bytes.
+
         Examples:
             >>> pubsub = _PubSub()
             >>> isinstance(pubsub._subscribers, list)
@@ -220,14 +327,24 @@ class _PubSub:
             True
         """
         self._subscribers: List[asyncio.Queue[str]] = []
+        self._sessions: Dict[str, asyncio.Queue[str]] = {}
+        self._max_queue_bytes = max_queue_bytes
+        # routed id -> (session id, client id) and the reverse lookup for cancellations
+        self._routes: Dict[str, Tuple[str, Any]] = {}
+        self._route_keys: Dict[Tuple[str, Any], str] = {}
+        self._next_route = 0
+        self._counters = {"published": 0, "targeted": 0, "broadcast": 0, "orphaned": 0, "dropped": 0, "evicted": 0}
 
     async def publish(self, data: str) -> None:
-        """Publish data to all subscribers.
+        """Publish data to its session, or to all subscribers.
 
-        Dead queues (full) are automatically removed from the subscriber list.
+        Responses to routed requests go only to the requesting session;
+        everything else (notifications, server requests, unrouted responses,
+        non-JSON output) is broadcast. Dead queues (full) are automatically
+        removed from the subscriber list.
 
         Args:
-            data: The data string to publish to all subscribers.
+            data: The data string to publish.
 
         Examples:
             >>> import asyncio
@@ -252,21 +369,287 @@ class _PubSub:
             >>> asyncio.run(test_full_queue())
             0
         """
+        self._counters["published"] += 1
+        if self._next_route:  # only parse lines once session routing is in use
+            routed = self._resolve_route(data)
+            if routed is not None:
+                deliveries, rest = routed
+                for session_id, line in deliveries:
+                    if session_id:
+                        await self.publish_to(session_id, line)
+                    else:
+                        self._counters["orphaned"] += 1
+                if rest is None:
+                    return
+                data = rest
+
+        self._counters["broadcast"] += 1
         dead: List[asyncio.Queue[str]] = []
         for q in self._subscribers:
-            try:
-                q.put_nowait(data)
-            except asyncio.QueueFull:
+            if not self._offer(q, data):
                 dead.append(q)
         for q in dead:
-            with suppress(ValueError):
-                self._subscribers.remove(q)
+            self.unsubscribe(q)
+
+    async def publish_to(self, session_id: str, data: str) -> None:
+        """Publish data to the single subscriber registered for a session.
+
+        Data for unknown (already disconnected) sessions is discarded. A full
+        queue is treated as dead, exactly like :meth:`publish`.
+
+        Args:
+            session_id: Session the subscriber registered with.
+            data: The data string to deliver.
+
+        Examples:
+            >>> import asyncio
+            >>> async def test_publish_to():
+            ...     pubsub = _PubSub()
+            ...     mine = pubsub.subscribe("a")
+            ...     other = pubsub.subscribe("b")
+            ...     await pubsub.publish_to("a", "only-a")
+            ...     await pubsub.publish_to("gone", "dropped")
+            ...     return mine.get_nowait(), other.empty()
+            >>> asyncio.run(test_publish_to())
+            ('only-a', True)
+        """
+        q = self._sessions.get(session_id)
+        if q is None:
+            self._counters["orphaned"] += 1
+            return
+        self._counters["targeted"] += 1
+        if not self._offer(q, data):
+            self.unsubscribe(q)
+
+    def _offer(self, q: "asyncio.Queue[str]", data: str) -> bool:
+        """Queue data for one subscriber, honouring its memory bound.
+
+        Args:
+            q: Subscriber queue.
+            data: Message to queue.
+
+        Returns:
+            False if the queue is full and the subscriber should be removed.
+        """
+        if isinstance(q, _SubscriberQueue) and not q.has_room_for(data):
+            q.dropped += 1
+            self._counters["dropped"] += 1
+            if q.dropped == 1:
+                LOGGER.warning(f"SSE subscriber over its {q.max_bytes} byte buffer; dropping messages")
+            return True
+        try:
+            q.put_nowait(data)
+        except asyncio.QueueFull:
+            self._counters["evicted"] += 1
+            return False
+        return True
+
+    def route_outgoing(self, raw: str, session_id: str) -> str:
+        """Rewrite the ids of client requests so their responses can be routed back.
+
+        Requests get a pubsub-unique string id; ``notifications/cancelled``
+        has its ``requestId`` translated to match. Anything else, including
+        non-JSON input and messages from sessions without a subscriber (whose
+        replies keep being broadcast), is returned unchanged.
+
+        Args:
+            raw: Raw JSON-RPC message text (object or batch).
+            session_id: Session that should receive the responses.
+
+        Returns:
+            The message text to send to the subprocess.
+
+        Examples:
+            >>> pubsub = _PubSub()
+            >>> _ = pubsub.subscribe("s")
+            >>> orjson.loads(pubsub.route_outgoing('{"id": 7, "method": "tools/list"}', "s"))["id"]
+            'mcpgw-1'
+            >>> orjson.loads(pubsub.route_outgoing('{"method": "notifications/cancelled", "params": {"requestId": 7}}', "s"))["params"]
+            {'requestId': 'mcpgw-1'}
+            >>> pubsub.route_outgoing("not json", "s")
+            'not json'
+            >>> pubsub.route_outgoing('{"id": 1, "method": "ping"}', "unknown")
+            '{"id": 1, "method": "ping"}'
+        """
+        if session_id not in self._sessions:
+            return raw
+        try:
+            message = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return raw
+
+        rewritten = False
+        for item in message if isinstance(message, list) else [message]:
+            if not isinstance(item, dict) or "method" not in item:
+                continue
+            if item.get("id") is not None:
+                item["id"] = self._add_route(session_id, item["id"])
+                rewritten = True
+            elif item["method"] == "notifications/cancelled" and isinstance(item.get("params"), dict):
+                routed_id = self._route_keys.get((session_id, self._hashable(item["params"].get("requestId"))))
+                if routed_id is not None:
+                    item["params"]["requestId"] = routed_id
+                    rewritten = True
+
+        return orjson.dumps(message).decode() + "\n" if rewritten else raw
+
+    @staticmethod
+    def _hashable(value: Any) -> Any:
+        """Return a JSON-RPC id in hashable form.
+
+        Args:
+            value: Client-supplied id.
+
+        Returns:
+            The id itself for str/int, otherwise its JSON text.
+        """
+        return value if isinstance(value, (str, int)) else orjson.dumps(value).decode()
 
-    def subscribe(self) -> "asyncio.Queue[str]":
+    def _add_route(self, session_id: str, client_id: Any) -> str:
+        """Register a routed request and return the id sent to the subprocess.
+
+        The oldest routes are forgotten once ``PUBSUB_MAX_PENDING_ROUTES`` are outstanding.
+
+        Args:
+            session_id: Requesting session.
+            client_id: The client's JSON-RPC id.
+
+        Returns:
+            The rewritten id.
+        """
+        self._next_route += 1
+        routed_id = f"{ROUTED_ID_PREFIX}{self._next_route}"
+        self._routes[routed_id] = (session_id, client_id)
+        self._route_keys[(session_id, self._hashable(client_id))] = routed_id
+        while len(self._routes) > PUBSUB_MAX_PENDING_ROUTES:
+            self._drop_route(next(iter(self._routes)))
+        return routed_id
+
+    def _drop_route(self, routed_id: str) -> Optional[Tuple[str, Any]]:
+        """Forget a routed request.
+
+        Args:
+            routed_id: The rewritten id.
+
+        Returns:
+            The (session id, client id) pair, or None if unknown.
+        """
+        route = self._routes.pop(routed_id, None)
+        if route is not None:
+            self._route_keys.pop((route[0], self._hashable(route[1])), None)
+        return route
+
+    def _restore_id(self, item: Any) -> Tuple[bool, Optional[str]]:
+        """Restore the client's id of one routed response and forget its route.
+
+        Args:
+            item: One JSON-RPC message (modified in place).
+
+        Returns:
+            Whether the item carries a routed id, and the session that owns it
+            (None for a late reply whose session is gone).
+        """
+        if not isinstance(item, dict) or "method" in item:
+            return False, None
+        msg_id = item.get("id")
+        if not isinstance(msg_id, str) or not msg_id.startswith(ROUTED_ID_PREFIX):
+            return False, None
+        route = self._drop_route(msg_id)
+        if route is None:
+            return True, None
+        session_id, item["id"] = route
+        return True, session_id
+
+    def _resolve_route(self, data: str) -> Optional[Tuple[List[Tuple[Optional[str], str]], Optional[str]]]:
+        """Match a subprocess line against the routed requests.
+
+        The responses of a batch are grouped by owning session, and each
+        session receives its own responses as one batch.
+
+        Args:
+            data: Line published by the subprocess.
+
+        Returns:
+            None if the line should be broadcast, otherwise the (target session,
+            line with the client's ids restored) deliveries, where the session is
+            None for late replies whose session is gone, and the line holding
+            the unrouted rest of a batch to broadcast (None if there is none).
+
+        Examples:
+            >>> pubsub = _PubSub()
+            >>> _ = pubsub.subscribe("a"), pubsub.subscribe("b")
+            >>> _ = pubsub.route_outgoing('[{"id": 1, "method": "ping"}, {"id": 2, "method": "ping"}]', "a")
+            >>> _ = pubsub.route_outgoing('{"id": 1, "method": "ping"}', "b")
+            >>> pubsub._resolve_route('[{"id": "mcpgw-1"}, {"id": "mcpgw-3"}, {"id": "mcpgw-2"}, {"id": 9}]')
+            ([('a', '[{"id":1},{"id":2}]\\n'), ('b', '[{"id":1}]\\n')], '[{"id":9}]\\n')
+            >>> pubsub.stats()["pending_routes"]
+            0
+        """
+        try:
+            message = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return None
+        if isinstance(message, dict):
+            routed, session_id = self._restore_id(message)
+            return ([(session_id, orjson.dumps(message).decode() + "\n")], None) if routed else None
+        if not isinstance(message, list):
+            return None
+
+        groups: Dict[Optional[str], List[Any]] = {}
+        unrouted: List[Any] = []
+        for item in message:
+            routed, session_id = self._restore_id(item)
+            if routed:
+                groups.setdefault(session_id, []).append(item)
+            else:
+                unrouted.append(item)
+        if not groups:
+            return None
+        deliveries = [(session_id, orjson.dumps(items).decode() + "\n") for session_id, items in groups.items()]
+        return deliveries, orjson.dumps(unrouted).decode() + "\n" if unrouted else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return delivery counters and per-subscriber drop counts.
+
+        Returns:
+            Dict with subscriber/route gauges, message counters and a
+            ``subscriber_drops`` list with the session id (None for anonymous
+            subscribers), drop count and queued bytes of every subscriber that
+            dropped messages.
+
+        Examples:
+            >>> import asyncio
+            >>> pubsub = _PubSub(max_queue_bytes=4)
+            >>> _ = pubsub.subscribe("s")
+            >>> _ = pubsub.subscribe()
+            >>> for data in ("abc", "def"):
+            ...     asyncio.run(pubsub.publish(data))
+            >>> stats = pubsub.stats()
+            >>> stats["subscribers"], stats["sessions"], stats["dropped"]
+            (2, 1, 2)
+            >>> stats["subscriber_drops"]
+            [{'session_id': 's', 'dropped': 1, 'queued_bytes': 3}, {'session_id': None, 'dropped': 1, 'queued_bytes': 3}]
+        """
+        session_ids = {id(q): sid for sid, q in self._sessions.items()}
+        return {
+            "subscribers": len(self._subscribers),
+            "sessions": len(self._sessions),
+            "pending_routes": len(self._routes),
+            **self._counters,
+            "subscriber_drops": [
+                {"session_id": session_ids.get(id(q)), "dropped": q.dropped, "queued_bytes": q.queued_bytes} for q in self._subscribers if isinstance(q, _SubscriberQueue) and q.dropped
+            ],
+        }
+
+    def subscribe(self, session_id: Optional[str] = None) -> "asyncio.Queue[str]":
         """Subscribe to published data.
 
         Creates a new queue for receiving published messages with a maximum
-        size of 1024 items.
+        size of 1024 items and a bound of ``max_queue_bytes`` queued UTF-8 bytes.
+
+        Args:
+            session_id: Optional session identifier; registered subscribers can
+                also be addressed individually through :meth:`publish_to`.
 
         Returns:
             asyncio.Queue[str]: A queue that will receive published data.
@@ -283,15 +666,17 @@ class _PubSub:
             >>> pubsub._subscribers[0] is q
             True
         """
-        q: asyncio.Queue[str] = asyncio.Queue(maxsize=1024)
+        q: asyncio.Queue[str] = _SubscriberQueue(maxsize=1024, max_bytes=self._max_queue_bytes)
         self._subscribers.append(q)
+        if session_id is not None:
+            self._sessions[session_id] = q
         return q
 
     def unsubscribe(self, q: "asyncio.Queue[str]") -> None:
         """Unsubscribe from published data.
 
-        Removes the queue from the subscriber list. Safe to call even if
-        the queue is not in the list.
+        Removes the queue from the subscriber list and forgets requests still
+        routed to its session. Safe to call even if the queue is not in the list.
 
         Args:
             q: The queue to unsubscribe from published data.
@@ -304,6 +689,10 @@ class _PubSub:
         """
         with suppress(ValueError):
             self._subscribers.remove(q)
+        for session_id in [sid for sid, queue in self._sessions.items() if queue is q]:
+            del self._sessions[session_id]
+            for routed_id in [rid for rid, (sid, _) in self._routes.items() if sid == session_id]:
+                self._drop_route(routed_id)
 
 
 # ---------------------------------------------------------------------------#
@@ -502,11 +891,13 @@ class StdIOEndpoint:
         """
         return self._proc is not None
 
-    async def send(self, raw: str) -> None:
+    async def send(self, raw: str, session_id: Optional[str] = None) -> None:
         """Send data to the subprocess stdin.
 
         Args:
             raw: The raw data string to send to the subprocess.
+            session_id: Originating client session. When set, request ids
+                are rewritten so the responses reach only that session.
 
         Raises:
             RuntimeError: If the stdio endpoint is not started.
@@ -525,6 +916,8 @@ class StdIOEndpoint:
         """
         if not self._stdin:
             raise RuntimeError("stdio endpoint not started")
+        if session_id is not None and isinstance(self._pubsub, _PubSub):
+            raw = self._pubsub.route_outgoing(raw, session_id)
         LOGGER.debug(f"→ stdio: {raw.strip()}")
         self._stdin.write(raw.encode())
         await self._stdin.drain()
@@ -559,6 +952,465 @@ class StdIOEndpoint:
             raise
 
 
+class StdIOPoolSaturatedError(RuntimeError):
+    """Raised when every pooled stdio child is at its in-flight request limit."""
+
+
+class _PendingRequest:
+    """Bookkeeping for a request forwarded to a pooled child under a rewritten id."""
+
+    __slots__ = ("worker", "session_id", "original_id", "internal")
+
+    def __init__(self, worker: int, session_id: Optional[str], original_id: Any, internal: bool = False) -> None:
+        """Record where a rewritten request came from.
+
+        Args:
+            worker: Index of the child the request was sent to.
+            session_id: Client session that sent the request (None = broadcast reply).
+            original_id: The JSON-RPC id chosen by the client.
+            internal: True for pool-generated requests whose reply is swallowed.
+        """
+        self.worker = worker
+        self.session_id = session_id
+        self.original_id = original_id
+        self.internal = internal
+
+
+class _PoolWorkerSink:
+    """Stand-in for :class:`_PubSub` that hands a child's stdout to its pool."""
+
+    def __init__(self, pool: "StdIOPool", index: int) -> None:
+        """Bind the sink to one child of a pool.
+
+        Args:
+            pool: Owning pool.
+            index: Index of the child whose output this sink receives.
+        """
+        self._pool = pool
+        self._index = index
+
+    async def publish(self, data: str) -> None:
+        """Forward one stdout line to the pool dispatcher.
+
+        Args:
+            data: Line read from the child's stdout.
+        """
+        await self._pool._on_worker_output(self._index, data)  # pylint: disable=protected-access
+
+
+class StdIOPool:
+    """Run N copies of a stdio MCP server behind one JSON-RPC dispatcher.
+
+    Client requests are sent to the least-loaded child with their ``id``
+    rewritten to a pool-unique integer; the child's response gets the client
+    id back and is delivered only to the originating session. Notifications
+    from children are still broadcast. ``initialize`` is fanned out to every
+    child (only the first reply reaches the client) and replayed whenever a
+    child is restarted after it exits. Each child accepts at most
+    ``max_inflight`` concurrent requests; when all are saturated, :meth:`send`
+    waits up to ``saturation_timeout`` seconds and then raises
+    :class:`StdIOPoolSaturatedError`.
+
+    The pool exposes the same ``start``/``stop``/``is_running``/``send``
+    interface as :class:`StdIOEndpoint`.
+
+    Examples:
+        >>> pool = StdIOPool("cat", _PubSub(), size=3)
+        >>> len(pool._workers)
+        3
+        >>> pool.is_running()
+        False
+        >>> pool.stats()["size"]
+        3
+        >>> StdIOPool("cat", _PubSub(), size=0)
+        Traceback (most recent call last):
+            ...
+        ValueError: pool size must be at least 1
+    """
+
+    def __init__(
+        self,
+        cmd: str,
+        pubsub: _PubSub,
+        size: int,
+        env_vars: Optional[Dict[str, str]] = None,
+        header_mappings: Optional[NormalizedMappings] = None,
+        max_inflight: int = DEFAULT_POOL_MAX_INFLIGHT,
+        saturation_timeout: float = DEFAULT_POOL_SATURATION_TIMEOUT,
+    ) -> None:
+        """Create the pool; children are not spawned until :meth:`start`.
+
+        Args:
+            cmd: The command string to execute for each child.
+            pubsub: The publish-subscribe system client sessions listen on.
+            size: Number of child processes.
+            env_vars: Optional environment variables for every child.
+            header_mappings: Optional mapping of HTTP headers to environment variable names.
+            max_inflight: Maximum concurrent requests per child.
+            saturation_timeout: Seconds to wait for capacity before rejecting a request.
+
+        Raises:
+            ValueError: If ``size`` or ``max_inflight`` is smaller than 1.
+        """
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
+        self._cmd = cmd
+        self._pubsub = pubsub
+        self._max_inflight = max_inflight
+        self._saturation_timeout = saturation_timeout
+        self._workers = [StdIOEndpoint(cmd, _PoolWorkerSink(self, i), env_vars=env_vars, header_mappings=header_mappings) for i in range(size)]  # type: ignore[arg-type]
+        self._inflight = [0] * size
+        self._restarts = [0] * size
+        self._supervisors: List[Optional[asyncio.Task[None]]] = [None] * size
+        self._pending: Dict[int, _PendingRequest] = {}
+        self._server_requests: Dict[str, Tuple[int, Any]] = {}
+        self._next_id = 0
+        self._capacity = asyncio.Condition()
+        self._additional_env_vars: Optional[Dict[str, str]] = None
+        self._init_request: Optional[Dict[str, Any]] = None
+        self._client_initialized = False
+        self._stopping = False
+
+    async def start(self, additional_env_vars: Optional[Dict[str, str]] = None) -> None:
+        """Start every child and its restart supervisor.
+
+        Args:
+            additional_env_vars: Extra environment variables for the children;
+                also reused when a crashed child is restarted.
+        """
+        if self.is_running():
+            await self.stop()
+        self._stopping = False
+        self._additional_env_vars = additional_env_vars
+        LOGGER.info(f"Starting stdio pool with {len(self._workers)} workers: {self._cmd}")
+        for index, worker in enumerate(self._workers):
+            await worker.start(additional_env_vars)
+            self._supervisors[index] = asyncio.create_task(self._supervise(index))
+
+    async def stop(self) -> None:
+        """Stop every child and fail requests still waiting for a reply.
+
+        Examples:
+            >>> import asyncio
+            >>> asyncio.run(StdIOPool("cat", _PubSub(), size=2).stop())  # safe before start
+        """
+        self._stopping = True
+        for index, task in enumerate(self._supervisors):
+            if task is not None:
+                task.cancel()
+                with suppress(BaseException):
+                    await task
+                self._supervisors[index] = None
+        for index, worker in enumerate(self._workers):
+            await worker.stop()
+            await self._fail_pending(index, "stdio worker stopped")
+
+    def is_running(self) -> bool:
+        """Check whether at least one child is running.
+
+        Returns:
+            True if any child process is running, False otherwise.
+        """
+        return any(worker.is_running() for worker in self._workers)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-child load and restart counters.
+
+        Returns:
+            Dict with pool size, pending request count and per-worker details.
+        """
+        return {
+            "size": len(self._workers),
+            "pending": len(self._pending),
+            "workers": [{"running": worker.is_running(), "inflight": self._inflight[i], "restarts": self._restarts[i]} for i, worker in enumerate(self._workers)],
+        }
+
+    async def send(self, raw: str, session_id: Optional[str] = None) -> None:
+        """Dispatch a client message (or batch) to the pool.
+
+        Args:
+            raw: Raw JSON-RPC message text.
+            session_id: Session that should receive the responses; None
+                broadcasts them to every subscriber.
+
+        Raises:
+            RuntimeError: If no child is running.
+        """
+        if not self.is_running():
+            raise RuntimeError("stdio endpoint not started")
+        try:
+            message = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Not JSON-RPC; hand it to one child untouched
+            await self._workers[self._least_loaded()].send(raw)
+            return
+        for item in message if isinstance(message, list) else [message]:
+            if isinstance(item, dict):
+                await self._dispatch(item, session_id)
+
+    async def _dispatch(self, message: Dict[str, Any], session_id: Optional[str]) -> None:
+        """Route one client message to the right child(ren).
+
+        Args:
+            message: Decoded JSON-RPC message.
+            session_id: Originating session.
+        """
+        method = message.get("method")
+        msg_id = message.get("id")
+
+        if method is None:
+            # Client reply to a request a child initiated (sampling, elicitation, ...)
+            route = self._server_requests.pop(str(msg_id), None)
+            if route is None:
+                LOGGER.debug(f"Dropping reply to unknown server request id {msg_id!r}")
+                return
+            index, original_id = route
+            await self._write(index, {**message, "id": original_id})
+            return
+
+        if msg_id is None:
+            await self._dispatch_notification(message, session_id)
+            return
+
+        index = await self._acquire()
+        if method == "initialize":
+            self._init_request = {k: v for k, v in message.items() if k != "id"}
+            for other, worker in enumerate(self._workers):
+                if other != index and worker.is_running():
+                    await self._reserve(other)
+                    await self._forward(other, message, None, internal=True)
+        await self._forward(index, message, session_id)
+
+    async def _dispatch_notification(self, message: Dict[str, Any], session_id: Optional[str]) -> None:
+        """Deliver a client notification.
+
+        Cancellations go to the child handling the request (with the id
+        rewritten); everything else goes to every child.
+
+        Args:
+            message: Decoded JSON-RPC notification.
+            session_id: Originating session.
+        """
+        method = message.get("method")
+        if method == "notifications/cancelled":
+            params = message.get("params") or {}
+            for routed_id, pending in self._pending.items():
+                if pending.session_id == session_id and pending.original_id == params.get("requestId") and not pending.internal:
+                    await self._write(pending.worker, {**message, "params": {**params, "requestId": routed_id}})
+                    break
+            return
+
+        if method == "notifications/initialized":
+            self._client_initialized = True
+        for index, worker in enumerate(self._workers):
+            if worker.is_running():
+                await self._write(index, message)
+
+    def _least_loaded(self) -> int:
+        """Pick the running child with the fewest in-flight requests.
+
+        Returns:
+            Child index (lowest index wins ties); 0 if nothing is running.
+        """
+        running = [i for i, worker in enumerate(self._workers) if worker.is_running()]
+        return min(running, key=lambda i: (self._inflight[i], i)) if running else 0
+
+    def _has_capacity(self) -> bool:
+        """Check whether any running child can take another request.
+
+        Returns:
+            True if a running child is below ``max_inflight``.
+        """
+        return any(worker.is_running() and self._inflight[i] < self._max_inflight for i, worker in enumerate(self._workers))
+
+    async def _acquire(self) -> int:
+        """Reserve a request slot on the least-loaded child, waiting for capacity.
+
+        Returns:
+            Index of the reserved child.
+
+        Raises:
+            StdIOPoolSaturatedError: If no slot frees up within ``saturation_timeout``.
+        """
+        async with self._capacity:
+            try:
+                await asyncio.wait_for(self._capacity.wait_for(self._has_capacity), timeout=self._saturation_timeout)
+            except asyncio.TimeoutError as exc:
+                raise StdIOPoolSaturatedError(f"All {len(self._workers)} stdio workers are busy ({self._max_inflight} in-flight requests each)") from exc
+            running = [i for i, worker in enumerate(self._workers) if worker.is_running() and self._inflight[i] < self._max_inflight]
+            index = min(running, key=lambda i: (self._inflight[i], i))
+            self._inflight[index] += 1
+            return index
+
+    async def _reserve(self, index: int) -> None:
+        """Take a slot on a specific child regardless of ``max_inflight``.
+
+        Used for pool-internal requests (handshake fan-out and replay) that
+        must reach that child even when it is saturated.
+
+        Args:
+            index: Child index.
+        """
+        async with self._capacity:
+            self._inflight[index] += 1
+
+    async def _release(self, index: int, count: int = 1) -> None:
+        """Return request slots on a child and wake waiting senders.
+
+        Args:
+            index: Child index.
+            count: Number of slots to release.
+        """
+        async with self._capacity:
+            self._inflight[index] = max(0, self._inflight[index] - count)
+            self._capacity.notify_all()
+
+    async def _forward(self, index: int, message: Dict[str, Any], session_id: Optional[str], internal: bool = False) -> None:
+        """Send a request to a child under a fresh pool-unique id.
+
+        The caller must already hold a slot on ``index``.
+
+        Args:
+            index: Child index.
+            message: Client request.
+            session_id: Session that should receive the reply.
+            internal: Swallow the reply instead of delivering it.
+
+        Raises:
+            Exception: Re-raised from the child's ``send`` after releasing the slot.
+        """
+        self._next_id += 1
+        routed_id = self._next_id
+        self._pending[routed_id] = _PendingRequest(index, session_id, message.get("id"), internal)
+        try:
+            await self._write(index, {**message, "id": routed_id})
+        except Exception:
+            self._pending.pop(routed_id, None)
+            await self._release(index)
+            raise
+
+    async def _write(self, index: int, message: Dict[str, Any]) -> None:
+        """Serialize a message onto a child's stdin.
+
+        Args:
+            index: Child index.
+            message: JSON-RPC message.
+        """
+        await self._workers[index].send(orjson.dumps(message).decode() + "\n")
+
+    async def _deliver(self, session_id: Optional[str], message: Dict[str, Any]) -> None:
+        """Publish a message to one session, or to everyone when unknown.
+
+        Args:
+            session_id: Target session, or None to broadcast.
+            message: JSON-RPC message.
+        """
+        data = orjson.dumps(message).decode() + "\n"
+        if session_id is None:
+            await self._pubsub.publish(data)
+        else:
+            await self._pubsub.publish_to(session_id, data)
+
+    async def _on_worker_output(self, index: int, line: str) -> None:
+        """Handle one stdout line from a child.
+
+        Args:
+            index: Child index.
+            line: Raw stdout line.
+        """
+        try:
+            parsed = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            await self._pubsub.publish(line)
+            return
+
+        for message in parsed if isinstance(parsed, list) else [parsed]:
+            if not isinstance(message, dict):
+                continue
+            if "method" in message:
+                if message.get("id") is not None:
+                    # Server-initiated request: make its id unique across children
+                    pool_id = f"w{index}-{message['id']}"
+                    self._server_requests[pool_id] = (index, message["id"])
+                    message = {**message, "id": pool_id}
+                await self._deliver(None, message)
+                continue
+
+            pending = self._pending.pop(message.get("id"), None)  # type: ignore[arg-type]
+            if pending is None:
+                LOGGER.debug(f"Dropping response with unknown id {message.get('id')!r} from stdio worker {index}")
+                continue
+            await self._release(pending.worker)
+            if not pending.internal:
+                await self._deliver(pending.session_id, {**message, "id": pending.original_id})
+
+    async def _fail_pending(self, index: int, reason: str) -> None:
+        """Answer every outstanding request on a child with a JSON-RPC error.
+
+        Args:
+            index: Child index.
+            reason: Error message sent to the clients.
+        """
+        failed = [routed_id for routed_id, pending in self._pending.items() if pending.worker == index]
+        for routed_id in failed:
+            pending = self._pending.pop(routed_id)
+            if not pending.internal:
+                await self._deliver(pending.session_id, {"jsonrpc": "2.0", "id": pending.original_id, "error": {"code": -32603, "message": reason}})
+        for pool_id in [pool_id for pool_id, (worker, _) in self._server_requests.items() if worker == index]:
+            del self._server_requests[pool_id]
+        await self._release(index, self._inflight[index])
+
+    async def _supervise(self, index: int) -> None:
+        """Restart a child whenever it exits, with exponential backoff.
+
+        Args:
+            index: Child index.
+        """
+        worker = self._workers[index]
+        backoff = 1.0
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            proc = worker._proc  # pylint: disable=protected-access
+            started = loop.time()
+            returncode = await proc.wait() if proc is not None else None
+            if self._stopping:
+                return
+            LOGGER.warning(f"stdio worker {index} exited with code {returncode}; restarting in {backoff:.0f}s")
+            await worker.stop()
+            await self._fail_pending(index, f"stdio worker {index} exited")
+            if loop.time() - started > POOL_RESTART_MAX_BACKOFF:
+                backoff = 1.0
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, POOL_RESTART_MAX_BACKOFF)
+            if self._stopping:
+                return
+            try:
+                await worker.start(self._additional_env_vars)
+            except Exception as exc:
+                LOGGER.error(f"Failed to restart stdio worker {index}: {exc}")
+                continue
+            self._restarts[index] += 1
+            await self._replay_handshake(index)
+            # Wake senders that waited for capacity while the child was down
+            async with self._capacity:
+                self._capacity.notify_all()
+
+    async def _replay_handshake(self, index: int) -> None:
+        """Re-initialize a restarted child with the client's last handshake.
+
+        Args:
+            index: Child index.
+        """
+        if self._init_request is None:
+            return
+        await self._reserve(index)
+        await self._forward(index, {**self._init_request, "id": None}, None, internal=True)
+        if self._client_initialized:
+            await self._write(index, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+
 # ---------------------------------------------------------------------------#
 # SSE Event Parser                                                           #
 # ---------------------------------------------------------------------------#
@@ -736,8 +1588,8 @@ def _build_fastapi(
                 await stdio.stop()  # Stop existing process
                 await stdio.start(additional_env_vars)  # Start with new env vars
 
-        queue = pubsub.subscribe()
         session_id = uuid.uuid4().hex
+        queue = pubsub.subscribe(session_id)
 
         async def event_gen() -> AsyncIterator[Dict[str, Any]]:
             """Generate Server-Sent Events for the SSE stream.
@@ -822,8 +1674,6 @@ def _build_fastapi(
             Response: ``202 Accepted`` if the payload is forwarded successfully,
             or ``400 Bad Request`` when the body is not valid JSON.
         """
-        _ = session_id  # Unused but required for API compatibility
-
         # Extract environment variables from headers if dynamic env is enabled
         additional_env_vars = {}
         if header_mappings:
@@ -851,7 +1701,7 @@ def _build_fastapi(
                 f"Invalid JSON payload: {exc}",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
-        await stdio.send(payload.decode().rstrip() + "\n")
+        await stdio.send(payload.decode().rstrip() + "\n", session_id=session_id)
         return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # ----- Liveness ---------------------------------------------------------#
@@ -966,6 +1816,11 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         >>> args = _parse_args(["--connect-sse", "http://example.com/sse"])
         >>> args.stdioCommand is None
         True
+
+        >>> # Test worker pool options
+        >>> args = _parse_args(["--stdio", "cat", "--pool-size", "4"])
+        >>> args.pool_size, args.pool_max_inflight == DEFAULT_POOL_MAX_INFLIGHT
+        (4, True)
     """
     p = argparse.ArgumentParser(
         prog="mcpgateway.translate",
@@ -1052,6 +1907,22 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
         help="Return JSON responses instead of SSE streams for streamable HTTP (default: False)",
     )
 
+    # Worker pool for --stdio mode
+    p.add_argument(
+        "--pool-size",
+        dest="pool_size",
+        type=int,
+        default=1,
+        help="Number of stdio child processes to run behind a JSON-RPC dispatcher (default: 1)",
+    )
+    p.add_argument(
+        "--pool-max-inflight",
+        dest="pool_max_inflight",
+        type=int,
+        default=DEFAULT_POOL_MAX_INFLIGHT,
+        help=f"Maximum concurrent requests per pooled child before backpressure (default: {DEFAULT_POOL_MAX_INFLIGHT})",
+    )
+
     args = p.parse_args(argv)
     # streamableHttp is now supported, no need to raise NotImplementedError
     return args
@@ -1804,6 +2675,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     stateless: bool = False,
     json_response: bool = False,
     header_mappings: Optional[NormalizedMappings] = None,
+    pool_size: int = 1,
+    pool_max_inflight: int = DEFAULT_POOL_MAX_INFLIGHT,
 ) -> None:
     """Run a stdio server and expose it via multiple protocols simultaneously.
 
@@ -1821,6 +2694,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         stateless: Whether to use stateless mode for streamable HTTP.
         json_response: Whether to return JSON responses for streamable HTTP.
         header_mappings: Optional mapping of HTTP headers to environment variables.
+        pool_size: Number of stdio child processes; values above 1 run them behind a StdIOPool.
+        pool_max_inflight: Per-child in-flight request limit when pooling.
     """
     LOGGER.info(f"Starting multi-protocol server for command: {cmd}")
     LOGGER.info(f"Protocols: SSE={expose_sse}, StreamableHTTP={expose_streamable_http}")
@@ -1828,8 +2703,13 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
     # Create a shared pubsub whenever either protocol needs stdout observations
     pubsub = _PubSub() if (expose_sse or expose_streamable_http) else None
 
-    # Create the stdio endpoint
-    stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings) if (expose_sse or expose_streamable_http) and pubsub else None
+    # Create the stdio endpoint (or a pool of them)
+    stdio: Optional[StdIOEndpoint | StdIOPool] = None
+    if (expose_sse or expose_streamable_http) and pubsub:
+        if pool_size > 1:
+            stdio = StdIOPool(cmd, pubsub, size=pool_size, header_mappings=header_mappings, max_inflight=pool_max_inflight)
+        else:
+            stdio = StdIOEndpoint(cmd, pubsub, header_mappings=header_mappings)
 
     # Create fastapi app and middleware
     app = FastAPI()
@@ -1876,8 +2756,8 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                     await stdio.stop()  # Stop existing process
                     await stdio.start(additional_env_vars)  # Start with new env vars
 
-            queue = pubsub.subscribe()
             session_id = uuid.uuid4().hex
+            queue = pubsub.subscribe(session_id)
 
             async def event_gen() -> AsyncIterator[Dict[str, Any]]:
                 """Generate SSE events for the client.
@@ -1933,10 +2813,9 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                 session_id: Optional session ID for correlation.
 
             Returns:
-                Response: Acknowledgement of message receipt.
+                Response: Acknowledgement of message receipt, or ``503`` when
+                every pooled stdio worker is saturated.
             """
-            _ = session_id
-
             # Extract environment variables from headers if dynamic env is enabled
             additional_env_vars = {}
             if header_mappings and stdio:
@@ -1966,7 +2845,10 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                 )
             if not stdio:
                 raise RuntimeError("Stdio endpoint not available")
-            await stdio.send(payload.decode().rstrip() + "\n")
+            try:
+                await stdio.send(payload.decode().rstrip() + "\n", session_id=session_id)
+            except StdIOPoolSaturatedError as exc:
+                return PlainTextResponse(str(exc), status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
             return PlainTextResponse("forwarded", status_code=status.HTTP_202_ACCEPTED)
 
     # Add health check
@@ -1979,6 +2861,15 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
         """
         return PlainTextResponse("ok")
 
+    @app.get("/stats")
+    async def stats() -> Response:
+        """Bridge statistics endpoint.
+
+        Returns:
+            Response: JSON with the subscriber delivery/drop counters and the worker pool statistics (``null`` without ``--pool-size``).
+        """
+        return ORJSONResponse({"pubsub": pubsub.stats() if pubsub else None, "pool": stdio.stats() if isinstance(stdio, StdIOPool) else None})
+
     # Streamable HTTP support
     streamable_server = None
     streamable_manager = None
@@ -2019,6 +2910,7 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
                     - 200 OK with matched JSON response if correlation succeeds.
                     - 202 Accepted if no matching response is received in time or for notifications.
                     - 400 Bad Request if the payload is not valid JSON.
+                    - 503 Service Unavailable if every pooled stdio worker is saturated.
 
             Example:
                 >>> import httpx
@@ -2035,50 +2927,54 @@ async def _run_multi_protocol_server(  # pylint: disable=too-many-positional-arg
             except Exception as exc:
                 return PlainTextResponse(f"Invalid JSON payload: {exc}", status_code=status.HTTP_400_BAD_REQUEST)
 
-            # Forward raw newline-delimited JSON to stdio
             if not stdio:
                 raise RuntimeError("Stdio endpoint not available")
-            await stdio.send(body.decode().rstrip() + "\n")
-
-            # If it's a request (has an id) -> attempt to correlate response from stdio
-            if isinstance(obj, dict) and "id" in obj:
-                if not pubsub:
-                    return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
 
-                queue = pubsub.subscribe()
+            # Notifications (no id) need no correlation
+            if not (isinstance(obj, dict) and "id" in obj) or not pubsub:
                 try:
-                    timeout = 10.0  # seconds; tuneable
-                    deadline = asyncio.get_event_loop().time() + timeout
-                    while True:
-                        remaining = max(0.0, deadline - asyncio.get_event_loop().time())
-                        if remaining == 0:
-                            break
-                        try:
-                            msg = await asyncio.wait_for(queue.get(), timeout=remaining)
-                        except asyncio.TimeoutError:
-                            break
+                    await stdio.send(body.decode().rstrip() + "\n")
+                except StdIOPoolSaturatedError as exc:
+                    return PlainTextResponse(str(exc), status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+                return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
+
+            # Request (has an id) -> subscribe before forwarding so the response cannot be missed
+            request_session = f"mcp-{uuid.uuid4().hex}"
+            queue = pubsub.subscribe(request_session)
+            try:
+                try:
+                    await stdio.send(body.decode().rstrip() + "\n", session_id=request_session)
+                except StdIOPoolSaturatedError as exc:
+                    return PlainTextResponse(str(exc), status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-                        # stdio stdout lines may contain JSON objects or arrays
-                        try:
-                            parsed = orjson.loads(msg)
-                        except (orjson.JSONDecodeError, ValueError):
-                            # not JSON -> skip
-                            continue
-
-                        candidates = parsed if isinstance(parsed, list) else [parsed]
-                        for candidate in candidates:
-                            if isinstance(candidate, dict) and candidate.get("id") == obj.get("id"):
-                                # return the matched response as JSON
-                                return ORJSONResponse(candidate)
-
-                    # timeout -> accept and return 202
-                    return PlainTextResponse("accepted (no response yet)", status_code=status.HTTP_202_ACCEPTED)
-                finally:
-                    if pubsub:
-                        pubsub.unsubscribe(queue)
+                timeout = 10.0  # seconds; tuneable
+                deadline = asyncio.get_event_loop().time() + timeout
+                while True:
+                    remaining = max(0.0, deadline - asyncio.get_event_loop().time())
+                    if remaining == 0:
+                        break
+                    try:
+                        msg = await asyncio.wait_for(queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
 
-            # Notification -> return 202
-            return PlainTextResponse("accepted", status_code=status.HTTP_202_ACCEPTED)
+                    # stdio stdout lines may contain JSON objects or arrays
+                    try:
+                        parsed = orjson.loads(msg)
+                    except (orjson.JSONDecodeError, ValueError):
+                        # not JSON -> skip
+                        continue
+
+                    candidates = parsed if isinstance(parsed, list) else [parsed]
+                    for candidate in candidates:
+                        if isinstance(candidate, dict) and candidate.get("id") == obj.get("id"):
+                            # return the matched response as JSON
+                            return ORJSONResponse(candidate)
+
+                # timeout -> accept and return 202
+                return PlainTextResponse("accepted (no response yet)", status_code=status.HTTP_202_ACCEPTED)
+            finally:
+                pubsub.unsubscribe(queue)
 
         # ASGI wrapper to route GET/other /mcp scopes to streamable_manager.handle_request
         async def mcp_asgi_wrapper(scope: Scope, receive: Receive, send: Send) -> None:
@@ -2431,6 +3327,8 @@ def main(argv: Optional[Sequence[str]] | None = None) -> None:
                     stateless=getattr(args, "stateless", False),
                     json_response=getattr(args, "jsonResponse", False),
                     header_mappings=header_mappings,
+                    pool_size=getattr(args, "pool_size", 1),
+                    pool_max_inflight=getattr(args, "pool_max_inflight", DEFAULT_POOL_MAX_INFLIGHT),
                 )
             )
 
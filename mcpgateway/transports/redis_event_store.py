@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/transports/redis_event_store.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Redis Streams event store for streamable HTTP resumability.
+
+The in-memory event store only lets a client resume (``Last-Event-ID``) on the
+worker that produced the events. This store keeps each MCP stream in a Redis
+Stream instead, so any gateway worker can replay it:
+
+- ``store_event`` appends with ``XADD ... MAXLEN`` (an exact XTRIM on every
+  write) and refreshes the key TTL, so each stream stays capped and abandoned
+  streams expire.
+- Event IDs are ``<stream_id>:<redis entry id>``; ``replay_events_after`` seeks
+  to the entry with ``XRANGE (<id> +``, which is O(log n) in the stream's
+  radix tree, then pages through the k newer entries.
+- Without Redis, calls go to the fallback store, and the shared client is looked
+  up again after a backoff that doubles from 1 to 60 seconds.
+
+Examples:
+    >>> store = RedisEventStore(max_events_per_stream=10, ttl=60)
+    >>> store.max_events_per_stream
+    10
+    >>> store._key("abc")
+    'mcpgw:events:abc'
+    >>> RedisEventStore._split_event_id("abc:1700000000000-0")
+    ('abc', '1700000000000-0')
+    >>> RedisEventStore._split_event_id("not-an-event") is None
+    True
+"""
+
+# Standard
+import logging
+import re
+import time
+from typing import Any, Optional, Union
+
+# Third-Party
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.types import JSONRPCMessage
+
+logger = logging.getLogger(__name__)
+
+_ENTRY_ID_RE = re.compile(r"^\d+-\d+$")
+_MESSAGE_FIELD = "m"
+
+# Seconds before looking up an unavailable Redis again, doubling up to the maximum
+_REDIS_RETRY_MIN = 1.0
+_REDIS_RETRY_MAX = 60.0
+
+
+def _text(value: Union[str, bytes]) -> str:
+    """Decode a Redis reply that may be bytes when decode_responses is off.
+
+    Args:
+        value: Redis reply value.
+
+    Returns:
+        The value as a string.
+
+    Examples:
+        >>> _text(b"1-0"), _text("1-0")
+        ('1-0', '1-0')
+    """
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisEventStore(EventStore):
+    """EventStore persisting streamable HTTP events in Redis Streams.
+
+    When no Redis client is available (``CACHE_TYPE`` is not ``redis`` or the
+    connection failed) all calls are delegated to the optional fallback store.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Any] = None,
+        max_events_per_stream: int = 100,
+        ttl: int = 3600,
+        key_prefix: str = "mcpgw:events",
+        replay_batch_size: int = 100,
+        fallback: Optional[EventStore] = None,
+    ):
+        """Initialize the event store.
+
+        Args:
+            redis: Async Redis client; the shared gateway client is used when omitted.
+            max_events_per_stream: Maximum number of events kept per stream.
+            ttl: Seconds a stream is kept after its last event.
+            key_prefix: Prefix of the Redis stream keys.
+            replay_batch_size: Number of entries fetched per XRANGE page during replay.
+            fallback: Store used when Redis is unavailable.
+        """
+        self._redis = redis
+        self._retry_at = 0.0
+        self._retry_delay = _REDIS_RETRY_MIN
+        self.max_events_per_stream = max_events_per_stream
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.replay_batch_size = replay_batch_size
+        self.fallback = fallback
+
+    def _key(self, stream_id: StreamId) -> str:
+        """Return the Redis key of a stream.
+
+        Args:
+            stream_id: The MCP stream ID.
+
+        Returns:
+            The Redis stream key.
+        """
+        return f"{self.key_prefix}:{stream_id}"
+
+    @staticmethod
+    def _split_event_id(event_id: EventId) -> Optional[tuple[str, str]]:
+        """Split an event ID into its stream ID and Redis entry ID.
+
+        Args:
+            event_id: Event ID produced by :meth:`store_event`.
+
+        Returns:
+            Tuple of (stream ID, entry ID), or None if the ID was not issued by this store.
+        """
+        stream_id, _, entry_id = event_id.rpartition(":")
+        if not stream_id or not _ENTRY_ID_RE.match(entry_id):
+            return None
+        return stream_id, entry_id
+
+    async def _client(self) -> Optional[Any]:
+        """Return the Redis client, resolving the shared client on first use.
+
+        An unavailable client is looked up again once the retry backoff elapsed.
+
+        Returns:
+            The async Redis client, or None if Redis is unavailable.
+        """
+        if self._redis is not None:
+            return self._redis
+        now = time.monotonic()
+        if now < self._retry_at:
+            return None
+        # First-Party
+        from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+        self._redis = await get_redis_client()
+        if self._redis is None:
+            logger.warning(
+                "Redis unavailable for the streamable HTTP event store; %s (retrying in %gs)",
+                "using fallback store" if self.fallback else "events will not be stored",
+                self._retry_delay,
+            )
+            self._retry_at = now + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, _REDIS_RETRY_MAX)
+            return None
+        self._retry_delay = _REDIS_RETRY_MIN
+        return self._redis
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        """Append an event to the stream, trimming it to max_events_per_stream.
+
+        Args:
+            stream_id: The ID of the stream.
+            message: The message to store.
+
+        Returns:
+            The ID of the stored event.
+
+        Raises:
+            RuntimeError: If Redis is unavailable and no fallback store is configured.
+        """
+        client = await self._client()
+        if client is None:
+            if self.fallback is None:
+                raise RuntimeError("Redis event store unavailable")
+            return await self.fallback.store_event(stream_id, message)
+
+        key = self._key(stream_id)
+        data = message.model_dump_json(by_alias=True, exclude_none=True)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, {_MESSAGE_FIELD: data}, maxlen=self.max_events_per_stream, approximate=False)
+            pipe.expire(key, self.ttl)
+            entry_id, _ = await pipe.execute()
+        return f"{stream_id}:{_text(entry_id)}"
+
+    async def replay_events_after(self, last_event_id: EventId, send_callback: EventCallback) -> Union[StreamId, None]:
+        """Replay the events stored after last_event_id.
+
+        Args:
+            last_event_id: The ID of the last event the client received.
+            send_callback: Async callback to send each replayed event.
+
+        Returns:
+            The stream ID if the event is still retained, otherwise None.
+        """
+        client = await self._client()
+        if client is None:
+            return await self.fallback.replay_events_after(last_event_id, send_callback) if self.fallback else None
+
+        parts = self._split_event_id(last_event_id)
+        if parts is None:
+            if self.fallback is not None:
+                # Issued by the fallback store before Redis became available
+                return await self.fallback.replay_events_after(last_event_id, send_callback)
+            logger.warning("Event ID %s not found in store", last_event_id)
+            return None
+        stream_id, entry_id = parts
+        key = self._key(stream_id)
+
+        # Resuming after a trimmed or expired event would silently skip messages
+        if not await client.xrange(key, min=entry_id, max=entry_id, count=1):
+            logger.warning("Event ID %s not found in store", last_event_id)
+            return None
+
+        cursor = entry_id
+        while True:
+            entries = await client.xrange(key, min=f"({cursor}", max="+", count=self.replay_batch_size)
+            for raw_id, fields in entries:
+                cursor = _text(raw_id)
+                data = fields.get(_MESSAGE_FIELD) or fields.get(_MESSAGE_FIELD.encode())
+                await send_callback(EventMessage(JSONRPCMessage.model_validate_json(data), f"{stream_id}:{cursor}"))
+            if len(entries) < self.replay_batch_size:
+                break
+        return stream_id
@@ -13,6 +13,7 @@ Key components include:
         1. stateful/stateless operation
         2. JSON response mode or SSE streams
 - InMemoryEventStore: A simple in-memory event storage system for maintaining session state
+- RedisEventStore (redis_event_store.py): Redis Streams event store shared by all workers
 
 Examples:
     >>> # Test module imports
@@ -48,12 +49,14 @@ from mcp.server.lowlevel import Server
 from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.types import JSONRPCMessage
+import orjson
 from sqlalchemy.orm import Session
 from starlette.datastructures import Headers
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 from starlette.types import Receive, Scope, Send
 
 # First-Party
+from mcpgateway.cache.list_response_cache import get_list_response_cache
 from mcpgateway.common.models import LogLevel
 from mcpgateway.config import settings
 from mcpgateway.db import SessionLocal
@@ -62,6 +65,7 @@ from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.services.prompt_service import PromptService
 from mcpgateway.services.resource_service import ResourceService
 from mcpgateway.services.tool_service import ToolService
+from mcpgateway.utils.jsonrpc_batch import check_batch, error_response, execute_batch, is_batch
 from mcpgateway.utils.orjson_response import ORJSONResponse
 from mcpgateway.utils.verify_credentials import verify_credentials
 
@@ -103,6 +107,8 @@ class EventEntry:
         'stream-456'
         >>> entry.seq_num
         0
+        >>> entry.size
+        0
         >>> # Access message attributes through model_dump() for Pydantic v2
         >>> message_dict = message.model_dump()
         >>> message_dict['jsonrpc']
@@ -117,6 +123,7 @@ class EventEntry:
     stream_id: StreamId
     message: JSONRPCMessage
     seq_num: int
+    size: int = 0  # serialized size in bytes, tracked when the store is byte-bounded
 
 
 @dataclass
@@ -138,6 +145,8 @@ class StreamBuffer:
         0
         >>> len(buffer)
         0
+        >>> buffer.total_bytes
+        0
 
         >>> # Simulate adding an entry
         >>> buffer.next_seq = 1
@@ -150,6 +159,7 @@ class StreamBuffer:
     start_seq: int = 0  # oldest seq still buffered
     next_seq: int = 0  # seq assigned to next insert
     count: int = 0
+    total_bytes: int = 0  # sum of entry sizes
 
     def __len__(self) -> int:
         """Return the number of events currently in the buffer.
@@ -166,7 +176,8 @@ class InMemoryEventStore(EventStore):
     This is primarily intended for examples and testing, not for production use
     where a persistent storage solution would be more appropriate.
 
-    This implementation keeps only the last N events per stream for memory efficiency.
+    This implementation keeps only the last N events per stream for memory efficiency,
+    and optionally evicts the oldest events once a stream exceeds max_bytes_per_stream.
     Uses a ring buffer with per-stream sequence numbers for O(1) event lookup and O(k) replay.
 
     Examples:
@@ -196,11 +207,13 @@ class InMemoryEventStore(EventStore):
         True
     """
 
-    def __init__(self, max_events_per_stream: int = 100):
+    def __init__(self, max_events_per_stream: int = 100, max_bytes_per_stream: int = 0):
         """Initialize the event store.
 
         Args:
             max_events_per_stream: Maximum number of events to keep per stream
+            max_bytes_per_stream: Maximum serialized size of the events kept per stream (0 = unbounded).
+                The newest event is always kept, even if it alone exceeds the limit.
 
         Examples:
             >>> # Test initialization with default value
@@ -216,8 +229,11 @@ class InMemoryEventStore(EventStore):
             >>> store = InMemoryEventStore(max_events_per_stream=25)
             >>> store.max_events_per_stream
             25
+            >>> InMemoryEventStore(max_bytes_per_stream=4096).max_bytes_per_stream
+            4096
         """
         self.max_events_per_stream = max_events_per_stream
+        self.max_bytes_per_stream = max_bytes_per_stream
         # Per-stream ring buffers for O(1) position lookup
         self.streams: dict[StreamId, StreamBuffer] = {}
         # event_id -> EventEntry for quick lookup
@@ -277,6 +293,14 @@ class InMemoryEventStore(EventStore):
             False
             >>> id2 in store2.event_index and id3 in store2.event_index
             True
+
+            >>> # Test byte-bounded eviction
+            >>> store3 = InMemoryEventStore(max_events_per_stream=10, max_bytes_per_stream=120)
+            >>> ids = [asyncio.run(store3.store_event("s", JSONRPCMessage(jsonrpc="2.0", method="m" * 20, id=i))) for i in range(5)]
+            >>> len(store3.streams["s"]), store3.streams["s"].total_bytes <= 120
+            (2, True)
+            >>> ids[0] in store3.event_index, ids[4] in store3.event_index
+            (False, True)
         """
         # Get or create ring buffer for this stream
         buffer = self.streams.get(stream_id)
@@ -294,6 +318,7 @@ class InMemoryEventStore(EventStore):
             evicted = buffer.entries[idx]
             if evicted is not None:
                 self.event_index.pop(evicted.event_id, None)
+                buffer.total_bytes -= evicted.size
             buffer.start_seq += 1
         else:
             if buffer.count == 0:
@@ -302,9 +327,22 @@ class InMemoryEventStore(EventStore):
 
         # Create and store the new event entry
         event_id = str(uuid4())
-        event_entry = EventEntry(event_id=event_id, stream_id=stream_id, message=message, seq_num=seq_num)
+        size = len(message.model_dump_json(by_alias=True, exclude_none=True)) if self.max_bytes_per_stream else 0
+        event_entry = EventEntry(event_id=event_id, stream_id=stream_id, message=message, seq_num=seq_num, size=size)
         buffer.entries[idx] = event_entry
         self.event_index[event_id] = event_entry
+        buffer.total_bytes += size
+
+        # Evict oldest events until the stream fits its byte budget, keeping the newest
+        while self.max_bytes_per_stream and buffer.total_bytes > self.max_bytes_per_stream and buffer.count > 1:
+            oldest_idx = buffer.start_seq % self.max_events_per_stream
+            oldest = buffer.entries[oldest_idx]
+            buffer.entries[oldest_idx] = None
+            if oldest is not None:
+                self.event_index.pop(oldest.event_id, None)
+                buffer.total_bytes -= oldest.size
+            buffer.start_seq += 1
+            buffer.count -= 1
 
         return event_id
 
@@ -381,6 +419,37 @@ class InMemoryEventStore(EventStore):
         return last_event.stream_id
 
 
+def create_event_store() -> EventStore:
+    """Create the event store selected by STREAMABLE_HTTP_EVENT_STORE.
+
+    Returns:
+        A RedisEventStore (falling back to memory when Redis is unavailable) or an InMemoryEventStore.
+
+    Examples:
+        >>> from unittest.mock import patch
+        >>> with patch.object(settings, "streamable_http_event_store", "memory"):
+        ...     type(create_event_store()).__name__
+        'InMemoryEventStore'
+        >>> with patch.object(settings, "streamable_http_event_store", "redis"):
+        ...     type(create_event_store()).__name__
+        'RedisEventStore'
+    """
+    memory_store = InMemoryEventStore(
+        max_events_per_stream=settings.streamable_http_max_events_per_stream,
+        max_bytes_per_stream=settings.streamable_http_max_bytes_per_stream,
+    )
+    if settings.streamable_http_event_store == "redis":
+        # First-Party
+        from mcpgateway.transports.redis_event_store import RedisEventStore  # pylint: disable=import-outside-toplevel
+
+        return RedisEventStore(
+            max_events_per_stream=settings.streamable_http_max_events_per_stream,
+            ttl=settings.streamable_http_event_ttl,
+            fallback=memory_store,
+        )
+    return memory_store
+
+
 # ------------------------------ Streamable HTTP Transport ------------------------------
 
 
@@ -698,11 +767,23 @@ async def list_tools() -> List[types.Tool]:
     elif token_teams is None:
         token_teams = []  # Non-admin without teams = public-only (secure default)
 
+    # Reuse the SDK objects built for this caller scope when nothing changed
+    list_cache = get_list_response_cache()
+    cache_key = list_cache.make_key("tools", server_id, None, user_email, token_teams, representation="mcp")
+    generation = list_cache.generation("tools")
+    cached = list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     if server_id:
         try:
             async with get_db() as db:
                 tools = await tool_service.list_server_tools(db, server_id, user_email=user_email, token_teams=token_teams, _request_headers=request_headers)
-                return [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools]
+                return list_cache.set(
+                    cache_key,
+                    [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools],
+                    generation,
+                )
         except Exception as e:
             logger.exception(f"Error listing tools:{e}")
             return []
@@ -710,7 +791,11 @@ async def list_tools() -> List[types.Tool]:
         try:
             async with get_db() as db:
                 tools, _ = await tool_service.list_tools(db, include_inactive=False, limit=0, user_email=user_email, token_teams=token_teams, _request_headers=request_headers)
-                return [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools]
+                return list_cache.set(
+                    cache_key,
+                    [types.Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema, outputSchema=tool.output_schema, annotations=tool.annotations) for tool in tools],
+                    generation,
+                )
         except Exception as e:
             logger.exception(f"Error listing tools:{e}")
             return []
@@ -750,11 +835,18 @@ async def list_prompts() -> List[types.Prompt]:
     elif token_teams is None:
         token_teams = []  # Non-admin without teams = public-only (secure default)
 
+    list_cache = get_list_response_cache()
+    cache_key = list_cache.make_key("prompts", server_id, None, user_email, token_teams, representation="mcp")
+    generation = list_cache.generation("prompts")
+    cached = list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     if server_id:
         try:
             async with get_db() as db:
                 prompts = await prompt_service.list_server_prompts(db, server_id, user_email=user_email, token_teams=token_teams)
-                return [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts]
+                return list_cache.set(cache_key, [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts], generation)
         except Exception as e:
             logger.exception(f"Error listing Prompts:{e}")
             return []
@@ -762,7 +854,7 @@ async def list_prompts() -> List[types.Prompt]:
         try:
             async with get_db() as db:
                 prompts, _ = await prompt_service.list_prompts(db, include_inactive=False, limit=0, user_email=user_email, token_teams=token_teams)
-                return [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts]
+                return list_cache.set(cache_key, [types.Prompt(name=prompt.name, description=prompt.description, arguments=prompt.arguments) for prompt in prompts], generation)
         except Exception as e:
             logger.exception(f"Error listing prompts:{e}")
             return []
@@ -875,11 +967,20 @@ async def list_resources() -> List[types.Resource]:
     elif token_teams is None:
         token_teams = []  # Non-admin without teams = public-only (secure default)
 
+    list_cache = get_list_response_cache()
+    cache_key = list_cache.make_key("resources", server_id, None, user_email, token_teams, representation="mcp")
+    generation = list_cache.generation("resources")
+    cached = list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     if server_id:
         try:
             async with get_db() as db:
                 resources = await resource_service.list_server_resources(db, server_id, user_email=user_email, token_teams=token_teams)
-                return [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources]
+                return list_cache.set(
+                    cache_key, [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources], generation
+                )
         except Exception as e:
             logger.exception(f"Error listing Resources:{e}")
             return []
@@ -887,7 +988,9 @@ async def list_resources() -> List[types.Resource]:
         try:
             async with get_db() as db:
                 resources, _ = await resource_service.list_resources(db, include_inactive=False, limit=0, user_email=user_email, token_teams=token_teams)
-                return [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources]
+                return list_cache.set(
+                    cache_key, [types.Resource(uri=resource.uri, name=resource.name, description=resource.description, mimeType=resource.mime_type) for resource in resources], generation
+                )
         except Exception as e:
             logger.exception(f"Error listing resources:{e}")
             return []
@@ -1160,7 +1263,7 @@ class SessionManagerWrapper:
         """
 
         if settings.use_stateful_sessions:
-            event_store = InMemoryEventStore()
+            event_store = create_event_store()
             stateless = False
         else:
             event_store = None
@@ -1249,6 +1352,12 @@ class SessionManagerWrapper:
             server_id_var.set(None)
 
         try:
+            if receive is not None and scope.get("method") == "POST" and "application/json" in headers.get("content-type", ""):
+                body = await _read_body(receive)
+                if is_batch(body):
+                    await self._handle_batch(scope, body, send)
+                    return
+                receive = _replay_body(body, receive)
             await self.session_manager.handle_request(scope, receive, send)
         except anyio.ClosedResourceError:
             # Expected when client closes one side of the stream (normal lifecycle)
@@ -1257,6 +1366,208 @@ class SessionManagerWrapper:
             logger.exception(f"Error handling streamable HTTP request: {e}")
             raise
 
+    async def _handle_batch(self, scope: Scope, body: bytes, send: Send) -> None:
+        """
+        Execute a JSON-RPC batch array by forwarding each entry as its own request.
+
+        The MCP session manager only accepts single messages, so every entry is
+        replayed through it with a copy of the original scope (same headers and
+        session id) and its response is captured from the JSON body or the SSE
+        stream. The collected responses are returned as one JSON array.
+
+        Args:
+            scope (Scope): ASGI scope of the batch request.
+            body (bytes): Raw request body holding the batch array.
+            send (Send): ASGI send callable.
+        """
+        try:
+            batch = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            await ORJSONResponse(status_code=400, content=error_response(-32700, "Parse error"))(scope, _no_receive, send)
+            return
+
+        error = check_batch(batch, settings.jsonrpc_batch_max_size)
+        if error:
+            await ORJSONResponse(status_code=400, content=error)(scope, _no_receive, send)
+            return
+
+        entry_headers = [(key, value) for key, value in scope.get("headers", []) if key.lower() != b"content-length"]
+
+        async def handle(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            """Forward one batch entry to the session manager.
+
+            Args:
+                entry: Batch entry
+
+            Returns:
+                The entry's JSON-RPC response, or None if none was produced
+            """
+            entry_body = orjson.dumps(entry)
+            entry_scope = {**scope, "headers": entry_headers + [(b"content-length", str(len(entry_body)).encode())]}
+            captured = _CapturedResponse()
+            try:
+                await self.session_manager.handle_request(entry_scope, _replay_body(entry_body, captured.wait_disconnect), captured.send)
+            finally:
+                captured.finish()
+            response = captured.message()
+            if response is None and "id" in entry and captured.status >= 400:
+                response = error_response(-32600, "Invalid Request", entry.get("id"), captured.body.decode(errors="replace") or None)
+            return response
+
+        responses = await execute_batch(batch, handle, settings.jsonrpc_batch_max_concurrency)
+        if not responses:
+            await send({"type": "http.response.start", "status": 202, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await ORJSONResponse(content=responses)(scope, _no_receive, send)
+
+
+class _CapturedResponse:
+    """Collects the ASGI response of one batch entry."""
+
+    def __init__(self) -> None:
+        """Initialize an empty capture."""
+        self.status = 0
+        self.content_type = ""
+        self.body = b""
+        self._done = anyio.Event()
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        """ASGI send callable recording status, content type and body.
+
+        Args:
+            message: ASGI message
+        """
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            self.content_type = dict(Headers(raw=message.get("headers", []))).get("content-type", "")
+        elif message["type"] == "http.response.body":
+            self.body += message.get("body", b"")
+
+    async def wait_disconnect(self) -> Dict[str, Any]:
+        """ASGI receive callable that reports a disconnect once the entry is done.
+
+        Returns:
+            An ``http.disconnect`` message
+        """
+        await self._done.wait()
+        return {"type": "http.disconnect"}
+
+    def finish(self) -> None:
+        """Mark the entry as handled, releasing pending receive calls."""
+        self._done.set()
+
+    def message(self) -> Optional[Dict[str, Any]]:
+        """Extract the JSON-RPC response from the captured body.
+
+        Returns:
+            The response object, or None if the body holds none (e.g. 202 for notifications)
+
+        Examples:
+            >>> captured = _CapturedResponse()
+            >>> captured.content_type = "text/event-stream"
+            >>> captured.body = b'event: message\\r\\ndata: {"jsonrpc":"2.0","result":{},"id":1}\\r\\n\\r\\n'
+            >>> captured.message()
+            {'jsonrpc': '2.0', 'result': {}, 'id': 1}
+            >>> captured.content_type, captured.body = "application/json", b'{"jsonrpc":"2.0","error":{"code":-32601,"message":"x"},"id":2}'
+            >>> captured.message()["error"]["code"]
+            -32601
+            >>> captured.body = b""
+            >>> captured.message() is None
+            True
+        """
+        if not self.body:
+            return None
+        if self.content_type.startswith("text/event-stream"):
+            payloads = [line[5:].strip() for line in self.body.splitlines() if line.startswith(b"data:")]
+        else:
+            payloads = [self.body]
+        for payload in reversed(payloads):
+            try:
+                message = orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(message, dict) and ("result" in message or "error" in message):
+                return message
+        return None
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """
+    Read the complete request body from an ASGI receive callable.
+
+    Args:
+        receive (Receive): ASGI receive callable.
+
+    Returns:
+        bytes: The request body.
+
+    Examples:
+        >>> import asyncio
+        >>> messages = iter([{"type": "http.request", "body": b"[1,", "more_body": True}, {"type": "http.request", "body": b"2]"}])
+        >>> async def receive():
+        ...     return next(messages)
+        >>> asyncio.run(_read_body(receive))
+        b'[1,2]'
+    """
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """
+    Wrap a receive callable so the already-read body is delivered first.
+
+    Args:
+        body (bytes): Body to deliver on the first call.
+        receive (Receive): Receive callable used for subsequent calls.
+
+    Returns:
+        Receive: The wrapped receive callable.
+
+    Examples:
+        >>> import asyncio
+        >>> async def disconnect():
+        ...     return {"type": "http.disconnect"}
+        >>> replay = _replay_body(b"{}", disconnect)
+        >>> asyncio.run(replay())
+        {'type': 'http.request', 'body': b'{}', 'more_body': False}
+        >>> asyncio.run(replay())
+        {'type': 'http.disconnect'}
+    """
+    delivered = False
+
+    async def replay() -> Dict[str, Any]:
+        """Return the buffered body once, then delegate.
+
+        Returns:
+            The next ASGI message
+        """
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+async def _no_receive() -> Dict[str, Any]:
+    """
+    Receive callable for responses sent after the request body was consumed.
+
+    Returns:
+        Dict[str, Any]: An ``http.disconnect`` message.
+    """
+    return {"type": "http.disconnect"}
+
 
 # ------------------------- Authentication for /mcp routes ------------------------------
 
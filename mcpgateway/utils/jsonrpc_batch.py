@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/jsonrpc_batch.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+JSON-RPC batch execution.
+
+Runs the entries of a JSON-RPC 2.0 batch array concurrently, with a cap on
+the number of entries in flight, and collects their responses in request
+order. Notifications (entries without an ``id``) are executed but produce no
+response, as required by the specification. Used by the ``/rpc`` endpoint and
+the streamable HTTP transport; each caller supplies the handler for a single
+entry.
+
+Examples:
+    >>> import asyncio
+    >>> async def echo(entry):
+    ...     return {"jsonrpc": "2.0", "result": entry["params"], "id": entry["id"]}
+    >>> batch = [
+    ...     {"jsonrpc": "2.0", "method": "echo", "params": [1], "id": 1},
+    ...     {"jsonrpc": "2.0", "method": "notify", "params": []},
+    ...     "bogus",
+    ... ]
+    >>> asyncio.run(execute_batch(batch, echo, max_concurrency=2))
+    [{'jsonrpc': '2.0', 'result': [1], 'id': 1}, {'jsonrpc': '2.0', 'error': {'code': -32600, 'message': 'Invalid Request'}, 'id': None}]
+"""
+
+# Standard
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# First-Party
+from mcpgateway.validation.jsonrpc import INTERNAL_ERROR, INVALID_REQUEST, JSONRPCError
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def error_response(code: int, message: str, request_id: Any = None, data: Any = None) -> Dict[str, Any]:
+    """Build a JSON-RPC error response.
+
+    Args:
+        code: Error code
+        message: Error message
+        request_id: ID of the failed request
+        data: Optional error data
+
+    Returns:
+        Error response dictionary
+
+    Examples:
+        >>> error_response(-32600, "Invalid Request")
+        {'jsonrpc': '2.0', 'error': {'code': -32600, 'message': 'Invalid Request'}, 'id': None}
+    """
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "error": error, "id": request_id}
+
+
+def is_batch(body: bytes) -> bool:
+    """Tell whether a raw request body holds a JSON array, without parsing it.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        True if the first non-whitespace byte opens an array
+
+    Examples:
+        >>> is_batch(b'  [{"jsonrpc": "2.0"}]'), is_batch(b'{"jsonrpc": "2.0"}'), is_batch(b"")
+        (True, False, False)
+    """
+    stripped = body.lstrip()
+    return stripped[:1] == b"["
+
+
+def check_batch(batch: List[Any], max_size: int) -> Optional[Dict[str, Any]]:
+    """Validate the batch as a whole.
+
+    Args:
+        batch: Parsed batch array
+        max_size: Maximum number of entries (0 disables batches)
+
+    Returns:
+        The error response for the whole batch, or None if it can be executed
+
+    Examples:
+        >>> check_batch([], 10)["error"]["message"]
+        'Invalid Request'
+        >>> check_batch([{}] * 3, 2)["error"]["message"]
+        'Batch too large'
+        >>> check_batch([{}], 0)["error"]["message"]
+        'Batch requests are disabled'
+        >>> check_batch([{}], 2) is None
+        True
+    """
+    if not batch:
+        return error_response(INVALID_REQUEST, "Invalid Request")
+    if max_size <= 0:
+        return error_response(INVALID_REQUEST, "Batch requests are disabled")
+    if len(batch) > max_size:
+        return error_response(INVALID_REQUEST, "Batch too large", data={"max_size": max_size, "size": len(batch)})
+    return None
+
+
+async def execute_batch(batch: List[Any], handler: BatchHandler, max_concurrency: int) -> List[Dict[str, Any]]:
+    """Execute batch entries concurrently and return their responses in order.
+
+    Entries that are not request objects get an Invalid Request error. A
+    ``JSONRPCError`` raised by the handler becomes the entry's error response;
+    other exceptions become Internal error responses, so one failing entry does
+    not fail the batch.
+
+    Args:
+        batch: Parsed batch array (checked with :func:`check_batch`)
+        handler: Coroutine handling one entry, returning its response dictionary
+        max_concurrency: Maximum number of entries executed at once
+
+    Returns:
+        Responses of the entries that are not notifications, in request order
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(entry: Any) -> Optional[Dict[str, Any]]:
+        """Execute one entry.
+
+        Args:
+            entry: Batch entry
+
+        Returns:
+            The entry's response, or None for notifications
+        """
+        if not isinstance(entry, dict) or not isinstance(entry.get("method"), str):
+            return error_response(INVALID_REQUEST, "Invalid Request", entry.get("id") if isinstance(entry, dict) else None)
+        is_notification = "id" not in entry
+        async with semaphore:
+            try:
+                response = await handler(entry)
+            except JSONRPCError as e:
+                response = error_response(e.code, e.message, entry.get("id"), e.data)
+            except Exception as e:
+                logger.error(f"JSON-RPC batch entry {entry.get('method')} failed: {e}")
+                response = error_response(INTERNAL_ERROR, "Internal error", entry.get("id"), str(e))
+        return None if is_notification else response
+
+    responses = await asyncio.gather(*(run(entry) for entry in batch))
+    return [response for response in responses if response is not None]
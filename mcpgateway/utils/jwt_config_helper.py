@@ -205,3 +205,8 @@ def clear_jwt_caches() -> None:
     get_jwt_public_key_or_secret.cache_clear()
     get_jwt_private_key_or_secret.cache_clear()
     _key_file_cache.clear()
+
+    # First-Party
+    from mcpgateway.cache.verified_token_cache import get_verified_token_cache  # pylint: disable=import-outside-toplevel
+
+    get_verified_token_cache().clear()
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/quantile_sketch.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Mergeable quantile sketch.
+
+A DDSketch keeps counts in logarithmically sized buckets, so every quantile it
+returns is within ``relative_accuracy`` of the true value, memory grows with
+the logarithm of the value range rather than the number of samples, and two
+sketches merge exactly by adding bucket counts. This makes it suitable for
+aggregating latencies per time window and rolling small windows into larger
+ones without keeping the raw values.
+
+Examples:
+    >>> sketch = DDSketch(relative_accuracy=0.01)
+    >>> for value in range(1, 1001):
+    ...     sketch.add(value)
+    >>> abs(sketch.quantile(0.95) - 950) / 950 <= 0.01
+    True
+    >>> other = DDSketch(relative_accuracy=0.01)
+    >>> other.add(5000)
+    >>> sketch.merge(other).count, sketch.max
+    (1001, 5000.0)
+"""
+
+# Standard
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Values at or below this are counted in the zero bucket
+_MIN_INDEXABLE = 1e-9
+
+
+class DDSketch:
+    """Quantile sketch with relative-error guarantees and exact merges.
+
+    Count, sum, min and max are tracked exactly; quantiles are clamped to
+    ``[min, max]``.
+
+    Examples:
+        >>> sketch = DDSketch()
+        >>> sketch.quantile(0.5)
+        0.0
+        >>> sketch.add(0)
+        >>> sketch.add(10, weight=3)
+        >>> sketch.count, sketch.sum, sketch.mean
+        (4, 30.0, 7.5)
+        >>> sketch.quantile(0.0), sketch.quantile(1.0)
+        (0.0, 10.0)
+    """
+
+    __slots__ = ("relative_accuracy", "_gamma", "_log_gamma", "_bins", "_zero_count", "count", "sum", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Create an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantiles, between 0 and 1
+
+        Raises:
+            ValueError: If the accuracy is out of range
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def mean(self) -> float:
+        """Mean of the added values.
+
+        Returns:
+            The exact mean, or 0.0 when empty
+        """
+        return self.sum / self.count if self.count else 0.0
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add a value.
+
+        Args:
+            value: Sample value; values at or below zero share the zero bucket
+            weight: Number of occurrences
+        """
+        value = float(value)
+        if value > _MIN_INDEXABLE:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._bins[key] = self._bins.get(key, 0) + weight
+        else:
+            self._zero_count += weight
+        self.count += weight
+        self.sum += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add many values with weight 1.
+
+        Equivalent to calling :meth:`add` for each value, but faster.
+
+        Args:
+            values: Sample values
+
+        Examples:
+            >>> sketch = DDSketch()
+            >>> sketch.update([0, 1, 2, 3])
+            >>> sketch.count, sketch.sum, sketch.min, sketch.max
+            (4, 6.0, 0.0, 3.0)
+        """
+        bins = self._bins
+        log, ceil, log_gamma = math.log, math.ceil, self._log_gamma
+        low, high, total, count = self.min, self.max, self.sum, 0
+        for value in values:
+            value = float(value)
+            if value > _MIN_INDEXABLE:
+                key = ceil(log(value) / log_gamma)
+                bins[key] = bins.get(key, 0) + 1
+            else:
+                self._zero_count += 1
+            count += 1
+            total += value
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        self.count += count
+        self.sum, self.min, self.max = total, low, high
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """Add the contents of another sketch to this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+
+        Returns:
+            This sketch
+
+        Raises:
+            ValueError: If the accuracies differ
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other._bins.items():  # pylint: disable=protected-access
+            self._bins[key] = self._bins.get(key, 0) + count
+        self._zero_count += other._zero_count  # pylint: disable=protected-access
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "DDSketch":
+        """Return an independent copy.
+
+        Returns:
+            A new sketch with the same contents
+        """
+        clone = DDSketch(self.relative_accuracy)
+        return clone.merge(self)
+
+    def cumulative_counts(self, bounds: Sequence[float]) -> List[int]:
+        """Count the values at or below each bound, e.g. for histogram buckets.
+
+        Counts are exact at ``min``, ``max`` and beyond; in between, a bound
+        counts its whole bucket, so it may include values up to
+        ``relative_accuracy`` above it.
+
+        Args:
+            bounds: Upper bounds in ascending order
+
+        Returns:
+            Cumulative count for each bound
+
+        Examples:
+            >>> sketch = DDSketch()
+            >>> sketch.update([0.001, 0.02, 0.3, 0.3, 4.0])
+            >>> sketch.cumulative_counts([0.0005, 0.01, 0.1, 1.0, 10.0])
+            [0, 1, 2, 4, 5]
+        """
+        keys = sorted(self._bins)
+        counts: List[int] = []
+        seen, index = self._zero_count, 0
+        for bound in bounds:
+            if not self.count or bound < self.min:
+                counts.append(0)
+                continue
+            if bound >= self.max:
+                counts.append(self.count)
+                continue
+            if bound > _MIN_INDEXABLE:
+                limit = math.ceil(math.log(bound) / self._log_gamma)
+                while index < len(keys) and keys[index] <= limit:
+                    seen += self._bins[keys[index]]
+                    index += 1
+            counts.append(seen)
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary accepted by :meth:`from_dict`
+
+        Examples:
+            >>> sketch = DDSketch()
+            >>> sketch.update([0, 1.5, 3])
+            >>> clone = DDSketch.from_dict(sketch.to_dict())
+            >>> (clone.count, clone.sum, clone.min, clone.max, clone.quantile(0.5)) == (3, 4.5, 0.0, 3.0, sketch.quantile(0.5))
+            True
+            >>> DDSketch.from_dict(DDSketch().to_dict()).count
+            0
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(key): count for key, count in self._bins.items()},
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        """Rebuild a sketch serialized with :meth:`to_dict`.
+
+        Args:
+            data: Serialized sketch
+
+        Returns:
+            The sketch
+        """
+        sketch = cls(data["relative_accuracy"])
+        sketch._bins = {int(key): count for key, count in data["bins"].items()}  # pylint: disable=protected-access
+        sketch._zero_count = data["zero_count"]  # pylint: disable=protected-access
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Like linear-interpolation percentiles over the sorted values, the
+        estimate interpolates between the values ranked just below and above
+        ``q * (count - 1)``. Both are within ``relative_accuracy``, so their
+        interpolation is too, even where neighbouring values are far apart
+        (e.g. in a sparse tail).
+
+        Args:
+            q: Quantile between 0.0 and 1.0
+
+        Returns:
+            The estimated value, or 0.0 when the sketch is empty
+
+        Examples:
+            >>> sketch = DDSketch(relative_accuracy=0.01)
+            >>> sketch.update([1, 100])
+            >>> abs(sketch.quantile(0.5) - 50.5) / 50.5 <= 0.01
+            True
+        """
+        if not self.count:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        lower_rank = math.floor(rank)
+        upper_rank = math.ceil(rank)
+        lower: Optional[float] = None
+        upper: Optional[float] = None
+        seen = self._zero_count
+        if seen > lower_rank:
+            lower = 0.0
+        if seen > upper_rank:
+            upper = 0.0
+        if upper is None:
+            for key in sorted(self._bins):
+                seen += self._bins[key]
+                if lower is None and seen > lower_rank:
+                    lower = min(max(2 * self._gamma**key / (self._gamma + 1), self.min), self.max)
+                if seen > upper_rank:
+                    upper = min(max(2 * self._gamma**key / (self._gamma + 1), self.min), self.max)
+                    break
+        lower = self.max if lower is None else lower
+        upper = self.max if upper is None else upper
+        return lower + (upper - lower) * (rank - lower_rank)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/single_flight.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Single-flight coalescing of identical concurrent upstream calls.
+
+When many clients issue the same idempotent request at the same time (the
+same read-only tool with the same arguments, the same ``resources/read`` URI),
+only the first caller (the leader) performs the upstream call. Callers arriving
+while it is in flight wait for the leader's outcome and receive the same
+result object or exception. Nothing is cached: once the call finishes the next
+caller starts a new flight.
+
+If the leader is cancelled, waiting callers are not cancelled with it; the
+first of them starts a new flight.
+
+Examples:
+    >>> import asyncio
+    >>> flights = SingleFlight("example")
+    >>> calls = []
+    >>> async def fetch():
+    ...     calls.append(1)
+    ...     await asyncio.sleep(0.01)
+    ...     return "value"
+    >>> async def main():
+    ...     return await asyncio.gather(*(flights.do("key", fetch) for _ in range(3)))
+    >>> asyncio.run(main())
+    ['value', 'value', 'value']
+    >>> len(calls)
+    1
+    >>> flights.stats()
+    {'kind': 'example', 'leaders': 1, 'coalesced': 2, 'in_flight': 0}
+    >>> make_flight_key("tool", {"b": 1, "a": [1, 2]}) == make_flight_key("tool", {"a": [1, 2], "b": 1})
+    True
+"""
+
+# Standard
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+# Third-Party
+import orjson
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def make_flight_key(*parts: Any) -> str:
+    """Build a compact key from JSON-serializable parts, independent of dict ordering.
+
+    Args:
+        *parts: Values identifying the request (name, arguments, identity, ...).
+
+    Returns:
+        Hex digest of the canonical JSON encoding of the parts.
+
+    Examples:
+        >>> len(make_flight_key("a", {"x": 1}))
+        32
+        >>> make_flight_key("a", {"x": 1}) == make_flight_key("a", {"x": 2})
+        False
+    """
+    canonical = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing a key into one in-flight call."""
+
+    def __init__(self, kind: str):
+        """Initialize the coalescer.
+
+        Args:
+            kind: Label of the coalesced request type, used for metrics.
+        """
+        self.kind = kind
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or join the in-flight call with the same key.
+
+        Args:
+            key: Identity of the request; callers with equal keys share one call.
+            fn: Coroutine function performing the upstream call.
+
+        Returns:
+            The result of the (shared) call.
+
+        Raises:
+            asyncio.CancelledError: If the calling task is cancelled.
+        """
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                break
+            self._coalesced += 1
+            self._record_coalesced()
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The leader was cancelled, not us: start or join a new flight
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self._leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            flight.exception()  # mark retrieved when nobody joined
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _record_coalesced(self) -> None:
+        """Increment the Prometheus counter of coalesced requests."""
+        try:
+            # First-Party
+            from mcpgateway.services.metrics import upstream_requests_coalesced_counter  # pylint: disable=import-outside-toplevel
+
+            upstream_requests_coalesced_counter.labels(kind=self.kind).inc()
+        except Exception as exc:
+            logger.debug("Failed to increment upstream_requests_coalesced_counter: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return coalescing counters.
+
+        Returns:
+            Dict with the number of leader calls, coalesced callers and flights in progress.
+        """
+        return {"kind": self.kind, "leaders": self._leaders, "coalesced": self._coalesced, "in_flight": len(self._flights)}
+
+    def reset_stats(self) -> None:
+        """Reset the counters."""
+        self._leaders = 0
+        self._coalesced = 0
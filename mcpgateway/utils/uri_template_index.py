@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Location: ./mcpgateway/utils/uri_template_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+URI template index for resource template routing.
+
+Resolving a templated ``resources/read`` used to test the URI against every
+known template regex in turn. This module groups compiled templates by their
+literal prefix (the text before the first ``{`` expression) so a lookup only
+evaluates the templates whose prefix is actually a prefix of the URI.
+
+Within the candidate set, templates are tried from most to least specific:
+
+1. more literal characters first,
+2. then fewer ``{var*}`` wildcard expressions,
+3. then fewer expressions overall,
+4. then the template string and insertion order as tie breakers.
+
+so the winner never depends on dictionary or database ordering.
+
+Examples:
+    >>> index = UriTemplateIndex()
+    >>> index.add("files://{path*}", "any-file")
+    >>> index.add("files://docs/{name}", "doc")
+    >>> index.match("files://docs/readme.md")
+    'doc'
+    >>> index.match("files://src/main.py")
+    'any-file'
+    >>> index.match("other://x") is None
+    True
+    >>> len(index)
+    2
+"""
+
+# Standard
+from bisect import insort
+import heapq
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_EXPRESSION_RE = re.compile(r"(\{[^}]+\})")
+_QUERY_EXPRESSION_RE = re.compile(r"\{\?[^}]+\}")
+
+# (specificity key, insertion sequence, compiled regex, value)
+_Entry = Tuple[Tuple[int, int, int, str], int, "re.Pattern[str]", Any]
+
+
+def build_template_regex(template: str) -> "re.Pattern[str]":
+    """Convert a URI template into a compiled, anchored regular expression.
+
+    ``{var}`` matches a single segment, ``{var*}`` matches one or more
+    segments and ``{?a,b}`` query expressions are ignored.
+
+    Args:
+        template: The URI template string.
+
+    Returns:
+        Compiled regular expression with one named group per expression.
+
+    Examples:
+        >>> build_template_regex("files://root/{path*}/meta/{id}{?expand}").pattern
+        '^files://root/(?P<path>.+)/meta/(?P<id>[^/]+)$'
+        >>> bool(build_template_regex("db://{table}").match("db://users"))
+        True
+    """
+    template_without_query = _QUERY_EXPRESSION_RE.sub("", template)
+
+    pattern = ""
+    for part in _EXPRESSION_RE.split(template_without_query):
+        if part.startswith("{") and part.endswith("}"):
+            name = part[1:-1]
+            if name.endswith("*"):
+                pattern += f"(?P<{name[:-1]}>.+)"
+            else:
+                pattern += f"(?P<{name}>[^/]+)"
+        else:
+            pattern += re.escape(part)
+    return re.compile(f"^{pattern}$")
+
+
+def template_specificity(template: str) -> Tuple[int, int, int, str]:
+    """Compute the sort key used to rank overlapping templates.
+
+    Lower keys are more specific.
+
+    Args:
+        template: The URI template string.
+
+    Returns:
+        Tuple of (negated literal length, wildcard count, expression count, template).
+
+    Examples:
+        >>> template_specificity("files://docs/{name}") < template_specificity("files://{path*}")
+        True
+        >>> template_specificity("a://{x}/{y}") < template_specificity("a://{x*}/{y}")
+        True
+    """
+    parts = _EXPRESSION_RE.split(_QUERY_EXPRESSION_RE.sub("", template))
+    literal_chars = sum(len(part) for part in parts[::2])
+    expressions = parts[1::2]
+    wildcards = sum(1 for expr in expressions if expr.endswith("*}"))
+    return (-literal_chars, wildcards, len(expressions), template)
+
+
+def literal_prefix(template: str) -> str:
+    """Return the literal text preceding the first template expression.
+
+    Args:
+        template: The URI template string.
+
+    Returns:
+        Prefix every matching URI must start with.
+
+    Examples:
+        >>> literal_prefix("weather://{city}/current")
+        'weather://'
+        >>> literal_prefix("{scheme}://x")
+        ''
+        >>> literal_prefix("static://about")
+        'static://about'
+    """
+    return _QUERY_EXPRESSION_RE.sub("", template).split("{", 1)[0]
+
+
+class UriTemplateIndex:
+    """Prefix-bucketed index resolving URIs to the most specific template.
+
+    Each bucket holds the entries sharing one literal prefix, kept sorted by
+    specificity. A lookup probes one dictionary key per distinct prefix length
+    and lazily merges the matching buckets, stopping at the first regex hit, so
+    its cost depends on the number of overlapping templates rather than the
+    total number registered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._buckets: Dict[str, List[_Entry]] = {}
+        self._prefix_lengths: List[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed templates.
+
+        Returns:
+            Number of templates added to the index.
+        """
+        return self._size
+
+    def add(self, template: str, value: Any) -> None:
+        """Add a template to the index.
+
+        Args:
+            template: The URI template string.
+            value: Object returned by :meth:`match` when this template wins.
+        """
+        prefix = literal_prefix(template)
+        bucket = self._buckets.get(prefix)
+        if bucket is None:
+            bucket = self._buckets[prefix] = []
+            if len(prefix) not in self._prefix_lengths:
+                insort(self._prefix_lengths, len(prefix))
+        insort(bucket, (template_specificity(template), self._size, build_template_regex(template), value))
+        self._size += 1
+
+    def match(self, uri: str) -> Optional[Any]:
+        """Find the most specific template matching a URI.
+
+        The query string, if any, is ignored.
+
+        Args:
+            uri: Concrete resource URI.
+
+        Returns:
+            The value registered with the winning template, or None.
+        """
+        path = uri.partition("?")[0]
+        candidates = []
+        for length in self._prefix_lengths:
+            if length > len(path):
+                break
+            bucket = self._buckets.get(path[:length])
+            if bucket:
+                candidates.append(bucket)
+
+        if len(candidates) == 1:
+            ordered = iter(candidates[0])
+        else:
+            ordered = heapq.merge(*candidates)
+
+        for _key, _seq, regex, value in ordered:
+            if regex.match(path):
+                return value
+        return None
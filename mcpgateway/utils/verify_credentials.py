@@ -62,6 +62,7 @@ from fastapi.security.utils import get_authorization_scheme_param
 import jwt
 
 # First-Party
+from mcpgateway.cache.verified_token_cache import get_verified_token_cache
 from mcpgateway.config import settings
 from mcpgateway.services.logging_service import LoggingService
 from mcpgateway.utils.jwt_config_helper import validate_jwt_algo_and_keys
@@ -173,11 +174,13 @@ async def verify_jwt_token(token: str) -> dict:
 
 
 async def verify_jwt_token_cached(token: str, request: Optional[Request] = None) -> dict:
-    """Verify JWT token with request-level caching.
+    """Verify JWT token with request-level and process-wide caching.
 
     If a request object is provided and the token has already been verified
-    for this request, returns the cached payload. Otherwise, performs
-    verification and caches the result in request.state.
+    for this request, returns the cached payload. Otherwise the verified
+    token cache (bounded LRU keyed by a token digest, valid until ``exp`` and
+    evicted on revocation) is consulted before performing verification. The
+    result is cached in request.state.
 
     Args:
         token: JWT token string to verify
@@ -199,8 +202,13 @@ async def verify_jwt_token_cached(token: str, request: Optional[Request] = None)
             if cached_token == token:
                 return cached_payload
 
-    # Verify token (single decode)
-    payload = await verify_jwt_token(token)
+    # Check the process-wide cache of verified tokens
+    verified_cache = get_verified_token_cache()
+    payload = await verified_cache.get(token)
+    if payload is None:
+        # Verify token (single decode)
+        payload = await verify_jwt_token(token)
+        verified_cache.set(token, payload)
 
     # Cache in request.state for reuse across middleware
     if request is not None and hasattr(request, "state"):
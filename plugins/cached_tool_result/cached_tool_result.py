@@ -5,15 +5,18 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
 Cached Tool Result Plugin.
-Stores idempotent tool results in an in-memory cache keyed by tool name and
-selected argument fields. Reads are advisory (metadata) due to framework
-constraints; writes occur in tool_post_invoke.
+Stores idempotent tool results in a bounded in-memory LRU cache keyed by tool
+name, selected argument fields and the caller (user, tenant, server, gateway
+and request headers), optionally backed by Redis so that workers share
+entries. A hit in tool_pre_invoke returns the cached result, which makes the
+gateway skip the upstream call; writes occur in tool_post_invoke.
 """
 
 # Future
 from __future__ import annotations
 
 # Standard
+from collections import OrderedDict
 from dataclasses import dataclass
 import hashlib
 import time
@@ -33,6 +36,14 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokePayload,
     ToolPreInvokeResult,
 )
+from mcpgateway.plugins.framework.constants import TOOL_METADATA
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+_REDIS_PREFIX = "cached_tool_result:"
 
 
 class CacheConfig(BaseModel):
@@ -42,11 +53,15 @@ class CacheConfig(BaseModel):
         cacheable_tools: List of tool names that should be cached.
         ttl: Time-to-live in seconds for cached results.
         key_fields: Optional mapping of tool names to specific argument fields to use for cache keys.
+        max_entries: Maximum number of in-memory entries; the least recently used are evicted first.
+        redis_url: Optional Redis URL shared by all workers; entries are read through to memory.
     """
 
     cacheable_tools: List[str] = Field(default_factory=list)
     ttl: int = 300
     key_fields: Optional[Dict[str, List[str]]] = None  # {tool: [fields...]}
+    max_entries: int = Field(default=1000, ge=1)
+    redis_url: Optional[str] = None
 
 
 @dataclass
@@ -62,21 +77,54 @@ class _Entry:
     expires_at: float
 
 
-_CACHE: Dict[str, _Entry] = {}
+def _caller_scope(payload: ToolPreInvokePayload, context: PluginContext) -> Dict[str, Any]:
+    """Identify the caller a tool result was fetched for.
 
+    Hits skip the upstream call, so a result fetched with one caller's
+    identity, credentials or passthrough headers must never be served to another.
+
+    Args:
+        payload: Tool invocation payload (its headers carry auth and passthrough headers).
+        context: Plugin execution context.
 
-def _make_key(tool: str, args: dict | None, fields: Optional[List[str]]) -> str:
-    """Generate a cache key hash from tool name and selected argument fields.
+    Returns:
+        User, tenant, server, gateway and headers of the call.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework import GlobalContext
+        >>> ctx = PluginContext(global_context=GlobalContext(request_id="r", user="alice", tenant_id="t1"))
+        >>> scope = _caller_scope(ToolPreInvokePayload(name="echo", args={}), ctx)
+        >>> scope["user"], scope["tenant"], scope["headers"]
+        ('alice', 't1', None)
+    """
+    global_context = context.global_context
+    tool_metadata = global_context.metadata.get(TOOL_METADATA)
+    return {
+        "user": global_context.user,
+        "tenant": global_context.tenant_id,
+        "server": global_context.server_id,
+        "gateway": getattr(tool_metadata, "gateway_id", None),
+        "headers": payload.headers.model_dump() if payload.headers is not None else None,
+    }
+
+
+def _make_key(tool: str, args: dict | None, fields: Optional[List[str]], scope: Optional[Dict[str, Any]] = None) -> str:
+    """Generate a cache key hash from tool name, selected argument fields and caller scope.
 
     Args:
         tool: Tool name.
         args: Tool arguments dictionary.
         fields: Optional list of specific argument fields to include in the key.
+        scope: Caller scope from :func:`_caller_scope`.
 
     Returns:
         SHA256 hex digest cache key.
+
+    Examples:
+        >>> _make_key("echo", {"x": 1}, None, {"user": "a"}) == _make_key("echo", {"x": 1}, None, {"user": "b"})
+        False
     """
-    base = {"tool": tool, "args": {}}
+    base = {"tool": tool, "args": {}, "scope": scope}
     if args:
         if fields:
             base["args"] = {k: args.get(k) for k in fields}
@@ -87,7 +135,7 @@ def _make_key(tool: str, args: dict | None, fields: Optional[List[str]]) -> str:
 
 
 class CachedToolResultPlugin(Plugin):
-    """Cache idempotent tool results (write-through)."""
+    """Cache idempotent tool results and serve hits without calling the tool."""
 
     def __init__(self, config: PluginConfig) -> None:
         """Initialize the cached tool result plugin.
@@ -97,30 +145,92 @@ class CachedToolResultPlugin(Plugin):
         """
         super().__init__(config)
         self._cfg = CacheConfig(**(config.config or {}))
+        self._store: OrderedDict[str, _Entry] = OrderedDict()
+        self._redis_url = self._cfg.redis_url
+        self._redis: Any = None  # lazy-initialised aioredis client
+
+    async def _get_redis(self):  # pragma: no cover - integration test only
+        """Lazily initialize and return the async Redis client.
+
+        Returns:
+            Async Redis client instance, or None if Redis is not configured
+            or the redis package is unavailable.
+        """
+        if self._redis is None and self._redis_url:
+            try:
+                # Third-Party
+                import redis.asyncio as aioredis  # pylint: disable=import-outside-toplevel
+
+                self._redis = aioredis.from_url(self._redis_url)
+            except ImportError:
+                logger.warning("redis package not installed - falling back to memory-only tool result cache")
+                self._redis_url = None
+        return self._redis
+
+    async def _get(self, key: str) -> Optional[Any]:
+        """Look up a cached result, in memory first and then in Redis.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached result, or None on a miss.
+        """
+        ent = self._store.get(key)
+        if ent is not None:
+            if ent.expires_at > time.time():
+                self._store.move_to_end(key)
+                return ent.value
+            del self._store[key]
+        redis = await self._get_redis()
+        if redis:  # pragma: no cover
+            try:
+                raw = await redis.get(_REDIS_PREFIX + key)
+                if raw:
+                    value = orjson.loads(raw)
+                    ttl = await redis.ttl(_REDIS_PREFIX + key)
+                    self._put_memory(key, value, ttl if ttl and ttl > 0 else self._cfg.ttl)
+                    return value
+            except Exception as e:
+                logger.warning(f"Redis lookup failed for cached tool result: {e}")
+        return None
+
+    def _put_memory(self, key: str, value: Any, ttl: int) -> None:
+        """Store a result in memory, evicting the least recently used entries.
+
+        Args:
+            key: Cache key.
+            value: Tool result.
+            ttl: Time-to-live in seconds.
+        """
+        self._store[key] = _Entry(value=value, expires_at=time.time() + ttl)
+        self._store.move_to_end(key)
+        while len(self._store) > self._cfg.max_entries:
+            self._store.popitem(last=False)
 
     async def tool_pre_invoke(self, payload: ToolPreInvokePayload, context: PluginContext) -> ToolPreInvokeResult:
-        """Check cache before tool invocation and store cache key in context.
+        """Return the cached result on a hit, and store the cache key in context.
 
         Args:
             payload: Tool invocation payload.
             context: Plugin execution context.
 
         Returns:
-            Result with cache hit/miss metadata.
+            Result with cache hit/miss metadata, carrying the cached tool result on a hit.
         """
         tool = payload.name
         if tool not in self._cfg.cacheable_tools:
             return ToolPreInvokeResult(continue_processing=True)
         fields = (self._cfg.key_fields or {}).get(tool)
-        key = _make_key(tool, payload.args or {}, fields)
+        key = _make_key(tool, payload.args or {}, fields, _caller_scope(payload, context))
         # Persist key for post-invoke
         context.set_state("cache_key", key)
         context.set_state("cache_tool", tool)
-        ent = _CACHE.get(key)
-        now = time.time()
-        if ent and ent.expires_at > now:
-            # Advisory metadata; actual short-circuiting is not supported here
-            return ToolPreInvokeResult(metadata={"cache_hit": True, "key": key})
+        value = await self._get(key)
+        if value is not None:
+            # The gateway returns this result without calling the tool; post-invoke must not re-store it
+            context.set_state("cache_hit", True)
+            return ToolPreInvokeResult(result=value, metadata={"cache_hit": True, "key": key})
         return ToolPreInvokeResult(metadata={"cache_hit": False, "key": key})
 
     async def tool_post_invoke(self, payload: ToolPostInvokePayload, context: PluginContext) -> ToolPostInvokeResult:
@@ -140,8 +250,19 @@ class CachedToolResultPlugin(Plugin):
         # Read key from context
         key = context.get_state("cache_key") if context else None
         if not key:
-            # Fallback to a coarse key when args are unknown
-            key = _make_key(tool, None, None)
+            # Without the pre-invoke key the caller scope is unknown: a coarse key could leak results
+            return ToolPostInvokeResult(metadata={"cache_stored": False})
+        if context and context.get_state("cache_hit"):
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "key": key})
+        if isinstance(payload.result, dict) and payload.result.get("isError"):
+            # Never serve a failed call from the cache
+            return ToolPostInvokeResult(metadata={"cache_stored": False, "key": key})
         ttl = max(1, int(self._cfg.ttl))
-        _CACHE[key] = _Entry(value=payload.result, expires_at=time.time() + ttl)
+        self._put_memory(key, payload.result, ttl)
+        redis = await self._get_redis()
+        if redis:  # pragma: no cover
+            try:
+                await redis.setex(_REDIS_PREFIX + key, ttl, orjson.dumps(payload.result, default=str))
+            except Exception as e:
+                logger.warning(f"Redis store failed for cached tool result: {e}")
         return ToolPostInvokeResult(metadata={"cache_stored": True, "key": key, "ttl": ttl})
@@ -6,6 +6,6 @@ Copyright 2025
 SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
-Enforces simple in-memory rate limits by user, tenant, and/or tool.
-Uses a fixed window keyed by second for simplicity and determinism.
+Enforces GCRA rate limits by user, tenant, and/or tool, per process or
+shared across workers through Redis.
 """
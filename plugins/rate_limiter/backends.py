@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""Location: ./plugins/rate_limiter/backends.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Rate limiter backends.
+
+Both backends implement GCRA (generic cell rate algorithm): each key stores a
+single theoretical arrival time (TAT) that advances by ``window / count`` per
+request, and a request passes while the TAT stays within one window of now.
+This allows bursts of up to ``count`` requests and then spaces requests
+evenly, without the burst-at-boundary effect of fixed windows.
+
+* ``MemoryBackend`` keeps TATs in process and evicts idle keys.
+* ``RedisBackend`` runs GCRA in an atomic Lua script so the limit holds across
+  workers and hosts. Keys expire in Redis once idle. With ``local_batch`` it
+  reserves several requests per round-trip and serves them from memory.
+
+Examples:
+    >>> import asyncio
+    >>> backend = MemoryBackend()
+    >>> [asyncio.run(backend.acquire("user:alice", 2, 60)).allowed for _ in range(3)]
+    [True, True, False]
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard
+from collections import OrderedDict
+from dataclasses import dataclass
+import math
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+# First-Party
+from mcpgateway.services.logging_service import LoggingService
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
+
+# Float tolerance when counting whole emission intervals
+_EPSILON = 1e-9
+
+# Seconds before retrying an unavailable Redis, doubling up to the maximum
+_REDIS_RETRY_MIN = 1.0
+_REDIS_RETRY_MAX = 60.0
+
+# KEYS[1]: bucket key. ARGV: emission interval (us), window (us), requests wanted.
+# Grants between 1 and the wanted number of requests, using the Redis clock so
+# that workers with skewed clocks agree. Returns {granted, remaining, retry_after_us, reset_us}.
+GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local wanted = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+local available = math.floor((now + window - tat) / interval + 1e-9)
+if available < 1 then
+  return {0, 0, math.ceil(tat + interval - window - now), math.ceil(tat - now)}
+end
+local granted = math.min(wanted, available)
+tat = tat + granted * interval
+redis.call('SET', KEYS[1], string.format('%.0f', tat), 'PX', math.max(1, math.ceil((tat - now) / 1000)))
+return {granted, available - granted, 0, math.ceil(tat - now)}
+"""
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of a rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed.
+        remaining: Requests that may still be made right now.
+        reset_in: Seconds until the full burst is available again.
+        retry_after: Seconds until the next request can pass (0 when allowed).
+    """
+
+    allowed: bool
+    remaining: int
+    reset_in: float
+    retry_after: float
+
+
+class MemoryBackend:
+    """In-process GCRA limiter with idle key eviction.
+
+    A key whose TAT is in the past behaves exactly like an absent key, so it
+    can be dropped without changing any decision. Such idle keys are swept
+    every ``sweep_interval`` checks. A new key that would exceed ``max_keys``
+    evicts the least recently used key in O(1) instead.
+
+    Examples:
+        >>> import asyncio
+        >>> backend = MemoryBackend(max_keys=2)
+        >>> for user in ("a", "b", "c"):
+        ...     _ = asyncio.run(backend.acquire(f"user:{user}", 10, 1))
+        >>> len(backend)
+        2
+    """
+
+    def __init__(self, max_keys: int = 100_000, sweep_interval: int = 1024) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_keys: Maximum number of tracked keys.
+            sweep_interval: Number of checks between idle key sweeps.
+        """
+        self._tat: OrderedDict[str, float] = OrderedDict()
+        self._max_keys = max_keys
+        self._sweep_interval = sweep_interval
+        self._checks = 0
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys.
+
+        Returns:
+            Number of keys with state.
+        """
+        return len(self._tat)
+
+    async def acquire(self, key: str, count: int, window: float) -> RateLimitDecision:
+        """Check and record one request.
+
+        Args:
+            key: Bucket key (e.g. ``user:alice``).
+            count: Requests allowed per window.
+            window: Window length in seconds.
+
+        Returns:
+            The decision for this request.
+
+        Examples:
+            >>> import asyncio
+            >>> backend = MemoryBackend()
+            >>> asyncio.run(backend.acquire("k", 2, 1)).remaining
+            1
+            >>> denied = [asyncio.run(backend.acquire("k", 2, 1)) for _ in range(2)][-1]
+            >>> denied.allowed, 0 < denied.retry_after <= 0.5
+            (False, True)
+        """
+        now = time.monotonic()
+        interval = window / count
+        tat = max(self._tat.get(key, now), now)
+        self._maybe_sweep(now)
+        allow_at = tat + interval - window
+        if allow_at > now + _EPSILON:
+            return RateLimitDecision(False, 0, tat - now, allow_at - now)
+        tat += interval
+        if key in self._tat:
+            self._tat.move_to_end(key)
+        elif len(self._tat) >= self._max_keys:
+            self._tat.popitem(last=False)
+        self._tat[key] = tat
+        return RateLimitDecision(True, int((now + window - tat) / interval + _EPSILON), tat - now, 0.0)
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Drop idle keys every ``sweep_interval`` checks.
+
+        Args:
+            now: Current monotonic time.
+        """
+        self._checks += 1
+        if self._checks % self._sweep_interval:
+            return
+        for key in [key for key, tat in self._tat.items() if tat <= now]:
+            del self._tat[key]
+
+
+@dataclass
+class _Lease:
+    """Requests reserved from Redis and served locally.
+
+    Attributes:
+        tokens: Reserved requests not used yet.
+        remaining: Requests left in Redis when the lease was granted.
+        reset_at: Monotonic time at which the Redis bucket is full again.
+        expires_at: Monotonic time after which unused tokens are discarded.
+    """
+
+    tokens: int
+    remaining: int
+    reset_at: float
+    expires_at: float
+
+
+class RedisBackend:
+    """Distributed GCRA limiter running an atomic Lua script in Redis.
+
+    Uses ``redis_url`` when given, otherwise the gateway's shared Redis client.
+    Without Redis (not configured, package missing or a failed call) checks
+    fall back to a per-process ``MemoryBackend`` so requests are still limited.
+    An unavailable client is looked up again after a backoff that doubles from
+    1 to 60 seconds, so the backend recovers once Redis comes up.
+
+    With ``local_batch`` > 1 each Redis call reserves up to that many requests
+    for the key and serves them from memory, trading a small amount of
+    unfairness between workers (reserved requests unused by one worker are
+    not available to the others until they expire) for fewer round-trips.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, prefix: str = "ratelimit", local_batch: int = 1, fallback: Optional[MemoryBackend] = None) -> None:
+        """Initialize the backend.
+
+        Args:
+            redis_url: Redis URL, or None to use the gateway's shared client.
+            prefix: Prefix of the Redis keys.
+            local_batch: Requests to reserve per Redis call.
+            fallback: Backend used when Redis is unavailable.
+        """
+        self._redis_url = redis_url
+        self._prefix = prefix
+        self._local_batch = max(1, local_batch)
+        self._fallback = fallback or MemoryBackend()
+        self._redis: Any = None
+        self._script: Any = None
+        self._retry_at = 0.0
+        self._retry_delay = _REDIS_RETRY_MIN
+        self._leases: Dict[str, _Lease] = {}
+        self._checks = 0
+
+    async def _get_script(self):
+        """Lazily connect to Redis and register the GCRA script.
+
+        Returns:
+            The registered script, or None if Redis is unavailable.
+        """
+        if self._script is not None:
+            return self._script
+        now = time.monotonic()
+        if now < self._retry_at:
+            return None
+        try:
+            if self._redis_url:
+                # Third-Party
+                import redis.asyncio as aioredis  # pylint: disable=import-outside-toplevel
+
+                self._redis = aioredis.from_url(self._redis_url)
+            else:
+                # First-Party
+                from mcpgateway.utils.redis_client import get_redis_client  # pylint: disable=import-outside-toplevel
+
+                self._redis = await get_redis_client()
+        except ImportError:
+            logger.warning("redis package not installed - rate limits are enforced per process")
+            self._retry_at = math.inf
+            return None
+        except Exception as e:
+            logger.warning(f"Redis connection failed: {e}")
+            self._redis = None
+        if self._redis is None:
+            logger.warning(f"Redis is not available - rate limits are enforced per process (retrying in {self._retry_delay:g}s)")
+            self._retry_at = now + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, _REDIS_RETRY_MAX)
+            return None
+        self._script = self._redis.register_script(GCRA_LUA)
+        self._retry_delay = _REDIS_RETRY_MIN
+        return self._script
+
+    async def acquire(self, key: str, count: int, window: float) -> RateLimitDecision:
+        """Check and record one request.
+
+        Args:
+            key: Bucket key (e.g. ``user:alice``).
+            count: Requests allowed per window.
+            window: Window length in seconds.
+
+        Returns:
+            The decision for this request.
+        """
+        bucket = f"{self._prefix}:{key}:{window:g}"
+        now = time.monotonic()
+        self._checks += 1
+        if self._checks % 1024 == 0:
+            self._leases = {k: lease for k, lease in self._leases.items() if lease.tokens and lease.expires_at > now}
+
+        lease = self._leases.get(bucket)
+        if lease is not None and lease.tokens > 0 and lease.expires_at > now:
+            lease.tokens -= 1
+            return RateLimitDecision(True, lease.remaining + lease.tokens, max(0.0, lease.reset_at - now), 0.0)
+
+        script = await self._get_script()
+        if script is None:
+            return await self._fallback.acquire(key, count, window)
+        interval_us = window * 1_000_000 / count
+        try:
+            granted, remaining, retry_after_us, reset_us = await script(keys=[bucket], args=[interval_us, window * 1_000_000, min(self._local_batch, count)])
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed, enforcing per process: {e}")
+            return await self._fallback.acquire(key, count, window)
+
+        reset_in = int(reset_us) / 1_000_000
+        if not int(granted):
+            return RateLimitDecision(False, 0, reset_in, int(retry_after_us) / 1_000_000)
+        if int(granted) > 1:
+            # Reserved requests are only valid while Redis still accounts for them
+            self._leases[bucket] = _Lease(int(granted) - 1, int(remaining), now + reset_in, now + window)
+        return RateLimitDecision(True, int(remaining) + int(granted) - 1, reset_in, 0.0)
@@ -5,17 +5,18 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Mihai Criveti
 
 Rate Limiter Plugin.
-Enforces simple in-memory rate limits by user, tenant, and/or tool.
-Uses a fixed window keyed by second for simplicity and determinism.
+Enforces rate limits by user, tenant, and/or tool with GCRA, either per
+process or shared across workers through Redis (see ``backends``).
+Rejections carry ``retry_after`` in the violation details, which the gateway
+returns as a ``Retry-After`` header.
 """
 
 # Future
 from __future__ import annotations
 
 # Standard
-from dataclasses import dataclass
-import time
-from typing import Any, Dict, Optional
+import math
+from typing import Any, Dict, Literal, Optional
 
 # Third-Party
 from pydantic import BaseModel, Field
@@ -31,6 +32,7 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokePayload,
     ToolPreInvokeResult,
 )
+from plugins.rate_limiter.backends import MemoryBackend, RateLimitDecision, RedisBackend
 
 
 def _parse_rate(rate: str) -> tuple[int, int]:
@@ -64,58 +66,44 @@ class RateLimiterConfig(BaseModel):
         by_user: Rate limit per user (e.g., '60/m').
         by_tenant: Rate limit per tenant (e.g., '600/m').
         by_tool: Per-tool rate limits (e.g., {'search': '10/m'}).
+        backend: ``memory`` (per process) or ``redis`` (shared across workers).
+        redis_url: Redis URL for the ``redis`` backend; defaults to the gateway's Redis.
+        redis_key_prefix: Prefix of the Redis keys.
+        local_batch: Requests reserved per Redis call and served from memory (1 disables).
+        max_keys: Maximum number of keys tracked in memory; idle keys are evicted first.
     """
 
     by_user: Optional[str] = Field(default=None, description="e.g. '60/m'")
     by_tenant: Optional[str] = Field(default=None, description="e.g. '600/m'")
     by_tool: Optional[Dict[str, str]] = Field(default=None, description="per-tool rates, e.g. {'search': '10/m'}")
+    backend: Literal["memory", "redis"] = "memory"
+    redis_url: Optional[str] = None
+    redis_key_prefix: str = "ratelimit"
+    local_batch: int = Field(default=1, ge=1)
+    max_keys: int = Field(default=100_000, ge=1)
 
 
-@dataclass
-class _Window:
-    """Internal rate limiting window tracking.
-
-    Attributes:
-        window_start: Timestamp when the current window started.
-        count: Number of requests in the current window.
-    """
-
-    window_start: int
-    count: int
-
-
-_store: Dict[str, _Window] = {}
-
-
-def _allow(key: str, limit: Optional[str]) -> tuple[bool, dict[str, Any]]:
-    """Check if a request is allowed under the rate limit.
+def _meta(decision: RateLimitDecision) -> dict[str, Any]:
+    """Build the metadata of a rate limit decision.
 
     Args:
-        key: Unique key for the rate limit (e.g., 'user:alice', 'tool:search').
-        limit: Rate limit string (e.g., '60/m') or None to allow unlimited.
+        decision: Backend decision.
 
     Returns:
-        Tuple of (allowed, metadata) where allowed is True if the request is allowed,
-        and metadata contains rate limiting information.
+        Metadata with remaining requests and reset hints (plus ``retry_after`` when rejected).
+
+    Examples:
+        >>> _meta(RateLimitDecision(False, 0, 2.5, 0.25))
+        {'limited': True, 'remaining': 0, 'reset_in': 3, 'retry_after': 1}
     """
-    if not limit:
-        return True, {"limited": False}
-    count, window_seconds = _parse_rate(limit)
-    now = int(time.time())
-    win_key = f"{key}:{window_seconds}"
-    wnd = _store.get(win_key)
-    if not wnd or now - wnd.window_start >= window_seconds:
-        _store[win_key] = _Window(window_start=now, count=1)
-        return True, {"limited": True, "remaining": count - 1, "reset_in": window_seconds}
-    if wnd.count < count:
-        wnd.count += 1
-        return True, {"limited": True, "remaining": count - wnd.count, "reset_in": window_seconds - (now - wnd.window_start)}
-    # exceeded
-    return False, {"limited": True, "remaining": 0, "reset_in": window_seconds - (now - wnd.window_start)}
+    meta: dict[str, Any] = {"limited": True, "remaining": decision.remaining, "reset_in": math.ceil(decision.reset_in)}
+    if not decision.allowed:
+        meta["retry_after"] = max(1, math.ceil(decision.retry_after))
+    return meta
 
 
 class RateLimiterPlugin(Plugin):
-    """Simple fixed-window rate limiter with per-user/tenant/tool buckets."""
+    """GCRA rate limiter with per-user/tenant/tool buckets."""
 
     def __init__(self, config: PluginConfig) -> None:
         """Initialize the rate limiter plugin.
@@ -125,6 +113,31 @@ class RateLimiterPlugin(Plugin):
         """
         super().__init__(config)
         self._cfg = RateLimiterConfig(**(config.config or {}))
+        # Parse rates once instead of on every request
+        self._user_rate = _parse_rate(self._cfg.by_user) if self._cfg.by_user else None
+        self._tenant_rate = _parse_rate(self._cfg.by_tenant) if self._cfg.by_tenant else None
+        self._tool_rates = {tool: _parse_rate(rate) for tool, rate in (self._cfg.by_tool or {}).items() if rate}
+        memory = MemoryBackend(max_keys=self._cfg.max_keys)
+        if self._cfg.backend == "redis":
+            self._backend: MemoryBackend | RedisBackend = RedisBackend(self._cfg.redis_url, self._cfg.redis_key_prefix, self._cfg.local_batch, fallback=memory)
+        else:
+            self._backend = memory
+
+    async def _allow(self, key: str, rate: Optional[tuple[int, int]]) -> tuple[bool, dict[str, Any]]:
+        """Check if a request is allowed under the rate limit.
+
+        Args:
+            key: Unique key for the rate limit (e.g., 'user:alice', 'tool:search').
+            rate: Parsed (count, window_seconds) limit, or None to allow unlimited.
+
+        Returns:
+            Tuple of (allowed, metadata) where allowed is True if the request is allowed,
+            and metadata contains rate limiting information.
+        """
+        if not rate:
+            return True, {"limited": False}
+        decision = await self._backend.acquire(key, *rate)
+        return decision.allowed, _meta(decision)
 
     async def prompt_pre_fetch(self, payload: PromptPrehookPayload, context: PluginContext) -> PromptPrehookResult:
         """Check rate limits before fetching a prompt.
@@ -139,7 +152,7 @@ class RateLimiterPlugin(Plugin):
         user = context.global_context.user or "anonymous"
         tenant = context.global_context.tenant_id or "default"
 
-        ok_u, meta_u = _allow(f"user:{user}", self._cfg.by_user)
+        ok_u, meta_u = await self._allow(f"user:{user}", self._user_rate)
         if not ok_u:
             return PromptPrehookResult(
                 continue_processing=False,
@@ -151,7 +164,7 @@ class RateLimiterPlugin(Plugin):
                 ),
             )
 
-        ok_t, meta_t = _allow(f"tenant:{tenant}", self._cfg.by_tenant)
+        ok_t, meta_t = await self._allow(f"tenant:{tenant}", self._tenant_rate)
         if not ok_t:
             return PromptPrehookResult(
                 continue_processing=False,
@@ -181,14 +194,12 @@ class RateLimiterPlugin(Plugin):
         tenant = context.global_context.tenant_id or "default"
 
         meta: dict[str, Any] = {}
-        ok_u, meta_u = _allow(f"user:{user}", self._cfg.by_user)
-        ok_t, meta_t = _allow(f"tenant:{tenant}", self._cfg.by_tenant)
+        ok_u, meta_u = await self._allow(f"user:{user}", self._user_rate)
+        ok_t, meta_t = await self._allow(f"tenant:{tenant}", self._tenant_rate)
         ok_tool = True
         meta_tool: dict[str, Any] | None = None
-        by_tool_config = self._cfg.by_tool
-        if hasattr(by_tool_config, "__contains__"):
-            if tool in by_tool_config:  # pylint: disable=unsupported-membership-test
-                ok_tool, meta_tool = _allow(f"tool:{tool}", by_tool_config[tool])
+        if tool in self._tool_rates:
+            ok_tool, meta_tool = await self._allow(f"tool:{tool}", self._tool_rates[tool])
         meta.update({"by_user": meta_u, "by_tenant": meta_t})
         if meta_tool is not None:
             meta["by_tool"] = meta_tool
@@ -200,7 +211,7 @@ class RateLimiterPlugin(Plugin):
                     reason="Rate limit exceeded",
                     description=f"Rate limit exceeded for {'tool ' + tool if not ok_tool else ('user' if not ok_u else 'tenant')}",
                     code="RATE_LIMIT",
-                    details=meta,
+                    details={**meta, "retry_after": max(m.get("retry_after", 0) for m in (meta_u, meta_t, meta_tool or {}))},
                 ),
             )
         return ToolPreInvokeResult(metadata=meta)
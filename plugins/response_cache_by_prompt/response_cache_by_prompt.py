@@ -6,23 +6,36 @@ Authors: Mihai Criveti
 
 Response Cache by Prompt Plugin.
 
-Advisory approximate caching of tool results using cosine similarity over
-selected string fields (e.g., "prompt", "input").
-
-Because the plugin framework cannot short-circuit tool execution at pre-hook,
-the plugin returns cache hit info via metadata in `tool_pre_invoke`, and writes
-results at `tool_post_invoke` with a TTL.
+Approximate caching of tool results using cosine similarity over selected
+string fields (e.g., "prompt", "input").
+
+On a hit, `tool_pre_invoke` returns the cached result so the gateway skips the
+upstream call; successful misses are stored at `tool_post_invoke` with a TTL.
+Entries are partitioned by tool, caller (user, tenant, server, gateway and
+request headers) and the arguments outside `fields`, so similarity only decides
+between calls that are otherwise identical, and one caller never receives a
+result fetched for another. Each partition keeps at most `max_entries` entries,
+evicting the least recently used; at most `max_partitions` partitions are kept,
+also in LRU order, and a partition is dropped once all its entries expired.
+
+Lookups go through the partition's `_PromptIndex`. With NumPy, hashed term vectors
+of all entries sit in one matrix and a lookup is a single matrix-vector
+product; the best `rescore_candidates` candidates are then rescored exactly.
+Hash collisions can keep the true best match out of that shortlist, so matrix
+lookups are approximate. Without NumPy an inverted index limits the exact scan
+to entries sharing a token with the query.
 """
 
 # Future
 from __future__ import annotations
 
 # Standard
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 from dataclasses import dataclass, field
 import math
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Literal, Optional, Sequence, Set, Tuple
+import zlib
 
 # Third-Party
 from pydantic import BaseModel, Field
@@ -37,6 +50,23 @@ from mcpgateway.plugins.framework import (
     ToolPreInvokePayload,
     ToolPreInvokeResult,
 )
+from mcpgateway.plugins.framework.constants import TOOL_METADATA
+from mcpgateway.services.logging_service import LoggingService
+from mcpgateway.utils.single_flight import make_flight_key
+
+# Optional vectorized index
+try:
+    # Third-Party
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
+# Initialize logging service first
+logging_service = LoggingService()
+logger = logging_service.get_logger(__name__)
 
 
 def _tokenize(text: str) -> list[str]:
@@ -89,6 +119,40 @@ def _cos_sim(a: Dict[str, float], b: Dict[str, float]) -> float:
     return sum(a.get(k, 0.0) * b.get(k, 0.0) for k in a.keys())
 
 
+def _partition_key(payload: ToolPreInvokePayload, context: PluginContext, fields: Sequence[str]) -> str:
+    """Key the partition a tool result belongs to.
+
+    A near-match hit skips the upstream call, so results must only be served
+    back to the same user, tenant, server, gateway and request headers, and
+    to calls whose arguments outside the similarity ``fields`` are identical.
+
+    Args:
+        payload: Tool invocation payload (its headers carry auth and passthrough headers).
+        context: Plugin execution context.
+        fields: Argument fields compared by similarity rather than exactly.
+
+    Returns:
+        Hex digest identifying the partition.
+
+    Examples:
+        >>> from mcpgateway.plugins.framework import GlobalContext
+        >>> def key(user, **args):
+        ...     context = PluginContext(global_context=GlobalContext(request_id="r", user=user))
+        ...     return _partition_key(ToolPreInvokePayload(name="search", args=args), context, ["query"])
+        >>> key("alice", query="weather today") == key("alice", query="weather tomorrow")
+        True
+        >>> key("alice", query="weather today") == key("bob", query="weather today")
+        False
+        >>> key("alice", query="weather", location="paris") == key("alice", query="weather", location="london")
+        False
+    """
+    global_context = context.global_context
+    tool_metadata = global_context.metadata.get(TOOL_METADATA)
+    headers = payload.headers.model_dump() if payload.headers is not None else None
+    exact_args = {k: v for k, v in (payload.args or {}).items() if k not in fields}
+    return make_flight_key(global_context.user, global_context.tenant_id, global_context.server_id, getattr(tool_metadata, "gateway_id", None), headers, exact_args)
+
+
 class ResponseCacheConfig(BaseModel):
     """Configuration for response cache by prompt similarity.
 
@@ -97,14 +161,22 @@ class ResponseCacheConfig(BaseModel):
         fields: Argument fields to extract text from for similarity matching.
         ttl: Time-to-live for cache entries in seconds.
         threshold: Minimum cosine similarity threshold for cache hits.
-        max_entries: Maximum number of cache entries per tool.
+        max_entries: Maximum number of cache entries per partition (tool and caller).
+        max_partitions: Maximum number of partitions, evicting the least recently used.
+        index: ``matrix`` (NumPy, falls back to ``inverted`` without it) or ``inverted``.
+        index_dim: Width of the hashed term vectors of the matrix index.
+        rescore_candidates: Best matrix candidates rescored with the exact cosine similarity.
     """
 
     cacheable_tools: List[str] = Field(default_factory=list)
     fields: List[str] = Field(default_factory=lambda: ["prompt", "input", "query"])  # fields to read string text from args
     ttl: int = 600
     threshold: float = 0.92  # cosine similarity threshold
-    max_entries: int = 1000
+    max_entries: int = Field(default=1000, ge=1)
+    max_partitions: int = Field(default=10000, ge=1)
+    index: Literal["matrix", "inverted"] = "matrix"
+    index_dim: int = Field(default=512, ge=16)
+    rescore_candidates: int = Field(default=8, ge=1)
 
 
 @dataclass
@@ -117,6 +189,7 @@ class _Entry:
         value: Cached result value.
         expires_at: Unix timestamp when entry expires.
         tokens: Set of tokens for fast filtering (optimization).
+        slot: Slot of the entry in its tool's index.
     """
 
     text: str
@@ -124,6 +197,216 @@ class _Entry:
     value: Any
     expires_at: float
     tokens: set[str] = field(default_factory=set)  # Pre-computed token set for quick filtering
+    slot: int = -1
+
+
+def _hashed_vector(vec: Dict[str, float], dim: int) -> Any:
+    """Project a sparse term vector onto ``dim`` dense dimensions (signed feature hashing).
+
+    Args:
+        vec: Token -> weight mapping.
+        dim: Number of dimensions.
+
+    Returns:
+        L2-normalized float32 NumPy vector.
+    """
+    row = np.zeros(dim, dtype=np.float32)
+    for tok, weight in vec.items():
+        h = zlib.crc32(tok.encode())
+        # A hash-derived sign keeps colliding tokens from inflating similarities on average
+        row[h % dim] += weight if (h // dim) & 1 else -weight
+    norm = float(np.linalg.norm(row))
+    return row / norm if norm else row
+
+
+class _PromptIndex:
+    """Similarity index over the cached prompts of one tool.
+
+    Entries live in numbered slots, so evicting one never renumbers the others.
+    They are kept in LRU order (oldest first) for eviction, and in insertion
+    order for expiry, which works because every entry of a plugin has the same TTL.
+
+    Examples:
+        >>> index = _PromptIndex(max_entries=2, use_matrix=False)
+        >>> for i, text in enumerate(["red apple", "green pear", "red cherry"]):
+        ...     index.add(_Entry(text=text, vec=_vectorize(text), value=i, expires_at=100.0, tokens=set(text.split())), now=0.0)
+        >>> [e.text for e in index]
+        ['green pear', 'red cherry']
+        >>> best, sim = index.find_best(_vectorize("red cherry"), now=0.0)
+        >>> best.value, round(sim, 4)
+        (2, 1.0)
+        >>> index.find_best(_vectorize("red cherry"), now=100.0)
+        (None, 0.0)
+    """
+
+    def __init__(self, max_entries: int, use_matrix: bool, dim: int = 512, rescore: int = 8) -> None:
+        """Initialize an empty index.
+
+        Args:
+            max_entries: Maximum number of entries.
+            use_matrix: Use the NumPy matrix index instead of the inverted index.
+            dim: Width of the hashed term vectors of the matrix index.
+            rescore: Best matrix candidates rescored with the exact cosine similarity.
+        """
+        self._max_entries = max_entries
+        self._use_matrix = use_matrix
+        self._dim = dim
+        self._rescore = rescore
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._expiry: Deque[_Entry] = deque()
+        self._free: List[int] = []
+        self._next_slot = 0
+        if use_matrix:
+            # Rows are allocated as entries arrive, so small partitions stay small
+            self._matrix = np.zeros((0, dim), dtype=np.float32)
+            # Free slots keep expiry 0, so they are masked like expired entries
+            self._expires = np.zeros(0, dtype=np.float64)
+        else:
+            self._postings: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        """Return the number of entries.
+
+        Returns:
+            Number of cached prompts.
+        """
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over the entries, least recently used first.
+
+        Returns:
+            Iterator over the entries.
+        """
+        return iter(self._entries.values())
+
+    def add(self, entry: _Entry, now: float) -> None:
+        """Add an entry, evicting expired and then least recently used entries.
+
+        Args:
+            entry: Entry to add.
+            now: Current time (same clock as ``expires_at``).
+        """
+        self.expire(now)
+        while len(self._entries) >= self._max_entries:
+            self._remove(next(iter(self._entries)))
+        if len(self._expiry) > 2 * self._max_entries:
+            # LRU evictions leave their entries queued until they would have expired
+            self._expiry = deque(e for e in self._expiry if self._entries.get(e.slot) is e)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self._next_slot
+            self._next_slot += 1
+        entry.slot = slot
+        self._entries[slot] = entry
+        self._expiry.append(entry)
+        if self._use_matrix:
+            if slot >= len(self._matrix):
+                self._grow()
+            self._matrix[slot] = _hashed_vector(entry.vec, self._dim)
+            self._expires[slot] = entry.expires_at
+        else:
+            for token in entry.tokens:
+                self._postings[token].add(slot)
+
+    def expire(self, now: float) -> None:
+        """Remove the entries that expired.
+
+        Args:
+            now: Current time (same clock as ``expires_at``).
+        """
+        while self._expiry and self._expiry[0].expires_at <= now:
+            expired = self._expiry.popleft()
+            if self._entries.get(expired.slot) is expired:
+                self._remove(expired.slot)
+
+    def touch(self, entry: _Entry) -> None:
+        """Mark an entry as most recently used.
+
+        Args:
+            entry: Entry returned by :meth:`find_best`.
+        """
+        if self._entries.get(entry.slot) is entry:
+            self._entries.move_to_end(entry.slot)
+
+    def find_best(self, vec: Dict[str, float], now: float) -> Tuple[Optional[_Entry], float]:
+        """Find the live entry most similar to a query vector.
+
+        Args:
+            vec: Normalized query vector from :func:`_vectorize`.
+            now: Current time (same clock as ``expires_at``).
+
+        Returns:
+            Tuple of (best matching entry, exact cosine similarity). The matrix
+            index only rescores its best candidates, so it may miss the true best match.
+        """
+        if not self._entries or not vec:
+            return None, 0.0
+        if self._use_matrix:
+            candidates = self._matrix_candidates(vec, now)
+        else:
+            candidates = set()
+            for token in vec:
+                candidates.update(self._postings.get(token, ()))
+
+        best: Optional[_Entry] = None
+        best_sim = 0.0
+        for slot in candidates:
+            e = self._entries.get(slot)
+            if e is None or e.expires_at <= now:
+                continue
+            sim = _cos_sim(vec, e.vec)
+            if sim > best_sim:
+                best = e
+                best_sim = sim
+        return best, best_sim
+
+    def _matrix_candidates(self, vec: Dict[str, float], now: float) -> List[int]:
+        """Rank every slot with one matrix-vector product and keep the best few.
+
+        Args:
+            vec: Normalized query vector.
+            now: Current time.
+
+        Returns:
+            Slots of the best candidates with a positive approximate similarity.
+        """
+        n = self._next_slot
+        scores = self._matrix[:n] @ _hashed_vector(vec, self._dim)
+        scores[self._expires[:n] <= now] = -1.0
+        k = min(self._rescore, n)
+        top = np.argpartition(scores, n - k)[n - k :]
+        return [int(slot) for slot in top if scores[slot] > 0]
+
+    def _grow(self) -> None:
+        """Double the matrix capacity, up to ``max_entries`` rows."""
+        capacity = min(max(2 * len(self._matrix), 1), self._max_entries)
+        matrix = np.zeros((capacity, self._dim), dtype=np.float32)
+        matrix[: len(self._matrix)] = self._matrix
+        expires = np.zeros(capacity, dtype=np.float64)
+        expires[: len(self._expires)] = self._expires
+        self._matrix, self._expires = matrix, expires
+
+    def _remove(self, slot: int) -> None:
+        """Remove the entry in a slot and free the slot.
+
+        Args:
+            slot: Slot to free.
+        """
+        entry = self._entries.pop(slot)
+        self._free.append(slot)
+        if self._use_matrix:
+            self._matrix[slot] = 0.0
+            self._expires[slot] = 0.0
+        else:
+            for token in entry.tokens:
+                slots = self._postings.get(token)
+                if slots is not None:
+                    slots.discard(slot)
+                    if not slots:
+                        del self._postings[token]
 
 
 class ResponseCacheByPromptPlugin(Plugin):
@@ -137,10 +420,11 @@ class ResponseCacheByPromptPlugin(Plugin):
         """
         super().__init__(config)
         self._cfg = ResponseCacheConfig(**(config.config or {}))
-        # Per-tool list of entries
-        self._cache: Dict[str, list[_Entry]] = {}
-        # Inverted index: tool -> token -> set of entry indices for fast filtering
-        self._index: Dict[str, Dict[str, Set[int]]] = defaultdict(lambda: defaultdict(set))
+        self._use_matrix = self._cfg.index == "matrix" and NUMPY_AVAILABLE
+        if self._cfg.index == "matrix" and not NUMPY_AVAILABLE:
+            logger.warning("numpy is not installed - response cache uses the inverted index")
+        # Similarity index per (tool, partition key), least recently used first
+        self._cache: OrderedDict[Tuple[str, str], _PromptIndex] = OrderedDict()
 
     def _gather_text(self, args: dict[str, Any] | None) -> str:
         """Extract and concatenate text from configured argument fields.
@@ -160,57 +444,28 @@ class ResponseCacheByPromptPlugin(Plugin):
                 chunks.append(v)
         return "\n".join(chunks)
 
-    def _find_best(self, tool: str, text: str) -> Tuple[Optional[_Entry], float]:
-        """Find the best matching cache entry for the given text (optimized).
-
-        Uses inverted index to quickly filter candidates before computing
-        expensive cosine similarity. Only entries sharing tokens with the
-        query are considered.
+    def _find_best(self, tool: str, text: str, scope: str) -> Tuple[Optional[_Entry], float]:
+        """Find the best matching cache entry for the given text.
 
         Args:
             tool: Tool name to search cache for.
             text: Query text to match against.
+            scope: Partition key from :func:`_partition_key`.
 
         Returns:
             Tuple of (best matching entry, similarity score).
         """
-        bucket = self._cache.get(tool, [])
-        if not bucket:
+        now = time.time()
+        index = self._cache.get((tool, scope))
+        if index is None:
             return None, 0.0
-
-        vec = _vectorize(text)
-        query_tokens = set(vec.keys())
-
-        # Fast path: use inverted index to find candidate entries
-        # Only consider entries that share at least one token with query
-        tool_index = self._index.get(tool, {})
-        candidate_indices: Set[int] = set()
-
-        for token in query_tokens:
-            if token in tool_index:
-                candidate_indices.update(tool_index[token])
-
-        # If no candidates found via index, fall back to empty result
-        if not candidate_indices:
+        index.expire(now)
+        if not index:
+            # Every entry expired: drop the partition rather than keep it until evicted
+            del self._cache[(tool, scope)]
             return None, 0.0
-
-        # Compute similarity only for candidates
-        best: Optional[_Entry] = None
-        best_sim = 0.0
-        now = time.time()
-
-        for idx in candidate_indices:
-            if idx >= len(bucket):
-                continue
-            e = bucket[idx]
-            if e.expires_at <= now:
-                continue
-            sim = _cos_sim(vec, e.vec)
-            if sim > best_sim:
-                best = e
-                best_sim = sim
-
-        return best, best_sim
+        self._cache.move_to_end((tool, scope))
+        return index.find_best(_vectorize(text), now)
 
     async def tool_pre_invoke(self, payload: ToolPreInvokePayload, context: PluginContext) -> ToolPreInvokeResult:
         """Check for cache hit before tool invocation.
@@ -220,7 +475,7 @@ class ResponseCacheByPromptPlugin(Plugin):
             context: Plugin execution context.
 
         Returns:
-            Result with metadata indicating cache hit status.
+            Result with metadata indicating cache hit status, carrying the cached tool result on a hit.
         """
         tool = payload.name
         if tool not in self._cfg.cacheable_tools:
@@ -228,9 +483,11 @@ class ResponseCacheByPromptPlugin(Plugin):
         text = self._gather_text(payload.args or {})
         if not text:
             return ToolPreInvokeResult(continue_processing=True)
-        # Keep text for post-invoke storage
+        scope = _partition_key(payload, context, self._cfg.fields)
+        # Keep text and partition key for post-invoke storage
         context.set_state("rcbp_last_text", text)
-        best, sim = self._find_best(tool, text)
+        context.set_state("rcbp_scope", scope)
+        best, sim = self._find_best(tool, text, scope)
         meta: dict[str, Any] = {"approx_cache": False}
         if best and sim >= self._cfg.threshold:
             meta.update(
@@ -243,6 +500,10 @@ class ResponseCacheByPromptPlugin(Plugin):
             # Expose a small hint; not all callers will use it
             context.metadata["approx_cached_result_available"] = True
             context.metadata["approx_cached_similarity"] = sim
+            self._cache[(tool, scope)].touch(best)
+            # The gateway returns this result without calling the tool; post-invoke must not re-store it
+            context.set_state("rcbp_hit", True)
+            return ToolPreInvokeResult(result=best.value, metadata=meta)
         return ToolPreInvokeResult(metadata=meta)
 
     async def tool_post_invoke(self, payload: ToolPostInvokePayload, context: PluginContext) -> ToolPostInvokeResult:
@@ -258,43 +519,27 @@ class ResponseCacheByPromptPlugin(Plugin):
         tool = payload.name
         if tool not in self._cfg.cacheable_tools:
             return ToolPostInvokeResult(continue_processing=True)
-        # Retrieve text captured in pre-invoke
+        # Retrieve text and partition key captured in pre-invoke
         text = context.get_state("rcbp_last_text") if context else ""
-        if not text:
+        scope = context.get_state("rcbp_scope") if context else None
+        if not text or scope is None:
             # As a fallback, do nothing
             return ToolPostInvokeResult(continue_processing=True)
+        if context and context.get_state("rcbp_hit"):
+            return ToolPostInvokeResult(metadata={"approx_cache_stored": False})
+        if isinstance(payload.result, dict) and payload.result.get("isError"):
+            # Never serve a failed call from the cache
+            return ToolPostInvokeResult(metadata={"approx_cache_stored": False})
 
         vec = _vectorize(text)
-        tokens = set(vec.keys())
-        entry = _Entry(text=text, vec=vec, value=payload.result, expires_at=time.time() + max(1, int(self._cfg.ttl)), tokens=tokens)
-
-        bucket = self._cache.setdefault(tool, [])
-        entry_idx = len(bucket)
-        bucket.append(entry)
-
-        # Update inverted index for new entry
-        tool_index = self._index[tool]
-        for token in tokens:
-            tool_index[token].add(entry_idx)
-
-        # Evict expired entries and rebuild index
         now = time.time()
-        # Filter out expired entries
-        valid_entries = [e for e in bucket if e.expires_at > now]
-
-        # Cap size if needed
-        if len(valid_entries) > self._cfg.max_entries:
-            valid_entries = valid_entries[-self._cfg.max_entries:]
-
-        # Rebuild bucket and index if we removed or modified entries
-        if len(valid_entries) != len(bucket):
-            bucket.clear()
-            bucket.extend(valid_entries)
-
-            # Rebuild inverted index for this tool
-            self._index[tool].clear()
-            for new_idx, entry in enumerate(bucket):
-                for token in entry.tokens:
-                    self._index[tool][token].add(new_idx)
-
+        entry = _Entry(text=text, vec=vec, value=payload.result, expires_at=now + max(1, int(self._cfg.ttl)), tokens=set(vec.keys()))
+        index = self._cache.get((tool, scope))
+        if index is None:
+            index = self._cache[(tool, scope)] = _PromptIndex(self._cfg.max_entries, self._use_matrix, self._cfg.index_dim, self._cfg.rescore_candidates)
+            while len(self._cache) > self._cfg.max_partitions:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end((tool, scope))
+        index.add(entry, now)
         return ToolPostInvokeResult(metadata={"approx_cache_stored": True})
@@ -350,3 +350,37 @@ def clear_jwt_cache_between_tests():
         clear_jwt_caches()
     except ImportError:
         pass
+
+
+@pytest.fixture(autouse=True)
+def clear_permission_cache():
+    """Clear the process-wide permission cache before and after each test.
+
+    Tests reuse the same user emails with different mocked roles, so compiled
+    permission sets must not leak between them.
+    """
+    from mcpgateway.cache.permission_cache import get_permission_cache
+
+    get_permission_cache().invalidate_all()
+    yield
+    get_permission_cache().invalidate_all()
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_access_cache():
+    """Clear the entity visibility cache used by token scoping before and after each test."""
+    from mcpgateway.cache.resource_access_cache import get_resource_access_cache
+
+    get_resource_access_cache().invalidate_all()
+    yield
+    get_resource_access_cache().invalidate_all()
+
+
+@pytest.fixture(autouse=True)
+def clear_list_response_cache():
+    """Clear the pre-serialized tools/prompts/resources list cache before and after each test."""
+    from mcpgateway.cache.list_response_cache import get_list_response_cache
+
+    get_list_response_cache().invalidate_all()
+    yield
+    get_list_response_cache().invalidate_all()
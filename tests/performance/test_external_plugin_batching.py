@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Performance tests for batched external plugin hook invocation.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+These tests start a local stdio plugin server and compare the throughput of
+one ``invoke_hook`` round-trip per call against ``invoke_hooks`` batches for
+waves of concurrent hook invocations (as produced by concurrent requests or a
+group of read-only plugins).
+
+Run with:
+    uv run pytest -v -s tests/performance/test_external_plugin_batching.py
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from mcpgateway.plugins.framework import ConfigLoader, GlobalContext, PluginContext, PluginLoader, PromptHookType, PromptPrehookPayload
+
+N_WAVES = 50
+WAVE_SIZE = 16
+
+
+async def _load_plugin(batch_hooks: bool):
+    config = ConfigLoader.load_config("tests/unit/mcpgateway/plugins/fixtures/configs/valid_stdio_external_plugin.yaml")
+    plugin_config = config.plugins[0]
+    plugin_config.mcp.batch_hooks = batch_hooks
+    return await PluginLoader().load_and_instantiate_plugin(plugin_config)
+
+
+async def _run_waves(plugin) -> float:
+    start = time.perf_counter()
+    for wave in range(N_WAVES):
+        await asyncio.gather(
+            *(
+                plugin.invoke_hook(
+                    PromptHookType.PROMPT_PRE_FETCH,
+                    PromptPrehookPayload(prompt_id="test_prompt", args={"text": f"request {wave}-{i}"}),
+                    PluginContext(global_context=GlobalContext(request_id=f"{wave}-{i}")),
+                )
+                for i in range(WAVE_SIZE)
+            )
+        )
+    return time.perf_counter() - start
+
+
+class TestExternalPluginBatchingPerformance:
+    """Benchmark of per-call vs batched hook RPC over stdio."""
+
+    @pytest.mark.asyncio
+    async def test_batched_throughput_beats_per_call(self, monkeypatch):
+        monkeypatch.setenv("PLUGINS_CONFIG_PATH", "tests/unit/mcpgateway/plugins/fixtures/configs/valid_multiple_plugins_filter.yaml")
+        monkeypatch.setenv("PYTHONPATH", os.environ.get("PYTHONPATH", "."))
+
+        throughput = {}
+        for batch_hooks in (False, True):
+            plugin = await _load_plugin(batch_hooks)
+            try:
+                await _run_waves(plugin)  # warm up
+                elapsed = await _run_waves(plugin)
+            finally:
+                await plugin.shutdown()
+            throughput[batch_hooks] = N_WAVES * WAVE_SIZE / elapsed
+
+        speedup = throughput[True] / throughput[False]
+        print(f"\nPer-call: {throughput[False]:.0f} hooks/s, batched: {throughput[True]:.0f} hooks/s ({speedup:.1f}x)")
+
+        assert speedup > 1.0
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Performance test for incremental log aggregation with mergeable sketches.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Compares how the performance metrics of one hour of structured logs (12
+five-minute windows plus the hourly window, per component/operation) are
+computed by:
+
+1. The rescan path: durations of every window are loaded, sorted and passed to
+   ``LogAggregator._percentile`` (what the Python fallback and ``backfill`` did
+   for every window).
+2. The incremental path: entries are recorded per minute in a
+   ``SlidingWindowAggregator`` as they are logged, and windows are rolled up by
+   merging minute statistics.
+
+on synthetic logs (500k entries by default, spread over 20 component/operation
+pairs with a log-normal latency distribution). Recording cost is reported
+separately since it is paid at log time, and the rollup is timed twice: the
+first run builds the sketches of the minute statistics, later runs (the
+aggregation loop re-rolling overlapping windows) reuse them.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_log_aggregation_sketches.py
+
+Set LOG_AGGREGATION_BENCHMARK_ENTRIES to change the number of entries.
+"""
+
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from mcpgateway.services.log_aggregator import _minute_of, LogAggregator, SlidingWindowAggregator
+
+N_ENTRIES = int(os.environ.get("LOG_AGGREGATION_BENCHMARK_ENTRIES", "500000"))
+N_PAIRS = 20
+START = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+WINDOWS = [(START + timedelta(minutes=m), START + timedelta(minutes=m + 5)) for m in range(0, 60, 5)] + [(START, START + timedelta(hours=1))]
+
+
+def _synthetic_hour():
+    rng = random.Random(42)
+    return [(START + timedelta(seconds=rng.random() * 3600), ("component-%d" % (i % N_PAIRS), "operation"), rng.lognormvariate(3.0, 0.8)) for i in range(N_ENTRIES)]
+
+
+def _rescan(entries):
+    results = {}
+    for window_start, window_end in WINDOWS:
+        by_pair = {}
+        for ts, pair, duration in entries:
+            if window_start <= ts < window_end:
+                by_pair.setdefault(pair, []).append(duration)
+        for pair, durations in by_pair.items():
+            durations.sort()
+            results[(window_start, window_end, pair)] = {
+                "count": len(durations),
+                "avg_duration": sum(durations) / len(durations),
+                "p50": LogAggregator._percentile(durations, 0.5),
+                "p95": LogAggregator._percentile(durations, 0.95),
+                "p99": LogAggregator._percentile(durations, 0.99),
+            }
+    return results
+
+
+def _record(entries):
+    sliding = SlidingWindowAggregator(retention_minutes=120)
+    sliding._started_minute = _minute_of(START)
+    for ts, (component, operation), duration in entries:
+        sliding.record(component, operation, ts, duration, is_error=False)
+    return sliding
+
+
+def _rollup(sliding):
+    results = {}
+    for window_start, window_end in WINDOWS:
+        for pair, stats in sliding.window_stats(window_start, window_end).items():
+            results[(window_start, window_end, pair)] = stats.to_stats()
+    return results
+
+
+def _measure(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+class TestLogAggregationSketchPerformance:
+    """Benchmark of rescanning logs vs merging per-minute sketches."""
+
+    def test_sketch_rollup_beats_rescan(self):
+        entries = _synthetic_hour()
+
+        exact, rescan_s = _measure(lambda: _rescan(entries))
+        sliding, record_s = _measure(lambda: _record(entries))
+        rolled, rollup_s = _measure(lambda: _rollup(sliding))
+        _, warm_rollup_s = _measure(lambda: _rollup(sliding))
+
+        errors = [abs(rolled[key][q] - exact[key][q]) / exact[key][q] for key in exact for q in ("p50", "p95", "p99")]
+        print(
+            f"\n{N_ENTRIES:,} entries, {N_PAIRS} pairs, {len(WINDOWS)} windows\n"
+            f"  rescan + sort: {rescan_s:8.3f}s\n"
+            f"  record:        {record_s:8.3f}s  ({record_s / N_ENTRIES * 1e6:.2f}us per entry, paid at log time)\n"
+            f"  sketch rollup: {rollup_s:8.3f}s  ({rescan_s / rollup_s:.1f}x faster)\n"
+            f"  warm rollup:   {warm_rollup_s:8.3f}s  ({rescan_s / warm_rollup_s:.1f}x faster)\n"
+            f"  max percentile error: {max(errors):.3%}"
+        )
+
+        assert rolled.keys() == exact.keys()
+        for key, expected in exact.items():
+            assert rolled[key]["count"] == expected["count"]
+            assert abs(rolled[key]["avg_duration"] - expected["avg_duration"]) <= 1e-9 * expected["avg_duration"]
+        assert max(errors) <= 0.02
+        assert rollup_s < rescan_s
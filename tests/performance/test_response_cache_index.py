@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Performance test for the ResponseCacheByPrompt similarity index.
+
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Compares the lookup latency of the two ``_PromptIndex`` implementations:
+
+1. The inverted index: exact cosine similarity against every cached prompt
+   sharing a token with the query.
+2. The matrix index: one NumPy matrix-vector product over hashed term vectors,
+   then exact rescoring of the best few candidates (approximate: hash
+   collisions can keep the true best match out of the shortlist).
+
+at 10k and 100k cached prompts. Prompts draw their words from a Zipf-like
+vocabulary, so common words make many entries share a token with any query,
+as with natural-language prompts.
+
+Run with:
+    uv run pytest -v -s tests/performance/test_response_cache_index.py
+
+Set RCBP_BENCHMARK_QUERIES to change the number of lookups per size.
+"""
+
+import os
+import random
+import statistics
+import time
+
+import pytest
+
+from plugins.response_cache_by_prompt.response_cache_by_prompt import _Entry, _PromptIndex, _vectorize
+
+pytest.importorskip("numpy")
+
+N_QUERIES = int(os.environ.get("RCBP_BENCHMARK_QUERIES", "200"))
+VOCABULARY = [f"word{i}" for i in range(5000)]
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def _prompts(rng, n):
+    return [" ".join(rng.choices(VOCABULARY, weights=WEIGHTS, k=12)) for _ in range(n)]
+
+
+def _build(prompts, use_matrix):
+    index = _PromptIndex(len(prompts), use_matrix=use_matrix)
+    for i, prompt in enumerate(prompts):
+        vec = _vectorize(prompt)
+        index.add(_Entry(text=prompt, vec=vec, value=i, expires_at=1e12, tokens=set(vec)), now=0.0)
+    return index
+
+
+def _lookup_latencies(index, queries):
+    latencies = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(index.find_best(query, now=0.0))
+        latencies.append(time.perf_counter() - start)
+    return results, latencies
+
+
+def _report(latencies):
+    ordered = sorted(latencies)
+    return f"p50 {statistics.median(ordered) * 1000:8.2f} ms   p99 {ordered[int(len(ordered) * 0.99) - 1] * 1000:8.2f} ms"
+
+
+class TestResponseCacheIndexPerformance:
+    """Benchmark of inverted vs matrix similarity lookups."""
+
+    @pytest.mark.parametrize("n_entries", [10_000, 100_000])
+    def test_matrix_lookup_beats_inverted_index(self, n_entries):
+        rng = random.Random(42)
+        prompts = _prompts(rng, n_entries)
+        # Half near-duplicates of cached prompts (hits), half fresh prompts (misses)
+        queries = [_vectorize(" ".join(p.split()[1:])) for p in rng.sample(prompts, N_QUERIES // 2)]
+        queries += [_vectorize(p) for p in _prompts(rng, N_QUERIES - len(queries))]
+
+        matrix_results, matrix_latencies = _lookup_latencies(_build(prompts, use_matrix=True), queries)
+        inverted_results, inverted_latencies = _lookup_latencies(_build(prompts, use_matrix=False), queries)
+
+        print(f"\n{n_entries:,} cached prompts, {len(queries)} lookups\n  inverted: {_report(inverted_latencies)}\n  matrix:   {_report(matrix_latencies)}")
+
+        # The matrix index is approximate: it only rescores its best candidates, so it can
+        # miss the true best match, but a similarity it reports is exact and never higher
+        hits = N_QUERIES // 2
+        recalled = 0
+        for (_, m_sim), (_, i_sim) in zip(matrix_results[:hits], inverted_results[:hits]):
+            assert m_sim <= i_sim + 1e-9
+            recalled += m_sim == pytest.approx(i_sim)
+        print(f"  matrix recall of the best near-duplicate: {recalled / hits:.1%}")
+        assert recalled >= 0.9 * hits
+
+        assert statistics.median(matrix_latencies) < statistics.median(inverted_latencies)
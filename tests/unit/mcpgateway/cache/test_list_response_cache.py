@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_list_response_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the pre-serialized tools/prompts/resources list cache.
+"""
+
+# Standard
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+from fastapi import Request
+import pytest
+
+# First-Party
+from mcpgateway.cache.list_response_cache import get_list_response_cache, ListResponseCache, serialize_result
+from mcpgateway.cache.registry_cache import CacheInvalidationSubscriber, RegistryCache
+from mcpgateway.main import handle_rpc
+
+
+def _key(kind="tools", server_id=None, user_email=None, token_teams=None):
+    return ListResponseCache.make_key(kind, server_id, None, user_email, token_teams)
+
+
+def test_scopes_do_not_share_entries():
+    cache = ListResponseCache(ttl=30)
+    cache.set(_key(token_teams=["t1"]), serialize_result({"tools": ["team"]}), cache.generation("tools"))
+
+    assert cache.get(_key(token_teams=[])) is None
+    assert cache.get(_key(user_email="alice@example.com", token_teams=["t1"])) is None
+    assert cache.get(_key(server_id="srv", token_teams=["t1"])) is None
+    assert cache.get(ListResponseCache.make_key("tools", None, None, None, ["t1"], representation="mcp")) is None
+    assert cache.get(_key(token_teams=["t1"])).body == b'{"tools":["team"]}'
+
+
+def test_invalidation_follows_dependencies():
+    cache = ListResponseCache(ttl=30)
+    for kind in ("tools", "prompts", "resources"):
+        cache.set(_key(kind), serialize_result({kind: []}), cache.generation(kind))
+
+    cache.invalidate_type("prompts")
+    assert cache.get(_key("prompts")) is None
+    assert cache.get(_key("tools")) is not None
+
+    cache.invalidate_type("agents")
+    assert cache.stats()["size"] == 2
+
+    cache.invalidate_type("gateways")
+    assert cache.stats()["size"] == 0
+
+
+def test_list_computed_before_invalidation_is_not_stored():
+    cache = ListResponseCache(ttl=30)
+    generation = cache.generation("tools")
+    # A tool changes while the list is being computed
+    cache.invalidate_type("tools")
+    stale = serialize_result({"tools": ["old"]})
+
+    assert cache.set(_key(), stale, generation) is stale
+    assert cache.get(_key()) is None
+    cache.set(_key(), serialize_result({"tools": ["new"]}), cache.generation("tools"))
+    assert cache.get(_key()).body == b'{"tools":["new"]}'
+
+    generation = cache.generation("prompts")
+    cache.invalidate_all()
+    cache.set(_key("prompts"), serialize_result({"prompts": []}), generation)
+    assert cache.get(_key("prompts")) is None
+
+
+def test_entries_expire():
+    cache = ListResponseCache(ttl=30)
+    key = _key()
+    cache.set(key, serialize_result({"tools": []}), cache.generation("tools"))
+    with patch("mcpgateway.cache.list_response_cache.time.monotonic", return_value=1e12):
+        assert cache.get(key) is None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = ListResponseCache(enabled=False)
+    value = serialize_result({"tools": []})
+    assert cache.set(_key(), value, 0) is value
+    assert cache.get(_key()) is None
+
+
+@pytest.mark.asyncio
+async def test_registry_invalidation_clears_list_cache():
+    get_list_response_cache().set(_key(), serialize_result({"tools": []}), get_list_response_cache().generation("tools"))
+    registry = RegistryCache()
+    with patch.object(registry, "_get_redis_client", new=AsyncMock(return_value=None)):
+        await registry.invalidate_tools()
+    assert get_list_response_cache().get(_key()) is None
+
+
+@pytest.mark.asyncio
+async def test_pubsub_invalidation_clears_list_cache():
+    get_list_response_cache().set(_key("resources", server_id="srv"), serialize_result({"resources": []}), get_list_response_cache().generation("resources"))
+    await CacheInvalidationSubscriber()._process_invalidation("registry:servers")
+    assert get_list_response_cache().get(_key("resources", server_id="srv")) is None
+
+
+def _rpc_request(payload, headers=None):
+    request = MagicMock(spec=Request)
+    request.body = AsyncMock(return_value=json.dumps(payload).encode())
+    request.headers = headers or {}
+    request.query_params = {}
+    request.state = MagicMock(jsonrpc_batch=False)
+    return request
+
+
+@pytest.mark.asyncio
+async def test_rpc_tools_list_served_from_cache_with_etag():
+    tool = MagicMock()
+    tool.model_dump.return_value = {"name": "tool-1"}
+    list_tools = AsyncMock(return_value=([tool], None))
+
+    with (
+        patch("mcpgateway.main.tool_service.list_tools", new=list_tools),
+        patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", ["team-1"], False)),
+    ):
+        first = await handle_rpc(_rpc_request({"jsonrpc": "2.0", "id": 1, "method": "tools/list"}), db=MagicMock(), user={"email": "user@example.com"})
+        second = await handle_rpc(_rpc_request({"jsonrpc": "2.0", "id": 2, "method": "tools/list"}), db=MagicMock(), user={"email": "user@example.com"})
+        etag = first.headers["etag"]
+        not_modified = await handle_rpc(_rpc_request({"jsonrpc": "2.0", "id": 3, "method": "tools/list"}, headers={"if-none-match": etag}), db=MagicMock(), user={"email": "user@example.com"})
+
+    assert list_tools.await_count == 1
+    assert json.loads(first.body) == {"jsonrpc": "2.0", "result": {"tools": [{"name": "tool-1"}]}, "id": 1}
+    assert json.loads(second.body)["id"] == 2
+    assert second.headers["etag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_permission_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the process-wide compiled permission cache.
+"""
+
+# Standard
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.auth_cache import AuthCache
+from mcpgateway.cache.permission_cache import get_permission_cache, PermissionCache, process_invalidation_message
+from mcpgateway.cache.registry_cache import CacheInvalidationSubscriber
+from mcpgateway.services.permission_service import PermissionService
+from mcpgateway.services.role_service import RoleService
+
+
+def user_role(*permissions):
+    role = MagicMock()
+    role.role.get_effective_permissions.return_value = list(permissions)
+    return role
+
+
+def test_identical_sets_are_shared():
+    cache = PermissionCache(ttl=60)
+    first = cache.set_permissions("a@example.com", None, ["tools.read", "tools.execute"], cache.generation)
+    second = cache.set_permissions("b@example.com", "team-1", ("tools.execute", "tools.read"), cache.generation)
+    other = cache.set_permissions("c@example.com", None, ["tools.read"], cache.generation)
+
+    assert first is second
+    assert other is not first
+    assert isinstance(first, frozenset)
+    assert cache.stats()["distinct_permission_sets"] == 2
+
+
+def test_entries_expire(monkeypatch):
+    cache = PermissionCache(ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr("mcpgateway.cache.permission_cache.time.monotonic", lambda: now[0])
+    cache.set_permissions("a@example.com", None, ["tools.read"], cache.generation)
+    cache.set_admin("a@example.com", False, cache.generation)
+
+    now[0] += 9
+    assert cache.get_permissions("a@example.com", None) == {"tools.read"}
+    assert cache.get_admin("a@example.com") is False
+
+    now[0] += 2
+    assert cache.get_permissions("a@example.com", None) is None
+    assert cache.get_admin("a@example.com") is None
+
+
+def test_lookup_racing_an_invalidation_is_not_stored():
+    cache = PermissionCache(ttl=60)
+    generation = cache.generation
+
+    cache.invalidate_user("someone-else@example.com")
+    cache.set_permissions("a@example.com", None, ["tools.read"], generation)
+    cache.set_admin("a@example.com", True, generation)
+
+    assert cache.get_permissions("a@example.com", None) is None
+    assert cache.get_admin("a@example.com") is None
+
+
+def test_invalidation_scopes():
+    cache = PermissionCache(ttl=60)
+    for email, team in (("a@example.com", None), ("a@example.com", "t1"), ("b@example.com", "t1"), ("b@example.com", "t2")):
+        cache.set_permissions(email, team, [f"{team}.read"], cache.generation)
+
+    cache.invalidate_team("t1")
+    assert cache.get_permissions("a@example.com", "t1") is None
+    assert cache.get_permissions("b@example.com", "t1") is None
+    assert cache.get_permissions("b@example.com", "t2") is not None
+
+    cache.invalidate_user("b@example.com")
+    assert cache.get_permissions("b@example.com", "t2") is None
+    assert cache.get_permissions("a@example.com", None) is not None
+
+    cache.invalidate_all()
+    assert cache.stats()["permission_entries"] == 0
+
+
+def test_max_entries_evicts_oldest():
+    cache = PermissionCache(ttl=60, max_entries=4)
+    for i in range(5):
+        cache.set_permissions(f"u{i}@example.com", None, ["tools.read"], cache.generation)
+
+    assert cache.stats()["permission_entries"] == 3
+    assert cache.get_permissions("u0@example.com", None) is None
+    assert cache.get_permissions("u4@example.com", None) is not None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = PermissionCache(enabled=False)
+    assert cache.set_permissions("a@example.com", None, ["tools.read"], cache.generation) == {"tools.read"}
+    assert cache.get_permissions("a@example.com", None) is None
+    assert cache.stats()["permission_entries"] == 0
+
+
+@pytest.mark.parametrize(
+    "message,cleared",
+    [
+        ("user:a@example.com", {("a@example.com", None), ("a@example.com", "t1")}),
+        ("membership:a@example.com", {("a@example.com", None), ("a@example.com", "t1")}),
+        ("role:a@example.com:t1", {("a@example.com", None), ("a@example.com", "t1")}),
+        ("team_roles:t1", {("a@example.com", "t1"), ("b@example.com", "t1")}),
+        ("permissions:b@example.com", {("b@example.com", "t1")}),
+        ("permissions:*", {("a@example.com", None), ("a@example.com", "t1"), ("b@example.com", "t1")}),
+        ("revoke:jti-1", set()),
+    ],
+)
+def test_process_invalidation_message(message, cleared):
+    cache = get_permission_cache()
+    keys = {("a@example.com", None), ("a@example.com", "t1"), ("b@example.com", "t1")}
+    for email, team in keys:
+        cache.set_permissions(email, team, ["tools.read"], cache.generation)
+
+    process_invalidation_message(message)
+
+    assert {key for key in keys if cache.get_permissions(*key) is None} == cleared
+
+
+class TestPermissionServiceSharing:
+    """The shared cache spans PermissionService instances (one per request)."""
+
+    @pytest.mark.asyncio
+    async def test_permissions_loaded_once_across_instances(self):
+        first = PermissionService(MagicMock(), audit_enabled=False)
+        second = PermissionService(MagicMock(), audit_enabled=False)
+
+        with patch.object(PermissionService, "_get_user_roles", new=AsyncMock(return_value=[user_role("tools.read")])) as get_roles:
+            assert await first.get_user_permissions("a@example.com", "t1") == {"tools.read"}
+            assert await second.get_user_permissions("a@example.com", "t1") == {"tools.read"}
+            assert await second.check_permission("a@example.com", "tools.read", team_id="t1", allow_admin_bypass=False)
+
+        assert get_roles.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_audit_mode_bypasses_shared_cache(self):
+        service = PermissionService(MagicMock(), audit_enabled=True)
+
+        with patch.object(PermissionService, "_get_user_roles", new=AsyncMock(return_value=[user_role("tools.read")])):
+            await service.get_user_permissions("a@example.com")
+
+        assert get_permission_cache().stats()["permission_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_admin_flag_cached_across_instances(self):
+        db = MagicMock()
+        db.execute.return_value.scalar_one_or_none.return_value = MagicMock(is_admin=True)
+
+        assert await PermissionService(db)._is_user_admin("ops@example.com") is True
+        assert await PermissionService(db)._is_user_admin("ops@example.com") is True
+        assert db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_auth_cache_hooks_invalidate(self):
+        auth_cache = AuthCache(enabled=False)
+        cache = get_permission_cache()
+        service = PermissionService(MagicMock(), audit_enabled=False)
+
+        with patch.object(PermissionService, "_get_user_roles", new=AsyncMock(return_value=[user_role("tools.read")])) as get_roles:
+            await service.get_user_permissions("a@example.com", "t1")
+            for invalidate in (
+                auth_cache.invalidate_user("a@example.com"),
+                auth_cache.invalidate_user_role("a@example.com", "t1"),
+                auth_cache.invalidate_team_roles("t1"),
+                auth_cache.invalidate_team_membership("a@example.com"),
+                auth_cache.invalidate_permissions("a@example.com"),
+                auth_cache.invalidate_permissions(),
+            ):
+                await invalidate
+                assert cache.get_permissions("a@example.com", "t1") is None
+                await PermissionService(MagicMock(), audit_enabled=False).get_user_permissions("a@example.com", "t1")
+
+        assert get_roles.await_count == 7
+        assert auth_cache.stats()["permissions"]["invalidation_count"] >= 6
+
+    @pytest.mark.asyncio
+    async def test_invalidate_permissions_publishes(self):
+        auth_cache = AuthCache()
+        redis = AsyncMock()
+        with patch.object(auth_cache, "_get_redis_client", new=AsyncMock(return_value=redis)):
+            await auth_cache.invalidate_permissions("a@example.com")
+            await auth_cache.invalidate_permissions()
+
+        assert [call.args for call in redis.publish.await_args_list] == [
+            ("mcpgw:auth:invalidate", "permissions:a@example.com"),
+            ("mcpgw:auth:invalidate", "permissions:*"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_role_changes_invalidate_permissions():
+    service = RoleService(MagicMock())
+    assignment = MagicMock(is_active=True)
+
+    with (
+        patch("mcpgateway.services.role_service.auth_cache") as auth_cache,
+        patch.object(RoleService, "get_user_role_assignment", new=AsyncMock(return_value=assignment)),
+    ):
+        auth_cache.invalidate_permissions = AsyncMock()
+        assert await service.revoke_role_from_user("a@example.com", "role-1", "team", "t1")
+
+    auth_cache.invalidate_permissions.assert_awaited_once_with("a@example.com")
+
+
+@pytest.mark.asyncio
+async def test_subscriber_routes_auth_channel_messages(monkeypatch):
+    subscriber = CacheInvalidationSubscriber()
+    stop_event = asyncio.Event()
+    messages = [
+        {"type": "message", "channel": b"mcpgw:auth:invalidate", "data": b"user:a@example.com"},
+        {"type": "message", "channel": "mcpgw:cache:invalidate", "data": "registry:tools"},
+    ]
+
+    class FakePubSub:
+        async def get_message(self, **_kwargs):
+            if not messages:
+                stop_event.set()
+                return None
+            return messages.pop(0)
+
+    subscriber._pubsub = FakePubSub()
+    subscriber._stop_event = stop_event
+    subscriber._started = True
+    monkeypatch.setattr(subscriber, "_process_invalidation", AsyncMock())
+    cache = get_permission_cache()
+    cache.set_permissions("a@example.com", None, ["tools.read"], cache.generation)
+
+    await subscriber._listen_loop()
+
+    assert cache.get_permissions("a@example.com", None) is None
+    subscriber._process_invalidation.assert_awaited_once_with("registry:tools")
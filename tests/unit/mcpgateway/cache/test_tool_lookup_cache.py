@@ -20,6 +20,7 @@ def tool_lookup_cache_instance():
     cache._enabled = True
     cache._l2_enabled = False
     cache._cache.clear()
+    cache._validators.clear()
     cache._l1_maxsize = 10
     cache.reset_stats()
     return cache
@@ -257,3 +258,22 @@ async def test_tool_lookup_cache_invalidate_gateway_redis_error(tool_lookup_cach
     tool_lookup_cache_instance._get_redis_client = AsyncMock(return_value=redis)
 
     await tool_lookup_cache_instance.invalidate_gateway("gw-1")
+
+
+def test_tool_lookup_cache_validators(tool_lookup_cache_instance):
+    tool_lookup_cache_instance._l1_maxsize = 2
+    compile_validator = MagicMock(side_effect=lambda: object())
+
+    first = tool_lookup_cache_instance.get_validator("t1", "input", "v1", compile_validator)
+    assert tool_lookup_cache_instance.get_validator("t1", "input", "v1", compile_validator) is first
+    assert tool_lookup_cache_instance.get_validator("t1", "output", "v1", compile_validator) is not first
+    tool_lookup_cache_instance.get_validator("t2", "input", "v1", compile_validator)
+
+    # LRU eviction keeps the validators bounded by the L1 size
+    stats = tool_lookup_cache_instance.stats()
+    assert stats["validator_count"] == 2
+    assert stats["validator_compile_count"] == 3
+    assert stats["validator_hit_count"] == 1
+
+    tool_lookup_cache_instance.invalidate_all_local()
+    assert tool_lookup_cache_instance.stats()["validator_count"] == 0
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/cache/test_verified_token_cache.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the process-wide verified JWT cache.
+"""
+
+# Standard
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.cache.auth_cache import AuthCache
+from mcpgateway.cache.registry_cache import CacheInvalidationSubscriber
+from mcpgateway.cache.verified_token_cache import get_verified_token_cache, VerifiedTokenCache
+from mcpgateway.utils import verify_credentials as vc
+from mcpgateway.utils.jwt_config_helper import clear_jwt_caches
+
+
+def request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+@pytest.fixture
+def auth_cache():
+    cache = AuthCache(enabled=False)
+    with patch("mcpgateway.cache.auth_cache.get_auth_cache", return_value=cache):
+        yield cache
+
+
+@pytest.mark.asyncio
+async def test_verified_once_across_requests():
+    get_verified_token_cache().reset_stats()
+    payload = {"sub": "alice@example.com", "exp": time.time() + 60}
+    with patch.object(vc, "verify_jwt_token", new=AsyncMock(return_value=payload)) as verify:
+        first = await vc.verify_jwt_token_cached("token", request())
+        second = await vc.verify_jwt_token_cached("token", request())
+        await vc.verify_jwt_token_cached("other-token", request())
+
+    assert first == second == payload
+    assert second is not payload
+    assert verify.await_count == 2
+    assert get_verified_token_cache().stats()["hit_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_nested_claims_cannot_be_mutated(auth_cache):
+    cache = VerifiedTokenCache(max_ttl=60, enabled=True)
+    payload = {"sub": "alice", "teams": ["t1"], "scopes": {"permissions": ["tools.read"]}}
+    cache.set("token", payload)
+    payload["teams"].append("t2")
+
+    claims = await cache.get("token")
+    claims["teams"].append("t3")
+    claims["scopes"]["permissions"].append("admin.all")
+
+    assert await cache.get("token") == {"sub": "alice", "teams": ["t1"], "scopes": {"permissions": ["tools.read"]}}
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_not_cached():
+    with patch.object(vc, "verify_jwt_token", new=AsyncMock(side_effect=vc.HTTPException(status_code=401))) as verify:
+        for _ in range(2):
+            with pytest.raises(vc.HTTPException):
+                await vc.verify_jwt_token_cached("bad-token", request())
+
+    assert verify.await_count == 2
+    assert get_verified_token_cache().stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_entry_expires_at_exp_and_max_ttl(monkeypatch):
+    cache = VerifiedTokenCache(max_ttl=60, enabled=True)
+    now = [1000.0]
+    monkeypatch.setattr("mcpgateway.cache.verified_token_cache.time.time", lambda: now[0])
+    cache.set("short", {"sub": "a", "exp": 1010})
+    cache.set("long", {"sub": "b", "exp": 5000})
+
+    now[0] = 1009
+    assert await cache.get("short") is not None
+    now[0] = 1010
+    assert await cache.get("short") is None
+    now[0] = 1059
+    assert await cache.get("long") is not None
+    now[0] = 1060
+    assert await cache.get("long") is None
+    assert cache.stats()["expired_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_bound():
+    cache = VerifiedTokenCache(max_size=2, enabled=True)
+    cache.set("a", {"sub": "a"})
+    cache.set("b", {"sub": "b"})
+    assert await cache.get("a") is not None  # "b" becomes least recently used
+    cache.set("c", {"sub": "c"})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.stats()["eviction_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_locally_revoked_token_is_never_served(auth_cache):
+    cache = VerifiedTokenCache(enabled=True)
+    cache.set("token", {"sub": "a", "jti": "jti-1"})
+    auth_cache._revoked_jtis.add("jti-1")
+
+    assert await cache.get("token") is None
+    assert cache.stats()["revoked_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_revocation_rechecked_after_interval(auth_cache, monkeypatch):
+    cache = VerifiedTokenCache(enabled=True, revocation_check_interval=30)
+    now = [1000.0]
+    monkeypatch.setattr("mcpgateway.cache.verified_token_cache.time.time", lambda: now[0])
+    cache.set("token", {"sub": "a", "jti": "jti-1"})
+
+    with patch.object(auth_cache, "is_token_revoked", new=AsyncMock(side_effect=[None, True])) as is_revoked:
+        now[0] += 10
+        assert await cache.get("token") is not None
+        assert is_revoked.await_count == 0
+
+        now[0] += 30
+        assert await cache.get("token") is not None
+        now[0] += 10
+        assert await cache.get("token") is not None
+        assert is_revoked.await_count == 1
+
+        now[0] += 30
+        assert await cache.get("token") is None
+        assert is_revoked.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_revocation_evicts():
+    cache = get_verified_token_cache()
+    cache.set("token-1", {"sub": "a", "jti": "jti-1"})
+    cache.set("token-2", {"sub": "a", "jti": "jti-2"})
+    cache.set("token-3", {"sub": "a", "jti": "jti-3"})
+    auth_cache = AuthCache(enabled=True)
+    db = MagicMock()
+    db.execute.return_value = [("jti-2",)]
+
+    with (
+        patch.object(auth_cache, "_get_redis_client", new=AsyncMock(return_value=None)),
+        patch("mcpgateway.db.fresh_db_session") as fresh_db_session,
+    ):
+        fresh_db_session.return_value.__enter__.return_value = db
+        await auth_cache.invalidate_revocation("jti-1")
+        assert await cache.get("token-1") is None
+
+        await auth_cache.sync_revoked_tokens()
+    assert await cache.get("token-2") is None
+    assert await cache.get("token-3") is not None
+
+    CacheInvalidationSubscriber()._process_auth_invalidation("revoke:jti-3")
+    assert await cache.get("token-3") is None
+
+
+@pytest.mark.asyncio
+async def test_stats_exposed_by_auth_cache():
+    cache = get_verified_token_cache()
+    cache.reset_stats()
+    cache.set("token", {"sub": "a"})
+    await cache.get("token")
+    await cache.get("missing")
+    auth_cache = AuthCache(enabled=False)
+
+    stats = auth_cache.stats()["verified_tokens"]
+    assert (stats["hit_count"], stats["miss_count"], stats["size"]) == (1, 1, 1)
+
+    auth_cache.reset_stats()
+    assert auth_cache.stats()["verified_tokens"]["hit_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_clear_jwt_caches_and_disabled_cache():
+    cache = get_verified_token_cache()
+    cache.set("token", {"sub": "a"})
+    clear_jwt_caches()
+    assert cache.stats()["size"] == 0
+
+    disabled = VerifiedTokenCache(enabled=False)
+    disabled.set("token", {"sub": "a"})
+    assert await disabled.get("token") is None
+    assert disabled.stats()["size"] == 0
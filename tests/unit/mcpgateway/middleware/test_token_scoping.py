@@ -12,6 +12,7 @@ This module tests the token scoping middleware, particularly the security fixes
 """
 
 # Standard
+import ipaddress
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -20,8 +21,11 @@ from fastapi import Request, status
 import pytest
 
 # First-Party
+from mcpgateway.cache.registry_cache import RegistryCache
+from mcpgateway.cache.resource_access_cache import get_resource_access_cache
 from mcpgateway.db import Permissions
-from mcpgateway.middleware.token_scoping import TokenScopingMiddleware
+from mcpgateway.middleware import token_scoping
+from mcpgateway.middleware.token_scoping import IPRestrictionMatcher, TokenScopingMiddleware
 
 
 class TestTokenScopingMiddleware:
@@ -664,8 +668,9 @@ def test_check_resource_team_ownership_tool_private_and_unknown():
     assert middleware._check_resource_team_ownership("/tools/a1b2c3d4", ["team-1"], db=db, _user_email="owner@example.com") is True
     assert middleware._check_resource_team_ownership("/tools/a1b2c3d4", ["team-1"], db=db, _user_email="other@example.com") is False
 
-    # Unknown visibility denies
+    # Unknown visibility denies (entity updates invalidate the cached scope)
     tool.visibility = "mystery"
+    get_resource_access_cache().invalidate_type("tools")
     assert middleware._check_resource_team_ownership("/tools/a1b2c3d4", ["team-1"], db=db, _user_email="owner@example.com") is False
 
 
@@ -679,9 +684,10 @@ def test_check_resource_team_ownership_resource_branches():
     db.execute.return_value.scalar_one_or_none.return_value = resource
     assert middleware._check_resource_team_ownership("/resources/a1b2c3d4", ["team-1"], db=db, _user_email="user@example.com") is True
 
-    # Public-only token denied for team resource
+    # Public-only token denied for team resource (entity updates invalidate the cached scope)
     resource.visibility = "team"
     resource.team_id = "team-1"
+    get_resource_access_cache().invalidate_type("resources")
     assert middleware._check_resource_team_ownership("/resources/a1b2c3d4", [], db=db, _user_email="user@example.com") is False
 
     # Team mismatch denied
@@ -690,10 +696,12 @@ def test_check_resource_team_ownership_resource_branches():
     # Private resource denied for non-owner
     resource.visibility = "private"
     resource.owner_email = "owner@example.com"
+    get_resource_access_cache().invalidate_type("resources")
     assert middleware._check_resource_team_ownership("/resources/a1b2c3d4", ["team-1"], db=db, _user_email="other@example.com") is False
 
     # Unknown visibility denies
     resource.visibility = "mystery"
+    get_resource_access_cache().invalidate_type("resources")
     assert middleware._check_resource_team_ownership("/resources/a1b2c3d4", ["team-1"], db=db, _user_email="user@example.com") is False
 
 
@@ -779,3 +787,105 @@ async def test_public_only_resource_denied():
         response = await middleware(mock_request, call_next)
         assert response.status_code == status.HTTP_403_FORBIDDEN
         call_next.assert_not_called()
+
+
+ROUTE_SAMPLE_PATHS = [
+    "/",
+    "/tools",
+    "/tools/",
+    "/tools/abc123",
+    "/tools/abc123/execute",
+    "/toolsabc",
+    "/servers/0f0f-aa/tools/abc/call",
+    "/servers/s1/resources",
+    "/sse/abc?x=1",
+    "/ws/abc",
+    "/gateways",
+    "/gateways/",
+    "/gateways/gw1/toggle",
+    "/prompts/abc/servers/def",
+    "/admin",
+    "/admin/users",
+    "/admin/tools/abc",
+    "/resources/ab-cd",
+    "/health",
+]
+
+
+@pytest.mark.parametrize("path", ROUTE_SAMPLE_PATHS)
+@pytest.mark.parametrize("method", ["GET", "POST", "PUT", "DELETE", "PATCH"])
+def test_route_tables_match_sequential_patterns(path, method):
+    """The folded route tables classify paths exactly like the ordered pattern lists."""
+    expected_permission = next((perm for m, pattern, perm in token_scoping._PERMISSION_PATTERNS if m == method and pattern.match(path)), None)
+    route = token_scoping._PERMISSION_ROUTES.get(method)
+    match = route[0].match(path) if route else None
+    assert (route[1][match.lastindex - 1] if match else None) == expected_permission
+
+    expected_resource = next(((rtype, m.group(1)) for pattern, rtype in token_scoping._RESOURCE_PATTERNS if (m := pattern.search(path))), None)
+    match = token_scoping._RESOURCE_ROUTE.match(path)
+    assert ((token_scoping._RESOURCE_ROUTE_TYPES[match.lastindex - 1], match.group(match.lastindex)) if match else None) == expected_resource
+
+    expected_server = next((m.group(1) for pattern in token_scoping._SERVER_PATH_PATTERNS if (m := pattern.search(path))), None)
+    match = token_scoping._SERVER_PATH_ROUTE.match(path)
+    assert (match.group(match.lastindex) if match else None) == expected_server
+
+
+def test_ip_restriction_matcher_merges_intervals():
+    matcher = IPRestrictionMatcher(["10.0.0.128/25", "10.0.0.0/25", "10.0.0.7", "10.0.2.0/24", "::1", "garbage", "10.0.0.0/33"])
+
+    assert matcher.intervals(4) == [(int(ipaddress.ip_address("10.0.0.0")), int(ipaddress.ip_address("10.0.0.255"))), (int(ipaddress.ip_address("10.0.2.0")), int(ipaddress.ip_address("10.0.2.255")))]
+    assert "10.0.0.200" in matcher
+    assert "10.0.1.1" not in matcher
+    assert "::1" in matcher
+    assert "::2" not in matcher
+    # IPv4 addresses never match IPv6 ranges and vice versa
+    assert "0.0.0.1" not in matcher
+    assert "not-an-ip" not in matcher
+    assert "10.0.0.1" not in IPRestrictionMatcher(["bad"])
+
+
+def test_compiled_scopes_cached_per_jti():
+    middleware = TokenScopingMiddleware()
+    payload = {"jti": "jti-1", "scopes": {"server_id": "s1", "ip_restrictions": ["10.0.0.0/8"], "permissions": ["tools.read"]}}
+
+    with patch.object(token_scoping, "IPRestrictionMatcher", wraps=IPRestrictionMatcher) as compile_ips:
+        first = middleware._get_compiled_scopes(payload)
+        assert middleware._get_compiled_scopes(payload) is first
+        assert compile_ips.call_count == 1
+
+        # Same jti with different claims is never served from the cache
+        other = middleware._get_compiled_scopes({"jti": "jti-1", "scopes": {"server_id": "s2"}})
+        assert other.server_id == "s2"
+        assert other.ip_matcher is None
+
+        # Tokens without jti are compiled per request
+        middleware._get_compiled_scopes({"scopes": payload["scopes"]})
+        middleware._get_compiled_scopes({"scopes": payload["scopes"]})
+        assert compile_ips.call_count == 3
+
+
+def test_compiled_scopes_lru_bound():
+    middleware = TokenScopingMiddleware()
+    middleware._compiled_scopes_max = 2
+    for i in range(3):
+        middleware._get_compiled_scopes({"jti": f"jti-{i}", "scopes": {}})
+
+    assert list(middleware._compiled_scopes) == ["jti-1", "jti-2"]
+
+
+@pytest.mark.asyncio
+async def test_resource_scope_cached_until_registry_invalidation():
+    middleware = TokenScopingMiddleware()
+    db = MagicMock()
+    server = MagicMock(visibility="team", team_id="team-1", owner_email="owner@example.com")
+    db.execute.return_value.scalar_one_or_none.return_value = server
+
+    assert middleware._check_resource_team_ownership("/servers/abc123/mcp", ["team-1"], db=db) is True
+    assert middleware._check_resource_team_ownership("/servers/abc123/sse", ["team-2"], db=db) is False
+    assert db.execute.call_count == 1
+
+    # Updating a server invalidates the registry cache, which drops the cached scope
+    server.visibility = "public"
+    await RegistryCache().invalidate_servers()
+    assert middleware._check_resource_team_ownership("/servers/abc123/mcp", ["team-2"], db=db) is True
+    assert db.execute.call_count == 2
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/plugins/framework/external/mcp/test_client_batching.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for batched hook invocation of external plugins.
+"""
+
+# Standard
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock
+
+# Third-Party
+from mcp.types import CallToolResult, TextContent as MCPTextContent
+import orjson
+import pytest
+
+# First-Party
+from mcpgateway.plugins.framework import ConfigLoader, GlobalContext, PluginContext, PluginLoader, PromptHookType, PromptPrehookPayload
+from mcpgateway.plugins.framework.constants import CALLS, INVOKE_HOOKS, RESULTS
+from mcpgateway.plugins.framework.errors import PluginError
+from mcpgateway.plugins.framework.external.mcp.client import HookBatcher
+
+
+def make_session(delay: float = 0.0):
+    """Fake MCP session echoing one result per call of each batch."""
+    session = Mock()
+
+    async def call_tool(name, arguments):
+        assert name == INVOKE_HOOKS
+        await asyncio.sleep(delay)
+        results = [{"result": {"continue_processing": True, "metadata": {"n": call["payload"]}}} for call in arguments[CALLS]]
+        return CallToolResult(content=[MCPTextContent(type="text", text=orjson.dumps({RESULTS: results}).decode())])
+
+    session.call_tool = AsyncMock(side_effect=call_tool)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_round_trip():
+    session = make_session()
+    batcher = HookBatcher()
+    batcher.attach(session)
+
+    results = await asyncio.gather(*(batcher.submit({"plugin_name": "p", "payload": i}) for i in range(5)))
+
+    assert [r["result"]["metadata"]["n"] for r in results] == [0, 1, 2, 3, 4]
+    assert session.call_tool.await_count == 1
+    assert batcher.stats()["largest_batch"] == 5
+
+
+@pytest.mark.asyncio
+async def test_batches_split_at_max_size_and_pipeline():
+    session = make_session(delay=0.05)
+    batcher = HookBatcher(window=1.0, max_size=2)
+    batcher.attach(session)
+
+    results = await asyncio.wait_for(asyncio.gather(*(batcher.submit({"plugin_name": "p", "payload": i}) for i in range(4))), timeout=0.5)
+
+    assert [r["result"]["metadata"]["n"] for r in results] == [0, 1, 2, 3]
+    assert session.call_tool.await_count == 2
+    assert batcher.stats() == {"batches": 2, "calls": 4, "largest_batch": 2, "in_flight": 0, "sessions": 1}
+
+
+@pytest.mark.asyncio
+async def test_window_collects_later_calls(monkeypatch):
+    session = make_session()
+    batcher = HookBatcher(window=0.05)
+    batcher.attach(session)
+    # Capture the window timer instead of waiting on the clock, and fire it by hand
+    timers = []
+    monkeypatch.setattr(asyncio.get_running_loop(), "call_later", lambda delay, callback: timers.append((delay, callback)) or Mock())
+
+    first = asyncio.create_task(batcher.submit({"plugin_name": "p", "payload": 0}))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(batcher.submit({"plugin_name": "p", "payload": 1}))
+    await asyncio.sleep(0)
+    assert [delay for delay, _ in timers] == [0.05]
+    assert session.call_tool.await_count == 0
+
+    timers[0][1]()
+    results = await asyncio.gather(first, second)
+
+    assert [r["result"]["metadata"]["n"] for r in results] == [0, 1]
+    assert session.call_tool.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_failures_reach_every_caller():
+    session = Mock()
+    session.call_tool = AsyncMock(return_value=CallToolResult(content=[MCPTextContent(type="text", text=orjson.dumps({RESULTS: []}).decode())]))
+    batcher = HookBatcher()
+    batcher.attach(session)
+
+    results = await asyncio.gather(*(batcher.submit({"plugin_name": "p", "payload": i}) for i in range(2)), return_exceptions=True)
+    assert all(isinstance(r, PluginError) for r in results)
+
+    assert batcher.detach(session) is True
+    with pytest.raises(PluginError, match="No plugin session available"):
+        await batcher.submit({"plugin_name": "p", "payload": 0})
+
+
+@pytest.mark.asyncio
+async def test_external_plugin_batches_over_stdio():
+    os.environ["PLUGINS_CONFIG_PATH"] = "tests/unit/mcpgateway/plugins/fixtures/configs/valid_multiple_plugins_filter.yaml"
+    os.environ["PYTHONPATH"] = "."
+    config = ConfigLoader.load_config("tests/unit/mcpgateway/plugins/fixtures/configs/valid_stdio_external_plugin.yaml")
+    plugin_config = config.plugins[0]
+    plugin_config.mcp.batch_hooks = True
+
+    plugin = await PluginLoader().load_and_instantiate_plugin(plugin_config)
+    try:
+        assert plugin._batcher is not None
+        prompts = ["That was innovative!", "That was fine", "innovative again"]
+        results = await asyncio.gather(
+            *(
+                plugin.invoke_hook(
+                    PromptHookType.PROMPT_PRE_FETCH,
+                    PromptPrehookPayload(prompt_id="test_prompt", args={"text": text}),
+                    PluginContext(global_context=GlobalContext(request_id=str(i), server_id="2")),
+                )
+                for i, text in enumerate(prompts)
+            )
+        )
+        assert [r.violation.code if r.violation else None for r in results] == ["deny", None, "deny"]
+        assert plugin._batcher.stats()["batches"] == 1
+    finally:
+        await plugin.shutdown()
+        del os.environ["PLUGINS_CONFIG_PATH"]
+        del os.environ["PYTHONPATH"]
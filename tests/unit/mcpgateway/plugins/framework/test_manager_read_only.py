@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/plugins/framework/test_manager_read_only.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for concurrent execution of read-only plugins in the plugin executor.
+"""
+
+# Standard
+import asyncio
+import time
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.plugins.framework import (
+    GlobalContext,
+    Plugin,
+    PluginConfig,
+    PluginMode,
+    PluginViolation,
+    PluginViolationError,
+    ToolHookType,
+    ToolPreInvokePayload,
+    ToolPreInvokeResult,
+)
+from mcpgateway.plugins.framework.base import HookRef, PluginRef
+from mcpgateway.plugins.framework.manager import PluginExecutor
+
+
+class CheckPlugin(Plugin):
+    """Configurable tool_pre_invoke plugin recording what it observed."""
+
+    def __init__(self, config, delay=0.0, block=False, rename=None, events=None):
+        super().__init__(config)
+        self.delay = delay
+        self.block = block
+        self.rename = rename
+        self.events = events if events is not None else []
+        self.seen_name = None
+        self.seen_context = None
+
+    async def tool_pre_invoke(self, payload, context):
+        self.events.append(("start", self.name))
+        self.seen_name = payload.name
+        self.seen_context = context.global_context
+        await asyncio.sleep(self.delay)
+        self.events.append(("end", self.name))
+        if self.block:
+            return ToolPreInvokeResult(
+                continue_processing=False,
+                violation=PluginViolation(reason="blocked", description=f"{self.name} blocked", code=f"{self.name}_CODE", details={}),
+            )
+        if self.rename:
+            return ToolPreInvokeResult(modified_payload=ToolPreInvokePayload(name=self.rename, args=payload.args), metadata={"order": self.name})
+        return ToolPreInvokeResult(metadata={"order": self.name, self.name: True})
+
+
+def make_ref(name, priority, read_only, **kwargs):
+    config = PluginConfig(name=name, kind="test.CheckPlugin", hooks=[ToolHookType.TOOL_PRE_INVOKE], mode=PluginMode.ENFORCE, priority=priority, read_only=read_only)
+    return HookRef(ToolHookType.TOOL_PRE_INVOKE, PluginRef(CheckPlugin(config, **kwargs)))
+
+
+@pytest.mark.asyncio
+async def test_read_only_plugins_run_concurrently():
+    refs = [make_ref(f"ro{i}", 10 + i, True, delay=0.2) for i in range(3)]
+    executor = PluginExecutor()
+
+    start = time.monotonic()
+    result, contexts = await executor.execute(refs, ToolPreInvokePayload(name="tool", args={}), GlobalContext(request_id="1"), ToolHookType.TOOL_PRE_INVOKE)
+    elapsed = time.monotonic() - start
+
+    assert result.continue_processing
+    assert elapsed < 0.5
+    assert len(contexts) == 3
+    # Metadata is merged in priority order, not completion order
+    assert result.metadata == {"order": "ro2", "ro0": True, "ro1": True, "ro2": True}
+
+
+@pytest.mark.asyncio
+async def test_read_only_plugins_share_global_context():
+    global_context = GlobalContext(request_id="1", state={"key": "value"})
+    read_only = make_ref("ro", 10, True)
+    mutating = make_ref("rw", 20, False)
+
+    await PluginExecutor().execute([read_only, mutating], ToolPreInvokePayload(name="tool", args={}), global_context, ToolHookType.TOOL_PRE_INVOKE)
+
+    assert read_only.plugin_ref.plugin.seen_context is global_context
+    assert mutating.plugin_ref.plugin.seen_context is not global_context
+    assert mutating.plugin_ref.plugin.seen_context.state["key"] == "value"
+
+
+@pytest.mark.asyncio
+async def test_first_violation_in_priority_order_wins():
+    # The lower priority plugin finishes first, the higher priority one still wins
+    refs = [make_ref("slow", 10, True, delay=0.1, block=True), make_ref("fast", 20, True, block=True)]
+
+    result, _ = await PluginExecutor().execute(refs, ToolPreInvokePayload(name="tool", args={}), GlobalContext(request_id="1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert not result.continue_processing
+    assert result.violation.plugin_name == "slow"
+    assert result.violation.code == "slow_CODE"
+
+    with pytest.raises(PluginViolationError, match="slow"):
+        await PluginExecutor().execute(refs, ToolPreInvokePayload(name="tool", args={}), GlobalContext(request_id="2"), ToolHookType.TOOL_PRE_INVOKE, violations_as_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_mutating_plugin_splits_read_only_groups():
+    events = []
+    refs = [
+        make_ref("ro1", 10, True, delay=0.05, events=events),
+        make_ref("rw", 20, False, rename="renamed", events=events),
+        make_ref("ro2", 30, True, events=events),
+        make_ref("ro3", 40, True, events=events),
+    ]
+
+    result, _ = await PluginExecutor().execute(refs, ToolPreInvokePayload(name="tool", args={}), GlobalContext(request_id="1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert result.modified_payload.name == "renamed"
+    # The mutating plugin starts only after the first group finished
+    assert events.index(("end", "ro1")) < events.index(("start", "rw"))
+    assert refs[2].plugin_ref.plugin.seen_name == "renamed"
+    assert refs[3].plugin_ref.plugin.seen_name == "renamed"
+    assert result.metadata["order"] == "ro3"
+
+
+@pytest.mark.asyncio
+async def test_disabled_plugin_does_not_split_group():
+    refs = [make_ref("ro1", 10, True, delay=0.2), make_ref("off", 15, False), make_ref("ro2", 20, True, delay=0.2)]
+    refs[1].plugin_ref.plugin.config.mode = PluginMode.DISABLED
+
+    start = time.monotonic()
+    await PluginExecutor().execute(refs, ToolPreInvokePayload(name="tool", args={}), GlobalContext(request_id="1"), ToolHookType.TOOL_PRE_INVOKE)
+
+    assert time.monotonic() - start < 0.35
+    assert refs[1].plugin_ref.plugin.seen_name is None
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/plugins/framework/test_manager_short_circuit.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for pre-invoke hooks returning a final tool result.
+"""
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.plugins.framework import (
+    GlobalContext,
+    Plugin,
+    PluginConfig,
+    PluginMode,
+    PluginViolation,
+    ToolHookType,
+    ToolPreInvokePayload,
+    ToolPreInvokeResult,
+)
+from mcpgateway.plugins.framework.base import HookRef, PluginRef
+from mcpgateway.plugins.framework.manager import PluginExecutor
+
+
+class ResultPlugin(Plugin):
+    """tool_pre_invoke plugin that returns a fixed result, blocks, or does nothing."""
+
+    def __init__(self, config, result=None, block=False):
+        super().__init__(config)
+        self.result = result
+        self.block = block
+        self.called = False
+
+    async def tool_pre_invoke(self, payload, context):
+        self.called = True
+        if self.block:
+            return ToolPreInvokeResult(continue_processing=False, violation=PluginViolation(reason="blocked", description="blocked", code="BLOCKED", details={}))
+        return ToolPreInvokeResult(result=self.result, metadata={self.name: True})
+
+
+def make_ref(name, priority, read_only=False, **kwargs):
+    config = PluginConfig(name=name, kind="test.ResultPlugin", hooks=[ToolHookType.TOOL_PRE_INVOKE], mode=PluginMode.ENFORCE, priority=priority, read_only=read_only)
+    return HookRef(ToolHookType.TOOL_PRE_INVOKE, PluginRef(ResultPlugin(config, **kwargs)))
+
+
+async def run(refs):
+    result, _ = await PluginExecutor().execute(refs, ToolPreInvokePayload(name="tool", args={}), GlobalContext(request_id="1"), ToolHookType.TOOL_PRE_INVOKE)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_first_result_in_priority_order_wins():
+    refs = [make_ref("plain", 5), make_ref("first", 10, result={"v": 1}), make_ref("second", 20, result={"v": 2})]
+
+    result = await run(refs)
+
+    assert isinstance(result, ToolPreInvokeResult)
+    assert result.continue_processing
+    assert result.result == {"v": 1}
+    # Later plugins still run and their metadata is merged
+    assert refs[2].plugin_ref.plugin.called
+    assert result.metadata == {"plain": True, "first": True, "second": True}
+
+
+@pytest.mark.asyncio
+async def test_result_from_read_only_group():
+    refs = [make_ref("ro1", 10, read_only=True), make_ref("ro2", 20, read_only=True, result={"v": 2})]
+
+    assert (await run(refs)).result == {"v": 2}
+
+
+@pytest.mark.asyncio
+async def test_later_plugin_can_block_a_result():
+    refs = [make_ref("cache", 10, result={"v": 1}), make_ref("guard", 20, block=True)]
+
+    result = await run(refs)
+
+    assert not result.continue_processing
+    assert result.violation.code == "BLOCKED"
+
+
+@pytest.mark.asyncio
+async def test_no_result_without_short_circuit():
+    assert getattr(await run([make_ref("plain", 10)]), "result", None) is None
@@ -11,6 +11,7 @@ import pytest
 
 from mcpgateway.plugins.framework import (
     GlobalContext,
+    HttpHeaderPayload,
     PluginConfig,
     PluginContext,
     ToolHookType,
@@ -40,3 +41,69 @@ async def test_cache_store_and_hit():
     ctx2 = PluginContext(global_context=GlobalContext(request_id="r2"))
     pre2 = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": 1}), ctx2)
     assert pre2.metadata and pre2.metadata.get("cache_hit") is True
+    # the hit carries the cached result and is not stored again
+    assert pre2.result == {"ok": True}
+    post2 = await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result={"ok": True}), ctx2)
+    assert post2.metadata and post2.metadata.get("cache_stored") is False
+
+
+def _plugin(**config):
+    return CachedToolResultPlugin(
+        PluginConfig(
+            name="cache",
+            kind="plugins.cached_tool_result.cached_tool_result.CachedToolResultPlugin",
+            hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+            config={"cacheable_tools": ["echo"], "ttl": 60, **config},
+        )
+    )
+
+
+async def _call(plugin, x, result):
+    ctx = PluginContext(global_context=GlobalContext(request_id=f"r{x}"))
+    pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="echo", args={"x": x}), ctx)
+    if pre.result is None:
+        await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result=result), ctx)
+    return pre
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    plugin = _plugin(max_entries=2)
+    await _call(plugin, 1, {"v": 1})
+    await _call(plugin, 2, {"v": 2})
+    # touch 1 so that 2 is the least recently used
+    assert (await _call(plugin, 1, None)).result == {"v": 1}
+    await _call(plugin, 3, {"v": 3})
+    assert len(plugin._store) == 2
+    assert (await _call(plugin, 1, None)).result == {"v": 1}
+    assert (await _call(plugin, 3, None)).result == {"v": 3}
+    assert (await _call(plugin, 2, {"v": 2})).result is None
+
+
+@pytest.mark.asyncio
+async def test_error_results_not_cached():
+    plugin = _plugin()
+    await _call(plugin, 1, {"content": [], "isError": True})
+    assert (await _call(plugin, 1, {"v": 1})).result is None
+
+
+@pytest.mark.asyncio
+async def test_entries_are_not_shared_between_callers():
+    plugin = _plugin()
+
+    async def call(user, tenant="t1", headers=None, result=None):
+        ctx = PluginContext(global_context=GlobalContext(request_id="r", user=user, tenant_id=tenant))
+        payload = ToolPreInvokePayload(name="echo", args={"x": 1}, headers=HttpHeaderPayload(root=headers) if headers else None)
+        pre = await plugin.tool_pre_invoke(payload, ctx)
+        if pre.result is None:
+            await plugin.tool_post_invoke(ToolPostInvokePayload(name="echo", result=result), ctx)
+        return pre.result
+
+    assert await call("alice", result={"owner": "alice"}) is None
+    assert await call("alice") == {"owner": "alice"}
+    # Another user, tenant or credential never sees alice's result
+    assert await call("bob", result={"owner": "bob"}) is None
+    assert await call("bob") == {"owner": "bob"}
+    assert await call("alice", tenant="t2", result={"owner": "alice-t2"}) is None
+    assert await call("alice", headers={"Authorization": "Bearer other"}, result={"owner": "other-token"}) is None
+    assert await call("alice") == {"owner": "alice"}
@@ -7,6 +7,8 @@ Authors: Mihai Criveti
 Tests for RateLimiterPlugin.
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from mcpgateway.plugins.framework import (
@@ -15,7 +17,8 @@ from mcpgateway.plugins.framework import (
     PluginContext,
     PromptHookType,
     PromptPrehookPayload,
-    ToolHookType
+    ToolHookType,
+    ToolPreInvokePayload,
 )
 from plugins.rate_limiter.rate_limiter import RateLimiterPlugin
 
@@ -42,3 +45,156 @@ async def test_rate_limit_blocks_on_third_call():
     assert r2.violation is None
     r3 = await plugin.prompt_pre_fetch(payload, ctx)
     assert r3.violation is not None
+
+
+@pytest.mark.asyncio
+async def test_rejection_reports_retry_after():
+    plugin = _mk("1/m")
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1", user="u2"))
+    payload = PromptPrehookPayload(prompt_id="p", args={})
+    await plugin.prompt_pre_fetch(payload, ctx)
+    r2 = await plugin.prompt_pre_fetch(payload, ctx)
+    assert r2.violation.details["retry_after"] == 60
+    assert r2.violation.details["remaining"] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_are_spaced_after_burst(monkeypatch):
+    from plugins.rate_limiter import backends
+
+    now = [1_000.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now[0])
+    plugin = _mk("2/s")
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1", user="u3"))
+    payload = PromptPrehookPayload(prompt_id="p", args={})
+    assert (await plugin.prompt_pre_fetch(payload, ctx)).violation is None
+    assert (await plugin.prompt_pre_fetch(payload, ctx)).violation is None
+    assert (await plugin.prompt_pre_fetch(payload, ctx)).violation is not None
+    # One emission interval later exactly one more request fits, unlike a fixed window reset
+    now[0] += 0.5
+    assert (await plugin.prompt_pre_fetch(payload, ctx)).violation is None
+    assert (await plugin.prompt_pre_fetch(payload, ctx)).violation is not None
+
+
+@pytest.mark.asyncio
+async def test_tool_limit_blocks_tool_only():
+    plugin = RateLimiterPlugin(
+        PluginConfig(
+            name="rl",
+            kind="plugins.rate_limiter.rate_limiter.RateLimiterPlugin",
+            hooks=[ToolHookType.TOOL_PRE_INVOKE],
+            config={"by_tool": {"search": "1/m"}},
+        )
+    )
+    ctx = PluginContext(global_context=GlobalContext(request_id="r1", user="u4"))
+    assert (await plugin.tool_pre_invoke(ToolPreInvokePayload(name="search", args={}), ctx)).violation is None
+    blocked = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="search", args={}), ctx)
+    assert blocked.violation.description == "Rate limit exceeded for tool search"
+    assert blocked.violation.details["retry_after"] == 60
+    assert (await plugin.tool_pre_invoke(ToolPreInvokePayload(name="other", args={}), ctx)).violation is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_idle_keys(monkeypatch):
+    from plugins.rate_limiter import backends
+
+    now = [1_000.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now[0])
+    backend = backends.MemoryBackend(sweep_interval=4)
+    for i in range(3):
+        await backend.acquire(f"user:{i}", 10, 1)
+    assert len(backend) == 3
+    # Once their TAT has passed the keys carry no state and are swept
+    now[0] += 1
+    await backend.acquire("user:new", 10, 1)
+    assert len(backend) == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used_when_full():
+    from plugins.rate_limiter.backends import MemoryBackend
+
+    backend = MemoryBackend(max_keys=2, sweep_interval=1_000)
+    for key in ("user:a", "user:b", "user:a", "user:c"):
+        await backend.acquire(key, 10, 60)
+
+    assert list(backend._tat) == ["user:a", "user:c"]
+
+
+class _FakeScript:
+    """Python stand-in for the GCRA Lua script, counting Redis round-trips."""
+
+    def __init__(self):
+        self.calls = 0
+        self.tat = {}
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        interval, window, wanted = args
+        now = 0
+        tat = max(self.tat.get(keys[0], now), now)
+        available = int((now + window - tat) / interval + 1e-9)
+        if available < 1:
+            return [0, 0, int(tat + interval - window - now), int(tat - now)]
+        granted = min(wanted, available)
+        self.tat[keys[0]] = tat + granted * interval
+        return [granted, available - granted, 0, int(self.tat[keys[0]] - now)]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_reserves_in_batches():
+    from plugins.rate_limiter.backends import RedisBackend
+
+    backend = RedisBackend(local_batch=4)
+    script = _FakeScript()
+    backend._script = script
+
+    decisions = [await backend.acquire("user:u", 10, 60) for _ in range(11)]
+
+    assert [d.allowed for d in decisions] == [True] * 10 + [False]
+    # 10 requests served with 3 reservations (4 + 4 + 2), then one rejected call
+    assert script.calls == 4
+    assert decisions[0].remaining == 9
+    assert decisions[-1].retry_after == pytest.approx(6.0)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_falls_back_to_memory():
+    from plugins.rate_limiter.backends import RedisBackend
+
+    class _Broken:
+        async def __call__(self, keys, args):
+            raise ConnectionError("down")
+
+    backend = RedisBackend()
+    backend._script = _Broken()
+    assert [(await backend.acquire("user:u", 1, 60)).allowed for _ in range(2)] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_retries_unavailable_client(monkeypatch):
+    from plugins.rate_limiter import backends
+    from mcpgateway.utils import redis_client
+
+    now = [1_000.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now[0])
+    script = _FakeScript()
+    clients = [None, None, MagicMock(register_script=MagicMock(return_value=script))]
+    lookups = AsyncMock(side_effect=clients)
+    monkeypatch.setattr(redis_client, "get_redis_client", lookups)
+    backend = backends.RedisBackend()
+
+    assert (await backend.acquire("user:u", 10, 60)).allowed
+    assert (await backend.acquire("user:u", 10, 60)).allowed
+    # Within the backoff the client is not looked up again
+    assert lookups.await_count == 1
+    now[0] += 1
+    await backend.acquire("user:u", 10, 60)
+    now[0] += 1
+    await backend.acquire("user:u", 10, 60)
+    # The second failure doubled the backoff
+    assert lookups.await_count == 2
+    now[0] += 1
+    await backend.acquire("user:u", 10, 60)
+    assert lookups.await_count == 3
+    assert script.calls == 1
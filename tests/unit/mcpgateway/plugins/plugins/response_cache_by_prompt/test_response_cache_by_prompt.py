@@ -21,11 +21,19 @@ from mcpgateway.plugins.framework import (
 )
 from plugins.response_cache_by_prompt.response_cache_by_prompt import (
     ResponseCacheByPromptPlugin,
+    _partition_key,
     _cos_sim,
     _tokenize,
     _vectorize,
 )
 
+# Partition of calls made without user, tenant, headers or non-text arguments, as in most tests below
+ANON_SCOPE = _partition_key(ToolPreInvokePayload(name="test_tool", args={}), PluginContext(global_context=GlobalContext(request_id="anon")), [])
+
+
+def _tool_index(plugin):
+    return plugin._cache[("test_tool", ANON_SCOPE)]
+
 
 class TestTokenization:
     """Tests for tokenization and vectorization functions."""
@@ -117,6 +125,102 @@ class TestCacheBasics:
         assert pre2.metadata and pre2.metadata.get("approx_cache") is True
         assert pre2.metadata.get("similarity") == 1.0
 
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_result_and_skips_store(self):
+        """Test that a hit carries the cached result and is not stored again."""
+        plugin = ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92},
+            )
+        )
+
+        ctx1 = PluginContext(global_context=GlobalContext(request_id="r1"))
+        pre1 = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "hello world"}), ctx1)
+        assert pre1.result is None
+        await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": "result1"}), ctx1)
+
+        ctx2 = PluginContext(global_context=GlobalContext(request_id="r2"))
+        pre2 = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "hello world"}), ctx2)
+        assert pre2.result == {"data": "result1"}
+
+        post2 = await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": "result1"}), ctx2)
+        assert post2.metadata.get("approx_cache_stored") is False
+        assert len(_tool_index(plugin)) == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_are_not_shared_between_callers(self):
+        """Test that a result cached for one user or tenant is not returned to another."""
+        plugin = ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92},
+            )
+        )
+        payload = ToolPreInvokePayload(name="test_tool", args={"prompt": "my account balance"})
+
+        alice = PluginContext(global_context=GlobalContext(request_id="r1", user="alice", tenant_id="t1"))
+        await plugin.tool_pre_invoke(payload, alice)
+        await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"balance": "alice"}), alice)
+
+        for request_id, user, tenant in (("r2", "bob", "t1"), ("r3", "alice", "t2")):
+            other = PluginContext(global_context=GlobalContext(request_id=request_id, user=user, tenant_id=tenant))
+            pre = await plugin.tool_pre_invoke(payload, other)
+            assert pre.result is None
+            assert pre.metadata.get("approx_cache") is False
+
+        again = PluginContext(global_context=GlobalContext(request_id="r4", user="alice", tenant_id="t1"))
+        assert (await plugin.tool_pre_invoke(payload, again)).result == {"balance": "alice"}
+
+    @pytest.mark.asyncio
+    async def test_entries_are_not_shared_between_other_arguments(self):
+        """Test that arguments outside the similarity fields must match exactly."""
+        plugin = ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92},
+            )
+        )
+
+        paris = PluginContext(global_context=GlobalContext(request_id="r1"))
+        await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"query": "weather today", "location": "paris"}), paris)
+        await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"forecast": "paris"}), paris)
+
+        london = PluginContext(global_context=GlobalContext(request_id="r2"))
+        pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"query": "weather today", "location": "london"}), london)
+        assert pre.result is None
+
+        again = PluginContext(global_context=GlobalContext(request_id="r3"))
+        pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"location": "paris", "query": "weather today"}), again)
+        assert pre.result == {"forecast": "paris"}
+
+    @pytest.mark.asyncio
+    async def test_error_results_are_not_stored(self):
+        """Test that a failed call is not replayed from the cache."""
+        plugin = ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92},
+            )
+        )
+
+        ctx1 = PluginContext(global_context=GlobalContext(request_id="r1"))
+        await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "hello world"}), ctx1)
+        post = await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"content": [], "isError": True}), ctx1)
+        assert post.metadata.get("approx_cache_stored") is False
+
+        ctx2 = PluginContext(global_context=GlobalContext(request_id="r2"))
+        pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "hello world"}), ctx2)
+        assert pre.result is None
+
     @pytest.mark.asyncio
     async def test_cache_miss_different_prompt(self):
         """Test cache miss for completely different prompt."""
@@ -168,7 +272,7 @@ class TestInvertedIndex:
                 name="cache",
                 kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
                 hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
-                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92},
+                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92, "index": "inverted"},
             )
         )
 
@@ -177,7 +281,7 @@ class TestInvertedIndex:
         await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": 1}), ctx)
 
         # Verify index contains the tokens
-        tool_index = plugin._index.get("test_tool", {})
+        tool_index = _tool_index(plugin)._postings
         assert "apple" in tool_index
         assert "banana" in tool_index
         assert 0 in tool_index["apple"]
@@ -191,7 +295,7 @@ class TestInvertedIndex:
                 name="cache",
                 kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
                 hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
-                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92},
+                config={"cacheable_tools": ["test_tool"], "ttl": 60, "threshold": 0.92, "index": "inverted"},
             )
         )
 
@@ -202,7 +306,7 @@ class TestInvertedIndex:
             await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": prompt}), ctx)
             await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": i}), ctx)
 
-        tool_index = plugin._index.get("test_tool", {})
+        tool_index = _tool_index(plugin)._postings
 
         # "banana" should map to entries 0 and 1
         assert tool_index.get("banana") == {0, 1}
@@ -231,7 +335,7 @@ class TestInvertedIndex:
             await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": i}), ctx)
 
         # Query with "apple" - should find the apple entry via index
-        best, sim = plugin._find_best("test_tool", "apple fruit")
+        best, sim = plugin._find_best("test_tool", "apple fruit", ANON_SCOPE)
         assert best is not None
         assert "apple" in best.text
 
@@ -257,7 +361,7 @@ class TestEvictionAndIndexRebuild:
             await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": f"unique{i} text"}), ctx)
             await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": i}), ctx)
 
-        bucket = plugin._cache.get("test_tool", [])
+        bucket = _tool_index(plugin)
         assert len(bucket) == 3
 
         # Oldest entries should be evicted (unique0, unique1)
@@ -268,6 +372,33 @@ class TestEvictionAndIndexRebuild:
         assert "unique3 text" in texts
         assert "unique4 text" in texts
 
+    @pytest.mark.asyncio
+    async def test_max_entries_evicts_least_recently_used(self):
+        """Test that a recently hit entry survives eviction."""
+        plugin = ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 3600, "threshold": 0.92, "max_entries": 3},
+            )
+        )
+
+        async def call(i, prompt):
+            ctx = PluginContext(global_context=GlobalContext(request_id=f"r{i}"))
+            await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": prompt}), ctx)
+            await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": i}), ctx)
+
+        for i in range(3):
+            await call(i, f"unique{i} text")
+        # Hit the oldest entry, then overflow the cache
+        await call(10, "unique0 text")
+        await call(3, "unique3 text")
+
+        # Entries are kept least recently used first
+        texts = [e.text for e in _tool_index(plugin)]
+        assert texts == ["unique2 text", "unique0 text", "unique3 text"]
+
     @pytest.mark.asyncio
     async def test_index_consistency_after_max_entries_eviction(self):
         """Test that inverted index is consistent after max_entries eviction."""
@@ -276,7 +407,7 @@ class TestEvictionAndIndexRebuild:
                 name="cache",
                 kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
                 hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
-                config={"cacheable_tools": ["test_tool"], "ttl": 3600, "threshold": 0.92, "max_entries": 3},
+                config={"cacheable_tools": ["test_tool"], "ttl": 3600, "threshold": 0.92, "max_entries": 3, "index": "inverted"},
             )
         )
 
@@ -286,20 +417,21 @@ class TestEvictionAndIndexRebuild:
             await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": f"unique{i} word"}), ctx)
             await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": i}), ctx)
 
-        bucket = plugin._cache.get("test_tool", [])
-        tool_index = plugin._index.get("test_tool", {})
+        bucket = _tool_index(plugin)
+        tool_index = bucket._postings
 
-        # Verify no stale indices
-        for token, indices in tool_index.items():
-            for idx in indices:
-                assert idx < len(bucket), f"Stale index {idx} for token {token}"
+        # Verify no stale slots
+        live_slots = {e.slot for e in bucket}
+        for token, slots in tool_index.items():
+            assert slots <= live_slots, f"Stale slots {slots - live_slots} for token {token}"
 
         # Verify evicted tokens are removed
         assert "unique0" not in tool_index
         assert "unique1" not in tool_index
 
     @pytest.mark.asyncio
-    async def test_ttl_expiration_and_index_rebuild(self, monkeypatch):
+    @pytest.mark.parametrize("index", ["matrix", "inverted"])
+    async def test_ttl_expiration_and_index_rebuild(self, monkeypatch, index):
         """Test that expired entries are removed and index is rebuilt."""
         # Stabilize time-dependent behavior by controlling time.time()
         from plugins.response_cache_by_prompt import response_cache_by_prompt as rcbp
@@ -312,7 +444,7 @@ class TestEvictionAndIndexRebuild:
                 name="cache",
                 kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
                 hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
-                config={"cacheable_tools": ["test_tool"], "ttl": 1, "threshold": 0.92, "max_entries": 100},
+                config={"cacheable_tools": ["test_tool"], "ttl": 1, "threshold": 0.92, "max_entries": 100, "index": index},
             )
         )
 
@@ -329,19 +461,17 @@ class TestEvictionAndIndexRebuild:
         await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "fresh new entry"}), ctx2)
         await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"data": "new"}), ctx2)
 
-        bucket = plugin._cache.get("test_tool", [])
-        tool_index = plugin._index.get("test_tool", {})
-
-        # Only the fresh entry should remain
-        assert len(bucket) == 1
-        assert bucket[0].text == "fresh new entry"
+        bucket = _tool_index(plugin)
 
-        # Index should be consistent
-        max_idx = max((max(indices) for indices in tool_index.values() if indices), default=-1)
-        assert max_idx < len(bucket)
+        # Only the fresh entry should remain, reusing the freed slot
+        assert [e.text for e in bucket] == ["fresh new entry"]
+        assert next(iter(bucket)).slot == 0
 
-        # Expired entry tokens should be gone
-        assert "temporary" not in tool_index
+        # Expired entry should be gone from the index
+        if index == "inverted":
+            assert "temporary" not in bucket._postings
+        best, _ = plugin._find_best("test_tool", "temporary entry", ANON_SCOPE)
+        assert best is None or best.text == "fresh new entry"
 
     @pytest.mark.asyncio
     async def test_query_after_eviction_finds_correct_entry(self):
@@ -371,3 +501,102 @@ class TestEvictionAndIndexRebuild:
         ctx_query2 = PluginContext(global_context=GlobalContext(request_id="query2"))
         pre2 = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "unique0 text"}), ctx_query2)
         assert pre2.metadata and pre2.metadata.get("approx_cache") is False
+
+    def test_expiry_queue_bounded_under_lru_eviction(self):
+        """Test that LRU-evicted entries do not pile up in the expiry queue."""
+        from plugins.response_cache_by_prompt.response_cache_by_prompt import _Entry, _PromptIndex
+
+        index = _PromptIndex(10, use_matrix=False)
+        for i in range(1000):
+            vec = _vectorize(f"prompt {i}")
+            index.add(_Entry(text=f"prompt {i}", vec=vec, value=i, expires_at=1e12, tokens=set(vec)), now=0.0)
+
+        assert len(index) == 10
+        assert len(index._expiry) <= 2 * 10 + 1
+        assert [e.value for e in index._expiry][-10:] == list(range(990, 1000))
+
+    @pytest.mark.asyncio
+    async def test_partitions_are_bounded_and_dropped_when_expired(self, monkeypatch):
+        """Test that partitions are evicted in LRU order and dropped once every entry expired."""
+        from plugins.response_cache_by_prompt import response_cache_by_prompt as rcbp
+
+        now = [1_000.0]
+        monkeypatch.setattr(rcbp.time, "time", lambda: now[0])
+        plugin = ResponseCacheByPromptPlugin(
+            PluginConfig(
+                name="cache",
+                kind="plugins.response_cache_by_prompt.response_cache_by_prompt.ResponseCacheByPromptPlugin",
+                hooks=[ToolHookType.TOOL_PRE_INVOKE, ToolHookType.TOOL_POST_INVOKE],
+                config={"cacheable_tools": ["test_tool"], "ttl": 10, "threshold": 0.92, "max_partitions": 2},
+            )
+        )
+
+        async def call(user):
+            ctx = PluginContext(global_context=GlobalContext(request_id=user, user=user))
+            pre = await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "my profile"}), ctx)
+            if pre.result is None:
+                await plugin.tool_post_invoke(ToolPostInvokePayload(name="test_tool", result={"user": user}), ctx)
+            return pre.result
+
+        for user in ("alice", "bob"):
+            await call(user)
+        assert await call("alice") == {"user": "alice"}
+        await call("carol")
+        assert len(plugin._cache) == 2
+        # Bob was the least recently used partition
+        assert await call("bob") is None
+        assert await call("alice") is None
+
+        now[0] += 11
+        for user in ("bob", "alice"):
+            ctx = PluginContext(global_context=GlobalContext(request_id=user, user=user))
+            assert (await plugin.tool_pre_invoke(ToolPreInvokePayload(name="test_tool", args={"prompt": "my profile"}), ctx)).result is None
+        assert len(plugin._cache) == 0
+
+
+class TestMatrixIndex:
+    """Tests for the NumPy matrix index."""
+
+    def _indexes(self, max_entries=1000):
+        from plugins.response_cache_by_prompt.response_cache_by_prompt import _PromptIndex
+
+        pytest.importorskip("numpy")
+        return _PromptIndex(max_entries, use_matrix=True), _PromptIndex(max_entries, use_matrix=False)
+
+    def _entry(self, text, value):
+        from plugins.response_cache_by_prompt.response_cache_by_prompt import _Entry
+
+        vec = _vectorize(text)
+        return _Entry(text=text, vec=vec, value=value, expires_at=1e12, tokens=set(vec))
+
+    def test_matrix_matches_inverted_index(self):
+        """Test that the matrix index finds the same near-duplicates as the exact scan."""
+        import random
+
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(200)]
+        prompts = [" ".join(rng.choices(vocab, k=8)) for _ in range(500)]
+        matrix, inverted = self._indexes()
+        for i, prompt in enumerate(prompts):
+            matrix.add(self._entry(prompt, i), now=0.0)
+            inverted.add(self._entry(prompt, i), now=0.0)
+
+        for prompt in rng.sample(prompts, 50):
+            # Drop one word so that the query is similar but not identical
+            query = _vectorize(" ".join(prompt.split()[1:]))
+            (m_best, m_sim), (i_best, i_sim) = matrix.find_best(query, now=0.0), inverted.find_best(query, now=0.0)
+            assert m_sim == pytest.approx(i_sim)
+            assert m_best.text == i_best.text
+
+    def test_matrix_grows_and_reuses_slots(self):
+        """Test that the matrix grows on demand and evicted slots are reused."""
+        matrix, _ = self._indexes(max_entries=100)
+        assert matrix._matrix.shape[0] == 0
+        for i in range(150):
+            matrix.add(self._entry(f"prompt number {i}", i), now=0.0)
+
+        assert len(matrix) == 100
+        assert matrix._matrix.shape[0] == 100
+        best, sim = matrix.find_best(_vectorize("prompt number 149"), now=0.0)
+        assert best.value == 149 and sim == pytest.approx(1.0)
+        assert matrix.find_best(_vectorize("number 3 prompt"), now=0.0)[0].value != 3
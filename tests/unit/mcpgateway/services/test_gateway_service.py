@@ -1439,6 +1439,7 @@ class TestGatewayService:
                 mock_settings.redis_leader_key = "gateway_service_leader"
                 mock_settings.redis_leader_ttl = 15
                 mock_settings.redis_leader_heartbeat_interval = 5
+                mock_settings.mcp_session_pool_prewarm_gateways = 0
 
                 # First-Party
                 from mcpgateway.services.gateway_service import GatewayService
@@ -3338,3 +3339,39 @@ async def test_fetch_tools_after_oauth_cleanup_and_adds_items(gateway_service, m
     assert len(gateway.tools) == 1
     assert len(gateway.resources) == 1
     assert len(gateway.prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_prewarm_session_pool_warms_hot_static_auth_gateways(monkeypatch):
+    # First-Party
+    from mcpgateway.services.mcp_session_pool import TransportType
+
+    hot = SimpleNamespace(id="gw-hot", url="http://hot/mcp", transport="STREAMABLEHTTP", auth_type="bearer", auth_value={"Authorization": "Bearer t"}, ca_certificate=None)
+    oauth = SimpleNamespace(id="gw-oauth", url="http://oauth/mcp", transport="SSE", auth_type="oauth", auth_value=None, ca_certificate=None)
+    stdio = SimpleNamespace(id="gw-stdio", url="http://stdio", transport="STDIO", auth_type=None, auth_value=None, ca_certificate=None)
+
+    session = MagicMock()
+    session.execute.side_effect = [
+        MagicMock(all=MagicMock(return_value=[SimpleNamespace(gateway_id=g.id) for g in (hot, oauth, stdio)])),
+        MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[stdio, oauth, hot])))),
+    ]
+    db_cm = MagicMock()
+    db_cm.__enter__.return_value = session
+    pool = SimpleNamespace(prewarm=AsyncMock(return_value=2))
+
+    monkeypatch.setattr("mcpgateway.services.gateway_service.fresh_db_session", lambda: db_cm)
+    monkeypatch.setattr("mcpgateway.services.gateway_service.get_mcp_session_pool", lambda: pool)
+    monkeypatch.setattr("mcpgateway.services.gateway_service.settings.mcp_session_pool_prewarm_gateways", 3)
+    monkeypatch.setattr("mcpgateway.services.gateway_service.settings.mcp_session_pool_prewarm_sessions", 2)
+    monkeypatch.setattr("mcpgateway.services.gateway_service.settings.mcp_session_pool_prewarm_identities", ["svc@example.com", "ops@example.com"])
+
+    assert await GatewayService().prewarm_session_pool() == 4
+
+    assert pool.prewarm.await_count == 2
+    for call in pool.prewarm.await_args_list:
+        assert call.args == ("http://hot/mcp",)
+        assert call.kwargs["headers"] == {"Authorization": "Bearer t"}
+        assert call.kwargs["transport_type"] == TransportType.STREAMABLE_HTTP
+        assert call.kwargs["gateway_id"] == "gw-hot"
+        assert call.kwargs["count"] == 2
+    assert {call.kwargs["user_identity"] for call in pool.prewarm.await_args_list} == {"svc@example.com", "ops@example.com"}
@@ -437,6 +437,7 @@ class TestGatewayServiceExtended:
                     mock_settings.redis_leader_key = "gateway_service_leader"
                     mock_settings.redis_leader_ttl = 15
                     mock_settings.redis_leader_heartbeat_interval = 5
+                    mock_settings.mcp_session_pool_prewarm_gateways = 0
 
                     service = GatewayService()
                     await service.initialize()
@@ -12,7 +12,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 # First-Party
-from mcpgateway.services.log_aggregator import _is_postgresql, LogAggregator
+from mcpgateway.services.log_aggregator import _is_postgresql, _minute_of, LogAggregator, SlidingWindowAggregator, WindowStats
 
 
 class TestIsPostgresql:
@@ -983,13 +983,35 @@ class TestBackfillAndSingleton:
         end = start + timedelta(minutes=10)
 
         with patch.object(aggregator, "_resolve_window_bounds", return_value=(start, end)):
-            with patch.object(aggregator, "aggregate_all_components", return_value=[MagicMock()]):
+            with patch.object(aggregator, "aggregate_all_components_batch", return_value=[MagicMock(window_start=start), MagicMock(window_start=start)]) as batch:
                 with patch("mcpgateway.services.log_aggregator.SessionLocal", return_value=mock_db):
                     processed = aggregator.backfill(0.2)
 
-        assert processed >= 1
+        # All windows are aggregated in one batch; metrics are counted per window
+        batch.assert_called_once()
+        assert len(batch.call_args.args[0]) == 3
+        assert processed == 1
         mock_db.commit.assert_called_once()
 
+    def test_backfill_uses_sliding_window_for_covered_windows(self):
+        aggregator = LogAggregator()
+        aggregator._sliding = SlidingWindowAggregator(retention_minutes=60)
+        mock_db = MagicMock()
+        end = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        aggregator._sliding._started_minute = _minute_of(end - timedelta(minutes=10))
+        aggregator._sliding.record("api", "GET", end - timedelta(minutes=7), 12.0, is_error=False)
+
+        with patch.object(aggregator, "_resolve_window_bounds", return_value=(end - timedelta(minutes=5), end)):
+            with patch.object(aggregator, "aggregate_all_components_batch", return_value=[]) as batch:
+                with patch.object(aggregator, "_upsert_metric", return_value=MagicMock()) as upsert:
+                    processed = aggregator.backfill(0.5, db=mock_db)
+
+        # 6 windows: the 2 most recent are covered by the per-minute statistics
+        assert len(batch.call_args.args[0]) == 4
+        assert processed == 1
+        assert upsert.call_args.kwargs["window_start"] == end - timedelta(minutes=10)
+        assert upsert.call_args.kwargs["request_count"] == 1
+
     def test_get_log_aggregator_singleton(self):
         from mcpgateway.services import log_aggregator as module
 
@@ -1061,3 +1083,128 @@ class TestUpsertMetric:
 
         assert result == metric
         mock_db.delete.assert_called_once_with(duplicate)
+
+
+class TestWindowStats:
+    """Tests for mergeable window statistics."""
+
+    def test_exact_for_small_windows(self):
+        durations = [float(v) for v in (5, 1, 9, 3, 7, 2)]
+        stats = WindowStats()
+        for value in durations:
+            stats.add(value, is_error=value > 8)
+
+        result = stats.to_stats()
+        ordered = sorted(durations)
+        assert result["p95"] == LogAggregator._percentile(ordered, 0.95)
+        assert result["p50"] == LogAggregator._percentile(ordered, 0.5)
+        assert (result["count"], result["min_duration"], result["max_duration"], result["error_count"]) == (6, 1.0, 9.0, 1)
+
+    def test_merge_spills_to_sketch_within_accuracy(self):
+        minutes = [WindowStats() for _ in range(5)]
+        for i in range(5000):
+            minutes[i % 5].add(float(i + 1), is_error=False)
+        merged = WindowStats()
+        for minute in minutes:
+            merged.merge(minute)
+
+        result = merged.to_stats()
+        assert merged._values is None
+        assert result["count"] == 5000
+        assert result["avg_duration"] == pytest.approx(2500.5)
+        assert (result["min_duration"], result["max_duration"]) == (1.0, 5000.0)
+        for q, key in ((0.5, "p50"), (0.95, "p95"), (0.99, "p99")):
+            expected = LogAggregator._percentile([float(v) for v in range(1, 5001)], q)
+            assert abs(result[key] - expected) / expected <= 0.011
+
+    def test_sketch_interpolates_sparse_tail_like_exact_percentile(self):
+        # Tail values far apart: the p99 rank falls between two distant neighbours
+        durations = [1.0] * 1980 + [100.0 * 1.5**i for i in range(20)]
+        stats = WindowStats()
+        for value in durations:
+            stats.add(value, is_error=False)
+
+        assert stats._values is None
+        expected = LogAggregator._percentile(sorted(durations), 0.99)
+        assert abs(stats.to_stats()["p99"] - expected) / expected <= 0.011
+
+    def test_empty(self):
+        assert WindowStats().to_stats()["max_duration"] == 0.0
+
+
+class TestSlidingWindowAggregator:
+    """Tests for the incremental per-minute aggregator."""
+
+    def test_rollup_matches_full_window(self):
+        sliding = SlidingWindowAggregator(retention_minutes=60)
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        sliding._started_minute = _minute_of(start)
+        durations = [float((i * 37) % 101) for i in range(300)]
+        for i, duration in enumerate(durations):
+            sliding.record("api", "GET", start + timedelta(seconds=i), duration, is_error=i % 50 == 0)
+
+        window = sliding.window_stats(start, start + timedelta(minutes=5))[("api", "GET")].to_stats()
+        full = WindowStats()
+        for i, duration in enumerate(durations):
+            full.add(duration, is_error=i % 50 == 0)
+        assert window == full.to_stats()
+        assert sliding.window_stats(start, start + timedelta(minutes=1))[("api", "GET")].count == 60
+
+    def test_coverage_and_pruning(self):
+        sliding = SlidingWindowAggregator(retention_minutes=10)
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert not sliding.covers(start)
+
+        sliding._started_minute = _minute_of(start)
+        sliding.record("api", "GET", start, 1.0, is_error=False)
+        sliding.record("api", "GET", start + timedelta(minutes=30), 1.0, is_error=False)
+        assert not sliding.covers(start)
+        assert sliding.covers(start + timedelta(minutes=25))
+        assert sliding.window_stats(start, start + timedelta(minutes=5)) == {}
+
+    def test_record_entry_from_log_router(self):
+        aggregator = LogAggregator()
+        aggregator._sliding = SlidingWindowAggregator()
+        now = datetime.now(timezone.utc)
+        aggregator._sliding._started_minute = _minute_of(now) - 1
+
+        from mcpgateway.services.structured_logger import LogRouter
+
+        router = LogRouter()
+        router.database_enabled = True
+        router.incremental_aggregation = True
+        entries = [
+            {"component": "api", "operation_type": "GET", "duration_ms": 10.0, "level": "INFO", "timestamp": now},
+            {"component": "api", "operation_type": "GET", "duration_ms": 30.0, "level": "INFO", "error_message": "boom", "timestamp": now},
+            {"component": "api", "operation_type": "GET", "level": "INFO", "timestamp": now},
+            {"component": "api", "duration_ms": 5.0, "level": "ERROR", "timestamp": now},
+        ]
+        with (
+            patch("mcpgateway.services.log_aggregator.get_log_aggregator", return_value=aggregator),
+            patch.object(router, "_persist_to_database"),
+            patch.object(router, "_log_to_python_logger"),
+        ):
+            for entry in entries:
+                router.route(entry, db=MagicMock())
+
+        minute_start = now.replace(second=0, microsecond=0)
+        stats = aggregator._sliding.window_stats(minute_start, minute_start + timedelta(minutes=1))
+        assert list(stats) == [("api", "GET")]
+        result = stats[("api", "GET")].to_stats()
+        assert (result["count"], result["avg_duration"], result["error_count"]) == (2, 20.0, 1)
+
+    def test_aggregate_all_components_uses_sliding_window(self):
+        aggregator = LogAggregator()
+        aggregator._sliding = SlidingWindowAggregator()
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        aggregator._sliding._started_minute = _minute_of(start)
+        aggregator._sliding.record("api", "GET", start, 10.0, is_error=False)
+        aggregator._sliding.record("db", "query", start + timedelta(minutes=4), 2.0, is_error=True)
+        mock_db = MagicMock()
+
+        with patch.object(aggregator, "_upsert_metric", side_effect=lambda **kwargs: kwargs) as upsert:
+            metrics = aggregator.aggregate_all_components(start, start + timedelta(minutes=5), db=mock_db)
+
+        mock_db.execute.assert_not_called()
+        assert upsert.call_count == 2
+        assert sorted((m["component"], m["request_count"], m["error_count"]) for m in metrics) == [("api", 1, 0), ("db", 1, 1)]
@@ -17,7 +17,7 @@ import pytest
 
 # First-Party
 from mcpgateway.common.models import LogLevel
-from mcpgateway.services.log_storage_service import LogEntry, LogStorageService
+from mcpgateway.services.log_storage_service import _SeqIndex, LogEntry, LogStorageService
 
 
 @pytest.mark.asyncio
@@ -546,7 +546,7 @@ async def test_get_logs_with_entity_id_no_type():
 
 @pytest.mark.asyncio
 async def test_remove_from_indices_value_error():
-    """Test _remove_from_indices handles ValueError gracefully."""
+    """Test _remove_from_indices leaves other entries' sequence numbers alone."""
     with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
         mock_settings.log_buffer_size_mb = 1.0
 
@@ -554,12 +554,13 @@ async def test_remove_from_indices_value_error():
 
         # Create a log entry
         entry = LogEntry(level=LogLevel.INFO, message="Test", entity_type="tool", entity_id="tool-1", request_id="req-1")
+        entry.seq = 0
 
         # Add to indices manually
-        service._entity_index["tool:tool-1"] = ["other-id"]  # Wrong ID
-        service._request_index["req-1"] = ["other-id"]  # Wrong ID
+        service._entity_index["tool:tool-1"] = _SeqIndex([5])  # Other entry
+        service._request_index["req-1"] = _SeqIndex([5])  # Other entry
 
-        # Should not raise ValueError
+        # Should not raise
         service._remove_from_indices(entry)
 
         # Indices should still have the other ID
@@ -578,9 +579,10 @@ async def test_remove_from_indices_empty_cleanup():
         # Create a log entry
         entry = LogEntry(level=LogLevel.INFO, message="Test", entity_type="tool", entity_id="tool-1", request_id="req-1")
 
-        # Add to indices with the correct ID
-        service._entity_index["tool:tool-1"] = [entry.id]
-        service._request_index["req-1"] = [entry.id]
+        # Add to indices with the correct sequence number
+        entry.seq = 0
+        service._entity_index["tool:tool-1"] = _SeqIndex([entry.seq])
+        service._request_index["req-1"] = _SeqIndex([entry.seq])
 
         # Remove from indices
         service._remove_from_indices(entry)
@@ -592,7 +594,7 @@ async def test_remove_from_indices_empty_cleanup():
 
 @pytest.mark.asyncio
 async def test_notify_subscribers_queue_full():
-    """Test _notify_subscribers handles full queues gracefully."""
+    """Test _publish handles full queues gracefully."""
     with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
         mock_settings.log_buffer_size_mb = 1.0
 
@@ -610,7 +612,7 @@ async def test_notify_subscribers_queue_full():
         entry = LogEntry(level=LogLevel.INFO, message="Test")
 
         # Should not raise even though queue is full
-        await service._notify_subscribers(entry)
+        service._publish(entry)
 
         # Queue should still be in subscribers
         assert queue in service._subscribers
@@ -618,7 +620,7 @@ async def test_notify_subscribers_queue_full():
 
 @pytest.mark.asyncio
 async def test_notify_subscribers_dead_queue():
-    """Test _notify_subscribers removes dead queues."""
+    """Test _publish removes dead queues."""
     with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
         mock_settings.log_buffer_size_mb = 1.0
 
@@ -637,7 +639,7 @@ async def test_notify_subscribers_dead_queue():
         entry = LogEntry(level=LogLevel.INFO, message="Test")
 
         # Should not raise
-        await service._notify_subscribers(entry)
+        service._publish(entry)
 
         # Dead queue should be removed
         assert mock_queue not in service._subscribers
@@ -683,3 +685,120 @@ async def test_log_entry_to_dict():
     assert result["data"] == {"custom": "data"}
     assert result["request_id"] == "req-abc"
     assert "timestamp" in result
+
+
+@pytest.mark.asyncio
+async def test_sequence_numbers_and_o1_eviction():
+    """Entries get increasing sequence numbers; eviction pops index heads."""
+    with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
+        mock_settings.log_buffer_size_mb = 0.01
+
+        service = LogStorageService()
+        for i in range(500):
+            await service.add_log(level=LogLevel.INFO if i % 2 else LogLevel.ERROR, message=f"Log {i}", entity_type="tool", entity_id=f"tool-{i % 3}", request_id=f"req-{i % 5}")
+
+        first_seq = service._buffer.first_seq
+        assert first_seq > 0
+        assert service._buffer.next_seq == 500
+        assert [log.seq for log in service._buffer] == list(range(first_seq, 500))
+        for index in (service._entity_index, service._request_index, service._level_index):
+            assert sorted(seq for seqs in index.values() for seq in seqs) == list(range(first_seq, 500))
+        assert sum(service.get_stats()["level_distribution"].values()) == len(service._buffer)
+        assert service.get_stats()["entity_distribution"] == {"tool": len(service._buffer)}
+
+        # Sequence numbers keep increasing after clear
+        service.clear()
+        entry = await service.add_log(level=LogLevel.INFO, message="After clear")
+        assert entry.seq == 500
+
+
+@pytest.mark.asyncio
+async def test_ring_compaction_keeps_lookups_consistent():
+    """Evicted head slots are compacted without breaking sequence lookups."""
+    with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
+        mock_settings.log_buffer_size_mb = 0.05
+
+        service = LogStorageService()
+        for i in range(5000):
+            await service.add_log(level=LogLevel.INFO, message=f"Log {i}", entity_id=f"e-{i % 7}")
+
+        assert len(service._buffer._entries) < 5000
+        result = await service.get_logs(entity_id="e-3", limit=3)
+        assert [log["message"] for log in result] == ["Log 4994", "Log 4987", "Log 4980"]
+
+
+def test_seq_index_compacts_evicted_head():
+    """Dropping the oldest numbers releases them in bulk and keeps slicing correct."""
+    index = _SeqIndex(range(0, 2000, 2))
+    for seq in range(0, 1600, 2):
+        assert index.pop_oldest(seq)
+
+    assert len(index) == 200
+    assert len(index._seqs) < 1000
+    assert list(index.slice(1700, 1710, descending=False)) == [1700, 1702, 1704, 1706, 1708]
+    assert list(index.slice(0, 1606, descending=True)) == [1604, 1602, 1600]
+
+
+@pytest.mark.asyncio
+async def test_get_logs_combined_filters_match_scan():
+    """Index and binary-search paths return what a full scan would."""
+    with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
+        mock_settings.log_buffer_size_mb = 1.0
+
+        service = LogStorageService()
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        levels = [LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR]
+        for i in range(200):
+            entry = LogEntry(level=levels[i % 4], message=f"Log {i}", entity_type="tool", entity_id=f"tool-{i % 3}", request_id=f"req-{i % 4}")
+            entry.timestamp = base + timedelta(seconds=i)
+            service._buffer.append(entry)
+            service._current_size_bytes += entry._size
+            service._entity_index.setdefault(f"tool:tool-{i % 3}", _SeqIndex()).append(entry.seq)
+            service._request_index.setdefault(f"req-{i % 4}", _SeqIndex()).append(entry.seq)
+            service._level_index.setdefault(entry.level, _SeqIndex()).append(entry.seq)
+
+        start, end = base + timedelta(seconds=50), base + timedelta(seconds=150)
+        cases = [
+            {"entity_type": "tool", "entity_id": "tool-1", "start_time": start, "end_time": end},
+            {"request_id": "req-2", "start_time": start},
+            {"level": LogLevel.WARNING, "end_time": end},
+            {"level": LogLevel.WARNING, "start_time": start, "end_time": end, "order": "asc"},
+            {"start_time": start, "end_time": end, "search": "LOG 1"},
+        ]
+        for case in cases:
+            expected = [
+                log
+                for log in service._buffer
+                if (not case.get("entity_id") or log.entity_id == case["entity_id"])
+                and (not case.get("request_id") or log.request_id == case["request_id"])
+                and (not case.get("level") or service._meets_level_threshold(log.level, case["level"]))
+                and (not case.get("start_time") or log.timestamp >= case["start_time"])
+                and (not case.get("end_time") or log.timestamp <= case["end_time"])
+                and (not case.get("search") or case["search"].lower() in log.message.lower())
+            ]
+            if case.get("order") != "asc":
+                expected.reverse()
+            result = await service.get_logs(limit=10, offset=5, **case)
+            assert [log["id"] for log in result] == [log.id for log in expected[5:15]], case
+
+
+@pytest.mark.asyncio
+async def test_add_log_does_not_wait_for_subscribers():
+    """Fan-out happens on the next loop iteration, in order, and only with subscribers."""
+    with patch("mcpgateway.services.log_storage_service.settings") as mock_settings:
+        mock_settings.log_buffer_size_mb = 1.0
+
+        service = LogStorageService()
+        await service.add_log(level=LogLevel.INFO, message="Nobody listening")
+        assert not service._pending
+
+        queue = asyncio.Queue(maxsize=100)
+        service._subscribers.append(queue)
+        for i in range(3):
+            await service.add_log(level=LogLevel.INFO, message=f"Log {i}")
+        assert queue.empty()
+        assert len(service._pending) == 3
+
+        await asyncio.sleep(0)
+        assert [queue.get_nowait()["data"]["message"] for _ in range(3)] == ["Log 0", "Log 1", "Log 2"]
+        assert not service._pending
@@ -19,6 +19,7 @@ from mcpgateway.services.mcp_session_pool import (
     MCPSessionPool,
     PooledSession,
     TransportType,
+    UpstreamLimiter,
     get_mcp_session_pool,
     init_mcp_session_pool,
     close_mcp_session_pool,
@@ -1437,3 +1438,171 @@ class TestContextManager:
             assert pool._pools[pool_key].qsize() == 1
 
         await pool.close_all()
+
+
+def _session_factory():
+    """Create a fresh fake PooledSession for every _create_session call."""
+
+    async def create(url, headers, transport_type, httpx_client_factory, timeout=None, gateway_id=None):
+        return PooledSession(
+            session=MagicMock(),
+            transport_context=MagicMock(),
+            url=url,
+            identity_key="anonymous",
+            transport_type=transport_type,
+            headers=headers or {},
+            gateway_id=gateway_id or "",
+        )
+
+    return create
+
+
+class TestUpstreamConcurrency:
+    """Tests for per-upstream limits, fair queueing and adaptive sizing."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_round_robin_across_identities(self):
+        """A burst from one identity does not starve another identity."""
+        pool = MCPSessionPool(max_sessions_per_key=5, upstream_max_concurrency=1)
+        order = []
+
+        async def call(name, user):
+            pooled = await pool.acquire("http://up:8080", user_identity=user)
+            order.append(name)
+            await pool.release(pooled)
+
+        with patch.object(pool, "_create_session", side_effect=_session_factory()):
+            holder = await pool.acquire("http://up:8080", user_identity="a")
+            tasks = []
+            for name, user in (("a2", "a"), ("a3", "a"), ("b1", "b")):
+                tasks.append(asyncio.create_task(call(name, user)))
+                await asyncio.sleep(0.01)
+
+            assert pool.get_metrics()["upstreams"]["http://up:8080"]["waiting"] == 3
+            await pool.release(holder)
+            await asyncio.gather(*tasks)
+
+        assert order == ["a2", "b1", "a3"]
+        assert pool.get_metrics()["upstreams"]["http://up:8080"]["in_flight"] == 0
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_upstream_slot_timeout(self):
+        """Waiting for an upstream slot honours the acquire timeout."""
+        pool = MCPSessionPool(upstream_max_concurrency=1, acquire_timeout_seconds=0.05)
+
+        with patch.object(pool, "_create_session", side_effect=_session_factory()):
+            holder = await pool.acquire("http://up:8080", user_identity="a")
+            with pytest.raises(asyncio.TimeoutError, match="upstream concurrency slot"):
+                await pool.acquire("http://up:8080", user_identity="b")
+
+            assert pool.get_metrics()["upstreams"]["http://up:8080"]["waiting"] == 0
+            await pool.release(holder)
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failed_session_creation_releases_slot_and_backs_off(self):
+        """Creation failures free the slot and shrink the adaptive limit."""
+        pool = MCPSessionPool(upstream_max_concurrency=4, adaptive_concurrency=True, circuit_breaker_threshold=100)
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=RuntimeError("down")):
+            for _ in range(3):
+                with pytest.raises(RuntimeError):
+                    await pool.acquire("http://up:8080")
+
+        stats = pool.get_metrics()["upstreams"]["http://up:8080"]
+        assert stats["in_flight"] == 0
+        assert stats["decreases"] == 3
+        assert stats["limit"] == pytest.approx(4 * 0.9**3, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_adaptive_limit_recovers_while_callers_queue(self):
+        """Healthy latency with queued callers grows the limit back additively."""
+        limiter = UpstreamLimiter(max_limit=4, adaptive=True)
+        for _ in range(5):
+            limiter.release(latency=0.01)
+        limiter.release(latency=1.0)
+        limiter.release(latency=1.0)
+        shrunk = limiter.limit
+        assert int(shrunk) == 3
+
+        for _ in range(3):
+            await limiter.acquire("a")
+        waiter = asyncio.create_task(limiter.acquire("b"))
+        await asyncio.sleep(0)
+        limiter.release(latency=0.01)
+        await waiter
+
+        assert limiter.limit > shrunk
+        assert limiter.stats()["increases"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_all_fails_waiters(self):
+        """Queued callers fail when the pool is closed."""
+        pool = MCPSessionPool(upstream_max_concurrency=1)
+
+        with patch.object(pool, "_create_session", side_effect=_session_factory()):
+            await pool.acquire("http://up:8080")
+            waiter = asyncio.create_task(pool.acquire("http://up:8080", user_identity="b"))
+            await asyncio.sleep(0.01)
+            await pool.close_all()
+
+            with pytest.raises(RuntimeError, match="closed"):
+                await waiter
+
+    @pytest.mark.asyncio
+    async def test_acquire_wait_histogram(self):
+        """Acquire waits are exposed as a cumulative histogram."""
+        pool = MCPSessionPool()
+
+        with patch.object(pool, "_create_session", side_effect=_session_factory()):
+            async with pool.session("http://up:8080"):
+                pass
+            async with pool.session("http://up:8080"):
+                pass
+
+        histogram = pool.get_metrics()["acquire_wait_seconds"]
+        assert histogram["count"] == 2
+        assert histogram["buckets"]["+Inf"] == 2
+        assert list(histogram["buckets"].values()) == sorted(histogram["buckets"].values())
+        await pool.close_all()
+
+
+class TestPrewarm:
+    """Tests for session pre-warming."""
+
+    @pytest.mark.asyncio
+    async def test_prewarm_parks_idle_sessions(self):
+        """Pre-warmed sessions are served as pool hits."""
+        pool = MCPSessionPool(max_sessions_per_key=3)
+
+        with patch.object(pool, "_create_session", side_effect=_session_factory()):
+            assert await pool.prewarm("http://up:8080", count=2, user_identity="svc@example.com", gateway_id="gw1") == 2
+            # Already warm: nothing new is created
+            assert await pool.prewarm("http://up:8080", count=2, user_identity="svc@example.com", gateway_id="gw1") == 0
+
+            await pool.acquire("http://up:8080", user_identity="svc@example.com", gateway_id="gw1")
+
+        assert pool._misses == 2
+        assert pool._hits == 3
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_bypasses_upstream_limiter(self):
+        """Pre-warming neither holds upstream permits nor trains the adaptive limit."""
+        pool = MCPSessionPool(max_sessions_per_key=3, upstream_max_concurrency=1, adaptive_concurrency=True)
+
+        with patch.object(pool, "_create_session", side_effect=_session_factory()):
+            assert await pool.prewarm("http://up:8080", count=3) == 3
+
+        assert "http://up:8080" not in pool._upstream_limiters
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failure_is_not_raised(self):
+        """Pre-warm failures are logged and reported as zero sessions."""
+        pool = MCPSessionPool()
+
+        with patch.object(pool, "_create_session", new_callable=AsyncMock, side_effect=RuntimeError("down")):
+            assert await pool.prewarm("http://up:8080", count=2) == 0
@@ -7,6 +7,7 @@ SPDX-License-Identifier: Apache-2.0
 
 # Standard
 import asyncio
+import threading
 import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -15,7 +16,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 # First-Party
-from mcpgateway.services.metrics_buffer_service import MetricsBufferService
+from mcpgateway.services.metrics_buffer_service import _MetricColumns, _RetrySpool, MetricsBufferService
+
+
+def buffered(service, kind):
+    """Return the rows buffered for a metric kind across all shards."""
+    rows = []
+    for shard in service._shards:
+        rows.extend(shard.buffers[kind].rows(with_interaction_type=kind == "a2a_agent"))
+    return rows
 
 
 class TestMetricsBufferServiceInit:
@@ -58,7 +67,7 @@ class TestDbMetricsRecordingEnabled:
         )
 
         # Buffer should remain empty
-        assert len(service._tool_metrics) == 0
+        assert len(buffered(service, "tool")) == 0
 
     def test_recording_disabled_skips_resource_metric(self):
         """When recording_enabled=False, record_resource_metric is a no-op."""
@@ -71,7 +80,7 @@ class TestDbMetricsRecordingEnabled:
             success=True,
         )
 
-        assert len(service._resource_metrics) == 0
+        assert len(buffered(service, "resource")) == 0
 
     def test_recording_disabled_skips_prompt_metric(self):
         """When recording_enabled=False, record_prompt_metric is a no-op."""
@@ -84,7 +93,7 @@ class TestDbMetricsRecordingEnabled:
             success=True,
         )
 
-        assert len(service._prompt_metrics) == 0
+        assert len(buffered(service, "prompt")) == 0
 
     def test_recording_disabled_skips_server_metric(self):
         """When recording_enabled=False, record_server_metric is a no-op."""
@@ -97,7 +106,7 @@ class TestDbMetricsRecordingEnabled:
             success=True,
         )
 
-        assert len(service._server_metrics) == 0
+        assert len(buffered(service, "server")) == 0
 
     def test_recording_disabled_skips_a2a_metric(self):
         """When recording_enabled=False, record_a2a_agent_metric is a no-op."""
@@ -110,7 +119,7 @@ class TestDbMetricsRecordingEnabled:
             success=True,
         )
 
-        assert len(service._a2a_agent_metrics) == 0
+        assert len(buffered(service, "a2a_agent")) == 0
 
     def test_recording_disabled_skips_a2a_metric_with_duration(self):
         """When recording_enabled=False, record_a2a_agent_metric_with_duration is a no-op."""
@@ -123,7 +132,7 @@ class TestDbMetricsRecordingEnabled:
             success=True,
         )
 
-        assert len(service._a2a_agent_metrics) == 0
+        assert len(buffered(service, "a2a_agent")) == 0
 
     def test_recording_disabled_immediate_write_skipped(self):
         """When recording_enabled=False and buffer disabled, immediate writes are also skipped."""
@@ -138,7 +147,7 @@ class TestDbMetricsRecordingEnabled:
         )
 
         # No exception, no write attempted
-        assert len(service._tool_metrics) == 0
+        assert len(buffered(service, "tool")) == 0
 
     def test_recording_enabled_records_normally(self):
         """When recording_enabled=True (default), metrics are recorded."""
@@ -151,7 +160,7 @@ class TestDbMetricsRecordingEnabled:
             success=True,
         )
 
-        assert len(service._tool_metrics) == 1
+        assert len(buffered(service, "tool")) == 1
 
     def test_get_stats_includes_recording_enabled(self):
         """get_stats() includes recording_enabled status."""
@@ -279,12 +288,12 @@ class TestMetricsBufferServiceRecording:
             error_message="Something went wrong",
         )
 
-        assert len(service._tool_metrics) == 1
-        metric = service._tool_metrics[0]
-        assert metric.tool_id == "test-id"
-        assert metric.is_success is False
-        assert metric.error_message == "Something went wrong"
-        assert metric.response_time >= 0.5
+        assert len(buffered(service, "tool")) == 1
+        tool_id, _timestamp, response_time, is_success, error_message = buffered(service, "tool")[0]
+        assert tool_id == "test-id"
+        assert is_success is False
+        assert error_message == "Something went wrong"
+        assert response_time >= 0.5
 
     def test_record_a2a_metric_with_interaction_type(self):
         """Test recording an A2A metric with custom interaction type."""
@@ -297,10 +306,10 @@ class TestMetricsBufferServiceRecording:
             interaction_type="stream",
         )
 
-        assert len(service._a2a_agent_metrics) == 1
-        metric = service._a2a_agent_metrics[0]
-        assert metric.a2a_agent_id == "agent-123"
-        assert metric.interaction_type == "stream"
+        assert len(buffered(service, "a2a_agent")) == 1
+        row = buffered(service, "a2a_agent")[0]
+        assert row[0] == "agent-123"
+        assert row[-1] == "stream"
 
     def test_multiple_metrics_buffered(self):
         """Test that multiple metrics are buffered correctly."""
@@ -313,7 +322,7 @@ class TestMetricsBufferServiceRecording:
                 success=True,
             )
 
-        assert len(service._tool_metrics) == 5
+        assert len(buffered(service, "tool")) == 5
         assert service._total_buffered == 5
 
 
@@ -376,8 +385,9 @@ async def test_flush_all_batches_metrics(monkeypatch):
     captured = {}
 
     async def _fake_to_thread(func, *args, **kwargs):
-        captured["func"] = func
-        captured["args"] = args
+        captured.setdefault("func", func)
+        captured.setdefault("args", args)
+        return True
 
     monkeypatch.setattr(asyncio, "to_thread", _fake_to_thread)
 
@@ -386,6 +396,9 @@ async def test_flush_all_batches_metrics(monkeypatch):
     assert service._total_flushed == 2
     assert service._flush_count == 1
     assert captured["func"] == service._flush_to_db
+    assert len(captured["args"][0]["tool"]) == 1
+    assert len(captured["args"][0]["resource"]) == 1
+    assert buffered(service, "tool") == []
 
 
 def test_flush_to_db_writes_batches(monkeypatch):
@@ -395,11 +408,11 @@ def test_flush_to_db_writes_batches(monkeypatch):
 
     class DummyDB:
         def __init__(self):
-            self.bulk_calls = []
+            self.executed = []
             self.committed = False
 
-        def bulk_insert_mappings(self, model, payload):
-            self.bulk_calls.append((model, payload))
+        def execute(self, statement, payload):
+            self.executed.append((statement.table.name, payload))
 
         def commit(self):
             self.committed = True
@@ -413,13 +426,226 @@ def test_flush_to_db_writes_batches(monkeypatch):
             return False
 
     monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", lambda: DummySession())
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.is_psycopg3_backend", lambda: False)
 
-    tool_metric = SimpleNamespace(tool_id="t1", timestamp=time.time(), response_time=0.1, is_success=True, error_message=None)
-    resource_metric = SimpleNamespace(resource_id="r1", timestamp=time.time(), response_time=0.2, is_success=False, error_message="err")
+    service.record_tool_metric("t1", start_time=time.monotonic() - 0.1, success=True)
+    service.record_tool_metric("t2", start_time=time.monotonic(), success=False, error_message="err")
+    service.record_a2a_agent_metric_with_duration("a1", response_time=0.5, success=True)
 
-    service._flush_to_db([tool_metric], [resource_metric], [], [], [])
+    assert service._flush_to_db(service._drain()) is True
     assert holder["db"].committed is True
-    assert holder["db"].bulk_calls
+    tables = dict(holder["db"].executed)
+    assert [row["tool_id"] for row in tables["tool_metrics"]] == ["t1", "t2"]
+    assert tables["tool_metrics"][1]["error_message"] == "err"
+    assert tables["a2a_agent_metrics"][0]["interaction_type"] == "invoke"
+    assert "resource_metrics" not in tables
+
+
+def test_flush_to_db_uses_copy_on_postgresql(monkeypatch):
+    service = MetricsBufferService(enabled=True)
+    copied = []
+
+    class DummySession:
+        def __enter__(self):
+            return MagicMock()
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", lambda: DummySession())
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.is_psycopg3_backend", lambda: True)
+    monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.bulk_insert_with_copy", lambda db, table, columns, rows: copied.append((table, columns, rows)))
+
+    service.record_server_metric("s1", start_time=time.monotonic(), success=True)
+    assert service._flush_to_db(service._drain()) is True
+
+    table, columns, rows = copied[0]
+    assert table == "server_metrics"
+    assert columns[0] == "server_id"
+    assert rows[0][0] == "s1" and rows[0][3] is True
+
+
+class TestShardsAndSpool:
+    """Tests for per-thread shards, occupancy stats and the retry spool."""
+
+    def test_threads_record_into_own_shards(self):
+        service = MetricsBufferService(enabled=True)
+
+        def record(prefix):
+            for i in range(100):
+                service.record_tool_metric(f"{prefix}-{i}", start_time=time.monotonic(), success=True)
+
+        threads = [threading.Thread(target=record, args=(f"t{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = service.get_stats()
+        assert stats["shard_count"] == 4
+        assert stats["current_buffer_size"] == stats["total_buffered"] == 400
+        assert stats["buffer_occupancy"] == pytest.approx(100 / service.max_buffer_size)
+        assert len(service._drain()["tool"]) == 400
+        assert service.get_stats()["current_buffer_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_shard_wakes_flush_loop(self):
+        service = MetricsBufferService(enabled=True, max_buffer_size=100)
+        service._loop = asyncio.get_running_loop()
+
+        for i in range(100):
+            service.record_prompt_metric(f"p{i}", start_time=time.monotonic(), success=True)
+        await asyncio.sleep(0)
+
+        assert service._flush_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_spooled_and_replayed(self, tmp_path, monkeypatch):
+        service = MetricsBufferService(enabled=True, spool_dir=str(tmp_path), spool_max_bytes=1 << 20)
+        monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.is_psycopg3_backend", lambda: False)
+        written = []
+
+        class FailingDB:
+            def execute(self, statement, payload):
+                raise RuntimeError("database unavailable")
+
+        class WorkingDB:
+            def execute(self, statement, payload):
+                written.extend(row["tool_id"] for row in payload)
+
+            def commit(self):
+                pass
+
+        db = [FailingDB()]
+
+        class DummySession:
+            def __enter__(self):
+                return db[0]
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+        monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", lambda: DummySession())
+
+        service.record_tool_metric("lost-1", start_time=time.monotonic(), success=True)
+        await service._flush_all()
+        stats = service.get_stats()
+        assert stats["failed_flush_count"] == 1
+        assert stats["total_flushed"] == 0
+        assert stats["spool"]["pending_batches"] == 1
+
+        db[0] = WorkingDB()
+        service.record_tool_metric("new-1", start_time=time.monotonic(), success=True)
+        await service._flush_all()
+
+        assert written == ["new-1", "lost-1"]
+        stats = service.get_stats()
+        assert stats["total_flushed"] == 2
+        assert stats["spool"]["pending_batches"] == 0
+        assert stats["spool"]["replayed_batches"] == 1
+        assert stats["last_flush_ms"] >= 0 and stats["max_flush_ms"] >= stats["avg_flush_ms"] > 0
+
+    def test_spool_is_bounded_and_claims_are_exclusive(self, tmp_path):
+        columns = _MetricColumns()
+        for i in range(50):
+            columns.append(f"tool-{i}", time.time(), 0.1, True, None, None)
+        first = _RetrySpool(str(tmp_path), max_bytes=4096)
+        second = _RetrySpool(str(tmp_path), max_bytes=4096)
+
+        assert first.write({"tool": columns}) is True
+        assert first.write({"tool": columns}) is False
+        assert first.stats()["dropped_batches"] == 1
+
+        claimed = first.claim(10)
+        assert len(claimed) == 1
+        assert second.claim(10) == []
+        first.release(claimed[0][0], done=False)
+        assert len(second.claim(10)[0][1]["tool"]) == 50
+
+        assert _RetrySpool(str(tmp_path), max_bytes=0).write({"tool": columns}) is False
+
+    def test_spool_discards_unreadable_files_as_dropped(self, tmp_path):
+        spool = _RetrySpool(str(tmp_path), max_bytes=4096)
+        (tmp_path / "batch-1-1.json").write_bytes(b"not json")
+        (tmp_path / "batch-2-1.json").write_bytes(b'{"tool": {"entity_ids": []}}')
+
+        assert spool.claim(10) == []
+        stats = spool.stats()
+        assert stats["dropped_batches"] == 2
+        assert stats["replayed_batches"] == 0
+        assert stats["pending_batches"] == 0
+
+    def test_spool_claim_skips_stale_claims_removed_concurrently(self, tmp_path, monkeypatch):
+        spool = _RetrySpool(str(tmp_path), max_bytes=4096)
+        (tmp_path / "batch-1-1.json.claimed").write_bytes(b"{}")
+        entries = spool._files()
+        # Another worker finishes the retry between the directory scan and the stat
+        (tmp_path / "batch-1-1.json.claimed").unlink()
+        monkeypatch.setattr(spool, "_files", lambda: entries)
+
+        assert spool.claim(10) == []
+        assert spool.stats()["dropped_batches"] == 0
+
+
+class TestPreaggregation:
+    """Tests for per-minute pre-aggregation into the hourly rollups."""
+
+    def test_aggregates_every_execution_and_samples_raw_rows(self):
+        service = MetricsBufferService(enabled=True, preaggregation_enabled=True, raw_sample_rate=0.0)
+        for i in range(10):
+            service.record_tool_metric(f"tool-{i % 2}", start_time=time.monotonic(), success=i != 3)
+        service.record_a2a_agent_metric_with_duration("agent-1", response_time=0.5, success=True, interaction_type="query")
+
+        assert buffered(service, "tool") == []
+        assert service.get_stats()["pending_aggregates"] == 3
+        aggregates = service._drain_aggregates()
+        tool_counts = {key[1]: (agg.sketch.count, agg.success_count) for key, agg in aggregates.items() if key[0] == "tool"}
+        assert tool_counts == {"tool-0": (5, 5), "tool-1": (5, 4)}
+        assert [key[2] for key in aggregates if key[0] == "a2a_agent"] == ["query"]
+        assert all(key[3] % 60 == 0 for key in aggregates)
+
+        sampled = MetricsBufferService(enabled=True, preaggregation_enabled=True, raw_sample_rate=1.0)
+        sampled.record_tool_metric("tool-0", start_time=time.monotonic(), success=True)
+        assert len(buffered(sampled, "tool")) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_merges_hourly_aggregates_and_retries_failures(self, monkeypatch):
+        service = MetricsBufferService(enabled=True, preaggregation_enabled=True, raw_sample_rate=0.0)
+        merged = []
+        fail = [True]
+
+        def merge_preaggregated(db, table_name, aggregations):
+            if fail[0]:
+                raise RuntimeError("database unavailable")
+            merged.extend((table_name, agg) for agg in aggregations)
+
+        class DummySession:
+            def __enter__(self):
+                return MagicMock()
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+        monkeypatch.setattr("mcpgateway.services.metrics_buffer_service.fresh_db_session", lambda: DummySession())
+        monkeypatch.setattr("mcpgateway.services.metrics_rollup_service.get_metrics_rollup_service", lambda: SimpleNamespace(merge_preaggregated=merge_preaggregated))
+
+        service.record_tool_metric("tool-1", start_time=time.monotonic(), success=True)
+        await service._flush_all()
+        assert service.get_stats()["failed_aggregate_flush_count"] == 1
+        assert service.get_stats()["pending_aggregates"] == 1
+
+        fail[0] = False
+        service.record_tool_metric("tool-1", start_time=time.monotonic(), success=False)
+        await service._flush_all()
+
+        assert len(merged) == 1
+        table_name, agg = merged[0]
+        assert table_name == "tool_metrics"
+        assert (agg.total_count, agg.success_count, agg.failure_count) == (2, 1, 1)
+        assert agg.hour_start.minute == 0 and agg.latency_histogram["count"] == 2
+        stats = service.get_stats()
+        assert stats["total_aggregated"] == 2
+        assert stats["pending_aggregates"] == 0
 
 
 def test_record_tool_metric_falls_back_to_immediate_write(monkeypatch):
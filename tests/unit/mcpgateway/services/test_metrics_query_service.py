@@ -34,6 +34,12 @@ def test_get_retention_cutoff_uses_hours(monkeypatch):
     assert timedelta(hours=1) <= delta < timedelta(hours=2)
 
 
+def test_get_retention_cutoff_covers_current_hour_when_preaggregated(monkeypatch):
+    monkeypatch.setattr(mqs.settings, "metrics_preaggregation_enabled", True)
+
+    assert mqs.get_retention_cutoff() == mqs.get_current_hour_start() + timedelta(hours=1)
+
+
 # ============================================================================
 # Tests for get_current_hour_start()
 # ============================================================================
@@ -713,6 +713,7 @@ class TestRollupInternals:
         service._is_postgresql = False
         monkeypatch.setattr(metrics_rollup_service.settings, "use_postgresdb_percentiles", False, raising=False)
         monkeypatch.setattr(metrics_rollup_service.settings, "yield_batch_size", 1, raising=False)
+        monkeypatch.setattr(metrics_rollup_service, "NUMPY_AVAILABLE", False)
 
         class DummyCol:
             def label(self, _name):
@@ -985,3 +986,182 @@ class TestRollupInternals:
 
         with pytest.raises(SQLAlchemyError):
             service._upsert_rollup(mock_db, DummyHourly, "tool_id", agg, is_a2a=False)
+
+
+class TestVectorizedAggregation:
+    """The NumPy engine must produce the same rollups as the Python path."""
+
+    @pytest.fixture
+    def db(self):
+        # Third-Party
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        # First-Party
+        from mcpgateway.db import Base
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    @staticmethod
+    def _aggregate(service, db, raw_model, entity_model, entity_id_col, is_a2a, hour_start):
+        aggregations = service._aggregate_hour(db, raw_model, entity_model, entity_id_col, "name", hour_start, hour_start + timedelta(hours=1), is_a2a)
+        return sorted(aggregations, key=lambda agg: (agg.entity_id, agg.interaction_type or ""))
+
+    @pytest.mark.parametrize("is_a2a", [False, True])
+    def test_matches_python_path(self, db, monkeypatch, is_a2a):
+        pytest.importorskip("numpy")
+        # First-Party
+        from mcpgateway.db import A2AAgent, A2AAgentMetric, Tool, ToolMetric
+
+        raw_model, entity_model, entity_id_col = (A2AAgentMetric, A2AAgent, "a2a_agent_id") if is_a2a else (ToolMetric, Tool, "tool_id")
+        hour_start = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        for i in range(200):
+            row = {
+                entity_id_col: f"entity-{i % 7}",
+                "timestamp": hour_start + timedelta(seconds=i * 10),
+                "response_time": ((i * 37) % 101) / 10,
+                "is_success": i % 5 != 0,
+            }
+            if is_a2a:
+                row["interaction_type"] = "invoke" if i % 3 else "query"
+            db.add(raw_model(**row))
+        # Outside the hour
+        db.add(raw_model(**{entity_id_col: "entity-0", "timestamp": hour_start + timedelta(hours=1), "response_time": 99.0, "is_success": True}))
+        db.commit()
+
+        service = MetricsRollupService()
+        service._is_postgresql = False
+        monkeypatch.setattr(metrics_rollup_service.settings, "yield_batch_size", 16, raising=False)
+
+        vectorized = self._aggregate(service, db, raw_model, entity_model, entity_id_col, is_a2a, hour_start)
+        monkeypatch.setattr(metrics_rollup_service, "NUMPY_AVAILABLE", False)
+        python = self._aggregate(service, db, raw_model, entity_model, entity_id_col, is_a2a, hour_start)
+
+        assert len(vectorized) == len(python) == (14 if is_a2a else 7)
+        assert sum(agg.total_count for agg in vectorized) == 200
+        for fast, slow in zip(vectorized, python):
+            assert (fast.entity_id, fast.interaction_type, fast.entity_name) == (slow.entity_id, slow.interaction_type, slow.entity_name)
+            assert (fast.total_count, fast.success_count, fast.failure_count) == (slow.total_count, slow.success_count, slow.failure_count)
+            for field in ("min_response_time", "max_response_time", "avg_response_time", "p50_response_time", "p95_response_time", "p99_response_time"):
+                assert getattr(fast, field) == pytest.approx(getattr(slow, field)), field
+
+    def test_empty_hour(self, db):
+        pytest.importorskip("numpy")
+        # First-Party
+        from mcpgateway.db import Tool, ToolMetric
+
+        service = MetricsRollupService()
+        service._is_postgresql = False
+        assert self._aggregate(service, db, ToolMetric, Tool, "tool_id", False, datetime(2026, 1, 1, tzinfo=timezone.utc)) == []
+
+    def test_grouped_stats_ignore_missing_response_times(self):
+        np = pytest.importorskip("numpy")
+
+        stats = metrics_rollup_service.grouped_response_time_stats(
+            np.array([0, 0, 1, 0]),
+            np.array([4.0, np.nan, np.nan, 2.0]),
+            np.array([True, False, True, True]),
+            2,
+        )
+
+        assert stats["count"].tolist() == [3, 1]
+        assert stats["valid"].tolist() == [2, 0]
+        assert stats["avg"][0] == 3.0
+        assert stats["p50"][0] == 3.0
+        assert np.isnan(stats["max"][1])
+
+
+class TestMergePreaggregated:
+    """Pre-aggregated hours are added to the rollups, not replacing them."""
+
+    @pytest.fixture
+    def db(self):
+        # Third-Party
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        # First-Party
+        from mcpgateway.db import Base
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    @staticmethod
+    def _aggregation(entity_id, hour_start, values, successes):
+        # First-Party
+        from mcpgateway.utils.quantile_sketch import DDSketch
+
+        sketch = DDSketch()
+        sketch.update(values)
+        return HourlyAggregation(
+            entity_id=entity_id,
+            entity_name="",
+            hour_start=hour_start,
+            total_count=sketch.count,
+            success_count=successes,
+            failure_count=sketch.count - successes,
+            min_response_time=sketch.min,
+            max_response_time=sketch.max,
+            avg_response_time=sketch.mean,
+            p50_response_time=sketch.quantile(0.5),
+            p95_response_time=sketch.quantile(0.95),
+            p99_response_time=sketch.quantile(0.99),
+            latency_histogram=sketch.to_dict(),
+        )
+
+    def test_merges_counts_and_histograms(self, db):
+        # First-Party
+        from mcpgateway.db import Tool, ToolMetricsHourly
+
+        db.add(Tool(id="tool-1", original_name="weather", custom_name="weather", custom_name_slug="weather", input_schema={}))
+        db.commit()
+        hour_start = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        service = MetricsRollupService()
+
+        assert service.merge_preaggregated(db, "tool_metrics", [self._aggregation("tool-1", hour_start, [float(v) for v in range(1, 51)], 50)]) == (1, 0)
+        assert service.merge_preaggregated(db, "tool_metrics", [self._aggregation("tool-1", hour_start, [float(v) for v in range(51, 101)], 40)]) == (0, 1)
+        db.commit()
+
+        row = db.query(ToolMetricsHourly).one()
+        assert row.tool_name == "weather"
+        assert (row.total_count, row.success_count, row.failure_count) == (100, 90, 10)
+        assert (row.min_response_time, row.max_response_time) == (1.0, 100.0)
+        assert row.avg_response_time == pytest.approx(50.5)
+        assert row.latency_histogram["count"] == 100
+        assert row.p50_response_time == pytest.approx(50.5, rel=0.02)
+        assert row.p99_response_time == pytest.approx(99.0, rel=0.02)
+
+    def test_unknown_table(self, db):
+        with pytest.raises(ValueError):
+            MetricsRollupService().merge_preaggregated(db, "nope", [])
+
+    def test_rollup_table_skips_raw_aggregation_when_preaggregated(self, monkeypatch):
+        service = MetricsRollupService(delete_raw_after_rollup=False)
+        service.preaggregated = True
+        db = MagicMock()
+        db.execute.return_value.scalar.return_value = 5
+
+        @contextmanager
+        def fake_session():
+            yield db
+
+        monkeypatch.setattr(metrics_rollup_service, "fresh_db_session", fake_session)
+        aggregate = MagicMock()
+        monkeypatch.setattr(service, "_aggregate_hour", aggregate)
+
+        start = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        result = service._rollup_table("tool_metrics", MagicMock(), MagicMock(), MagicMock(), "tool_id", "name", start, start + timedelta(hours=2), False)
+
+        aggregate.assert_not_called()
+        assert result.hours_processed == 0
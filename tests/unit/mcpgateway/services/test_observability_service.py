@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from mcpgateway.db import ObservabilityEvent, ObservabilitySpan, ObservabilityTrace
+from mcpgateway.services import observability_service
 from mcpgateway.services.observability_service import (
     ObservabilityService,
+    SpanRecorder,
     parse_traceparent,
     generate_w3c_trace_id,
     generate_w3c_span_id,
@@ -683,3 +691,144 @@ def test_query_traces_invalid_limit_and_order_raises(mock_db):
         service.query_traces(mock_db, limit=0)
     with pytest.raises(ValueError):
         service.query_traces(mock_db, order_by="unknown_field")
+
+
+# --- Write-behind span recorder ---
+
+
+@pytest.fixture
+def trace_db(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (ObservabilityTrace, ObservabilitySpan, ObservabilityEvent):
+        model.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(observability_service, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def stored_row():
+    return MagicMock(start_time=datetime.now(timezone.utc), attributes={})
+
+
+def make_recorder(monkeypatch, **kwargs):
+    recorder = SpanRecorder(**kwargs)
+    recorder._running = True
+    monkeypatch.setattr(observability_service, "get_span_recorder", lambda: recorder)
+    return recorder
+
+
+def record_request(service, db, status="ok", span_status="ok", event=False):
+    trace_id = service.start_trace(db, "POST /rpc")
+    parent = service.start_span(db, trace_id, "http.request", kind="server")
+    child = service.start_span(db, trace_id, "tool.invoke", parent_span_id=parent)
+    if event:
+        service.add_event(db, child, "tool.error", severity="error", message="boom")
+    service.end_span(db, child, status=span_status, attributes={"tool.result": "x"})
+    service.end_span(db, parent, status=span_status)
+    service.end_trace(db, trace_id, status=status, http_status_code=200)
+    return trace_id
+
+
+def test_span_recorder_buffers_trace_tree_and_writes_in_bulk(monkeypatch, mock_db, trace_db):
+    recorder = make_recorder(monkeypatch, head_sample_rate=1.0, tail_sample_rate=1.0)
+    service = ObservabilityService()
+
+    trace_ids = [record_request(service, mock_db, event=(i == 0)) for i in range(3)]
+
+    mock_db.add.assert_not_called()
+    mock_db.commit.assert_not_called()
+    mock_db.query.assert_not_called()
+    assert recorder.flush() == 3
+
+    with trace_db() as db:
+        traces = db.execute(select(ObservabilityTrace)).scalars().all()
+        assert sorted(t.trace_id for t in traces) == sorted(trace_ids)
+        assert all(t.status == "ok" and t.http_status_code == 200 and t.duration_ms is not None for t in traces)
+        spans = db.execute(select(ObservabilitySpan).where(ObservabilitySpan.trace_id == trace_ids[0])).scalars().all()
+        child = next(span for span in spans if span.name == "tool.invoke")
+        assert child.parent_span_id == next(span.span_id for span in spans if span.name == "http.request")
+        assert child.attributes == {"tool.result": "x"}
+        assert [event.name for event in child.events] == ["tool.error"]
+
+    stats = recorder.get_stats()
+    assert (stats["written_traces"], stats["written_spans"], stats["written_events"]) == (3, 6, 1)
+    assert stats["kept_error"] == 1  # the error event keeps the trace regardless of sampling
+    assert stats["queued_traces"] == stats["active_traces"] == 0
+
+
+def test_span_recorder_tail_sampling_keeps_errors_and_slow_traces(monkeypatch, mock_db, trace_db):
+    recorder = make_recorder(monkeypatch, tail_sample_rate=0.0, slow_threshold_ms=60000)
+    service = ObservabilityService()
+
+    record_request(service, mock_db)
+    error_trace = record_request(service, mock_db, status="error")
+    failed_span_trace = record_request(service, mock_db, span_status="error")
+    recorder.slow_threshold_ms = 0
+    slow_trace = record_request(service, mock_db)
+
+    recorder.flush()
+    with trace_db() as db:
+        assert set(db.execute(select(ObservabilityTrace.trace_id)).scalars()) == {error_trace, failed_span_trace, slow_trace}
+    stats = recorder.get_stats()
+    assert (stats["sampled_out_tail"], stats["kept_error"], stats["kept_slow"]) == (1, 2, 1)
+
+
+def test_span_recorder_head_sampling_drops_whole_trace(monkeypatch, mock_db, trace_db):
+    recorder = make_recorder(monkeypatch, head_sample_rate=0.0)
+    service = ObservabilityService()
+
+    record_request(service, mock_db, status="error")
+
+    assert recorder.flush() == 0
+    mock_db.add.assert_not_called()
+    stats = recorder.get_stats()
+    assert (stats["sampled_out_head"], stats["dropped_spans"], stats["recorded"]) == (1, 2, 0)
+
+
+def test_span_recorder_overflow_and_timeout(monkeypatch, mock_db, trace_db):
+    recorder = make_recorder(monkeypatch, max_traces=1, trace_timeout=0.001)
+    service = ObservabilityService()
+
+    open_trace = service.start_trace(mock_db, "GET /sse")
+    service.start_trace(mock_db, "POST /rpc")
+    assert recorder.get_stats()["dropped_overflow"] == 1
+
+    # The unfinished trace is written as is once it times out
+    time.sleep(0.01)
+    assert recorder.flush() == 1
+    with trace_db() as db:
+        assert db.get(ObservabilityTrace, open_trace).status == "unset"
+    assert recorder.get_stats()["timed_out"] == 1
+
+    # Updates to an already written trace go to the database
+    mock_db.query.return_value.first.return_value = stored_row()
+    service.end_trace(mock_db, open_trace, status="ok")
+    mock_db.query.assert_called_once_with(ObservabilityTrace)
+
+
+def test_span_recorder_unknown_span_falls_back_to_database(monkeypatch, mock_db):
+    make_recorder(monkeypatch)
+    service = ObservabilityService()
+    mock_db.query.return_value.first.return_value = stored_row()
+
+    service.end_span(mock_db, "span-started-elsewhere", status="ok")
+
+    mock_db.query.assert_called_once_with(ObservabilitySpan)
+    mock_db.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_span_recorder_shutdown_writes_everything(monkeypatch, mock_db, trace_db):
+    recorder = SpanRecorder(batch_size=100, flush_interval=60)
+    monkeypatch.setattr(observability_service, "get_span_recorder", lambda: recorder)
+    service = ObservabilityService()
+    await recorder.start()
+
+    finished = record_request(service, mock_db)
+    unfinished = service.start_trace(mock_db, "GET /sse")
+    await recorder.shutdown()
+
+    with trace_db() as db:
+        assert set(db.execute(select(ObservabilityTrace.trace_id)).scalars()) == {finished, unfinished}
+    assert recorder.running is False
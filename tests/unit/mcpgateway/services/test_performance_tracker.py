@@ -9,6 +9,9 @@ SPDX-License-Identifier: Apache-2.0
 from collections import deque
 from unittest.mock import patch
 
+# Third-Party
+import pytest
+
 # First-Party
 from mcpgateway.services.performance_tracker import get_performance_tracker, PerformanceTracker
 
@@ -555,3 +558,111 @@ class TestSummaryCaching:
                 assert ("test_op", 9) in tracker._summary_cache
             finally:
                 tracker._MAX_CACHE_ENTRIES = original_max
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for sketch publication."""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def pipeline(self):
+        redis = self
+        ops = []
+
+        class Pipeline:
+            def delete(self, key):
+                ops.append(lambda: redis.hashes.pop(key, None))
+
+            def hset(self, key, mapping):
+                ops.append(lambda: redis.hashes.setdefault(key, {}).update(mapping))
+
+            def expire(self, key, ttl):
+                pass
+
+            async def execute(self):
+                for op in ops:
+                    op()
+
+        return Pipeline()
+
+    async def scan_iter(self, match):
+        for key in list(self.hashes):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+    async def hgetall(self, key):
+        return {field.encode(): value for field, value in self.hashes[key].items()}
+
+
+class TestSketchSummaries:
+    """Tests for sketch-based summaries, histogram export and cluster merging."""
+
+    def test_summary_covers_all_samples_with_bounded_sketch(self):
+        tracker = PerformanceTracker()
+        tracker.max_samples = 100
+        tracker.set_threshold("tool_invocation", 2.0)
+
+        for i in range(1, 10001):
+            tracker.record_timing("tool_invocation", i / 1000, extra_context={})
+
+        summary = tracker.get_performance_summary("tool_invocation")["tool_invocation"]
+        assert len(tracker._operation_timings["tool_invocation"]) == 100
+        assert len(tracker._operation_sketches["tool_invocation"]._bins) < 1000
+        assert summary["count"] == 10000
+        assert summary["avg_duration_ms"] == pytest.approx(5000.5)
+        assert summary["p50_duration_ms"] == pytest.approx(5000, rel=0.01)
+        assert summary["p99_duration_ms"] == pytest.approx(9900, rel=0.01)
+        # Values above the 2s threshold, at bucket resolution
+        assert summary["threshold_violations"] == pytest.approx(8000, rel=0.01)
+
+    def test_clear_stats_resets_sketch(self):
+        tracker = PerformanceTracker()
+        tracker.record_timing("op1", 1.0)
+        tracker.clear_stats("op1")
+
+        assert tracker.get_performance_summary() == {}
+        assert tracker.get_operation_stats("op1") is None
+
+    def test_export_histograms(self):
+        tracker = PerformanceTracker()
+        for duration in (0.004, 0.04, 0.4, 4.0):
+            tracker.record_timing("cache_operation", duration)
+
+        [(operation, buckets, total)] = tracker.export_histograms([0.01, 0.1, 1.0])
+        assert operation == "cache_operation"
+        assert buckets == [("0.01", 1), ("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+        assert total == pytest.approx(4.444)
+
+    @pytest.mark.asyncio
+    async def test_cluster_summary_merges_worker_sketches(self, monkeypatch):
+        redis = FakeRedis()
+
+        async def get_redis():
+            return redis
+
+        monkeypatch.setattr("mcpgateway.services.performance_tracker.get_redis_client", get_redis)
+        worker_a, worker_b = PerformanceTracker(), PerformanceTracker()
+        for i in range(100):
+            worker_a.record_timing("database_query", 0.01)
+            worker_b.record_timing("database_query", 0.03)
+
+        monkeypatch.setattr("mcpgateway.services.performance_tracker.WORKER_ID", "worker-b")
+        assert await worker_b.publish_sketches() is True
+        monkeypatch.setattr("mcpgateway.services.performance_tracker.WORKER_ID", "worker-a")
+        summary = await worker_a.get_cluster_performance_summary()
+
+        assert summary["database_query"]["count"] == 200
+        assert summary["database_query"]["avg_duration_ms"] == pytest.approx(20.0)
+        assert summary["database_query"]["p95_duration_ms"] == pytest.approx(30.0, rel=0.01)
+
+    @pytest.mark.asyncio
+    async def test_cluster_summary_without_redis_is_local(self, monkeypatch):
+        async def no_redis():
+            return None
+
+        monkeypatch.setattr("mcpgateway.services.performance_tracker.get_redis_client", no_redis)
+        tracker = PerformanceTracker()
+        tracker.record_timing("op1", 0.5)
+
+        assert await tracker.get_cluster_performance_summary() == tracker.get_performance_summary()
@@ -16,6 +16,9 @@ This suite provides complete test coverage for:
 """
 
 # Standard
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 import time
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -30,6 +33,7 @@ from mcpgateway.schemas import ResourceCreate, ResourceRead, ResourceSubscriptio
 from mcpgateway.services.resource_service import (
     ResourceError,
     ResourceNotFoundError,
+    resource_read_flights,
     ResourceService,
 )
 
@@ -1916,6 +1920,39 @@ class TestResourceTemplateCaching:
         cache_info = service._build_regex.cache_info()
         assert cache_info.currsize <= 256, "Cache should respect maxsize limit"
 
+    @pytest.mark.asyncio
+    async def test_read_template_resource_picks_most_specific_template(self):
+        """Overlapping templates resolve to the most specific one, not the first cached."""
+        from mcpgateway.common.models import ResourceTemplate
+
+        db = MagicMock()
+        db.execute.return_value.scalar_one_or_none.return_value = None
+        service = ResourceService()
+        service._template_cache = {
+            "generic": ResourceTemplate(id="1", uriTemplate="weather://{city}/{metric}", name="generic", mime_type="text/plain"),
+            "current": ResourceTemplate(id="2", uriTemplate="weather://{city}/current", name="current", mime_type="text/plain"),
+        }
+
+        content = await service._read_template_resource(db, "weather://paris/current")
+        assert content.id == "2"
+
+        content = await service._read_template_resource(db, "weather://paris/humidity")
+        assert content.id == "1"
+
+    @pytest.mark.asyncio
+    async def test_template_index_dropped_on_resource_events(self):
+        """Resource change events clear the template cache and its index."""
+        service = ResourceService()
+        service._event_service = MagicMock(publish_event=AsyncMock())
+        service._template_cache = {"t": MagicMock(uri_template="t://{id}")}
+        assert service._get_template_index().match("t://1") is not None
+
+        await service._publish_event({"type": "resource_added", "data": {}})
+
+        assert service._template_cache == {}
+        assert service._template_index is None
+        service._event_service.publish_event.assert_awaited_once()
+
 
 class TestResourceAccessAuthorization:
     """Tests for _check_resource_access authorization logic."""
@@ -2304,3 +2341,54 @@ class TestResourceBulkRegistration:
 
         assert result["failed"] == 1
         assert any("Failed to process resource" in err for err in result["errors"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled, expected_reads", [(True, 1), (False, 3)])
+async def test_invoke_resource_coalesces_identical_reads(resource_service, monkeypatch, enabled, expected_reads):
+    """Concurrent reads of the same gateway resource share one upstream read when enabled."""
+    monkeypatch.setattr("mcpgateway.services.resource_service.settings.resource_coalescing_enabled", enabled)
+    monkeypatch.setattr("mcpgateway.services.resource_service.settings.mcp_session_pool_enabled", False)
+    resource_read_flights.reset_stats()
+
+    resource = SimpleNamespace(id="res-1", name="doc", gateway_id="gw-1")
+    gateway = SimpleNamespace(
+        id="gw-1", name="gw", url="http://upstream/mcp", transport="STREAMABLEHTTP", auth_type=None, auth_value=None, oauth_config=None, ca_certificate=None, auth_query_params=None
+    )
+    db = MagicMock()
+    db.execute.side_effect = lambda stmt: MagicMock(scalar_one_or_none=MagicMock(return_value=gateway if "gateways" in str(stmt) else resource))
+
+    reads = []
+
+    @asynccontextmanager
+    async def fake_client(**_kwargs):
+        yield (MagicMock(), MagicMock(), MagicMock())
+
+    class FakeSession:
+        def __init__(self, *_args):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *_args):
+            return False
+
+        async def initialize(self):
+            return None
+
+        async def read_resource(self, uri):
+            reads.append(uri)
+            await asyncio.sleep(0.05)
+            return SimpleNamespace(contents=[SimpleNamespace(text=f"content of {uri}")])
+
+    with (
+        patch("mcpgateway.services.resource_service.streamablehttp_client", fake_client),
+        patch("mcpgateway.services.resource_service.ClientSession", FakeSession),
+        patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=MagicMock()),
+    ):
+        results = await asyncio.gather(*(resource_service.invoke_resource(db, "res-1", "docs://readme", user_identity="alice@example.com") for _ in range(3)))
+
+    assert results == ["content of docs://readme"] * 3
+    assert len(reads) == expected_reads
+    assert resource_read_flights.stats()["coalesced"] == 3 - expected_reads
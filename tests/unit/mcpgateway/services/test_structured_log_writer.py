@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_structured_log_writer.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the batched structured log database writer.
+"""
+
+# Standard
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+# Third-Party
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# First-Party
+from mcpgateway.db import StructuredLogEntry
+from mcpgateway.services import structured_logger
+from mcpgateway.services.structured_logger import LogRouter, StructuredLogWriter, SubmitStatus
+
+
+def log(level="INFO", message="m", **fields):
+    return {"level": level, "component": "test", "message": message, "hostname": "host", "process_id": 1, "version": "1", "environment": "test", **fields}
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    StructuredLogEntry.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(structured_logger, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def stored_messages(factory):
+    with factory() as db:
+        return [row.message for row in db.execute(select(StructuredLogEntry).order_by(StructuredLogEntry.timestamp)).scalars()]
+
+
+@pytest.mark.asyncio
+async def test_size_trigger_writes_bulk_batches(session_factory):
+    writer = StructuredLogWriter(batch_size=10, flush_interval=60, max_queue_size=1000)
+    await writer.start()
+    try:
+        with patch.object(writer, "_write_batch", wraps=writer._write_batch) as write_batch:
+            for i in range(25):
+                assert writer.submit(log(message=f"m{i}")) is SubmitStatus.QUEUED
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if writer.get_stats()["written"] >= 20:
+                    break
+            assert writer.get_stats()["written"] >= 20
+            assert all(len(call.args[0]) <= 10 for call in write_batch.call_args_list)
+    finally:
+        await writer.shutdown()
+
+    stats = writer.get_stats()
+    assert stats["written"] == 25
+    assert stats["queue_size"] == 0
+    assert stats["flush_count"] >= 3
+    assert stats["max_queue_latency_ms"] >= stats["avg_queue_latency_ms"] > 0
+    assert stored_messages(session_factory) == [f"m{i}" for i in range(25)]
+
+
+@pytest.mark.asyncio
+async def test_time_trigger_flushes_partial_batch(session_factory):
+    writer = StructuredLogWriter(batch_size=100, flush_interval=0.05)
+    await writer.start()
+    try:
+        writer.submit(log(message="lonely"))
+        await asyncio.sleep(0.3)
+        assert writer.get_stats()["written"] == 1
+        assert stored_messages(session_factory) == ["lonely"]
+    finally:
+        await writer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_queue(session_factory):
+    writer = StructuredLogWriter(batch_size=1000, flush_interval=60)
+    await writer.start()
+    for level in ("ERROR", "DEBUG", "WARNING"):
+        writer.submit(log(level=level, message=level))
+
+    await writer.shutdown()
+
+    # Entries of all levels are written in submission order
+    assert stored_messages(session_factory) == ["ERROR", "DEBUG", "WARNING"]
+    assert writer.submit(log()) is SubmitStatus.STOPPED
+
+
+def test_drop_debug_first_never_evicts_more_severe_entries():
+    writer = StructuredLogWriter(batch_size=100, max_queue_size=3, overflow_policy="drop_debug_first")
+    writer._running = True
+    for level in ("DEBUG", "INFO", "WARNING"):
+        writer.submit(log(level=level, message=level))
+
+    writer.submit(log(level="ERROR", message="error"))  # evicts DEBUG
+    writer.submit(log(level="INFO", message="info-2"))  # evicts INFO
+    writer.submit(log(level="DEBUG", message="debug-2"))  # nothing less severe queued: dropped
+
+    assert [entry["message"] for entry in writer._drain()] == ["WARNING", "error", "info-2"]
+    assert writer.get_stats()["dropped_by_level"] == {"DEBUG": 2, "INFO": 1}
+
+
+@pytest.mark.parametrize("sample_rate,queued", [(0.0, ["old-0", "old-1"]), (1.0, ["old-1", "new-1"])])
+def test_sample_policy(sample_rate, queued):
+    writer = StructuredLogWriter(batch_size=100, max_queue_size=2, overflow_policy="sample", sample_rate=sample_rate)
+    writer._running = True
+    writer.submit(log(level="ERROR", message="old-0"))
+    writer.submit(log(level="ERROR", message="old-1"))
+
+    for i in range(2):
+        writer.submit(log(level="DEBUG", message=f"new-{i}"))
+
+    assert [entry["message"] for entry in writer._drain()] == queued
+    assert writer.get_stats()["dropped"] == 2
+
+
+def test_block_policy_waits_for_flush(session_factory):
+    writer = StructuredLogWriter(batch_size=100, max_queue_size=1, overflow_policy="block", block_timeout=5)
+    writer._running = True
+    writer.submit(log(message="first"))
+
+    producer = threading.Thread(target=writer.submit, args=(log(message="second"),))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()
+
+    writer.flush()
+    producer.join(5)
+    assert not producer.is_alive()
+    writer.flush()
+
+    assert stored_messages(session_factory) == ["first", "second"]
+    assert writer.get_stats()["block_waits"] == 1
+    assert writer.get_stats()["dropped"] == 0
+
+
+def test_block_policy_drops_on_timeout():
+    writer = StructuredLogWriter(batch_size=100, max_queue_size=1, overflow_policy="block", block_timeout=0.01)
+    writer._running = True
+    writer.submit(log(message="first"))
+
+    assert writer.submit(log(message="second")) is SubmitStatus.DROPPED
+    assert writer.get_stats()["dropped_by_level"] == {"INFO": 1}
+
+
+@pytest.mark.asyncio
+async def test_block_policy_awaits_space_on_event_loop(session_factory):
+    writer = StructuredLogWriter(batch_size=100, flush_interval=60, max_queue_size=1, overflow_policy="block", block_timeout=5)
+    await writer.start()
+    queued = []
+    try:
+        with patch.object(writer, "flush", wraps=writer.flush) as flush:
+            writer.submit(log(message="first"))
+            assert writer.submit(log(message="second"), on_queued=queued.append) is SubmitStatus.DEFERRED
+            # Nothing is written on the event loop; the flush task frees space
+            flush.assert_not_called()
+            assert writer.get_stats()["queue_size"] == 1
+            assert queued == []
+            await asyncio.wait_for(asyncio.gather(*writer._blocked_tasks), timeout=5)
+        assert writer.get_stats()["queue_size"] == 1
+        assert [entry["message"] for entry in queued] == ["second"]
+        for _ in range(100):
+            if writer.get_stats()["written"]:
+                break
+            await asyncio.sleep(0.01)
+        assert stored_messages(session_factory) == ["first"]
+    finally:
+        await writer.shutdown()
+    assert stored_messages(session_factory) == ["first", "second"]
+    assert writer.get_stats()["block_waits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_block_policy_on_event_loop_drops_on_timeout(session_factory):
+    writer = StructuredLogWriter(batch_size=100, flush_interval=60, max_queue_size=1, overflow_policy="block", block_timeout=0.01)
+    await writer.start()
+    try:
+        # Keep the flush task from freeing space
+        writer._flush_task.cancel()
+        queued = []
+        writer.submit(log(message="first"))
+        writer.submit(log(message="second"), on_queued=queued.append)
+        await asyncio.gather(*writer._blocked_tasks)
+        assert writer.get_stats()["dropped_by_level"] == {"INFO": 1}
+        assert queued == []
+    finally:
+        await writer.shutdown()
+    assert stored_messages(session_factory) == ["first"]
+
+
+def test_failed_batch_is_counted(monkeypatch):
+    db = MagicMock()
+    db.execute.side_effect = Exception("db down")
+    monkeypatch.setattr(structured_logger, "SessionLocal", MagicMock(return_value=db))
+    writer = StructuredLogWriter()
+    writer._running = True
+    writer.submit(log())
+
+    assert writer.flush() == 0
+
+    db.rollback.assert_called_once()
+    db.close.assert_called_once()
+    assert writer.get_stats()["failed"] == 1
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        StructuredLogWriter(overflow_policy="fifo")
+
+
+def test_router_submits_to_running_writer(monkeypatch):
+    writer = MagicMock()
+    writer.submit.return_value = SubmitStatus.QUEUED
+    monkeypatch.setattr(structured_logger, "get_structured_log_writer", lambda: writer)
+    router = LogRouter()
+    router.database_enabled = True
+    router.batch_enabled = True
+    router._persist_to_database = MagicMock()
+
+    router.route(log())
+    writer.submit.assert_called_once()
+    router._persist_to_database.assert_not_called()
+
+    # Writer not running: immediate write
+    writer.submit.return_value = SubmitStatus.STOPPED
+    router.route(log())
+    router._persist_to_database.assert_called_once()
+
+    # Caller-provided session: written in the caller's transaction
+    db = MagicMock()
+    router.route(log(), db=db)
+    router._persist_to_database.assert_called_with(log(), db)
+    assert writer.submit.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "status,persisted,recorded",
+    [(SubmitStatus.QUEUED, None, True), (SubmitStatus.DEFERRED, None, False), (SubmitStatus.DROPPED, None, False), (SubmitStatus.STOPPED, True, True), (SubmitStatus.STOPPED, False, False)],
+)
+def test_router_aggregates_only_stored_entries(monkeypatch, status, persisted, recorded):
+    writer = MagicMock()
+    writer.submit.return_value = status
+    monkeypatch.setattr(structured_logger, "get_structured_log_writer", lambda: writer)
+    router = LogRouter()
+    router.database_enabled = True
+    router.batch_enabled = True
+    router.incremental_aggregation = True
+    router._persist_to_database = MagicMock(return_value=persisted)
+
+    with patch("mcpgateway.services.log_aggregator.get_log_aggregator") as get_aggregator:
+        router.route(log(duration_ms=12.5))
+
+    assert get_aggregator.return_value.record_entry.called is recorded
+    # A deferred entry is recorded by the writer once it is queued
+    assert writer.submit.call_args.kwargs["on_queued"] == router._record_performance
@@ -40,6 +40,7 @@ from mcpgateway.services.tool_service import (
     ToolNameConflictError,
     ToolNotFoundError,
     ToolResult,
+    tool_call_flights,
     ToolService,
     ToolValidationError,
 )
@@ -1892,6 +1893,79 @@ class TestToolService:
             assert call_kwargs["success"] is True
             assert call_kwargs["error_message"] is None
 
+    @pytest.mark.asyncio
+    async def test_invoke_tool_rest_input_validation(self, tool_service, mock_tool, mock_global_config_obj, test_db, monkeypatch):
+        """Invalid arguments are rejected before the upstream call when input validation is enabled."""
+        monkeypatch.setattr(settings, "tool_input_validation_enabled", True)
+        tool_lookup_cache.reset_stats()
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "ok"})
+        tool_service._http_client.request = AsyncMock(return_value=mock_response)
+
+        mock_metrics_buffer = Mock()
+        with (
+            patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=mock_metrics_buffer),
+            patch("mcpgateway.services.tool_service._record_schema_validation") as record_validation,
+        ):
+            result = await tool_service.invoke_tool(test_db, "test_tool", {"param": 123}, request_headers=None)
+
+            assert result.is_error is True
+            details = orjson.loads(result.content[0].text)
+            assert details["code"] == "type"
+            assert details["path"] == ["param"]
+            tool_service._http_client.request.assert_not_called()
+            assert mock_metrics_buffer.record_tool_metric.call_args[1]["success"] is False
+            assert record_validation.call_args[0][:2] == ("input", "jsonschema")
+
+            result = await tool_service.invoke_tool(test_db, "test_tool", {"param": "value"}, request_headers=None)
+
+            assert not result.is_error
+            tool_service._http_client.request.assert_called_once()
+
+        assert tool_lookup_cache.stats()["validator_compile_count"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("annotations, expected_calls", [({"readOnlyHint": True}, 1), ({}, 3)])
+    async def test_invoke_tool_rest_coalescing(self, tool_service, mock_tool, mock_global_config_obj, test_db, monkeypatch, annotations, expected_calls):
+        """Identical concurrent calls of a read-only tool share one upstream request."""
+        monkeypatch.setattr(settings, "tool_coalescing_enabled", True)
+        tool_call_flights.reset_stats()
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.jsonpath_filter = ""
+        mock_tool.auth_value = None
+        mock_tool.annotations = annotations
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value={"result": "ok"})
+
+        async def slow_request(*_args, **_kwargs):
+            await asyncio.sleep(0.05)
+            return mock_response
+
+        tool_service._http_client.request = AsyncMock(side_effect=slow_request)
+
+        mock_metrics_buffer = Mock()
+        with patch("mcpgateway.services.metrics_buffer_service.get_metrics_buffer_service", return_value=mock_metrics_buffer):
+            results = await asyncio.gather(*(tool_service.invoke_tool(test_db, "test_tool", {"param": "value"}, request_headers=None) for _ in range(3)))
+
+        assert all(not result.is_error for result in results)
+        assert tool_service._http_client.request.await_count == expected_calls
+        assert tool_call_flights.stats()["coalesced"] == 3 - expected_calls
+        # Every caller still records its own metric
+        assert mock_metrics_buffer.record_tool_metric.call_count == 3
+
     @pytest.mark.asyncio
     async def test_invoke_tool_rest_parameter_substitution(self, tool_service, mock_tool, mock_global_config_obj, test_db):
         """Test invoking a REST tool."""
@@ -2956,6 +3030,37 @@ class TestToolService:
         # Verify result
         assert result.content[0].text == '{\n  "result": "original response"\n}'
 
+    async def test_invoke_tool_with_plugin_pre_invoke_result_skips_upstream(self, tool_service, mock_tool, mock_global_config_obj, test_db):
+        """Test that a result returned by a pre-invoke hook replaces the upstream call."""
+        # First-Party
+        from mcpgateway.plugins.framework import PluginResult, ToolHookType, ToolPreInvokeResult
+
+        mock_tool.integration_type = "REST"
+        mock_tool.request_type = "POST"
+        mock_tool.auth_value = None
+        setup_db_execute_mock(test_db, mock_tool, mock_global_config_obj)
+
+        cached = ToolResult(content=[TextContent(type="text", text="cached response")])
+        post_payloads = []
+
+        def invoke_hook_side_effect(hook_type, payload, global_context, local_contexts=None, **kwargs):
+            if hook_type == ToolHookType.TOOL_PRE_INVOKE:
+                return (ToolPreInvokeResult(result=cached.model_dump(by_alias=True)), None)
+            post_payloads.append(payload)
+            return (PluginResult(continue_processing=True), None)
+
+        tool_service._plugin_manager = Mock()
+        tool_service._plugin_manager.invoke_hook = AsyncMock(side_effect=invoke_hook_side_effect)
+
+        with patch("mcpgateway.services.tool_service.decode_auth", return_value={}):
+            result = await tool_service.invoke_tool(test_db, "test_tool", {"param": "value"}, request_headers=None)
+
+        tool_service._http_client.request.assert_not_called()
+        assert result.content[0].text == "cached response"
+        assert not result.is_error
+        # Post-invoke hooks still see the result
+        assert post_payloads[0].result["content"][0]["text"] == "cached response"
+
     async def test_invoke_tool_with_plugin_post_invoke_modified_payload(self, tool_service, mock_tool, mock_global_config_obj, test_db):
         """Test invoking tool with plugin post-invoke hook modifying payload."""
         # Configure tool as REST
@@ -3294,6 +3399,70 @@ class TestSchemaValidatorCaching:
         with pytest.raises(jsonschema.ValidationError):
             _validate_with_cached_schema({"foo": 123}, schema)
 
+    def test_compiled_validator_reused_per_schema_version(self):
+        """Validators are compiled once per tool and schema version."""
+        from mcpgateway.services.tool_service import _schema_version
+
+        tool_lookup_cache.reset_stats()
+        service = ToolService()
+        schema = {"type": "object", "properties": {"foo": {"type": "string"}}, "required": ["foo"]}
+        tool = SimpleNamespace(id="tool-1", output_schema_version=_schema_version(schema))
+
+        with patch("mcpgateway.services.tool_service._canonicalize_schema", wraps=lambda value: orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()) as canonicalize:
+            for _ in range(3):
+                service._validate_tool_schema(tool, "output", schema, {"foo": "bar"})
+            with pytest.raises(jsonschema.ValidationError):
+                service._validate_tool_schema(tool, "output", schema, {"foo": 1})
+            assert canonicalize.call_count == 1
+
+            # A new schema version replaces the compiled validator
+            new_schema = {"type": "object", "required": ["bar"]}
+            tool.output_schema_version = _schema_version(new_schema)
+            service._validate_tool_schema(tool, "output", new_schema, {"bar": 1})
+
+        stats = tool_lookup_cache.stats()
+        assert stats["validator_compile_count"] == 2
+        assert stats["validator_hit_count"] == 3
+        assert stats["validator_count"] == 1
+
+    def test_fastjsonschema_backend_reports_jsonschema_errors(self, monkeypatch):
+        """The code-generated backend handles valid data, jsonschema reports errors."""
+        from mcpgateway.services import tool_service as tool_service_module
+
+        class FakeJsonSchemaException(Exception):
+            pass
+
+        fast_calls = []
+
+        def compile_schema(schema):
+            def validate(instance):
+                fast_calls.append(instance)
+                if "foo" not in instance:
+                    raise FakeJsonSchemaException("missing foo")
+
+            return validate
+
+        monkeypatch.setattr(tool_service_module, "FASTJSONSCHEMA_AVAILABLE", True)
+        monkeypatch.setattr(tool_service_module, "fastjsonschema", SimpleNamespace(compile=compile_schema, JsonSchemaException=FakeJsonSchemaException))
+
+        validator = tool_service_module.CompiledSchemaValidator({"type": "object", "required": ["foo"]}, backend="fastjsonschema")
+        assert validator.backend == "fastjsonschema"
+        validator.validate({"foo": 1})
+        with pytest.raises(jsonschema.ValidationError, match="'foo' is a required property"):
+            validator.validate({})
+        assert fast_calls == [{"foo": 1}, {}]
+
+    def test_fastjsonschema_backend_falls_back(self, monkeypatch):
+        """Unavailable or failing fastjsonschema falls back to jsonschema."""
+        from mcpgateway.services import tool_service as tool_service_module
+
+        monkeypatch.setattr(tool_service_module, "FASTJSONSCHEMA_AVAILABLE", False)
+        assert tool_service_module.CompiledSchemaValidator({"type": "object"}, backend="fastjsonschema").backend == "jsonschema"
+
+        monkeypatch.setattr(tool_service_module, "FASTJSONSCHEMA_AVAILABLE", True)
+        monkeypatch.setattr(tool_service_module, "fastjsonschema", SimpleNamespace(compile=Mock(side_effect=ValueError("unsupported"))))
+        assert tool_service_module.CompiledSchemaValidator({"type": "object"}, backend="fastjsonschema").backend == "jsonschema"
+
 
 class TestCorrelationIdPoolExclusion:
     """Tests for X-Correlation-ID exclusion from pooled sessions.
@@ -158,6 +158,7 @@ def test_settings_default_values():
         assert settings.metrics_cleanup_interval_hours == 1
         assert settings.metrics_retention_days == 7
         assert settings.metrics_rollup_late_data_hours == 1
+        assert settings.observability_buffer_enabled is False
 
 
 def test_api_key_property():
@@ -2704,6 +2704,22 @@ class TestPluginExceptionHandlers:
         assert "Too many requests from this client" in content["error"]["message"]
         assert content["error"]["data"]["plugin_error_code"] == "RATE_LIMIT"
         assert content["error"]["data"]["plugin_name"] == "rate_limiter"
+        assert "retry-after" not in result.headers
+
+    def test_plugin_violation_exception_handler_sets_retry_after(self):
+        """Test plugin_violation_exception_handler exposes retry_after as a Retry-After header."""
+        # Standard
+        import asyncio
+
+        # First-Party
+        from mcpgateway.main import plugin_violation_exception_handler
+        from mcpgateway.plugins.framework.errors import PluginViolationError
+        from mcpgateway.plugins.framework.models import PluginViolation
+
+        violation = PluginViolation(reason="Rate limit exceeded", description="User rate limit exceeded", code="RATE_LIMIT", details={"remaining": 0, "retry_after": 3})
+        result = asyncio.run(plugin_violation_exception_handler(None, PluginViolationError(message="Rate limit violation", violation=violation)))
+
+        assert result.headers["retry-after"] == "3"
 
     def test_plugin_violation_exception_handler_with_minimal_violation(self):
         """Test plugin_violation_exception_handler with minimal violation details."""
@@ -1408,6 +1408,7 @@ class TestRpcHandling:
             patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
         ):
             result = await handle_rpc(request, db=mock_db, user={"email": "user@example.com"})
+            result = json.loads(result.body)  # list results are served pre-serialized
             assert result["result"]["tools"][0]["id"] == "tool-1"
 
     async def test_handle_rpc_list_tools_with_cursor(self):
@@ -1423,6 +1424,7 @@ class TestRpcHandling:
             patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
         ):
             result = await handle_rpc(request, db=mock_db, user={"email": "user@example.com"})
+            result = json.loads(result.body)  # list results are served pre-serialized
             assert result["result"]["nextCursor"] == "next-cursor"
 
     async def test_handle_rpc_list_gateways(self):
@@ -1458,6 +1460,7 @@ class TestRpcHandling:
             patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
         ):
             result = await handle_rpc(request, db=mock_db, user={"email": "user@example.com"})
+            result = json.loads(result.body)  # list results are served pre-serialized
             assert result["result"]["resources"][0]["id"] == "res-1"
             assert result["result"]["nextCursor"] == "next-cursor"
 
@@ -1511,6 +1514,7 @@ class TestRpcHandling:
             patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, False)),
         ):
             result = await handle_rpc(request, db=mock_db, user={"email": "user@example.com"})
+            result = json.loads(result.body)  # list results are served pre-serialized
             assert result["result"]["prompts"][0]["name"] == "prompt-1"
 
         payload_get = {"jsonrpc": "2.0", "id": "7", "method": "prompts/get", "params": {"name": "prompt-1"}}
@@ -1705,6 +1709,7 @@ class TestRpcHandling:
             patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, True)),
         ):
             result = await handle_rpc(request_list, db=MagicMock(), user={"email": "user@example.com"})
+            result = json.loads(result.body)  # list results are served pre-serialized
             assert result["result"]["resources"][0]["id"] == "res-admin"
 
         payload_missing = {"jsonrpc": "2.0", "id": "21", "method": "resources/subscribe", "params": {}}
@@ -1744,6 +1749,7 @@ class TestRpcHandling:
             patch("mcpgateway.main._get_rpc_filter_context", return_value=("user@example.com", None, True)),
         ):
             result = await handle_rpc(request_list, db=MagicMock(), user={"email": "user@example.com"})
+            result = json.loads(result.body)  # list results are served pre-serialized
             assert result["result"]["prompts"][0]["name"] == "prompt-admin"
 
         payload_missing = {"jsonrpc": "2.0", "id": "25", "method": "prompts/get", "params": {}}
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/test_rpc_batch.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for JSON-RPC batch arrays on the /rpc endpoint.
+"""
+
+# Standard
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+from fastapi import Request
+from fastapi.testclient import TestClient
+import pytest
+
+# First-Party
+from mcpgateway.main import _handle_rpc_batch, app
+from mcpgateway.plugins.framework import GlobalContext
+from mcpgateway.utils.jsonrpc_batch import check_batch, execute_batch
+
+
+@pytest.fixture
+def client():
+    """Create a test client with one mock database session per batch entry."""
+    sessions = []
+
+    def fake_get_db():
+        db = MagicMock()
+        sessions.append(db)
+        yield db
+
+    with patch("mcpgateway.config.settings.auth_required", False), patch("mcpgateway.main.get_db", fake_get_db):
+        test_client = TestClient(app)
+        test_client.sessions = sessions
+        yield test_client
+
+
+def _call(name, request_id):
+    return {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": name, "arguments": {}}, "id": request_id}
+
+
+class TestRPCBatch:
+    """Batch handling of the /rpc endpoint."""
+
+    def test_batch_returns_responses_in_order(self, client):
+        with patch("mcpgateway.main.tool_service.invoke_tool", new_callable=AsyncMock) as mock_invoke:
+            mock_invoke.side_effect = lambda **kwargs: {"content": [{"type": "text", "text": kwargs["name"]}], "isError": False}
+            batch = [_call("first", 1), {"jsonrpc": "2.0", "method": "notifications/initialized"}, 42, _call("second", "b")]
+
+            response = client.post("/rpc", json=batch)
+
+        assert response.status_code == 200
+        results = response.json()
+        assert [r["id"] for r in results] == [1, None, "b"]
+        assert results[0]["result"]["content"][0]["text"] == "first"
+        assert results[1]["error"]["code"] == -32600
+        assert results[2]["result"]["content"][0]["text"] == "second"
+        assert mock_invoke.await_count == 2
+        # Every executed entry got its own database session
+        assert len(client.sessions) == 3
+
+    def test_failing_entry_does_not_fail_batch(self, client):
+        async def invoke(**kwargs):
+            if kwargs["name"] == "bad":
+                raise RuntimeError("tool failed")
+            return {"content": [], "isError": False}
+
+        with patch("mcpgateway.main.tool_service.invoke_tool", side_effect=invoke):
+            response = client.post("/rpc", json=[_call("bad", 7), _call("ok", 8)])
+
+        assert response.status_code == 200
+        results = response.json()
+        assert results[0]["id"] == 7 and "error" in results[0]
+        assert results[1]["id"] == 8 and "result" in results[1]
+
+    def test_notifications_only_returns_202(self, client):
+        response = client.post("/rpc", json=[{"jsonrpc": "2.0", "method": "notifications/initialized"}])
+        assert response.status_code == 202
+
+    def test_rejects_empty_and_oversized_batches(self, client):
+        assert client.post("/rpc", json=[]).status_code == 400
+        with patch("mcpgateway.main.settings.jsonrpc_batch_max_size", 2):
+            response = client.post("/rpc", json=[_call("a", 1), _call("b", 2), _call("c", 3)])
+        assert response.status_code == 400
+        assert response.json()["error"]["data"] == {"max_size": 2, "size": 3}
+
+
+@pytest.mark.asyncio
+async def test_entries_get_their_own_plugin_contexts():
+    request = Request({"type": "http", "method": "POST", "path": "/rpc", "headers": []})
+    shared = GlobalContext(request_id="req", metadata={"source": "http"})
+    request.state.plugin_global_context = shared
+    request.state.plugin_context_table = {"req-plugin": MagicMock()}
+    seen = {}
+
+    async def invoke(**kwargs):
+        global_context = kwargs["plugin_global_context"]
+        # The tool path writes the server and tool metadata into the context
+        global_context.server_id = kwargs["name"]
+        global_context.metadata["tool"] = kwargs["name"]
+        await asyncio.sleep(0)
+        seen[kwargs["name"]] = (global_context.request_id, global_context.server_id, global_context.metadata["tool"], kwargs["plugin_context_table"])
+        return {"content": [], "isError": False}
+
+    def fake_get_db():
+        yield MagicMock()
+
+    with patch("mcpgateway.main.get_db", fake_get_db), patch("mcpgateway.main.tool_service.invoke_tool", side_effect=invoke):
+        response = await _handle_rpc_batch(request, [_call("a", 1), _call("b", 2)], {"email": "user@example.com", "is_admin": True})
+
+    assert response.status_code == 200
+    assert seen == {"a": ("req:0", "a", "a", None), "b": ("req:1", "b", "b", None)}
+    assert shared.server_id is None and shared.metadata == {"source": "http"}
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_limits_concurrency():
+    running = 0
+    peak = 0
+
+    async def handler(entry):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"jsonrpc": "2.0", "result": entry["id"], "id": entry["id"]}
+
+    batch = [{"jsonrpc": "2.0", "method": "m", "id": i} for i in range(10)]
+    responses = await execute_batch(batch, handler, max_concurrency=3)
+
+    assert [r["result"] for r in responses] == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_converts_handler_errors():
+    async def handler(entry):
+        raise RuntimeError("boom")
+
+    responses = await execute_batch([{"jsonrpc": "2.0", "method": "m", "id": 1}], handler, max_concurrency=1)
+    assert responses == [{"jsonrpc": "2.0", "error": {"code": -32603, "message": "Internal error", "data": "boom"}, "id": 1}]
+
+
+def test_check_batch_disabled():
+    assert check_batch([{"jsonrpc": "2.0", "method": "m", "id": 1}], 0)["error"]["message"] == "Batch requests are disabled"
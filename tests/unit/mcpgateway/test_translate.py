@@ -38,6 +38,7 @@ from __future__ import annotations
 # Standard Library
 import asyncio
 import importlib
+import json
 import sys
 import types
 from typing import Any, Sequence
@@ -163,6 +164,130 @@ async def test_pubsub_double_unsubscribe_and_publish_no_subs(translate):
     await ps.publish("no one listens")
 
 
+@pytest.mark.asyncio
+async def test_pubsub_routes_responses_to_requesting_session(translate):
+    ps = translate._PubSub()
+    alice, bob = ps.subscribe("alice"), ps.subscribe("bob")
+
+    # Both sessions use id 1; the subprocess sees distinct ids
+    to_child_a = json.loads(ps.route_outgoing('{"jsonrpc":"2.0","id":1,"method":"tools/list"}', "alice"))
+    to_child_b = json.loads(ps.route_outgoing('{"jsonrpc":"2.0","id":1,"method":"tools/list"}', "bob"))
+    assert to_child_a["id"] != to_child_b["id"]
+
+    await ps.publish(json.dumps({"jsonrpc": "2.0", "id": to_child_b["id"], "result": "b"}))
+    await ps.publish(json.dumps({"jsonrpc": "2.0", "id": to_child_a["id"], "result": "a"}))
+
+    assert json.loads(alice.get_nowait()) == {"jsonrpc": "2.0", "id": 1, "result": "a"}
+    assert json.loads(bob.get_nowait()) == {"jsonrpc": "2.0", "id": 1, "result": "b"}
+    assert alice.empty() and bob.empty()
+    assert ps.stats()["targeted"] == 2
+    assert ps.stats()["pending_routes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pubsub_broadcasts_notifications_and_unrouted_responses(translate):
+    ps = translate._PubSub()
+    alice, bob = ps.subscribe("alice"), ps.subscribe("bob")
+    ps.route_outgoing('{"jsonrpc":"2.0","id":1,"method":"ping"}', "alice")
+
+    await ps.publish('{"jsonrpc":"2.0","method":"notifications/tools/list_changed"}')
+    await ps.publish('{"jsonrpc":"2.0","id":99,"result":{}}')
+
+    for q in (alice, bob):
+        assert json.loads(q.get_nowait())["method"] == "notifications/tools/list_changed"
+        assert json.loads(q.get_nowait())["id"] == 99
+
+
+@pytest.mark.asyncio
+async def test_pubsub_late_reply_after_unsubscribe_is_not_broadcast(translate):
+    ps = translate._PubSub()
+    gone, other = ps.subscribe("gone"), ps.subscribe("other")
+    routed = json.loads(ps.route_outgoing('{"jsonrpc":"2.0","id":5,"method":"ping"}', "gone"))["id"]
+    ps.unsubscribe(gone)
+    assert ps.stats()["pending_routes"] == 0
+
+    await ps.publish(json.dumps({"jsonrpc": "2.0", "id": routed, "result": {}}))
+    assert other.empty()
+    assert ps.stats()["orphaned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pubsub_routes_batch_responses_per_session(translate):
+    ps = translate._PubSub()
+    alice, bob, other = ps.subscribe("alice"), ps.subscribe("bob"), ps.subscribe()
+    a_ids = [m["id"] for m in json.loads(ps.route_outgoing('[{"jsonrpc":"2.0","id":1,"method":"ping"},{"jsonrpc":"2.0","id":2,"method":"ping"}]', "alice"))]
+    b_id = json.loads(ps.route_outgoing('{"jsonrpc":"2.0","id":1,"method":"ping"}', "bob"))["id"]
+
+    await ps.publish(json.dumps([{"jsonrpc": "2.0", "id": a_ids[1], "result": "a2"}, {"jsonrpc": "2.0", "id": b_id, "result": "b"}, {"jsonrpc": "2.0", "id": a_ids[0], "result": "a1"}]))
+
+    assert json.loads(alice.get_nowait()) == [{"jsonrpc": "2.0", "id": 2, "result": "a2"}, {"jsonrpc": "2.0", "id": 1, "result": "a1"}]
+    assert json.loads(bob.get_nowait()) == [{"jsonrpc": "2.0", "id": 1, "result": "b"}]
+    assert alice.empty() and bob.empty() and other.empty()
+    assert ps.stats()["pending_routes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pubsub_cancellation_uses_routed_id(translate):
+    ps = translate._PubSub()
+    ps.subscribe("s")
+    routed = json.loads(ps.route_outgoing('{"jsonrpc":"2.0","id":"abc","method":"tools/call"}', "s"))["id"]
+    cancel = json.loads(ps.route_outgoing('{"jsonrpc":"2.0","method":"notifications/cancelled","params":{"requestId":"abc"}}', "s"))
+    assert cancel["params"]["requestId"] == routed
+
+
+@pytest.mark.asyncio
+async def test_pubsub_byte_bound_drops_messages_and_counts(translate):
+    ps = translate._PubSub(max_queue_bytes=10)
+    slow, fast = ps.subscribe("slow"), ps.subscribe("fast")
+
+    await ps.publish("12345678")
+    fast.get_nowait()
+    await ps.publish("abcdef")  # would take "slow" to 14 characters
+
+    assert slow.qsize() == 1
+    assert slow.dropped == 1
+    assert fast.get_nowait() == "abcdef"
+    stats = ps.stats()
+    assert stats["dropped"] == 1
+    assert stats["subscriber_drops"] == [{"session_id": "slow", "dropped": 1, "queued_bytes": 8}]
+    # Subscriber is kept and receives again once drained
+    slow.get_nowait()
+    await ps.publish("again")
+    assert slow.get_nowait() == "again"
+
+
+@pytest.mark.asyncio
+async def test_pubsub_byte_bound_counts_encoded_bytes(translate):
+    ps = translate._PubSub(max_queue_bytes=10)
+    q = ps.subscribe()
+
+    await ps.publish("é")  # 1 character, 2 bytes
+    await ps.publish("日本語")  # 3 characters, 9 bytes: over the bound
+
+    assert q.qsize() == 1
+    assert q.queued_bytes == 2
+    assert ps.stats()["subscriber_drops"] == [{"session_id": None, "dropped": 1, "queued_bytes": 2}]
+
+
+@pytest.mark.asyncio
+async def test_stdio_endpoint_send_rewrites_ids_for_sessions(monkeypatch, translate):
+    ps = translate._PubSub()
+    ps.subscribe("s")
+    fake = _FakeProc([])
+
+    async def _fake_exec(*_a, **_kw):
+        return fake
+
+    monkeypatch.setattr(translate.asyncio, "create_subprocess_exec", _fake_exec)
+    ep = translate.StdIOEndpoint("echo hi", ps)
+    await ep.start()
+    await ep.send('{"jsonrpc":"2.0","id":3,"method":"ping"}\n', session_id="s")
+    assert json.loads(fake.stdin.buffer[-1])["id"].startswith(translate.ROUTED_ID_PREFIX)
+    await ep.send('{"jsonrpc":"2.0","id":4,"method":"ping"}\n')
+    assert json.loads(fake.stdin.buffer[-1])["id"] == 4
+    await ep.stop()
+
+
 # ---------------------------------------------------------------------------#
 # Tests: StdIOEndpoint                                                       #
 # ---------------------------------------------------------------------------#
@@ -2474,6 +2599,7 @@ async def test_multi_protocol_server_basic(monkeypatch, translate):
     assert "stdio_init" in calls
     assert "stdio_start" in calls
     assert "fastapi_init" in calls
+    assert "get_/stats" in calls
     assert "server_serve" in calls
 
 
@@ -2535,7 +2661,7 @@ async def test_multi_protocol_server_with_streamable_http(monkeypatch, translate
         def __init__(self):
             pubsub_holder["pubsub"] = self
 
-        def subscribe(self):
+        def subscribe(self, session_id=None):
             queue = asyncio.Queue()
             if self.next_message is not None:
                 queue.put_nowait(self.next_message)
@@ -2627,7 +2753,7 @@ async def test_multi_protocol_server_sse_routes(monkeypatch, translate):
             pubsub_holder["pubsub"] = self
             self.subscribers = []
 
-        def subscribe(self):
+        def subscribe(self, session_id=None):
             queue = asyncio.Queue()
             self.subscribers.append(queue)
             return queue
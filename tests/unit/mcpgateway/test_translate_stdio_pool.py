@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the translate StdIOPool worker pool.
+
+Location: ./tests/unit/mcpgateway/test_translate_stdio_pool.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for id rewriting, targeted delivery, least-loaded dispatch,
+backpressure and per-child restart in StdIOPool.
+"""
+
+# Standard
+import asyncio
+import os
+import sys
+import tempfile
+
+# Third-Party
+import orjson
+import pytest
+
+# First-Party
+from mcpgateway import translate
+from mcpgateway.translate import _PubSub, StdIOPool, StdIOPoolSaturatedError
+
+# Minimal line-delimited JSON-RPC server: replies with its pid, sleeps when asked,
+# exits on "crash" and emits a notification for "notify".
+SERVER_SCRIPT = """
+import json, os, sys, time
+for line in sys.stdin:
+    msg = json.loads(line)
+    if "id" not in msg:
+        continue
+    method = msg.get("method")
+    if method == "crash":
+        sys.exit(3)
+    if method == "sleep":
+        time.sleep(msg["params"]["seconds"])
+    if method == "notify":
+        print(json.dumps({"jsonrpc": "2.0", "method": "notifications/message", "params": {}}), flush=True)
+    print(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": {"pid": os.getpid(), "method": method}}), flush=True)
+"""
+
+
+@pytest.fixture
+def server_cmd():
+    """Write the fake server to disk and return the command running it."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+        f.write(SERVER_SCRIPT)
+    try:
+        yield f"{sys.executable} {f.name}"
+    finally:
+        os.unlink(f.name)
+
+
+def _request(msg_id, method="ping", **params):
+    return orjson.dumps({"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params}).decode() + "\n"
+
+
+async def _next(queue, timeout=5.0):
+    return orjson.loads(await asyncio.wait_for(queue.get(), timeout))
+
+
+_REAL_SLEEP = asyncio.sleep
+
+
+async def _fast_sleep(delay, *args, **kwargs):
+    """Shrink restart backoff so the supervisor test runs quickly."""
+    return await _REAL_SLEEP(min(delay, 0.01), *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_responses_only_reach_originating_session(server_cmd):
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=2)
+    alice, bob = pubsub.subscribe("alice"), pubsub.subscribe("bob")
+    await pool.start()
+    try:
+        # Both clients use the same JSON-RPC id
+        await pool.send(_request(1), session_id="alice")
+        await pool.send(_request(1), session_id="bob")
+
+        assert (await _next(alice))["id"] == 1
+        assert (await _next(bob))["id"] == 1
+        assert alice.empty() and bob.empty()
+        assert pool.stats()["pending"] == 0
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_requests_go_to_least_loaded_worker(server_cmd):
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=2)
+    queue = pubsub.subscribe("s")
+    await pool.start()
+    try:
+        await pool.send(_request("slow", "sleep", seconds=0.5), session_id="s")
+        await pool.send(_request("fast"), session_id="s")
+
+        first = await _next(queue)
+        second = await _next(queue)
+        # The fast request went to the idle child and overtook the slow one
+        assert first["id"] == "fast"
+        assert second["id"] == "slow"
+        assert first["result"]["pid"] != second["result"]["pid"]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_initialize_fans_out_and_client_sees_one_reply(server_cmd):
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=3)
+    queue = pubsub.subscribe("s")
+    await pool.start()
+    try:
+        await pool.send(_request(0, "initialize"), session_id="s")
+        assert (await _next(queue))["result"]["method"] == "initialize"
+        await asyncio.sleep(0.3)
+        assert queue.empty()
+        stats = pool.stats()
+        assert stats["pending"] == 0
+        # Fan-out slots are released once the other children reply
+        assert [worker["inflight"] for worker in stats["workers"]] == [0, 0, 0]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_server_notifications_are_broadcast(server_cmd):
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=2)
+    caller, other = pubsub.subscribe("caller"), pubsub.subscribe("other")
+    await pool.start()
+    try:
+        await pool.send(_request(7, "notify"), session_id="caller")
+        assert (await _next(caller))["method"] == "notifications/message"
+        assert (await _next(caller))["id"] == 7
+        assert (await _next(other))["method"] == "notifications/message"
+        assert other.empty()
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_rejects_when_saturated(server_cmd):
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=1, max_inflight=1, saturation_timeout=0.1)
+    queue = pubsub.subscribe("s")
+    await pool.start()
+    try:
+        await pool.send(_request(1, "sleep", seconds=0.5), session_id="s")
+        with pytest.raises(StdIOPoolSaturatedError):
+            await pool.send(_request(2), session_id="s")
+        assert (await _next(queue))["id"] == 1
+        # Capacity is released once the reply arrives
+        await pool.send(_request(3), session_id="s")
+        assert (await _next(queue))["id"] == 3
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_restarted_and_pending_requests_fail(server_cmd, monkeypatch):
+    monkeypatch.setattr(asyncio, "sleep", _fast_sleep)
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=1)
+    queue = pubsub.subscribe("s")
+    await pool.start()
+    try:
+        await pool.send(_request(0, "initialize"), session_id="s")
+        await _next(queue)
+        old_pid = pool._workers[0]._proc.pid
+
+        await pool.send(_request(1, "crash"), session_id="s")
+        error = await _next(queue)
+        assert error["id"] == 1
+        assert error["error"]["code"] == -32603
+
+        for _ in range(100):
+            if pool.stats()["workers"][0]["restarts"] == 1 and pool.is_running():
+                break
+            await _REAL_SLEEP(0.05)
+        assert pool._workers[0]._proc.pid != old_pid
+
+        await pool.send(_request(2), session_id="s")
+        assert (await _next(queue))["id"] == 2
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_sender_waiting_for_capacity_resumes_after_restart(server_cmd, monkeypatch):
+    async def _slow_backoff(delay, *args, **kwargs):
+        return await _REAL_SLEEP(min(delay, 0.2), *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "sleep", _slow_backoff)
+    pubsub = _PubSub()
+    pool = StdIOPool(server_cmd, pubsub, size=2, max_inflight=1, saturation_timeout=5)
+    queue = pubsub.subscribe("s")
+    await pool.start()
+    try:
+        # Worker 0 stays busy past the test; worker 1 crashes
+        await pool.send(_request(1, "sleep", seconds=5), session_id="s")
+        await pool.send(_request(2, "crash"), session_id="s")
+        assert (await _next(queue))["id"] == 2
+        assert not pool.stats()["workers"][1]["running"]
+
+        # The waiting sender resumes once worker 1 is back, not when worker 0 frees up
+        await asyncio.wait_for(pool.send(_request(3), session_id="s"), timeout=2)
+        assert (await _next(queue))["id"] == 3
+        assert pool.stats()["workers"][1]["restarts"] == 1
+    finally:
+        await pool.stop()
+
+
+def test_pool_cli_options():
+    args = translate._parse_args(["--stdio", "cat", "--pool-size", "3", "--pool-max-inflight", "8"])
+    assert args.pool_size == 3
+    assert args.pool_max_inflight == 8
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/transports/test_redis_event_store.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the Redis Streams event store of the streamable HTTP transport.
+"""
+
+# Standard
+from unittest.mock import AsyncMock, patch
+
+# Third-Party
+from mcp.types import JSONRPCMessage
+import pytest
+
+# First-Party
+from mcpgateway.transports.redis_event_store import RedisEventStore
+from mcpgateway.transports.streamablehttp_transport import InMemoryEventStore
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def message(i: int) -> JSONRPCMessage:
+    return JSONRPCMessage(jsonrpc="2.0", method=f"notify/{i}", id=i)
+
+
+async def collect(store, last_event_id):
+    sent = []
+
+    async def callback(event):
+        sent.append(event)
+
+    stream_id = await store.replay_events_after(last_event_id, callback)
+    return stream_id, sent
+
+
+@pytest.fixture(params=[True, False], ids=["decoded", "bytes"])
+def redis(request):
+    return fakeredis.aioredis.FakeRedis(decode_responses=request.param)
+
+
+@pytest.mark.asyncio
+async def test_replay_after_event(redis):
+    store = RedisEventStore(redis=redis, replay_batch_size=2)
+    ids = [await store.store_event("stream-1", message(i)) for i in range(5)]
+    await store.store_event("stream-2", message(99))
+
+    stream_id, sent = await collect(store, ids[1])
+
+    assert stream_id == "stream-1"
+    assert [event.message.root.id for event in sent] == [2, 3, 4]
+    assert [event.event_id for event in sent] == ids[2:]
+
+
+@pytest.mark.asyncio
+async def test_replay_is_shared_between_store_instances(redis):
+    # Two workers pointing at the same Redis
+    writer = RedisEventStore(redis=redis)
+    reader = RedisEventStore(redis=redis)
+    first = await writer.store_event("stream-1", message(1))
+    await writer.store_event("stream-1", message(2))
+
+    stream_id, sent = await collect(reader, first)
+
+    assert stream_id == "stream-1"
+    assert [event.message.root.method for event in sent] == ["notify/2"]
+
+
+@pytest.mark.asyncio
+async def test_stream_is_trimmed_and_expires(redis):
+    store = RedisEventStore(redis=redis, max_events_per_stream=3, ttl=60)
+    ids = [await store.store_event("s", message(i)) for i in range(6)]
+
+    assert await redis.xlen("mcpgw:events:s") == 3
+    assert 0 < await redis.ttl("mcpgw:events:s") <= 60
+    # Resuming from a trimmed event must not silently skip messages
+    assert await collect(store, ids[1]) == (None, [])
+    _, sent = await collect(store, ids[3])
+    assert [event.message.root.id for event in sent] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_unknown_event_ids(redis):
+    store = RedisEventStore(redis=redis)
+    assert await collect(store, "garbage") == (None, [])
+    assert await collect(store, "missing:1-0") == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_falls_back_when_redis_unavailable():
+    fallback = InMemoryEventStore()
+    store = RedisEventStore(fallback=fallback)
+
+    with patch("mcpgateway.utils.redis_client.get_redis_client", AsyncMock(return_value=None)):
+        first = await store.store_event("s", message(1))
+        await store.store_event("s", message(2))
+        stream_id, sent = await collect(store, first)
+
+    assert first in fallback.event_index
+    assert stream_id == "s"
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_raises_without_redis_or_fallback():
+    store = RedisEventStore()
+
+    with patch("mcpgateway.utils.redis_client.get_redis_client", AsyncMock(return_value=None)):
+        with pytest.raises(RuntimeError, match="unavailable"):
+            await store.store_event("s", message(1))
+        assert await collect(store, "s:1-0") == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_redis_is_looked_up_again_after_backoff(redis, monkeypatch):
+    fallback = InMemoryEventStore()
+    store = RedisEventStore(fallback=fallback)
+    now = [1000.0]
+    monkeypatch.setattr("mcpgateway.transports.redis_event_store.time.monotonic", lambda: now[0])
+    get_redis_client = AsyncMock(return_value=None)
+
+    with patch("mcpgateway.utils.redis_client.get_redis_client", get_redis_client):
+        early = await store.store_event("s", message(1))
+        await store.store_event("s", message(2))
+        assert get_redis_client.await_count == 1
+
+        # Redis comes back: the next lookup after the backoff finds it
+        get_redis_client.return_value = redis
+        now[0] += 1.0
+        event_id = await store.store_event("s", message(3))
+
+    assert get_redis_client.await_count == 2
+    assert await redis.xlen("mcpgw:events:s") == 1
+    assert event_id.startswith("s:")
+    # Events stored before the switch are still replayed by the fallback
+    _, sent = await collect(store, early)
+    assert [event.message.root.id for event in sent] == [2]
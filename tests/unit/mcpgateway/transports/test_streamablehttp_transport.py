@@ -27,6 +27,7 @@ from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 # Third-Party
+import orjson
 import pytest
 from starlette.types import Scope
 
@@ -309,6 +310,51 @@ async def test_list_tools_with_server_id(monkeypatch):
     assert result[0].description == "desc"
 
 
+@pytest.mark.asyncio
+async def test_list_tools_reuses_cached_objects_per_scope(monkeypatch):
+    """Test list_tools builds the SDK objects once per caller scope until invalidated."""
+    # First-Party
+    from mcpgateway.cache.list_response_cache import get_list_response_cache
+    from mcpgateway.transports.streamablehttp_transport import list_tools, server_id_var, tool_service, user_context_var
+
+    mock_tool = MagicMock()
+    mock_tool.name = "t"
+    mock_tool.description = "desc"
+    mock_tool.input_schema = {"type": "object"}
+    mock_tool.output_schema = None
+    mock_tool.annotations = {}
+
+    @asynccontextmanager
+    async def fake_get_db():
+        yield MagicMock()
+
+    list_server_tools = AsyncMock(return_value=[mock_tool])
+    monkeypatch.setattr("mcpgateway.transports.streamablehttp_transport.get_db", fake_get_db)
+    monkeypatch.setattr(tool_service, "list_server_tools", list_server_tools)
+
+    server_token = server_id_var.set("123")
+    try:
+        user_token = user_context_var.set({"email": "a@example.com", "teams": ["t1"]})
+        first = await list_tools()
+        assert await list_tools() is first
+        user_context_var.reset(user_token)
+        assert list_server_tools.await_count == 1
+
+        # A different team scope gets its own entry
+        user_token = user_context_var.set({"email": "a@example.com", "teams": []})
+        await list_tools()
+        user_context_var.reset(user_token)
+        assert list_server_tools.await_count == 2
+
+        get_list_response_cache().invalidate_type("tools")
+        user_token = user_context_var.set({"email": "a@example.com", "teams": ["t1"]})
+        assert await list_tools() is not first
+        user_context_var.reset(user_token)
+        assert list_server_tools.await_count == 3
+    finally:
+        server_id_var.reset(server_token)
+
+
 @pytest.mark.asyncio
 async def test_list_tools_no_server_id(monkeypatch):
     """Test list_tools returns tools when no server_id is set."""
@@ -1467,6 +1513,49 @@ async def test_event_store_interleaved_streams():
     assert [m.message["idx"] for m in s2_sent] == [1, 2, 3]
 
 
+@pytest.mark.asyncio
+async def test_event_store_byte_bound_evicts_oldest():
+    """A byte-bounded stream drops its oldest events but always keeps the newest."""
+    # Third-Party
+    from mcp.types import JSONRPCMessage
+
+    store = InMemoryEventStore(max_events_per_stream=100, max_bytes_per_stream=200)
+    ids = [await store.store_event("s", JSONRPCMessage(jsonrpc="2.0", method="x" * 30, id=i)) for i in range(10)]
+    buffer = store.streams["s"]
+
+    assert buffer.total_bytes <= 200
+    assert len(buffer) == len(store.event_index) < 10
+    assert ids[-1] in store.event_index and ids[0] not in store.event_index
+
+    sent: List[tr.EventMessage] = []
+
+    async def collector(msg):
+        sent.append(msg)
+
+    oldest_kept = ids[10 - len(buffer)]
+    assert await store.replay_events_after(oldest_kept, collector) == "s"
+    assert [m.event_id for m in sent] == ids[11 - len(buffer) :]
+
+    # A single oversized event is still kept
+    big = await store.store_event("s", JSONRPCMessage(jsonrpc="2.0", method="y" * 500, id=99))
+    assert len(store.streams["s"]) == 1 and big in store.event_index
+
+
+def test_create_event_store_uses_settings(monkeypatch):
+    """create_event_store honours the configured backend and limits."""
+    monkeypatch.setattr(tr.settings, "streamable_http_max_events_per_stream", 7)
+    monkeypatch.setattr(tr.settings, "streamable_http_event_store", "memory")
+    store = tr.create_event_store()
+    assert isinstance(store, InMemoryEventStore)
+    assert store.max_events_per_stream == 7
+
+    monkeypatch.setattr(tr.settings, "streamable_http_event_store", "redis")
+    store = tr.create_event_store()
+    assert type(store).__name__ == "RedisEventStore"
+    assert store.max_events_per_stream == 7
+    assert isinstance(store.fallback, InMemoryEventStore)
+
+
 @pytest.mark.asyncio
 async def test_event_store_evicted_event_returns_none():
     """Replaying from an evicted event should return None."""
@@ -2275,3 +2364,69 @@ async def test_call_tool_with_gateway_model_image_annotations(monkeypatch):
     assert isinstance(result[0].annotations, types.Annotations)
     assert result[0].annotations.audience == ["assistant"]
     assert result[0].annotations.priority == 0.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("json_response", [True, False])
+async def test_session_manager_wrapper_handles_batch(monkeypatch, json_response):
+    """A JSON-RPC batch array is split into single messages and answered with one array."""
+    monkeypatch.setattr(tr.settings, "use_stateful_sessions", False)
+    monkeypatch.setattr(tr.settings, "json_response_enabled", json_response)
+    wrapper = SessionManagerWrapper()
+    await wrapper.initialize()
+
+    body = orjson.dumps(
+        [
+            {"jsonrpc": "2.0", "method": "ping", "id": 1},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            "bogus",
+            {"jsonrpc": "2.0", "method": "ping", "id": "two"},
+        ]
+    )
+    headers = [(b"content-type", b"application/json"), (b"accept", b"application/json, text/event-stream"), (b"content-length", str(len(body)).encode())]
+    scope = {**_make_scope("/mcp", headers), "query_string": b"", "scheme": "http", "server": ("test", 80), "root_path": ""}
+    messages = iter([{"type": "http.request", "body": body, "more_body": False}])
+
+    async def receive():
+        return next(messages)
+
+    sent = []
+
+    async def send(msg):
+        sent.append(msg)
+
+    try:
+        await wrapper.handle_streamable_http(scope, receive, send)
+    finally:
+        await wrapper.shutdown()
+
+    assert sent[0]["status"] == 200
+    responses = orjson.loads(sent[1]["body"])
+    assert [r["id"] for r in responses] == [1, None, "two"]
+    assert responses[0]["result"] == {} and responses[2]["result"] == {}
+    assert responses[1]["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_session_manager_wrapper_rejects_oversized_batch(monkeypatch):
+    """Batches above JSONRPC_BATCH_MAX_SIZE are rejected without reaching the session manager."""
+    monkeypatch.setattr(tr.settings, "jsonrpc_batch_max_size", 1)
+    wrapper = SessionManagerWrapper()
+    wrapper.session_manager = MagicMock()
+    body = b'[{"jsonrpc": "2.0", "method": "ping", "id": 1}, {"jsonrpc": "2.0", "method": "ping", "id": 2}]'
+    scope = _make_scope("/mcp", [(b"content-type", b"application/json")])
+    messages = iter([{"type": "http.request", "body": body, "more_body": False}])
+
+    async def receive():
+        return next(messages)
+
+    sent = []
+
+    async def send(msg):
+        sent.append(msg)
+
+    await wrapper.handle_streamable_http(scope, receive, send)
+
+    assert sent[0]["status"] == 400
+    assert orjson.loads(sent[1]["body"])["error"]["message"] == "Batch too large"
+    wrapper.session_manager.handle_request.assert_not_called()
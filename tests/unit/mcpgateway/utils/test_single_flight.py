@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/utils/test_single_flight.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Unit tests for single-flight request coalescing.
+"""
+
+# Standard
+import asyncio
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.utils.single_flight import make_flight_key, SingleFlight
+
+
+def counting(result=None, exc=None, delay=0.02):
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if exc is not None:
+            raise exc
+        return result
+
+    return fn, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight("tool")
+    fn, calls = counting(result={"value": 1})
+
+    results = await asyncio.gather(*(flights.do("k", fn) for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flights.stats() == {"kind": "tool", "leaders": 1, "coalesced": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_and_sequential_calls_are_not_coalesced():
+    flights = SingleFlight("tool")
+    fn, calls = counting(result="x")
+
+    await asyncio.gather(flights.do("a", fn), flights.do("b", fn))
+    await flights.do("a", fn)
+
+    assert len(calls) == 3
+    assert flights.stats()["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    flights = SingleFlight("resource")
+    fn, calls = counting(exc=ValueError("upstream failed"))
+
+    results = await asyncio.gather(*(flights.do("k", fn) for _ in range(3)), return_exceptions=True)
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flights.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    flights = SingleFlight("tool")
+    fn, calls = counting(result="ok", delay=0.05)
+
+    leader = asyncio.create_task(flights.do("k", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do("k", fn))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == "ok"
+    assert leader.cancelled()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_leader():
+    flights = SingleFlight("tool")
+    fn, calls = counting(result="ok", delay=0.05)
+
+    leader = asyncio.create_task(flights.do("k", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do("k", fn))
+    await asyncio.sleep(0.01)
+    follower.cancel()
+
+    assert await leader == "ok"
+    assert follower.cancelled()
+    assert len(calls) == 1
+
+
+def test_flight_key_is_canonical():
+    assert make_flight_key("t", {"a": 1, "b": {"y": 2, "x": 1}}, None) == make_flight_key("t", {"b": {"x": 1, "y": 2}, "a": 1}, None)
+    assert make_flight_key("t", {"a": 1}, "alice") != make_flight_key("t", {"a": 1}, "bob")
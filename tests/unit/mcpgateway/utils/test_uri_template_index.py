@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/utils/test_uri_template_index.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Unit tests for the prefix-bucketed URI template index.
+"""
+
+# First-Party
+from mcpgateway.utils.uri_template_index import build_template_regex, literal_prefix, UriTemplateIndex
+
+
+class TestBuildTemplateRegex:
+    """Tests for template-to-regex compilation."""
+
+    def test_simple_and_wildcard_expressions(self):
+        regex = build_template_regex("files://root/{path*}/meta/{id}")
+        match = regex.match("files://root/a/b/c/meta/42")
+        assert match is not None
+        assert match.groupdict() == {"path": "a/b/c", "id": "42"}
+
+    def test_simple_expression_does_not_cross_segments(self):
+        assert build_template_regex("db://{table}").match("db://a/b") is None
+
+    def test_query_expression_is_ignored(self):
+        assert build_template_regex("search://{q}{?limit,offset}").pattern == "^search://(?P<q>[^/]+)$"
+
+    def test_literals_are_escaped(self):
+        assert build_template_regex("a.b://{x}").match("aXb://1") is None
+
+
+class TestUriTemplateIndex:
+    """Tests for UriTemplateIndex lookups."""
+
+    def test_empty_index(self):
+        assert UriTemplateIndex().match("anything://x") is None
+
+    def test_no_match_returns_none(self):
+        index = UriTemplateIndex()
+        index.add("file://search/{query}", "search")
+        assert index.match("file://searching/hello") is None
+
+    def test_query_string_is_ignored_when_matching(self):
+        index = UriTemplateIndex()
+        index.add("search://{q}{?limit}", "search")
+        assert index.match("search://cats?limit=5") == "search"
+
+    def test_most_specific_template_wins_regardless_of_insertion_order(self):
+        templates = ["weather://{city}/{metric}", "weather://{city}/current", "weather://{rest*}", "weather://paris/current"]
+        for ordering in (templates, list(reversed(templates))):
+            index = UriTemplateIndex()
+            for template in ordering:
+                index.add(template, template)
+            assert index.match("weather://paris/current") == "weather://paris/current"
+            assert index.match("weather://rome/current") == "weather://{city}/current"
+            assert index.match("weather://rome/humidity") == "weather://{city}/{metric}"
+            assert index.match("weather://rome/a/b") == "weather://{rest*}"
+
+    def test_specificity_across_prefix_buckets(self):
+        index = UriTemplateIndex()
+        index.add("{scheme}://static/about", "generic")
+        index.add("app://{page}", "app")
+        # "generic" has more literal characters even though its prefix is empty
+        assert index.match("app://static/about") == "generic"
+        assert index.match("app://home") == "app"
+
+    def test_duplicate_templates_resolve_to_first_added(self):
+        index = UriTemplateIndex()
+        index.add("dup://{id}", "first")
+        index.add("dup://{id}", "second")
+        assert index.match("dup://1") == "first"
+        assert len(index) == 2
+
+    def test_many_templates(self):
+        index = UriTemplateIndex()
+        for i in range(2000):
+            index.add(f"svc{i}://items/{{id}}", i)
+        assert index.match("svc1234://items/abc") == 1234
+        assert index.match("svc99999://items/abc") is None
+
+    def test_literal_prefix(self):
+        assert literal_prefix("x://{a}/{b}") == "x://"
+        assert literal_prefix("x://y{?q}") == "x://y"